@@ -0,0 +1,197 @@
+"""
+Prediction service.
+
+Single-record ``/predict`` calls are coalesced into micro-batches (see
+``BatchCoalescer``) and scored with one vectorized call on a worker
+thread; ``/predict/batch`` scores a list of records at once. ``/metrics``
+exposes the queue depth and the batch-size and wait histograms used to
+tune ``max_batch_size`` and ``max_wait_ms``.
+
+With ``MODEL_BUCKET_NAME`` set, the model is the S3 registry's current
+model, fetched at startup through the local model cache.
+
+With ``--lookup-collection-name``, ``GET /predict/{customer_id}`` scores
+the customer record stored in MongoDB; concurrent lookups are coalesced
+into ``$in`` queries on an async client (see ``AsyncProjData``).
+
+Run with ``python app.py [--max-batch-size N] [--max-wait-ms MS]`` or
+``uvicorn app:app``.
+"""
+
+import argparse
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, ValidationError
+
+from mlops_project.entity.config_entity import PredictionServiceConfig
+from mlops_project.entity.s3_estimator import Proj1Estimator
+from mlops_project.logger import get_logger
+from mlops_project.pipeline.batch_coalescer import BatchCoalescer
+from mlops_project.pipeline.prediction_pipeline import PredictionPipeline, load_model
+
+if TYPE_CHECKING:
+    from mlops_project.data_access.async_proj_data import AsyncProjData
+
+
+class CustomerRecord(BaseModel):
+    """Feature columns of one customer, as in config/schema.yaml."""
+
+    id: Optional[int] = None
+    Gender: str
+    Age: int
+    Driving_License: int
+    Region_Code: float
+    Previously_Insured: int
+    Vehicle_Age: str
+    Vehicle_Damage: str
+    Annual_Premium: float
+    Policy_Sales_Channel: float
+    Vintage: int
+
+
+class Prediction(BaseModel):
+    prediction: int
+    probability: float
+
+
+class BatchPrediction(BaseModel):
+    predictions: list[int]
+    probabilities: list[float]
+
+
+def create_app(config: PredictionServiceConfig = None, data: "AsyncProjData" = None) -> FastAPI:
+    """
+    Builds the service; the coalescer starts and the model is loaded with the app's lifespan.
+
+    ``data`` serves the customer lookups; with ``lookup_collection_name`` and
+    no ``data``, one is created in the lifespan, on the serving event loop.
+    """
+    config = config or PredictionServiceConfig()
+    prediction_pipeline = PredictionPipeline(config.model_file_path, batch_size=config.batch_size)
+
+    def score(records: list[dict]) -> list[dict]:
+        probabilities = prediction_pipeline.predict_proba(records)
+        # Same decision as the estimator's predict
+        return [{"prediction": int(p > 0.5), "probability": float(p)} for p in probabilities]
+
+    coalescer = BatchCoalescer(score, max_batch_size=config.max_batch_size, max_wait_ms=config.max_wait_ms)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        logger = get_logger("App")
+        await coalescer.start()
+        owned_data = None
+        if config.lookup_collection_name and app.state.data is None:
+            from mlops_project.data_access.async_proj_data import AsyncProjData
+
+            app.state.data = owned_data = AsyncProjData()
+        if config.bucket_name:
+            # Downloaded only when the registry's current model is not in the local cache
+            estimator = Proj1Estimator(
+                config.bucket_name, model_path=config.s3_model_key_path, cache_dir=config.registry_cache_dir
+            )
+            model_file_path = await asyncio.to_thread(estimator.fetch_model)
+            if model_file_path is not None:
+                config.model_file_path = prediction_pipeline.model_file_path = model_file_path
+        if os.path.exists(config.model_file_path):
+            # Load before the first request rather than in it
+            await asyncio.to_thread(load_model, config.model_file_path)
+        else:
+            logger.warning(f"No model at {config.model_file_path} yet; predictions answer 503 until it exists")
+        logger.info(f"Serving with max_batch_size={config.max_batch_size}, max_wait_ms={config.max_wait_ms}")
+        yield
+        await coalescer.stop()
+        if owned_data is not None:
+            await owned_data.close()
+            app.state.data = None
+
+    app = FastAPI(title="Vehicle insurance response prediction", lifespan=lifespan)
+    app.state.config = config
+    app.state.coalescer = coalescer
+    app.state.data = data
+
+    def _check_model() -> None:
+        if not os.path.exists(config.model_file_path):
+            raise HTTPException(status_code=503, detail="No model is deployed")
+
+    def _failed(status_code: int, detail: str) -> HTTPException:
+        # Errors name files and hosts: log them, answer with a generic detail
+        get_logger("App").exception(detail)
+        return HTTPException(status_code=status_code, detail=detail)
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok", "model_available": os.path.exists(config.model_file_path)}
+
+    @app.post("/predict", response_model=Prediction)
+    async def predict(record: CustomerRecord) -> dict:
+        _check_model()
+        try:
+            return await coalescer.submit(record.model_dump())
+        except Exception as e:
+            raise _failed(500, "Prediction failed") from e
+
+    @app.get("/predict/{customer_id}", response_model=Prediction)
+    async def predict_customer(customer_id: int) -> dict:
+        if not config.lookup_collection_name or app.state.data is None:
+            raise HTTPException(status_code=503, detail="Customer lookups are not configured")
+        _check_model()
+        try:
+            document = await app.state.data.lookup(config.lookup_collection_name, customer_id)
+        except Exception as e:
+            raise _failed(502, "Customer lookup failed") from e
+        if document is None:
+            raise HTTPException(status_code=404, detail=f"No customer with id {customer_id}")
+        try:
+            record = CustomerRecord.model_validate(document)
+        except ValidationError as e:
+            # A stored record that cannot be scored is the data's fault, not the server's
+            fields = ", ".join(sorted({str(error["loc"][0]) for error in e.errors()}))
+            raise HTTPException(status_code=422, detail=f"Customer {customer_id} has invalid fields: {fields}")
+        try:
+            return await coalescer.submit(record.model_dump())
+        except Exception as e:
+            raise _failed(500, "Prediction failed") from e
+
+    @app.post("/predict/batch", response_model=BatchPrediction)
+    async def predict_batch(records: list[CustomerRecord]) -> dict:
+        _check_model()
+        try:
+            results = await asyncio.to_thread(score, [record.model_dump() for record in records])
+        except Exception as e:
+            raise _failed(500, "Prediction failed") from e
+        return {
+            "predictions": [result["prediction"] for result in results],
+            "probabilities": [result["probability"] for result in results],
+        }
+
+    @app.get("/metrics")
+    async def metrics() -> dict:
+        if app.state.data is None:
+            return coalescer.metrics()
+        return {**coalescer.metrics(), "lookups": app.state.data.metrics()}
+
+    return app
+
+
+app = create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    defaults = PredictionServiceConfig()
+    parser = argparse.ArgumentParser(description="Serve the deployed model")
+    parser.add_argument("--model-file-path", default=defaults.model_file_path)
+    parser.add_argument("--max-batch-size", type=int, default=defaults.max_batch_size)
+    parser.add_argument("--max-wait-ms", type=float, default=defaults.max_wait_ms)
+    parser.add_argument("--lookup-collection-name", default=defaults.lookup_collection_name)
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(PredictionServiceConfig(**vars(args))), host=args.host, port=args.port)
@@ -0,0 +1,63 @@
+"""
+Nightly bulk scoring of a MongoDB collection with the deployed model.
+
+Resumes after the last checkpointed document unless --restart is given;
+a finished run's checkpoint makes the next one score only new documents.
+
+    python batch_predict.py --collection Proj1-Data --output mongo
+    python batch_predict.py --output parquet --num-workers 8 --restart
+"""
+
+import argparse
+import json
+import logging
+
+from mlops_project.configuration.mongo_db_connection import MongoClient
+from mlops_project.entity.config_entity import BatchPredictionConfig, MongoClientConfig
+from mlops_project.logger import get_logger
+from mlops_project.pipeline.batch_prediction import BatchPrediction
+
+
+def main() -> None:
+    defaults = BatchPredictionConfig()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collection", default=defaults.input_collection_name, help="collection to score")
+    parser.add_argument("--output", choices=["mongo", "parquet"], default=defaults.output)
+    parser.add_argument("--output-collection", default=None, help="default <collection>-Predictions")
+    parser.add_argument("--output-dir", default=None, help="Parquet parts directory")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file (default under the artifact dir)")
+    parser.add_argument("--model-file-path", default=defaults.model_file_path)
+    parser.add_argument("--chunk-size", type=int, default=defaults.chunk_size)
+    parser.add_argument("--num-workers", type=int, default=defaults.num_workers)
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and score every document")
+    mongo_defaults = MongoClientConfig()
+    parser.add_argument("--max-pool-size", type=int, default=mongo_defaults.max_pool_size, help="MongoDB connections")
+    parser.add_argument("--compressors", default=mongo_defaults.compressors, help="MongoDB wire compression")
+    parser.add_argument(
+        "--read-preference", default=mongo_defaults.bulk_read_preference, help="of the scored collection"
+    )
+    args = parser.parse_args()
+
+    get_logger("pymongo").setLevel(logging.CRITICAL)
+    MongoClient.configure(
+        MongoClientConfig(
+            max_pool_size=args.max_pool_size, compressors=args.compressors, bulk_read_preference=args.read_preference
+        )
+    )
+
+    config = BatchPredictionConfig(
+        input_collection_name=args.collection,
+        output=args.output,
+        output_collection_name=args.output_collection,
+        output_dir=args.output_dir,
+        checkpoint_file_path=args.checkpoint,
+        model_file_path=args.model_file_path,
+        chunk_size=args.chunk_size,
+        num_workers=args.num_workers,
+    )
+    report = BatchPrediction(config).run(restart=args.restart)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
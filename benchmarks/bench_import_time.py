@@ -0,0 +1,146 @@
+"""
+Measure the import cost of the mlops_project modules with ``python -X importtime``.
+
+Usage:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --repeat 5 --modules mlops_project.logger
+
+Each module is imported in a fresh interpreter. The reported time is the
+cumulative ``-X importtime`` figure of everything the import pulled in (best
+of ``--repeat`` runs), so modules already loaded by ``site`` are not counted.
+The command exits with status 1 when a module is over ``IMPORT_TIME_BUDGET_MS``,
+imports one of ``HEAVY_MODULES`` or configures logging as a side effect;
+tests/imports/test_import_time.py enforces the same budget.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules that must stay cheap to import: CLIs, configs and prediction workers load them
+LIGHT_MODULES = (
+    "mlops_project",
+    "mlops_project.logger",
+    "mlops_project.exception",
+    "mlops_project.constants",
+    "mlops_project.entity.config_entity",
+    "mlops_project.entity.artifact_entity",
+    "mlops_project.configuration.mongo_db_connection",
+    "mlops_project.utils.mongo_utils",
+    "mlops_project.utils.main_utils",
+    "mlops_project.utils.instrumentation",
+    "mlops_project.pipeline.stage_cache",
+    "mlops_project.pipeline.training_pipeline",
+    "mlops_project.pipeline.prediction_pipeline",
+)
+
+# Loaded only by the code paths that use them
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "sklearn",
+    "scipy",
+    "pymongo",
+    "bson",
+    "certifi",
+    "boto3",
+    "botocore",
+    "dotenv",
+)
+
+IMPORT_TIME_BUDGET_MS = 150.0
+
+_PROBE = """
+import json, sys
+before = set(sys.modules)
+import {module}
+new_modules = sorted(set(sys.modules) - before)
+import logging
+print(json.dumps({{
+    "new_modules": new_modules,
+    "configured_logging": bool(logging.getLogger().handlers),
+}}))
+"""
+
+
+def _parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """(name, depth, self_us, cumulative_us) of every ``import time:`` line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_import(module: str, repeat: int = 3) -> dict:
+    """
+    Import ``module`` in fresh interpreters and report its cost.
+
+    Args:
+        module (str): Dotted module name.
+        repeat (int): Number of interpreters; the fastest run is reported.
+
+    Returns:
+        dict: ``ms`` (cumulative import time), ``heavy`` (HEAVY_MODULES it
+        loaded), ``configured_logging`` and the ``slowest`` modules by self time.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")]))}
+    best = None
+
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        probe = json.loads(completed.stdout.strip().splitlines()[-1])
+        new_modules = set(probe["new_modules"])
+        rows = [row for row in _parse_importtime(completed.stderr) if row[0] in new_modules]
+
+        total_us = sum(cumulative for _, depth, _, cumulative in rows if depth == 0)
+        if best is None or total_us < best["ms"] * 1000:
+            best = {
+                "module": module,
+                "ms": round(total_us / 1000, 2),
+                "heavy": sorted({name.split(".")[0] for name in new_modules} & set(HEAVY_MODULES)),
+                "configured_logging": probe["configured_logging"],
+                "slowest": [
+                    {"module": name, "self_ms": round(self_us / 1000, 2)}
+                    for name, _, self_us, _ in sorted(rows, key=lambda row: -row[2])[:5]
+                ],
+            }
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modules", nargs="+", default=list(LIGHT_MODULES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS)
+    args = parser.parse_args()
+
+    results = [measure_import(module, args.repeat) for module in args.modules]
+    failures = [
+        result["module"]
+        for result in results
+        if result["ms"] > args.budget_ms or result["heavy"] or result["configured_logging"]
+    ]
+
+    print(json.dumps({"budget_ms": args.budget_ms, "results": results, "failures": failures}, indent=2))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Benchmark the ingestion path: Mongo export, train/test split and artifact writes.
+
+Usage:
+    python -m benchmarks.bench_ingestion --scales 100k
+    python -m benchmarks.bench_ingestion --scales 100k 1M 10M --mongo-uri mongodb://localhost:27017
+    python -m benchmarks.bench_ingestion --scales 1M --formats csv parquet --compare benchmarks/results/baseline.json
+
+For every scale a synthetic collection following ``config/schema.yaml`` is
+loaded (not timed), then these stages are measured with
+``mlops_project.utils.instrumentation``:
+
+- ``export``: ``ProjData.export_collection_as_dataframe``
+- ``split``: ``DataIngetion.split_data_as_train_test_split`` without its writes
+- ``write_train_test``: the train/test writes of that split, per ``--formats``
+- ``write_feature_store``: ``write_dataframe`` of the full frame, per ``--formats``
+
+Results (seconds, CPU seconds, rows/s, peak-RSS growth, frame size) are
+written as JSON with the git commit and library versions. ``--compare``
+matches them against an earlier result file and exits with status 1 when a
+stage got slower, or grew the peak RSS more, than ``--tolerance`` allows.
+
+Without ``--mongo-uri`` the collection lives in an in-process mongomock
+client, whose reads slow down with collection size (about 8k documents/s
+at 20k rows, 1k/s at 100k): use a local mongod for the 1M and 10M scales.
+The peak RSS of a process only grows, so run one scale per process (or
+scales in increasing order) when memory figures matter.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.synthetic import connect, install_client, load_collection, quiet_logging
+from mlops_project.components.data_ingestion import DataIngetion
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.entity.config_entity import DataIngestionConfig
+from mlops_project.utils.instrumentation import RunRecorder, stage
+from mlops_project.utils.main_utils import write_dataframe
+
+BENCH_COLLECTION = "bench-ingestion"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# Differences below these are noise (timer jitter, allocator reuse, page granularity)
+TIME_NOISE_FLOOR_SECONDS = 0.05
+RSS_NOISE_FLOOR_MB = 16.0
+
+
+def parse_scale(value: str) -> int:
+    """Parse a row count such as ``100k``, ``1M`` or ``2500``."""
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    value = value.strip().lower().replace("_", "")
+    if value and value[-1] in multipliers:
+        return int(float(value[:-1]) * multipliers[value[-1]])
+    return int(value)
+
+
+def _result(record, scale: int, file_format: Optional[str] = None, **extra) -> dict:
+    return {
+        "scale": scale,
+        "stage": record.name,
+        "format": file_format,
+        "seconds": record.wall_seconds,
+        "cpu_seconds": record.cpu_seconds,
+        "rows_per_second": round(scale / record.wall_seconds) if record.wall_seconds else None,
+        "peak_rss_delta_mb": record.peak_rss_delta_mb,
+        **extra,
+    }
+
+
+def run_scale(
+    scale: int,
+    formats: list[str],
+    batch_size: int,
+    num_workers: int,
+    use_schema: bool,
+    work_dir: Path,
+) -> list[dict]:
+    """Run every stage on an already loaded collection of ``scale`` rows."""
+    results = []
+    recorder = RunRecorder(work_dir, profile="")
+
+    with recorder.activate():
+        with stage("export") as record:
+            df = ProjData().export_collection_as_dataframe(
+                BENCH_COLLECTION, batch_size=batch_size, use_schema=use_schema, num_workers=num_workers
+            )
+        results.append(
+            _result(
+                record,
+                scale,
+                frame_mb=round(df.memory_usage(deep=True).sum() / 2**20, 2),
+                mongo_fetch_seconds=round(record.counters.get("mongo_fetch_seconds", 0.0), 3),
+                dataframe_build_seconds=round(record.counters.get("dataframe_build_seconds", 0.0), 3),
+            )
+        )
+
+        for file_format in formats:
+            config = DataIngestionConfig(
+                data_ingestion_dir=work_dir / f"{scale}-{file_format}",
+                file_format=file_format,
+                use_schema=use_schema,
+            )
+            # Records its own "split" stage, with a nested "write_train_test"
+            DataIngetion(config).split_data_as_train_test_split(df)
+
+            split = next(record for record in reversed(recorder.records) if record.path == "split")
+            write = next(record for record in reversed(recorder.records) if record.path == "split/write_train_test")
+
+            # The split stage contains its writes; report the split alone once
+            if file_format == formats[0]:
+                split_only = dict(
+                    _result(split, scale),
+                    seconds=round(split.wall_seconds - write.wall_seconds, 6),
+                    cpu_seconds=round(split.cpu_seconds - write.cpu_seconds, 6),
+                )
+                split_only["rows_per_second"] = round(scale / split_only["seconds"]) if split_only["seconds"] else None
+                results.append(split_only)
+
+            sizes = sum(Path(path).stat().st_size for path in (config.training_file_path, config.testing_file_path))
+            results.append(_result(write, scale, file_format, file_mb=round(sizes / 2**20, 2)))
+
+            feature_store_path = Path(config.feature_store_file_path)
+            with stage("write_feature_store") as record:
+                write_dataframe(df, feature_store_path, file_format=file_format)
+            results.append(
+                _result(record, scale, file_format, file_mb=round(feature_store_path.stat().st_size / 2**20, 2))
+            )
+
+    return results
+
+
+def _metadata(args: argparse.Namespace) -> dict:
+    import numpy
+    import pandas
+    import pyarrow
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "pyarrow": pyarrow.__version__,
+        "backend": "mongod" if args.mongo_uri else "mongomock",
+        "batch_size": args.batch_size,
+        "num_workers": args.num_workers,
+        "use_schema": args.use_schema,
+    }
+
+
+# ---------------------- COMPARISON ----------------------
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[dict]:
+    """
+    Match results to a baseline by (scale, stage, format) and list the regressions.
+
+    A stage regresses when it takes more than ``(1 + tolerance)`` times the
+    baseline seconds, or grows the peak RSS by more than that factor.
+    Differences under ``TIME_NOISE_FLOOR_SECONDS`` / ``RSS_NOISE_FLOOR_MB``
+    are ignored.
+    """
+    base = {(row["scale"], row["stage"], row["format"]): row for row in baseline}
+    regressions = []
+
+    for row in results:
+        old = base.get((row["scale"], row["stage"], row["format"]))
+        if old is None:
+            continue
+
+        checks = [("seconds", row["seconds"], old["seconds"], TIME_NOISE_FLOOR_SECONDS)]
+        if row.get("peak_rss_delta_mb") is not None and old.get("peak_rss_delta_mb") is not None:
+            checks.append(("peak_rss_delta_mb", row["peak_rss_delta_mb"], old["peak_rss_delta_mb"], RSS_NOISE_FLOOR_MB))
+
+        for metric, new_value, old_value, floor in checks:
+            if new_value > max(old_value * (1 + tolerance), old_value + floor):
+                regressions.append(
+                    {
+                        "scale": row["scale"],
+                        "stage": row["stage"],
+                        "format": row["format"],
+                        "metric": metric,
+                        "baseline": old_value,
+                        "current": new_value,
+                        "ratio": round(new_value / old_value, 3) if old_value else None,
+                    }
+                )
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", default=["100k"], help="row counts, e.g. 100k 1M 10M")
+    parser.add_argument("--formats", nargs="+", default=["csv", "parquet", "feather"])
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--num-workers", type=int, default=1)
+    parser.add_argument("--use-schema", action="store_true", help="export with the schema-typed decoder")
+    parser.add_argument("--na-fraction", type=float, default=0.001)
+    parser.add_argument("--mongo-uri", default=None)
+    parser.add_argument("--output", type=Path, default=None, help="result file (default benchmarks/results/)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown/growth, 0.2 = 20%%")
+    args = parser.parse_args()
+
+    quiet_logging()
+
+    client = connect(args.mongo_uri)
+    install_client(client)
+    collection = client[DATABASE_NAME][BENCH_COLLECTION]
+
+    results = []
+    try:
+        for scale in sorted(parse_scale(value) for value in args.scales):
+            load_collection(collection, scale, na_fraction=args.na_fraction)
+            with tempfile.TemporaryDirectory(prefix="bench-ingestion-") as work_dir:
+                results += run_scale(
+                    scale, args.formats, args.batch_size, args.num_workers, args.use_schema, Path(work_dir)
+                )
+    finally:
+        collection.drop()
+
+    report = {"metadata": _metadata(args), "results": results}
+
+    run_name = f"ingestion_{report['metadata']['git_commit'] or 'nogit'}_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output = args.output or RESULTS_DIR / run_name
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    print(json.dumps(report, indent=2))
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        print(json.dumps({"baseline": str(args.compare), "regressions": regressions}, indent=2))
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
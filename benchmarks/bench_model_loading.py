@@ -0,0 +1,153 @@
+"""
+Per-worker memory and cold start of the deployed model, with and without
+memory-mapped loading (``MyModel.load(mmap_mode=...)``).
+
+Usage:
+    python -m benchmarks.bench_model_loading --workers 4
+    python -m benchmarks.bench_model_loading --workers 4 --estimator knn
+    python -m benchmarks.bench_model_loading --model-file-path artifact/deployed_model/model.pkl
+
+``--workers`` processes are spawned like ``uvicorn --workers`` spawns them.
+Each one loads the model, scores a batch, then waits until all are loaded
+before reading its memory from ``/proc/self/smaps_rollup`` (Linux), so
+shared pages are counted while every worker holds them:
+
+- ``rss_mb``: resident memory added by the load and the first batch
+- ``uss_mb``: of that, pages private to the worker
+- ``pss_mb``: resident memory with shared pages divided among the sharers
+
+Without ``--model-file-path`` a model like the trainer's (random forest of
+``config/model.yaml`` sizes) or a k-nearest-neighbours model (predicts from
+its fitted arrays) is fitted on synthetic data first.
+"""
+
+import argparse
+import json
+import multiprocessing
+import re
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import quiet_logging
+
+N_FEATURES = 12
+
+
+def memory_mb() -> dict:
+    """Rss, Pss and Uss (private pages) of this process, in MB."""
+    fields = dict(re.findall(r"^(\w+):\s+(\d+) kB", Path("/proc/self/smaps_rollup").read_text(), re.M))
+    kilobytes = {name: int(value) for name, value in fields.items()}
+    return {
+        "rss": kilobytes["Rss"] / 1024,
+        "pss": kilobytes["Pss"] / 1024,
+        "uss": (kilobytes["Private_Clean"] + kilobytes["Private_Dirty"]) / 1024,
+    }
+
+
+def build_model(estimator: str, n_rows: int, file_path: Path) -> None:
+    import numpy as np
+    import pandas as pd
+    from sklearn.compose import ColumnTransformer
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.neighbors import KNeighborsClassifier
+
+    from mlops_project.entity.estimator import MyModel
+
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(n_rows, N_FEATURES)), columns=[f"x{i}" for i in range(N_FEATURES)])
+    target = (features["x0"] + rng.normal(size=n_rows) > 0).astype(int)
+    preprocessor = ColumnTransformer([("passthrough", "passthrough", list(features.columns))]).fit(features)
+
+    if estimator == "random_forest":
+        model = RandomForestClassifier(n_estimators=200, max_depth=12, n_jobs=-1, random_state=42)
+    else:
+        model = KNeighborsClassifier(algorithm="brute")
+    model.fit(preprocessor.transform(features), target)
+    MyModel(preprocessor, model).save(file_path)
+
+
+def worker(model_file_path: str, mmap_mode, barrier, results) -> None:
+    # Imports are part of every worker's start, not of the load
+    import numpy as np
+    import pandas as pd
+    import sklearn.ensemble  # noqa: F401
+    import sklearn.neighbors  # noqa: F401
+
+    from mlops_project.entity.estimator import MyModel
+
+    rows = pd.DataFrame(
+        np.random.default_rng(1).normal(size=(256, N_FEATURES)), columns=[f"x{i}" for i in range(N_FEATURES)]
+    )
+    before = memory_mb()
+    start = time.perf_counter()
+    model = MyModel.load(model_file_path, mmap_mode=mmap_mode)
+    load_seconds = time.perf_counter() - start
+    model.predict_proba_batch(rows)
+    first_batch_seconds = time.perf_counter() - start
+
+    barrier.wait()
+    after = memory_mb()
+    results.put(
+        {
+            "load_seconds": load_seconds,
+            "first_batch_seconds": first_batch_seconds,
+            **{f"{name}_mb": after[name] - before[name] for name in after},
+        }
+    )
+    barrier.wait()
+
+
+def run(model_file_path: str, mmap_mode, n_workers: int) -> dict:
+    context = multiprocessing.get_context("spawn")
+    barrier, results = context.Barrier(n_workers), context.Queue()
+    processes = [
+        context.Process(target=worker, args=(model_file_path, mmap_mode, barrier, results)) for _ in range(n_workers)
+    ]
+    for process in processes:
+        process.start()
+    workers = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    return {
+        "mmap_mode": mmap_mode,
+        "workers": n_workers,
+        "load_seconds": round(statistics.median(w["load_seconds"] for w in workers), 4),
+        "first_batch_seconds": round(statistics.median(w["first_batch_seconds"] for w in workers), 4),
+        **{
+            f"{name}_mb_per_worker": round(statistics.mean(w[f"{name}_mb"] for w in workers), 1)
+            for name in ("rss", "uss", "pss")
+        },
+        "pss_mb_total": round(sum(w["pss_mb"] for w in workers), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--model-file-path", default=None, help="saved MyModel (default: fit one)")
+    parser.add_argument("--estimator", choices=["random_forest", "knn"], default="random_forest")
+    parser.add_argument("--rows", type=int, default=200_000, help="training rows of the fitted model")
+    args = parser.parse_args()
+
+    quiet_logging()
+
+    with tempfile.TemporaryDirectory(prefix="bench-model-loading-") as work_dir:
+        model_file_path = args.model_file_path
+        if model_file_path is None:
+            model_file_path = str(Path(work_dir) / "model.pkl")
+            build_model(args.estimator, args.rows, Path(model_file_path))
+
+        report = {
+            "model_file_path": args.model_file_path or f"synthetic {args.estimator}",
+            "model_file_mb": round(Path(model_file_path).stat().st_size / 2**20, 1),
+            "results": [run(model_file_path, mmap_mode, args.workers) for mmap_mode in (None, "r")],
+        }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Compare naive and managed S3 transfers of pipeline artifacts.
+
+Usage:
+    python -m benchmarks.bench_s3_transfer --size-mb 128
+    python -m benchmarks.bench_s3_transfer --size-mb 512 --endpoint-url http://localhost:9000 --bucket bench
+
+Stages, each timed with its peak of traced (Python and NumPy) allocations:
+
+- ``upload``: ``put_object`` of the file's bytes, a single-stream managed
+  upload and the multipart upload of ``S3StorageConfig``
+- ``read_parquet``: ``get_object().read()`` parsed from memory, against
+  ``SimpleStorageService.read_dataframe`` (ranged reads, no copy)
+- ``read_npy``: the same for a float32 ``.npy`` array and ``read_numpy_array``
+- ``upload_directory``: ``--files`` files one at a time, then on the pool
+
+Without ``--endpoint-url`` a ``moto_server`` (``moto[server]`` of the dev
+dependencies) is started on a free local port, so requests go through
+real HTTP and the traced memory is the client's alone. moto spends about
+as much CPU per byte as the client: on one core, transfers are CPU-bound
+and concurrency shows less than against MinIO or S3. With
+``--endpoint-url`` credentials come from the usual AWS variables.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import quiet_logging
+from mlops_project.cloud_storage.aws_storage import SimpleStorageService
+from mlops_project.configuration.aws_connction import S3Client
+from mlops_project.entity.config_entity import S3StorageConfig
+from mlops_project.utils.main_utils import save_numpy_array_data, write_dataframe
+
+
+def measure(name: str, size_bytes: int, function) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    function()
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "path": name,
+        "seconds": round(elapsed, 3),
+        "mb_per_second": round(size_bytes / 2**20 / elapsed, 1),
+        "peak_traced_mb": round(peak / 2**20, 2),
+    }
+
+
+def make_artifacts(work_dir: Path, size_mb: int) -> dict:
+    """A Parquet frame and a .npy array of about ``size_mb`` each."""
+    rng = np.random.default_rng(0)
+    n_rows = size_mb * 2**20 // 64
+    array = rng.normal(size=(n_rows, 16)).astype(np.float32)
+
+    parquet_path = work_dir / "train.parquet"
+    frame = pd.DataFrame(array[:, :8].astype(np.float64), columns=[f"x{i}" for i in range(8)])
+    write_dataframe(frame, parquet_path)
+    npy_path = work_dir / "train.npy"
+    save_numpy_array_data(npy_path, array)
+    return {"parquet": parquet_path, "npy": npy_path}
+
+
+def run(bucket: str, size_mb: int, n_files: int, config: S3StorageConfig, work_dir: Path) -> list[dict]:
+    from boto3.s3.transfer import TransferConfig
+
+    storage = SimpleStorageService(config)
+    client = storage.s3_client
+    paths = make_artifacts(work_dir, size_mb)
+    results = []
+
+    # ---------------------- UPLOAD ----------------------
+    path, size = paths["npy"], paths["npy"].stat().st_size
+    results.append(
+        measure(
+            "upload/put_object",
+            size,
+            lambda: client.put_object(Bucket=bucket, Key="naive.npy", Body=path.read_bytes()),
+        )
+    )
+    single_stream = TransferConfig(multipart_threshold=size + 1, use_threads=False)
+    results.append(
+        measure(
+            "upload/single_stream",
+            size,
+            lambda: client.upload_file(str(path), bucket, "single.npy", Config=single_stream),
+        )
+    )
+    results.append(measure("upload/multipart", size, lambda: storage.upload_file(path, bucket, "train.npy")))
+    storage.upload_file(paths["parquet"], bucket, "train.parquet")
+
+    # ---------------------- READS ----------------------
+    parquet_size = paths["parquet"].stat().st_size
+    results.append(
+        measure(
+            "read_parquet/get_object_read",
+            parquet_size,
+            lambda: pd.read_parquet(io.BytesIO(client.get_object(Bucket=bucket, Key="train.parquet")["Body"].read())),
+        )
+    )
+    results.append(
+        measure("read_parquet/streaming", parquet_size, lambda: storage.read_dataframe(bucket, "train.parquet"))
+    )
+    results.append(
+        measure(
+            "read_npy/get_object_read",
+            size,
+            lambda: np.load(io.BytesIO(client.get_object(Bucket=bucket, Key="train.npy")["Body"].read())),
+        )
+    )
+    results.append(measure("read_npy/streaming", size, lambda: storage.read_numpy_array(bucket, "train.npy")))
+
+    # ---------------------- DIRECTORY ----------------------
+    directory = work_dir / "artifact"
+    directory.mkdir()
+    file_size = max(size // n_files, 1)
+    for index in range(n_files):
+        (directory / f"part-{index:03d}.bin").write_bytes(os.urandom(file_size))
+    total = file_size * n_files
+    results.append(
+        measure(
+            "upload_directory/sequential",
+            total,
+            lambda: storage.upload_directory(directory, bucket, "seq", max_workers=1),
+        )
+    )
+    results.append(measure("upload_directory/pool", total, lambda: storage.upload_directory(directory, bucket, "pool")))
+
+    return results
+
+
+@contextlib.contextmanager
+def moto_server():
+    """A moto S3 server in a child process; yields its endpoint URL."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-p", str(port)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            with contextlib.suppress(OSError), socket.create_connection(("127.0.0.1", port), timeout=1):
+                break
+            if time.monotonic() > deadline or process.poll() is not None:
+                raise RuntimeError("moto_server did not start; install moto[server]")
+            time.sleep(0.1)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=128, help="size of each test artifact")
+    parser.add_argument("--files", type=int, default=16, help="files of the directory upload")
+    parser.add_argument("--bucket", default="bench-s3-transfer")
+    parser.add_argument("--endpoint-url", default=None, help="S3-compatible server (MinIO, moto_server)")
+    parser.add_argument("--chunk-mb", type=int, default=S3StorageConfig.multipart_chunksize // 2**20)
+    parser.add_argument("--max-concurrency", type=int, default=S3StorageConfig.max_concurrency)
+    parser.add_argument("--upload-max-workers", type=int, default=S3StorageConfig.upload_max_workers)
+    args = parser.parse_args()
+
+    quiet_logging()
+    config = S3StorageConfig(
+        multipart_threshold=args.chunk_mb * 2**20,
+        multipart_chunksize=args.chunk_mb * 2**20,
+        max_concurrency=args.max_concurrency,
+        upload_max_workers=args.upload_max_workers,
+    )
+
+    if args.endpoint_url:
+        backend = contextlib.nullcontext(args.endpoint_url)
+    else:
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+        backend = moto_server()
+
+    with backend as endpoint_url:
+        os.environ["AWS_ENDPOINT_URL"] = endpoint_url
+        S3Client.s3_client = None
+        client = S3Client().s3_client
+        with contextlib.suppress(client.exceptions.BucketAlreadyOwnedByYou):
+            client.create_bucket(Bucket=args.bucket)
+
+        with tempfile.TemporaryDirectory(prefix="bench-s3-") as work_dir:
+            results = run(args.bucket, args.size_mb, args.files, config, Path(work_dir))
+
+    report = {"backend": args.endpoint_url or "moto_server", "config": vars(config), "results": results}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
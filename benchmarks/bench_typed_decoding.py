@@ -0,0 +1,71 @@
+"""
+Compare the inferred-dtype and schema-typed MongoDB -> DataFrame loaders.
+
+Usage:
+    python -m benchmarks.bench_typed_decoding --rows 1000000
+    python -m benchmarks.bench_typed_decoding --rows 1000000 --mongo-uri mongodb://localhost:27017
+
+Without ``--mongo-uri`` the collection lives in an in-process mongomock
+client. mongomock copies every document on read, so absolute numbers are far
+below a real mongod; compare the two paths relative to each other.
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.synthetic import connect, install_client, load_collection, quiet_logging
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.mlops_proj_data import ProjData
+
+BENCH_COLLECTION = "bench-typed-decoding"
+
+
+def run_export(use_schema: bool, batch_size: int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    df = ProjData().export_collection_as_dataframe(
+        BENCH_COLLECTION, batch_size=batch_size, use_schema=use_schema
+    )
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "path": "typed" if use_schema else "inferred",
+        "rows": len(df),
+        "seconds": round(elapsed, 3),
+        "rows_per_second": round(len(df) / elapsed),
+        "frame_mb": round(df.memory_usage(deep=True).sum() / 2**20, 2),
+        "peak_traced_mb": round(peak / 2**20, 2),
+        "dtypes": {name: str(dtype) for name, dtype in df.dtypes.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--na-fraction", type=float, default=0.001)
+    parser.add_argument("--mongo-uri", default=None)
+    args = parser.parse_args()
+
+    quiet_logging()
+
+    client = connect(args.mongo_uri)
+    install_client(client)
+    load_collection(client[DATABASE_NAME][BENCH_COLLECTION], args.rows, na_fraction=args.na_fraction)
+
+    results = [run_export(use_schema, args.batch_size) for use_schema in (False, True)]
+    print(json.dumps(results, indent=2))
+
+    client[DATABASE_NAME][BENCH_COLLECTION].drop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Synthetic insurance-style documents for benchmarks.
+
+The generated documents follow ``config/schema.yaml``: the categorical values
+are drawn from ``categorical_domains`` and the numeric columns follow the
+ranges seen in the original Proj1 dataset.
+
+Collections can be loaded into an in-process ``mongomock`` client (default)
+or a real local ``mongod`` when a URI is given.
+"""
+
+import os
+from typing import Iterator, Optional
+
+import numpy as np
+
+from mlops_project.configuration.mongo_db_connection import MongoClient
+from mlops_project.logger import configure_logging
+from mlops_project.utils.main_utils import load_schema
+
+
+def generate_documents(
+    n_rows: int,
+    seed: int = 42,
+    na_fraction: float = 0.0,
+    batch_size: int = 100_000,
+) -> Iterator[list[dict]]:
+    """
+    Yield lists of synthetic documents, ``batch_size`` at a time.
+
+    Args:
+        n_rows (int): Total number of documents.
+        seed (int): Seed of the random generator.
+        na_fraction (float): Share of Annual_Premium values replaced by the string "na".
+        batch_size (int): Documents per yielded list.
+    """
+    rng = np.random.default_rng(seed)
+    domains = load_schema()["categorical_domains"]
+
+    for start in range(0, n_rows, batch_size):
+        n = min(batch_size, n_rows - start)
+
+        columns = {
+            "id": np.arange(start + 1, start + n + 1),
+            "Gender": rng.choice(domains["Gender"], n),
+            "Age": rng.integers(20, 86, n),
+            "Driving_License": (rng.random(n) < 0.998).astype(int),
+            "Region_Code": rng.integers(0, 53, n).astype(float),
+            "Previously_Insured": rng.integers(0, 2, n),
+            "Vehicle_Age": rng.choice(domains["Vehicle_Age"], n, p=[0.43, 0.53, 0.04]),
+            "Vehicle_Damage": rng.choice(domains["Vehicle_Damage"], n),
+            # 2630 is the floor premium of the original data (numerical_ranges in the schema)
+            "Annual_Premium": np.round(np.clip(rng.gamma(4.0, 7_600.0, n), 2_630, 540_165)).astype(object),
+            "Policy_Sales_Channel": rng.integers(1, 164, n).astype(float),
+            "Vintage": rng.integers(10, 300, n),
+            "Response": (rng.random(n) < 0.12).astype(int),
+        }
+
+        if na_fraction:
+            columns["Annual_Premium"][rng.random(n) < na_fraction] = "na"
+
+        # Convert to plain Python scalars, as documents read back from Mongo would be
+        lists = {name: values.tolist() for name, values in columns.items()}
+        names = list(lists)
+        yield [dict(zip(names, row)) for row in zip(*lists.values())]
+
+
+def quiet_logging(level: str = "WARNING") -> None:
+    """Raise the root log level so per-batch DEBUG/INFO records do not skew timings."""
+    os.environ["LOG_LEVEL"] = level
+    configure_logging(force=True)
+
+
+def connect(mongo_uri: Optional[str] = None):
+    """Return a pymongo client for ``mongo_uri`` or an in-process mongomock client."""
+    if mongo_uri:
+        import pymongo
+
+        return pymongo.MongoClient(mongo_uri)
+
+    import mongomock
+
+    return mongomock.MongoClient()
+
+
+def install_client(client) -> None:
+    """Make ``client`` the shared ``MongoClient`` singleton used by ``ProjData``."""
+    MongoClient.client = client
+
+
+def load_collection(collection, n_rows: int, seed: int = 42, na_fraction: float = 0.0) -> None:
+    """Drop ``collection`` and fill it with ``n_rows`` synthetic documents."""
+    collection.drop()
+    for documents in generate_documents(n_rows, seed=seed, na_fraction=na_fraction):
+        collection.insert_many(documents, ordered=False)
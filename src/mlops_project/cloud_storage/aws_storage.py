@@ -0,0 +1,347 @@
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+from mlops_project.configuration.aws_connction import S3Client
+from mlops_project.entity.config_entity import S3StorageConfig
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+LOGGER_NAME = "S3 Storage"
+
+
+class S3ObjectReader(io.RawIOBase):
+    """
+    Seekable, read-only file object over an S3 object: every read is a ranged
+    GET of the bytes asked for. Wrapped in an ``io.BufferedReader`` (see
+    ``SimpleStorageService.open_object``) so small reads share one request;
+    Parquet and Feather readers then fetch only the footer and the column
+    chunks they need.
+    """
+
+    def __init__(self, s3_client, bucket_name: str, key: str, size: int, version_id: Optional[str] = None):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.key = key
+        self.size = size
+        self.version_id = version_id
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: self.size}[whence]
+        self.position = max(base + offset, 0)
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        if self.position >= self.size or len(buffer) == 0:
+            return 0
+        end = min(self.position + len(buffer), self.size) - 1
+        request = {"Bucket": self.bucket_name, "Key": self.key, "Range": f"bytes={self.position}-{end}"}
+        if self.version_id:
+            request["VersionId"] = self.version_id
+        data = self.s3_client.get_object(**request)["Body"].read()
+
+        buffer[: len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+
+class SimpleStorageService:
+    """
+    Object operations on the shared S3 client: metadata lookups, uploads,
+    server-side copies, downloads and streaming reads. Every method raises
+    ``MyException`` on failure, except that a missing object is reported as
+    None/False where documented.
+
+    Transfers go through boto3's managed transfer with ``S3StorageConfig``:
+    objects above ``multipart_threshold`` move as ``multipart_chunksize``
+    parts, ``max_concurrency`` of them at a time, so neither side buffers a
+    whole object. Reads into pandas/NumPy stream the response body (CSV,
+    ``.npy``) or issue ranged GETs (Parquet, Feather) instead of going
+    through a local copy.
+    """
+
+    def __init__(self, s3_storage_config: S3StorageConfig = None) -> None:
+        try:
+            from boto3.s3.transfer import TransferConfig
+
+            self.s3_storage_config = s3_storage_config or S3StorageConfig()
+            self.s3_client = S3Client().s3_client
+            self.transfer_config = TransferConfig(
+                multipart_threshold=self.s3_storage_config.multipart_threshold,
+                multipart_chunksize=self.s3_storage_config.multipart_chunksize,
+                max_concurrency=self.s3_storage_config.max_concurrency,
+            )
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        response = getattr(error, "response", None) or {}
+        return response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    # ---------------------- METADATA ----------------------
+    def get_object_metadata(self, bucket_name: str, key: str) -> Optional[dict]:
+        """
+        HEAD of an object: ``etag`` (without quotes), ``version_id``, ``size``
+        and the user ``metadata``; None when the object does not exist.
+        """
+        try:
+            from botocore.exceptions import ClientError
+
+            try:
+                head = self.s3_client.head_object(Bucket=bucket_name, Key=key)
+            except ClientError as e:
+                if self._is_not_found(e):
+                    return None
+                raise
+
+            return {
+                "etag": head["ETag"].strip('"'),
+                "version_id": head.get("VersionId"),
+                "size": head["ContentLength"],
+                "metadata": head.get("Metadata", {}),
+            }
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def s3_key_path_available(self, bucket_name: str, key: str) -> bool:
+        """Whether ``key`` exists in the bucket."""
+        return self.get_object_metadata(bucket_name, key) is not None
+
+    def list_keys(self, bucket_name: str, prefix: str) -> list[str]:
+        """All keys under ``prefix``, across result pages."""
+        try:
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            return [
+                item["Key"]
+                for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+                for item in page.get("Contents", [])
+            ]
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # ---------------------- UPLOADS AND COPIES ----------------------
+    def upload_file(
+        self,
+        from_filename: str | Path,
+        bucket_name: str,
+        key: str,
+        metadata: Optional[dict] = None,
+        remove: bool = False,
+    ) -> None:
+        """
+        Uploads a local file (multipart when large), with optional user metadata.
+
+        Args:
+            from_filename (str | Path): Local file.
+            bucket_name (str): Target bucket.
+            key (str): Target key.
+            metadata (Optional[dict]): ``x-amz-meta-*`` string values.
+            remove (bool): Delete the local file after the upload.
+        """
+        logger = get_logger(LOGGER_NAME)
+
+        try:
+            logger.info(f"Uploading {from_filename} to s3://{bucket_name}/{key}")
+            self.s3_client.upload_file(
+                str(from_filename),
+                bucket_name,
+                key,
+                ExtraArgs={"Metadata": metadata} if metadata else None,
+                Config=self.transfer_config,
+            )
+            if remove:
+                os.remove(from_filename)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def upload_directory(
+        self, local_dir: str | Path, bucket_name: str, prefix: str, max_workers: Optional[int] = None
+    ) -> list[str]:
+        """
+        Uploads every file under ``local_dir`` to ``<prefix>/<relative path>``,
+        ``max_workers`` files at a time (each one multipart when large).
+
+        Args:
+            local_dir (str | Path): Directory to upload, recursively.
+            bucket_name (str): Target bucket.
+            prefix (str): Key prefix of the directory.
+            max_workers (Optional[int]): Files in flight; ``config.upload_max_workers`` by default.
+
+        Returns:
+            list[str]: Uploaded keys, in path order.
+        """
+        logger = get_logger(LOGGER_NAME)
+
+        try:
+            local_dir = Path(local_dir)
+            files = sorted(path for path in local_dir.rglob("*") if path.is_file())
+            keys = [f"{prefix.strip('/')}/{path.relative_to(local_dir).as_posix()}".lstrip("/") for path in files]
+
+            def upload(path_and_key: tuple[Path, str]) -> None:
+                path, key = path_and_key
+                self.s3_client.upload_file(str(path), bucket_name, key, Config=self.transfer_config)
+
+            start = time.perf_counter()
+            max_workers = max_workers or self.s3_storage_config.upload_max_workers
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-upload") as executor:
+                # list() re-raises the first failed upload
+                list(executor.map(upload, zip(files, keys)))
+
+            seconds = time.perf_counter() - start
+            megabytes = sum(path.stat().st_size for path in files) / 2**20
+            logger.info(
+                f"Uploaded {len(files)} files ({megabytes:.1f} MB) from {local_dir} to s3://{bucket_name}/{prefix} "
+                f"in {seconds:.2f}s ({megabytes / max(seconds, 1e-9):.1f} MB/s)"
+            )
+            return keys
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def copy_object(self, bucket_name: str, source_key: str, key: str) -> None:
+        """
+        Server-side copy within a bucket; the object's metadata is copied with it.
+        """
+        try:
+            self.s3_client.copy(
+                {"Bucket": bucket_name, "Key": source_key}, bucket_name, key, Config=self.transfer_config
+            )
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # ---------------------- DOWNLOADS AND READS ----------------------
+    def download_file(
+        self, bucket_name: str, key: str, to_filename: str | Path, version_id: Optional[str] = None
+    ) -> None:
+        """
+        Downloads an object to a local file (ranged parts in parallel when
+        large), a given version of it when ``version_id`` is set.
+        """
+        logger = get_logger(LOGGER_NAME)
+
+        try:
+            logger.info(f"Downloading s3://{bucket_name}/{key} to {to_filename}")
+            os.makedirs(os.path.dirname(to_filename) or ".", exist_ok=True)
+            self.s3_client.download_file(
+                bucket_name,
+                key,
+                str(to_filename),
+                ExtraArgs={"VersionId": version_id} if version_id else None,
+                Config=self.transfer_config,
+            )
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def open_object(self, bucket_name: str, key: str) -> io.BufferedReader:
+        """
+        Seekable binary file object over an object, reading ``read_buffer_size``
+        bytes per ranged GET. Reads stay on the version found when opening.
+
+        Raises:
+            MyException: If the object does not exist.
+        """
+        try:
+            head = self.get_object_metadata(bucket_name, key)
+            if head is None:
+                raise FileNotFoundError(f"s3://{bucket_name}/{key}")
+            raw = S3ObjectReader(self.s3_client, bucket_name, key, head["size"], version_id=head["version_id"])
+            return io.BufferedReader(raw, buffer_size=self.s3_storage_config.read_buffer_size)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def _body(self, bucket_name: str, key: str):
+        response = self.s3_client.get_object(Bucket=bucket_name, Key=key)
+        return response["Body"], response["ContentLength"]
+
+    def read_dataframe(
+        self, bucket_name: str, key: str, file_format: Optional[str] = None, columns: Optional[list[str]] = None
+    ):
+        """
+        Reads a DataFrame file written by ``write_dataframe`` straight from S3.
+
+        CSV is parsed from the response stream; Parquet and Feather are read
+        through ``open_object``, so only the requested ``columns`` are fetched.
+        """
+        from mlops_project.utils.main_utils import infer_file_format, read_dataframe
+
+        try:
+            file_format = file_format or infer_file_format(key)
+            if file_format == "csv":
+                body, _ = self._body(bucket_name, key)
+                with body:
+                    return read_dataframe(body, file_format, columns=columns)
+
+            with self.open_object(bucket_name, key) as file:
+                return read_dataframe(file, file_format, columns=columns)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def iter_dataframe_chunks(
+        self,
+        bucket_name: str,
+        key: str,
+        file_format: Optional[str] = None,
+        chunk_size: int = 250_000,
+        columns: Optional[list[str]] = None,
+    ) -> Iterator:
+        """
+        Reads a DataFrame file from S3 as chunks of at most ``chunk_size`` rows
+        (see ``main_utils.iter_dataframe_chunks``); memory is bounded by the
+        chunk, not the object.
+        """
+        from mlops_project.utils.main_utils import infer_file_format, iter_dataframe_chunks
+
+        try:
+            file_format = file_format or infer_file_format(key)
+            if file_format == "csv":
+                body, size = self._body(bucket_name, key)
+                with body:
+                    # An empty object has no header to parse
+                    if size > 0:
+                        yield from iter_dataframe_chunks(body, file_format, chunk_size=chunk_size, columns=columns)
+                return
+
+            with self.open_object(bucket_name, key) as file:
+                yield from iter_dataframe_chunks(file, file_format, chunk_size=chunk_size, columns=columns)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def read_numpy_array(self, bucket_name: str, key: str):
+        """
+        Loads a ``.npy`` array from the response stream: the data is read in
+        blocks straight into the array, without a local or in-memory copy of
+        the file.
+        """
+        try:
+            import numpy as np
+
+            body, _ = self._body(bucket_name, key)
+            with body:
+                return np.lib.format.read_array(body, allow_pickle=False)
+
+        except Exception as e:
+            raise MyException(e, sys)
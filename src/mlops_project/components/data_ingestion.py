@@ -1,45 +1,196 @@
 import os
 import sys
+import time
+import shutil
 import pandas as pd
 
-from sklearn.model_selection import train_test_split
 from mlops_project.entity.config_entity import DataIngestionConfig
 from mlops_project.entity.artifact_entity import DataIngestionArtifact
 from mlops_project.exception import MyException
 from mlops_project.logger import get_logger
 from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.constants import TARGET_COLUMN
+from mlops_project.utils.instrumentation import add_rows, increment, stage
+from mlops_project.utils.main_utils import DataFrameChunkWriter, read_dataframe, write_dataframe
+from mlops_project.utils.split_utils import (
+    StreamingStratifiedSplitter,
+    class_counts,
+    hash_test_mask,
+    stratified_split_indices,
+)
 
 
 class DataIngetion:
     """
     Main class responsible for:
-    1. Fetching data from MongoDB
-    2. Splitting into train/test
-    3. Saving train/test CSV files
+    1. Fetching data from MongoDB (full, or incrementally past a watermark)
+    2. Saving the feature store
+    3. Splitting into train/test
+    4. Saving train/test files as CSV, Parquet or Feather
+
+    In streaming split mode steps 1-4 happen chunk by chunk, straight from
+    the Mongo cursor to the train/test files.
     """
 
-    def __init__(self, data_ingestion_config: DataIngestionConfig = DataIngestionConfig()):
+    def __init__(self, data_ingestion_config: DataIngestionConfig = None):
         try:
-            self.data_ingestion_config = data_ingestion_config
+            self.data_ingestion_config = data_ingestion_config or DataIngestionConfig()
         except Exception as e:
             raise MyException(e, sys)
 
     # -------------------------------------------------------------------------
-    def export_data_into_feature_store(self) -> pd.DataFrame:
+    def _read_watermark(self):
+        """
+        Returns the persisted watermark value, or None when there is none
+        or it was recorded for a different watermark field.
+        """
+        watermark_file_path = self.data_ingestion_config.watermark_file_path
+        if not os.path.exists(watermark_file_path):
+            return None
+
+        from bson import json_util
+
+        with open(watermark_file_path, "r", encoding="utf-8") as file:
+            state = json_util.loads(file.read())
+
+        if state.get("field") != self.data_ingestion_config.watermark_field:
+            return None
+
+        return state.get("value")
+
+    # -------------------------------------------------------------------------
+    def _write_watermark(self, value) -> None:
+        """
+        Persists the watermark atomically (ObjectId/datetime kept via extended JSON).
+        """
+        from bson import json_util
+
+        watermark_file_path = self.data_ingestion_config.watermark_file_path
+        os.makedirs(os.path.dirname(watermark_file_path), exist_ok=True)
+
+        tmp_path = f"{watermark_file_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(json_util.dumps({"field": self.data_ingestion_config.watermark_field, "value": value}))
+        os.replace(tmp_path, watermark_file_path)
+
+    # -------------------------------------------------------------------------
+    def _merge_into_cache(self, cached: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
         """
-        Fetches data from MongoDB and returns it as a pandas DataFrame.
-        IMPORTANT: Your earlier code was missing `return dataframe`.
+        Appends newly fetched documents to the cached feature store.
+        Rows sharing the merge key are replaced by their newer version.
+        """
+        if new.empty:
+            return cached
+
+        merged = pd.concat([cached, new], ignore_index=True)
+
+        merge_key = self.data_ingestion_config.merge_key
+        if merge_key in merged.columns:
+            merged = merged.drop_duplicates(subset=merge_key, keep="last", ignore_index=True)
+
+        return merged
+
+    # -------------------------------------------------------------------------
+    def _write(self, dataframe: pd.DataFrame, file_path) -> None:
+        """
+        Writes a DataFrame in the configured artifact format.
+        """
+        write_dataframe(
+            dataframe,
+            file_path,
+            file_format=self.data_ingestion_config.file_format,
+            compression=self.data_ingestion_config.parquet_compression,
+        )
+
+    # -------------------------------------------------------------------------
+    def _save_feature_store(self, dataframe: pd.DataFrame) -> None:
+        """
+        Writes the feature store of this run.
+
+        In incremental mode the shared cache is rewritten atomically and the
+        run's feature_store_file_path becomes a hard link to it (a copy when
+        links are not supported), so the data is written only once.
+        """
+        config = self.data_ingestion_config
+        feature_store_file_path = config.feature_store_file_path
+        os.makedirs(os.path.dirname(feature_store_file_path), exist_ok=True)
+
+        if not config.incremental:
+            self._write(dataframe, feature_store_file_path)
+            return
+
+        cache_file_path = config.feature_store_cache_file_path
+        os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+
+        tmp_path = f"{cache_file_path}.tmp"
+        self._write(dataframe, tmp_path)
+        os.replace(tmp_path, cache_file_path)
+
+        if os.path.exists(feature_store_file_path):
+            os.remove(feature_store_file_path)
+        try:
+            os.link(cache_file_path, feature_store_file_path)
+        except OSError:
+            shutil.copyfile(cache_file_path, feature_store_file_path)
+
+    # -------------------------------------------------------------------------
+    @stage("export")
+    def export_data_into_feature_store(self, full_refresh: bool = False) -> pd.DataFrame:
+        """
+        Fetches data from MongoDB, saves it as the feature store and returns it.
+
+        With `incremental` enabled in the config, only documents whose
+        watermark field is greater than the persisted watermark are fetched
+        and merged into the cached feature store. The new watermark is taken
+        before fetching, so documents inserted meanwhile wait for the next run.
+
+        `_id` watermarks only see inserts; use an update-timestamp field
+        as `watermark_field` to also pick up modified documents.
+
+        Args:
+            full_refresh (bool): Ignore the cache and watermark and re-download everything.
         """
         logger = get_logger("ExportData")
         logger.info("Fetching data from MongoDB...")
 
         try:
+            config = self.data_ingestion_config
+            field = config.watermark_field
             my_data = ProjData()
 
-            # Fetch MongoDB data
-            dataframe = my_data.export_collection_as_dataframe(
-                collection_name=self.data_ingestion_config.collection_name
-            )
+            high = my_data.get_max_value(config.collection_name, field) if config.incremental else None
+            low = None
+            if config.incremental and not full_refresh and os.path.exists(config.feature_store_cache_file_path):
+                low = self._read_watermark()
+
+            if low is None:
+                if config.incremental:
+                    logger.info(f"Full refresh of the feature store up to {field} = {high}")
+
+                # Fetch MongoDB data
+                dataframe = my_data.export_collection_as_dataframe(
+                    collection_name=config.collection_name,
+                    query={field: {"$lte": high}} if high is not None else None,
+                    use_schema=config.use_schema,
+                    batch_size=config.export_batch_size,
+                )
+            else:
+                logger.info(f"Incremental ingestion: fetching documents with {low} < {field} <= {high}")
+
+                new_data = (
+                    my_data.export_collection_as_dataframe(
+                        collection_name=config.collection_name,
+                        query={field: {"$gt": low, "$lte": high}},
+                        use_schema=config.use_schema,
+                        batch_size=config.export_batch_size,
+                    )
+                    if high is not None and high > low
+                    else pd.DataFrame()
+                )
+                logger.info(f"Fetched {len(new_data)} new documents")
+
+                cached = read_dataframe(config.feature_store_cache_file_path, config.file_format)
+                dataframe = self._merge_into_cache(cached, new_data)
 
             # Safety check — NONE
             if dataframe is None:
@@ -50,47 +201,166 @@ class DataIngetion:
                 raise MyException("MongoDB returned empty DataFrame.", sys)
 
             logger.info(f"Shape of DataFrame fetched: {dataframe.shape}")
+            add_rows(len(dataframe))
+
+            with stage("save_feature_store", rows=len(dataframe)):
+                self._save_feature_store(dataframe)
+            if config.incremental and high is not None:
+                self._write_watermark(high)
 
-            # THE MAIN FIX — RETURN THE DATAFRAME
             return dataframe
 
         except Exception as e:
             raise MyException(e, sys)
 
     # -------------------------------------------------------------------------
-    def split_data_as_train_test_split(self, dataframe: pd.DataFrame) -> None:
+    @stage("split")
+    def split_data_as_train_test_split(self, dataframe: pd.DataFrame) -> tuple[dict, dict]:
         """
-        Takes DataFrame and splits into train and test CSV files.
+        Takes DataFrame and splits into train and test files in the configured format.
+
+        With the "stratified" strategy each TARGET_COLUMN class keeps the
+        configured test ratio (see `stratified_split_indices`); "random" uses
+        sklearn's unstratified split. Both are seeded with `random_state`.
+
+        Returns:
+            tuple[dict, dict]: Train and test row counts per class.
         """
         logger = get_logger("DataSplit")
-        logger.info("Starting train-test split...")
+        config = self.data_ingestion_config
+        logger.info(f"Starting train-test split ({config.split_strategy})...")
 
         try:
-            train_set, test_set = train_test_split(
-                dataframe,
-                test_size=self.data_ingestion_config.train_test_split_ratio
-            )
+            if config.split_strategy == "stratified":
+                if TARGET_COLUMN not in dataframe.columns:
+                    raise MyException(f"Target column '{TARGET_COLUMN}' not found for stratified split.", sys)
+
+                train_idx, test_idx = stratified_split_indices(
+                    dataframe[TARGET_COLUMN].to_numpy(),
+                    config.train_test_split_ratio,
+                    config.random_state,
+                )
+                train_set, test_set = dataframe.take(train_idx), dataframe.take(test_idx)
+            else:
+                from sklearn.model_selection import train_test_split
 
-            logger.info("Train-test split complete.")
+                train_set, test_set = train_test_split(
+                    dataframe,
+                    test_size=config.train_test_split_ratio,
+                    random_state=config.random_state,
+                )
+
+            train_counts, test_counts = (
+                (class_counts(train_set[TARGET_COLUMN]), class_counts(test_set[TARGET_COLUMN]))
+                if TARGET_COLUMN in dataframe.columns
+                else (None, None)
+            )
+            logger.info(f"Train-test split complete. Train classes: {train_counts}, test classes: {test_counts}")
 
             # Create folder if needed
-            dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
+            dir_path = os.path.dirname(config.training_file_path)
             os.makedirs(dir_path, exist_ok=True)
 
             # Save files
-            train_set.to_csv(self.data_ingestion_config.training_file_path, index=False)
-            test_set.to_csv(self.data_ingestion_config.testing_file_path, index=False)
+            with stage("write_train_test", rows=len(dataframe)):
+                self._write(train_set, config.training_file_path)
+                self._write(test_set, config.testing_file_path)
+
+            logger.info(f"Train and test {config.file_format} files saved successfully.")
 
-            logger.info("Train and test CSV files saved successfully.")
+            return train_counts, test_counts
 
         except Exception as e:
             raise MyException(e, sys)
 
     # -------------------------------------------------------------------------
-    def initiate_data_ingestion(self) -> DataIngestionArtifact:
+    @stage("streaming_split")
+    def split_collection_streaming(self) -> tuple[dict, dict]:
+        """
+        Splits the collection into train and test files without materializing it.
+
+        Chunks are read from the Mongo cursor in `_id` order and each row is
+        assigned to train or test by the configured strategy:
+        - "hash": seeded hash of `split_key`, independent of order and chunking.
+        - "stratified": running per-class counts of TARGET_COLUMN.
+        The rows are appended to the output files as they go, so peak memory
+        is bounded by the chunk size.
+
+        Returns:
+            tuple[dict, dict]: Train and test row counts per class.
+        """
+        logger = get_logger("DataSplit")
+        config = self.data_ingestion_config
+        logger.info(f"Starting streaming train-test split ({config.streaming_split_strategy})...")
+
+        try:
+            if config.streaming_split_strategy == "hash":
+                splitter = None
+            elif config.streaming_split_strategy == "stratified":
+                splitter = StreamingStratifiedSplitter(config.train_test_split_ratio, config.random_state)
+            else:
+                raise ValueError(f"Unsupported streaming split strategy '{config.streaming_split_strategy}'")
+
+            chunks = ProjData().iter_collection_as_dataframes(
+                config.collection_name,
+                use_schema=config.use_schema,
+                batch_size=config.export_batch_size,
+                sort=[("_id", 1)],
+            )
+
+            train_counts: dict[str, int] = {}
+            test_counts: dict[str, int] = {}
+
+            compression = config.parquet_compression
+            with (
+                DataFrameChunkWriter(config.training_file_path, config.file_format, compression) as train_writer,
+                DataFrameChunkWriter(config.testing_file_path, config.file_format, compression) as test_writer,
+            ):
+
+                for chunk in chunks:
+                    start = time.perf_counter()
+                    if splitter is None:
+                        if config.split_key not in chunk.columns:
+                            raise MyException(f"Split key '{config.split_key}' not found in the collection.", sys)
+                        is_test = hash_test_mask(
+                            chunk[config.split_key], config.train_test_split_ratio, config.random_state
+                        )
+                    else:
+                        is_test = splitter.assign(chunk[TARGET_COLUMN])
+
+                    assigned = time.perf_counter()
+                    train_writer.write(chunk[~is_test])
+                    test_writer.write(chunk[is_test])
+                    increment("assign_seconds", assigned - start)
+                    increment("write_seconds", time.perf_counter() - assigned)
+
+                    if splitter is None and TARGET_COLUMN in chunk.columns:
+                        labels = chunk[TARGET_COLUMN]
+                        for counts, part in ((train_counts, labels[~is_test]), (test_counts, labels[is_test])):
+                            for label, count in class_counts(part).items():
+                                counts[label] = counts.get(label, 0) + count
+
+            if train_writer.rows_written + test_writer.rows_written == 0:
+                raise MyException("MongoDB returned empty DataFrame.", sys)
+            add_rows(train_writer.rows_written + test_writer.rows_written)
+
+            logger.info(
+                f"Streaming split complete: {train_writer.rows_written} train rows, "
+                f"{test_writer.rows_written} test rows."
+            )
+
+            if splitter is not None:
+                return splitter.class_counts()
+            return (train_counts, test_counts) if train_counts or test_counts else (None, None)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def initiate_data_ingestion(self, full_refresh: bool = False) -> DataIngestionArtifact:
         """
         Main Orchestrator:
-        1. Fetch DF
+        1. Fetch DF (incrementally when configured, unless full_refresh)
         2. Split DF
         3. Return artifact
         """
@@ -98,17 +368,38 @@ class DataIngetion:
         logger.info("Initiating Data Ingestion Pipeline...")
 
         try:
+            if self.data_ingestion_config.split_mode == "streaming":
+                if self.data_ingestion_config.incremental:
+                    logger.warning(
+                        "Streaming split reads the collection directly; the incremental feature store is not used."
+                    )
+
+                train_counts, test_counts = self.split_collection_streaming()
+                artifact = DataIngestionArtifact(
+                    trained_file_path=self.data_ingestion_config.training_file_path,
+                    test_file_path=self.data_ingestion_config.testing_file_path,
+                    file_format=self.data_ingestion_config.file_format,
+                    train_class_counts=train_counts,
+                    test_class_counts=test_counts,
+                )
+                logger.info(f"Data Ingestion Artifact Created: {artifact}")
+                return artifact
+
             # STEP 1 → Fetch DF
-            dataframe = self.export_data_into_feature_store()
+            dataframe = self.export_data_into_feature_store(full_refresh=full_refresh)
             logger.info(f"DataFrame received in pipeline: {type(dataframe)}")
 
             # STEP 2 → Split DF
-            self.split_data_as_train_test_split(dataframe)
+            train_counts, test_counts = self.split_data_as_train_test_split(dataframe)
 
             # STEP 3 → Prepare Artifact
             artifact = DataIngestionArtifact(
                 trained_file_path=self.data_ingestion_config.training_file_path,
-                test_file_path=self.data_ingestion_config.testing_file_path
+                test_file_path=self.data_ingestion_config.testing_file_path,
+                file_format=self.data_ingestion_config.file_format,
+                feature_store_file_path=self.data_ingestion_config.feature_store_file_path,
+                train_class_counts=train_counts,
+                test_class_counts=test_counts,
             )
 
             logger.info(f"Data Ingestion Artifact Created: {artifact}")
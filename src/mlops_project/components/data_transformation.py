@@ -0,0 +1,284 @@
+import os
+import sys
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from mlops_project.constants import TARGET_COLUMN
+from mlops_project.entity.artifact_entity import (
+    DataIngestionArtifact,
+    DataTransformationArtifact,
+    DataValidationArtifact,
+)
+from mlops_project.entity.config_entity import DataTransformationConfig
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.utils.instrumentation import add_rows, increment, stage
+from mlops_project.utils.main_utils import (
+    count_dataframe_rows,
+    iter_dataframe_chunks,
+    load_numpy_array_data,
+    load_schema,
+    save_numpy_array_data,
+    save_object,
+)
+from mlops_project.utils.resampling_utils import (
+    balanced_sample_weights,
+    oversample_indices,
+    resample_summary,
+    sample_weights_from_indices,
+    smote_resample,
+)
+
+
+class DataTransformation:
+    """
+    Main class responsible for:
+    1. Fitting the preprocessing ColumnTransformer on the train file, chunk by chunk
+    2. Transforming train and test into float32 .npy arrays (target as last column)
+    3. Resampling the train rows for class imbalance
+    4. Saving the fitted preprocessor
+
+    The one-hot categories come from the schema, so only the scaler needs
+    the data: it is fitted on the first chunk and updated with
+    ``partial_fit`` (running mean and variance) on the others. The arrays
+    are written in place through ``np.lib.format.open_memmap``, so neither
+    file is ever held in memory whole, and can be memory-mapped by training.
+
+    Oversampling is stored as row positions and sample weights next to the
+    train array instead of a second, resampled copy of it (see
+    ``resampling_utils``); only the opt-in "smote" strategy writes new rows.
+    """
+
+    def __init__(
+        self,
+        data_ingestion_artifact: DataIngestionArtifact,
+        data_validation_artifact: DataValidationArtifact,
+        data_transformation_config: DataTransformationConfig = None,
+    ):
+        try:
+            self.data_ingestion_artifact = data_ingestion_artifact
+            self.data_validation_artifact = data_validation_artifact
+            self.data_transformation_config = data_transformation_config or DataTransformationConfig()
+            self._schema_config = load_schema(self.data_transformation_config.schema_file_path)
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def _chunks(self, file_path):
+        return iter_dataframe_chunks(
+            file_path,
+            file_format=self.data_ingestion_artifact.file_format,
+            chunk_size=self.data_transformation_config.chunk_size,
+        )
+
+    # -------------------------------------------------------------------------
+    def get_data_transformer_object(self) -> ColumnTransformer:
+        """
+        Unfitted preprocessor: scaled numeric columns, one-hot categoricals
+        (schema domains; binary columns become a single 0/1 column) and
+        passthrough columns. Other columns are dropped.
+        """
+        try:
+            domains = self._schema_config["categorical_domains"]
+            onehot_columns = self._schema_config["onehot_columns"]
+
+            return ColumnTransformer(
+                transformers=[
+                    ("scaler", StandardScaler(), self._schema_config["scale_columns"]),
+                    (
+                        "onehot",
+                        OneHotEncoder(
+                            categories=[domains[column] for column in onehot_columns],
+                            drop="if_binary",
+                            handle_unknown="ignore",
+                            sparse_output=False,
+                            dtype=np.float32,
+                        ),
+                        onehot_columns,
+                    ),
+                    ("passthrough", "passthrough", self._schema_config["passthrough_columns"]),
+                ],
+                remainder="drop",
+                sparse_threshold=0,
+                verbose_feature_names_out=False,
+            )
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def fit_preprocessor(self, file_path) -> tuple[ColumnTransformer, int]:
+        """
+        Fits the preprocessor in one pass over ``file_path``.
+
+        Returns:
+            tuple[ColumnTransformer, int]: The fitted preprocessor and the file's row count.
+        """
+        try:
+            preprocessor = self.get_data_transformer_object()
+            scale_columns = self._schema_config["scale_columns"]
+            rows = 0
+
+            for chunk in self._chunks(file_path):
+                if not len(chunk):
+                    continue
+                if rows == 0:
+                    preprocessor.fit(chunk)
+                else:
+                    preprocessor.named_transformers_["scaler"].partial_fit(chunk[scale_columns])
+                rows += len(chunk)
+                add_rows(len(chunk))
+
+            if rows == 0:
+                raise ValueError(f"No rows to fit the preprocessor on in {file_path}")
+
+            return preprocessor, rows
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def transform_file(self, preprocessor: ColumnTransformer, file_path, output_path, rows: int) -> None:
+        """
+        Transforms ``file_path`` chunk by chunk into a float32 ``(rows, n_features + 1)``
+        .npy file whose last column is TARGET_COLUMN.
+        """
+        try:
+            n_features = len(preprocessor.get_feature_names_out())
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+            output = np.lib.format.open_memmap(output_path, mode="w+", dtype=np.float32, shape=(rows, n_features + 1))
+            start = 0
+            for chunk in self._chunks(file_path):
+                end = start + len(chunk)
+                if end > rows:
+                    raise ValueError(f"{file_path} has more rows than the {rows} expected")
+
+                output[start:end, :n_features] = preprocessor.transform(chunk)
+                output[start:end, n_features] = chunk[TARGET_COLUMN].to_numpy(dtype=np.float32)
+                start = end
+                add_rows(len(chunk))
+                increment("chunks")
+
+            if start != rows:
+                raise ValueError(f"{file_path} has {start} rows, expected {rows}")
+
+            output.flush()
+            del output
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def resample_train(self, train_file_path) -> dict:
+        """
+        Applies the configured resampling strategy to the transformed train array.
+
+        Returns:
+            dict: Artifact fields: ``resampled_index_file_path``, ``sample_weight_file_path``
+            and, for "smote", the ``transformed_train_file_path`` of the materialized array.
+        """
+        logger = get_logger("Transformation")
+
+        try:
+            config = self.data_transformation_config
+            strategy = config.resampling_strategy
+            if strategy == "none":
+                return {}
+
+            train = load_numpy_array_data(train_file_path, mmap_mode="r")
+            labels = np.asarray(train[:, -1]).astype(np.int64)
+
+            if strategy == "random_oversample":
+                indices = oversample_indices(labels, config.sampling_ratio, config.random_state)
+                save_numpy_array_data(config.resampled_index_file_path, indices)
+                save_numpy_array_data(config.sample_weight_file_path, sample_weights_from_indices(indices, len(labels)))
+                logger.info(
+                    f"Random oversampling: {len(labels)} -> {len(indices)} rows "
+                    f"{resample_summary(labels, indices=indices)}"
+                )
+                return {
+                    "resampled_index_file_path": config.resampled_index_file_path,
+                    "sample_weight_file_path": config.sample_weight_file_path,
+                }
+
+            if strategy == "class_weight":
+                weights = balanced_sample_weights(labels)
+                save_numpy_array_data(config.sample_weight_file_path, weights)
+                logger.info(f"Balanced class weights: {resample_summary(labels, weights=weights)}")
+                return {"sample_weight_file_path": config.sample_weight_file_path}
+
+            # "smote": synthesizes rows, so the resampled array is materialized
+            features, resampled_labels = smote_resample(
+                np.asarray(train[:, :-1]), labels, config.sampling_ratio, config.random_state
+            )
+            resampled = np.empty((len(features), features.shape[1] + 1), dtype=np.float32)
+            resampled[:, :-1] = features
+            resampled[:, -1] = resampled_labels
+            save_numpy_array_data(config.smote_train_file_path, resampled)
+            logger.info(f"SMOTE: {len(labels)} -> {len(resampled)} rows {resample_summary(resampled_labels)}")
+            return {"transformed_train_file_path": config.smote_train_file_path}
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def initiate_data_transformation(self) -> DataTransformationArtifact:
+        """
+        Main Orchestrator:
+        1. Check the validation status
+        2. Fit the preprocessor on train
+        3. Transform train and test into .npy arrays
+        4. Resample train
+        5. Save the preprocessor and return the artifact
+        """
+        logger = get_logger("Transformation")
+        logger.info("Initiating Data Transformation...")
+
+        try:
+            # STEP 1 → Only transform validated data
+            if not self.data_validation_artifact.validation_status:
+                raise ValueError(f"Data validation failed: {self.data_validation_artifact.message}")
+
+            train_file_path = self.data_ingestion_artifact.trained_file_path
+            test_file_path = self.data_ingestion_artifact.test_file_path
+
+            # STEP 2 → Fit
+            with stage("fit"):
+                preprocessor, train_rows = self.fit_preprocessor(train_file_path)
+            feature_names = [str(name) for name in preprocessor.get_feature_names_out()]
+            logger.info(f"Preprocessor fitted on {train_rows} rows: {len(feature_names)} features")
+
+            # STEP 3 → Transform
+            config = self.data_transformation_config
+            with stage("transform_train"):
+                self.transform_file(preprocessor, train_file_path, config.transformed_train_file_path, train_rows)
+            with stage("transform_test"):
+                test_rows = count_dataframe_rows(test_file_path, self.data_ingestion_artifact.file_format)
+                self.transform_file(preprocessor, test_file_path, config.transformed_test_file_path, test_rows)
+
+            # STEP 4 → Resample
+            with stage("resample"):
+                resampled = self.resample_train(self.data_transformation_config.transformed_train_file_path)
+
+            # STEP 5 → Save preprocessor and prepare artifact
+            save_object(self.data_transformation_config.transformed_object_file_path, preprocessor)
+
+            artifact = DataTransformationArtifact(
+                **{
+                    "transformed_object_file_path": self.data_transformation_config.transformed_object_file_path,
+                    "transformed_train_file_path": self.data_transformation_config.transformed_train_file_path,
+                    "transformed_test_file_path": self.data_transformation_config.transformed_test_file_path,
+                    "feature_names": feature_names,
+                    "resampling_strategy": self.data_transformation_config.resampling_strategy,
+                    **resampled,
+                }
+            )
+
+            logger.info(f"Data Transformation Artifact Created: {artifact}")
+            return artifact
+
+        except Exception as e:
+            raise MyException(e, sys)
@@ -0,0 +1,188 @@
+import sys
+from typing import Optional
+
+from mlops_project.constants import TARGET_COLUMN
+from mlops_project.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact
+from mlops_project.entity.config_entity import DataValidationConfig
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.utils.instrumentation import add_rows, stage
+from mlops_project.utils.main_utils import iter_dataframe_chunks, load_schema, write_yaml_file
+from mlops_project.utils.split_utils import class_counts
+from mlops_project.utils.validation_utils import DatasetProfile, drift_report
+
+
+class DataValidation:
+    """
+    Main class responsible for:
+    1. Profiling the train and test files against schema.yaml, chunk by chunk
+    2. Checking column presence, dtypes, null ratios, categorical domains and numeric ranges
+    3. Comparing train and test distributions (drift report)
+    4. Writing the validation report
+
+    Each file is read once; every check works on per-column accumulators
+    updated with vectorized operations, so memory is bounded by the chunk size.
+    """
+
+    def __init__(
+        self, data_ingestion_artifact: DataIngestionArtifact, data_validation_config: DataValidationConfig = None
+    ):
+        try:
+            self.data_ingestion_artifact = data_ingestion_artifact
+            self.data_validation_config = data_validation_config or DataValidationConfig()
+            self._schema_config = load_schema(self.data_validation_config.schema_file_path)
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def profile_file(self, file_path, reference: Optional[DatasetProfile] = None) -> tuple[DatasetProfile, dict]:
+        """
+        Streams a file once and returns its profile and its TARGET_COLUMN class counts.
+        """
+        try:
+            profile = DatasetProfile(
+                self._schema_config, bins=self.data_validation_config.histogram_bins, reference=reference
+            )
+            target_counts: dict[str, int] = {}
+
+            for chunk in iter_dataframe_chunks(
+                file_path,
+                file_format=self.data_ingestion_artifact.file_format,
+                chunk_size=self.data_validation_config.chunk_size,
+            ):
+                profile.update(chunk)
+                add_rows(len(chunk))
+
+                if TARGET_COLUMN in chunk.columns:
+                    for label, count in class_counts(chunk[TARGET_COLUMN]).items():
+                        target_counts[label] = target_counts.get(label, 0) + count
+
+            return profile, target_counts
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def check_profile(
+        self, name: str, profile: DatasetProfile, target_counts: dict, expected_counts: Optional[dict]
+    ) -> list[str]:
+        """
+        Returns the schema violations of one profiled file as messages (empty when valid).
+        """
+        logger = get_logger("Validation")
+        errors = []
+
+        if profile.missing_columns:
+            errors.append(f"{name}: missing columns {profile.missing_columns}")
+        if profile.unexpected_columns:
+            # Extra columns do not break downstream stages, which select by schema
+            logger.warning(f"{name}: columns not in schema {profile.unexpected_columns}")
+
+        for column, stats in profile.columns.items():
+            if not stats.rows:
+                continue
+            summary = stats.summary()
+
+            if not summary["dtype_ok"]:
+                errors.append(
+                    f"{name}.{column}: values do not fit dtype {summary['expected_dtype']} "
+                    f"(observed {summary['observed_dtypes']})"
+                )
+            if summary["null_ratio"] > self.data_validation_config.max_null_ratio:
+                errors.append(
+                    f"{name}.{column}: null ratio {summary['null_ratio']:.4f} above "
+                    f"{self.data_validation_config.max_null_ratio}"
+                )
+            if summary.get("out_of_domain"):
+                errors.append(
+                    f"{name}.{column}: {summary['out_of_domain']} values outside the domain, "
+                    f"e.g. {list(summary['unknown_values'])}"
+                )
+            if summary.get("out_of_range"):
+                errors.append(
+                    f"{name}.{column}: {summary['out_of_range']} values outside "
+                    f"[{stats.low}, {stats.high}] (min {summary['min']}, max {summary['max']})"
+                )
+
+        if expected_counts is not None and target_counts != expected_counts:
+            errors.append(
+                f"{name}: {TARGET_COLUMN} class counts {target_counts} differ from ingestion {expected_counts}"
+            )
+
+        return errors
+
+    # -------------------------------------------------------------------------
+    def initiate_data_validation(self) -> DataValidationArtifact:
+        """
+        Main Orchestrator:
+        1. Profile train, then test (with train's histogram bins)
+        2. Check both against the schema
+        3. Build the drift report and write the validation report
+        4. Return artifact
+        """
+        logger = get_logger("Validation")
+        logger.info("Initiating Data Validation...")
+
+        try:
+            # STEP 1 → Single pass over each file
+            with stage("profile_train"):
+                train_profile, train_counts = self.profile_file(self.data_ingestion_artifact.trained_file_path)
+            with stage("profile_test"):
+                test_profile, test_counts = self.profile_file(
+                    self.data_ingestion_artifact.test_file_path, reference=train_profile
+                )
+
+            # STEP 2 → Schema checks
+            ingestion = self.data_ingestion_artifact
+            errors = self.check_profile("train", train_profile, train_counts, ingestion.train_class_counts)
+            errors += self.check_profile("test", test_profile, test_counts, ingestion.test_class_counts)
+
+            # STEP 3 → Drift and report
+            with stage("drift"):
+                drift = drift_report(
+                    train_profile,
+                    test_profile,
+                    self.data_validation_config.drift_threshold,
+                    exclude=tuple(self.data_validation_config.drift_exclude_columns),
+                )
+            if drift["drift_detected"]:
+                drifted = [column for column, result in drift["columns"].items() if result["drift"]]
+                logger.warning(f"Drift between train and test in {drifted}")
+
+            validation_status = not errors
+            message = "; ".join(errors) if errors else "Train and test files match the schema."
+
+            report = {
+                "validation_status": validation_status,
+                "message": message,
+                "errors": errors,
+                "files": {
+                    name: {
+                        "rows": profile.rows,
+                        "missing_columns": profile.missing_columns,
+                        "unexpected_columns": profile.unexpected_columns,
+                        "target_class_counts": counts,
+                        "columns": {column: stats.summary() for column, stats in profile.columns.items()},
+                    }
+                    for name, profile, counts in (
+                        ("train", train_profile, train_counts),
+                        ("test", test_profile, test_counts),
+                    )
+                },
+                "drift": drift,
+            }
+            write_yaml_file(self.data_validation_config.validation_report_file_path, report, replace=True)
+
+            # STEP 4 → Prepare Artifact
+            artifact = DataValidationArtifact(
+                validation_status=validation_status,
+                message=message,
+                validation_report_file_path=self.data_validation_config.validation_report_file_path,
+                drift_detected=drift["drift_detected"],
+            )
+
+            logger.info(f"Data Validation Artifact Created: {artifact}")
+            return artifact
+
+        except Exception as e:
+            raise MyException(e, sys)
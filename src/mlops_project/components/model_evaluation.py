@@ -0,0 +1,214 @@
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from mlops_project.constants import TARGET_COLUMN
+from mlops_project.entity.artifact_entity import (
+    DataIngestionArtifact,
+    ModelEvaluationArtifact,
+    ModelTrainerArtifact,
+)
+from mlops_project.entity.config_entity import ModelEvaluationConfig
+from mlops_project.entity.estimator import MyModel
+from mlops_project.entity.s3_estimator import Proj1Estimator
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.utils.evaluation_utils import bootstrap_metrics
+from mlops_project.utils.instrumentation import add_rows, increment, stage
+from mlops_project.utils.main_utils import (
+    iter_dataframe_chunks,
+    load_numpy_array_data,
+    save_numpy_array_data,
+    write_yaml_file,
+)
+
+
+def _file_digest(file_path) -> str:
+    with open(file_path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class ModelEvaluation:
+    """
+    Main class responsible for:
+    1. Scoring the trained and the deployed model on the test file
+    2. Bootstrapping F1 and ROC-AUC of both models and of their paired difference
+    3. Accepting the trained model only if its F1 gain is large enough and significant
+    4. Writing the evaluation report
+
+    Each model scores the test set once: its positive-class probabilities
+    are cached as .npy, keyed by the content hashes of the model and the
+    test file, so the deployed model is not rescored on every run. All
+    bootstrap resamples are computed from those probabilities at once (see
+    ``evaluation_utils``).
+    """
+
+    def __init__(
+        self,
+        data_ingestion_artifact: DataIngestionArtifact,
+        model_trainer_artifact: ModelTrainerArtifact,
+        model_evaluation_config: ModelEvaluationConfig = None,
+    ):
+        try:
+            self.data_ingestion_artifact = data_ingestion_artifact
+            self.model_trainer_artifact = model_trainer_artifact
+            self.model_evaluation_config = model_evaluation_config or ModelEvaluationConfig()
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def get_deployed_model_path(self) -> Optional[Path]:
+        """
+        Returns the deployed model file, or None when no model is deployed yet.
+
+        With a registry bucket that is the local cached copy of the registry's
+        current model, downloaded only when it changed since the last fetch.
+        """
+        config = self.model_evaluation_config
+        if config.bucket_name:
+            return Proj1Estimator(
+                config.bucket_name, model_path=config.s3_model_key_path, cache_dir=config.registry_cache_dir
+            ).fetch_model()
+
+        deployed_model_file_path = config.deployed_model_file_path
+        if deployed_model_file_path is None or not os.path.exists(deployed_model_file_path):
+            return None
+        return Path(deployed_model_file_path)
+
+    def _chunks(self, file_path, columns=None):
+        return iter_dataframe_chunks(
+            file_path,
+            file_format=self.data_ingestion_artifact.file_format,
+            chunk_size=self.model_evaluation_config.chunk_size,
+            columns=columns,
+        )
+
+    # -------------------------------------------------------------------------
+    def read_test_labels(self, test_file_path) -> np.ndarray:
+        """
+        Reads only TARGET_COLUMN of the test file.
+        """
+        try:
+            labels = [
+                chunk[TARGET_COLUMN].to_numpy(dtype=np.int64)
+                for chunk in self._chunks(test_file_path, columns=[TARGET_COLUMN])
+            ]
+            return np.concatenate(labels) if labels else np.empty(0, dtype=np.int64)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def predict_probabilities(self, model_file_path, test_file_path, test_digest: str) -> np.ndarray:
+        """
+        Positive-class probability of every test row, from the prediction cache
+        or by scoring the test file chunk by chunk (and caching the result).
+        """
+        logger = get_logger("Evaluation")
+
+        try:
+            cache_file_path = Path(self.model_evaluation_config.prediction_cache_dir) / (
+                f"{_file_digest(model_file_path)[:32]}-{test_digest[:32]}.npy"
+            )
+            if cache_file_path.exists():
+                logger.info(f"Cached test predictions of {model_file_path}")
+                increment("prediction_cache_hits")
+                return load_numpy_array_data(cache_file_path)
+
+            model = MyModel.load(model_file_path)
+            positive = list(model.classes_).index(1)
+            probabilities = []
+            for chunk in self._chunks(test_file_path):
+                probabilities.append(model.predict_proba(chunk.drop(columns=[TARGET_COLUMN]))[:, positive])
+                add_rows(len(chunk))
+            probabilities = np.concatenate(probabilities) if probabilities else np.empty(0)
+
+            save_numpy_array_data(cache_file_path, probabilities)
+            increment("prediction_cache_misses")
+            return probabilities
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def initiate_model_evaluation(self) -> ModelEvaluationArtifact:
+        """
+        Main Orchestrator:
+        1. Score the trained and the deployed model on test (cached)
+        2. Bootstrap the metrics and their paired differences
+        3. Decide, write the report and return the artifact
+        """
+        logger = get_logger("Evaluation")
+        logger.info("Initiating Model Evaluation...")
+
+        try:
+            config = self.model_evaluation_config
+            test_file_path = self.data_ingestion_artifact.test_file_path
+            trained_model_path = self.model_trainer_artifact.trained_model_file_path
+            deployed_model_path = self.get_deployed_model_path()
+
+            # STEP 1 → One scoring of the test set per model
+            test_digest = _file_digest(test_file_path)
+            labels = self.read_test_labels(test_file_path)
+            scores = {}
+            if deployed_model_path is not None:
+                with stage("predict_deployed"):
+                    scores["deployed"] = self.predict_probabilities(deployed_model_path, test_file_path, test_digest)
+            with stage("predict_trained"):
+                scores["trained"] = self.predict_probabilities(trained_model_path, test_file_path, test_digest)
+
+            # STEP 2 → Bootstrap
+            with stage("bootstrap", rows=len(labels)):
+                metrics = bootstrap_metrics(
+                    labels, scores, n_boot=config.n_bootstrap, confidence=config.confidence, seed=config.random_state
+                )
+
+            # STEP 3 → Decision
+            if deployed_model_path is None:
+                is_model_accepted, changed_accuracy = True, metrics["models"]["trained"]["f1"]
+                f1_difference_ci, p_not_better = None, None
+                reason = "No model is deployed yet"
+            else:
+                difference = metrics["differences"]["trained_minus_deployed"]
+                changed_accuracy = difference["f1"]
+                f1_difference_ci, p_not_better = difference["f1_ci"], difference["f1_p_not_better"]
+                # A large enough gain whose whole confidence interval is above 0
+                is_model_accepted = changed_accuracy >= config.changed_threshold_score and f1_difference_ci[0] > 0
+                reason = (
+                    f"F1 change {changed_accuracy:+.4f} (CI {f1_difference_ci}), "
+                    f"threshold {config.changed_threshold_score}"
+                )
+
+            write_yaml_file(
+                config.evaluation_report_file_path,
+                {
+                    "is_model_accepted": is_model_accepted,
+                    "reason": reason,
+                    "trained_model_path": str(trained_model_path),
+                    "deployed_model_path": None if deployed_model_path is None else str(deployed_model_path),
+                    "test_file_path": str(test_file_path),
+                    "changed_threshold_score": config.changed_threshold_score,
+                    **metrics,
+                },
+                replace=True,
+            )
+            logger.info(f"Trained model {'accepted' if is_model_accepted else 'rejected'}: {reason}")
+
+            artifact = ModelEvaluationArtifact(
+                is_model_accepted=is_model_accepted,
+                changed_accuracy=changed_accuracy,
+                trained_model_path=trained_model_path,
+                deployed_model_path=deployed_model_path,
+                evaluation_report_file_path=config.evaluation_report_file_path,
+                f1_difference_ci=f1_difference_ci,
+                p_not_better=p_not_better,
+            )
+
+            logger.info(f"Model Evaluation Artifact Created: {artifact}")
+            return artifact
+
+        except Exception as e:
+            raise MyException(e, sys)
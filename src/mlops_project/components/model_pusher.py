@@ -0,0 +1,85 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from mlops_project.entity.artifact_entity import ModelEvaluationArtifact, ModelPusherArtifact
+from mlops_project.entity.config_entity import ModelPusherConfig
+from mlops_project.entity.s3_estimator import Proj1Estimator
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+
+class ModelPusher:
+    """
+    Main class responsible for:
+    1. Skipping models rejected by the evaluation
+    2. Pushing an accepted model to the S3 model registry as a new version
+       (or, without a bucket, copying it to the local deployed model path)
+    """
+
+    def __init__(
+        self, model_evaluation_artifact: ModelEvaluationArtifact, model_pusher_config: ModelPusherConfig = None
+    ):
+        try:
+            self.model_evaluation_artifact = model_evaluation_artifact
+            self.model_pusher_config = model_pusher_config or ModelPusherConfig()
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def deploy_locally(self, trained_model_path) -> Path:
+        """
+        Copies the model to the deployed model path; the copy is renamed into
+        place, so a serving process never loads a partial file.
+        """
+        deployed_model_file_path = Path(self.model_pusher_config.deployed_model_file_path)
+        os.makedirs(deployed_model_file_path.parent, exist_ok=True)
+        temporary_path = deployed_model_file_path.with_name(f".{deployed_model_file_path.name}.{os.getpid()}.tmp")
+        shutil.copyfile(trained_model_path, temporary_path)
+        os.replace(temporary_path, deployed_model_file_path)
+        return deployed_model_file_path
+
+    # -------------------------------------------------------------------------
+    def initiate_model_pusher(self) -> ModelPusherArtifact:
+        """
+        Main Orchestrator:
+        1. Skip a rejected model
+        2. Push to the registry, or deploy locally without a bucket
+        3. Return the artifact
+        """
+        logger = get_logger("Model Pusher")
+        logger.info("Initiating Model Pusher...")
+
+        try:
+            config = self.model_pusher_config
+            trained_model_path = self.model_evaluation_artifact.trained_model_path
+
+            # STEP 1 → Only accepted models are deployed
+            if not self.model_evaluation_artifact.is_model_accepted:
+                logger.info("Trained model was not accepted; nothing to push")
+                return ModelPusherArtifact(is_pushed=False)
+
+            # STEP 2 → Registry or local deployment
+            if config.bucket_name:
+                estimator = Proj1Estimator(
+                    config.bucket_name, model_path=config.s3_model_key_path, cache_dir=config.registry_cache_dir
+                )
+                pushed = estimator.save_model(trained_model_path)
+                artifact = ModelPusherArtifact(
+                    is_pushed=True,
+                    bucket_name=config.bucket_name,
+                    s3_model_path=pushed["s3_model_path"],
+                    model_version=pushed["version"],
+                )
+            else:
+                artifact = ModelPusherArtifact(
+                    is_pushed=True, deployed_model_path=self.deploy_locally(trained_model_path)
+                )
+
+            # STEP 3 → Artifact
+            logger.info(f"Model Pusher Artifact Created: {artifact}")
+            return artifact
+
+        except Exception as e:
+            raise MyException(e, sys)
@@ -0,0 +1,297 @@
+import importlib
+import sys
+import time
+
+import numpy as np
+
+from mlops_project.entity.artifact_entity import (
+    ClassificationMetricArtifact,
+    DataTransformationArtifact,
+    ModelTrainerArtifact,
+)
+from mlops_project.entity.config_entity import ModelTrainerConfig
+from mlops_project.entity.estimator import MyModel
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.utils.instrumentation import stage
+from mlops_project.utils.main_utils import (
+    load_numpy_array_data,
+    load_object,
+    read_yaml_file,
+    write_yaml_file,
+)
+
+SEARCH_STRATEGIES = ("grid", "random", "halving_grid", "halving_random")
+
+
+def _plain_params(params: dict) -> dict:
+    """Search parameters with NumPy scalars as Python values, for YAML reports."""
+    return {name: value.item() if isinstance(value, np.generic) else value for name, value in params.items()}
+
+
+class ModelTrainer:
+    """
+    Main class responsible for:
+    1. Loading the transformed train/test arrays memory-mapped
+    2. Searching the hyperparameter space of config/model.yaml (grid, random or successive halving)
+    3. Scoring the best model on test and saving it with the preprocessor
+
+    Candidates are fitted on a pool of loky worker processes. The train
+    array is an ``np.memmap``, which joblib hands to the workers by file
+    name, so every worker maps the same pages instead of unpickling its own
+    copy. Successive halving scores every candidate on a fraction of the
+    rows first and only gives more rows to the best ``1/factor`` of them.
+    """
+
+    def __init__(
+        self, data_transformation_artifact: DataTransformationArtifact, model_trainer_config: ModelTrainerConfig = None
+    ):
+        try:
+            self.data_transformation_artifact = data_transformation_artifact
+            self.model_trainer_config = model_trainer_config or ModelTrainerConfig()
+            self._model_config = read_yaml_file(self.model_trainer_config.model_config_file_path)
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def load_training_data(self) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]:
+        """
+        Returns the memory-mapped train features, the labels and the sample
+        weights of the resampling (None without). Estimators whose ``fit``
+        takes no ``sample_weight`` get the oversampled rows materialized instead.
+        """
+        artifact = self.data_transformation_artifact
+        train = load_numpy_array_data(artifact.transformed_train_file_path, mmap_mode="r")
+        features, labels = train[:, :-1], np.asarray(train[:, -1]).astype(np.int64)
+
+        sample_weight = None
+        if artifact.sample_weight_file_path is not None:
+            sample_weight = load_numpy_array_data(artifact.sample_weight_file_path)
+
+        if sample_weight is not None and not self._accepts_sample_weight():
+            if artifact.resampled_index_file_path is None:
+                raise ValueError(f"{self._model_config['estimator']['class']} does not accept sample_weight")
+
+            get_logger("ModelTrainer").warning("Estimator takes no sample_weight: materializing the oversampled rows")
+            indices = load_numpy_array_data(artifact.resampled_index_file_path)
+            return np.asarray(features[indices]), labels[indices], None
+
+        return features, labels, sample_weight
+
+    def _estimator_class(self):
+        module_name, _, class_name = self._model_config["estimator"]["class"].rpartition(".")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def _accepts_sample_weight(self) -> bool:
+        from sklearn.utils.validation import has_fit_parameter
+
+        return has_fit_parameter(self._estimator_class()(), "sample_weight")
+
+    # -------------------------------------------------------------------------
+    def _param_space(self, sampled: bool) -> dict:
+        """
+        ``param_grid`` of model.yaml; for sampled searches, ``{distribution: ...}``
+        entries become scipy.stats distributions.
+        """
+        space = {}
+        for name, values in self._model_config["param_grid"].items():
+            if isinstance(values, dict):
+                if not sampled:
+                    raise ValueError(f"Parameter '{name}' is a distribution; use a random search strategy")
+                from scipy import stats
+
+                spec = dict(values)
+                distribution = spec.pop("distribution")
+                if distribution in ("uniform", "loguniform"):
+                    low, high = spec["low"], spec["high"]
+                    if distribution == "uniform":
+                        space[name] = stats.uniform(low, high - low)
+                    else:
+                        space[name] = stats.loguniform(low, high)
+                else:
+                    space[name] = getattr(stats, distribution)(**spec)
+            else:
+                space[name] = list(values)
+        return space
+
+    def get_search_object(self):
+        """
+        Builds the unfitted scikit-learn search of the configured strategy.
+        """
+        try:
+            search_config = self._model_config.get("search", {})
+            strategy = search_config.get("strategy", "grid")
+            if strategy not in SEARCH_STRATEGIES:
+                raise ValueError(f"Unsupported search strategy '{strategy}', expected one of {list(SEARCH_STRATEGIES)}")
+
+            estimator = self._estimator_class()(**self._model_config["estimator"].get("params", {}))
+            common = {
+                "scoring": search_config.get("scoring", "f1"),
+                "cv": search_config.get("cv", 3),
+                "n_jobs": self.model_trainer_config.n_jobs,
+                "refit": True,
+            }
+            sampled = strategy.endswith("random")
+            space = self._param_space(sampled)
+
+            if strategy == "grid":
+                from sklearn.model_selection import GridSearchCV
+
+                return GridSearchCV(estimator, space, **common)
+            if strategy == "random":
+                from sklearn.model_selection import RandomizedSearchCV
+
+                return RandomizedSearchCV(
+                    estimator,
+                    space,
+                    n_iter=search_config.get("n_iter", 20),
+                    random_state=search_config.get("random_state"),
+                    **common,
+                )
+
+            from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+            from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
+
+            halving = {
+                "factor": search_config.get("factor", 3),
+                "min_resources": search_config.get("min_resources", "exhaust"),
+                "resource": "n_samples",
+                "random_state": search_config.get("random_state"),
+            }
+            if strategy == "halving_grid":
+                return HalvingGridSearchCV(estimator, space, **halving, **common)
+            return HalvingRandomSearchCV(
+                estimator, space, n_candidates=search_config.get("n_iter", 20), **halving, **common
+            )
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def _search_report(self, search, seconds: float) -> dict:
+        results = search.cv_results_
+        candidates = [
+            {
+                "params": _plain_params(params),
+                "mean_test_score": round(float(results["mean_test_score"][i]), 6),
+                "std_test_score": round(float(results["std_test_score"][i]), 6),
+                "mean_fit_seconds": round(float(results["mean_fit_time"][i]), 4),
+                "rank": int(results["rank_test_score"][i]),
+                **(
+                    {"iteration": int(results["iter"][i]), "n_resources": int(results["n_resources"][i])}
+                    if "iter" in results
+                    else {}
+                ),
+            }
+            for i, params in enumerate(results["params"])
+        ]
+        candidates.sort(key=lambda candidate: (candidate.get("iteration", 0), -candidate["mean_test_score"]))
+
+        report = {
+            "estimator": self._model_config["estimator"]["class"],
+            "search": self._model_config.get("search", {}),
+            "n_jobs": self.model_trainer_config.n_jobs,
+            "search_seconds": round(seconds, 3),
+            "refit_seconds": round(float(search.refit_time_), 3),
+            "best_params": _plain_params(search.best_params_),
+            "best_cv_score": round(float(search.best_score_), 6),
+            "candidates": candidates,
+        }
+        if hasattr(search, "n_resources_"):
+            report["halving"] = {
+                "n_candidates": [int(n) for n in search.n_candidates_],
+                "n_resources": [int(n) for n in search.n_resources_],
+            }
+        return report
+
+    def search_model(self, features, labels, sample_weight=None):
+        """
+        Runs the hyperparameter search on a loky process pool.
+
+        Returns:
+            tuple: The fitted search object and its report (per-candidate scores and timings).
+        """
+        logger = get_logger("ModelTrainer")
+
+        try:
+            from joblib import parallel_config
+
+            search = self.get_search_object()
+            fit_params = {} if sample_weight is None else {"sample_weight": sample_weight}
+
+            start = time.perf_counter()
+            # Arrays over 1 MB that are not memmaps already are dumped once to a shared memmap
+            with parallel_config(backend="loky", max_nbytes="1M", mmap_mode="r"):
+                search.fit(features, labels, **fit_params)
+            seconds = time.perf_counter() - start
+
+            report = self._search_report(search, seconds)
+            logger.info(
+                f"{type(search).__name__}: {len(report['candidates'])} candidate evaluations in {seconds:.2f}s, "
+                f"best {report['best_params']} (cv {search.best_score_:.4f})"
+            )
+            return search, report
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def initiate_model_trainer(self) -> ModelTrainerArtifact:
+        """
+        Main Orchestrator:
+        1. Load the arrays
+        2. Search and refit the best model
+        3. Score on test and check the expected score
+        4. Save the model with its preprocessor and return the artifact
+        """
+        logger = get_logger("ModelTrainer")
+        logger.info("Initiating Model Trainer...")
+
+        try:
+            from sklearn.metrics import f1_score, precision_score, recall_score
+
+            # STEP 1 → Memory-mapped arrays
+            features, labels, sample_weight = self.load_training_data()
+            test = load_numpy_array_data(self.data_transformation_artifact.transformed_test_file_path, mmap_mode="r")
+            x_test, y_test = test[:, :-1], np.asarray(test[:, -1]).astype(np.int64)
+
+            # STEP 2 → Search
+            with stage("search", rows=len(labels)):
+                search, report = self.search_model(features, labels, sample_weight)
+            model = search.best_estimator_
+
+            # STEP 3 → Test metrics
+            with stage("score_test", rows=len(y_test)):
+                y_pred = model.predict(x_test)
+            metric_artifact = ClassificationMetricArtifact(
+                f1_score=float(f1_score(y_test, y_pred, zero_division=0)),
+                precision_score=float(precision_score(y_test, y_pred, zero_division=0)),
+                recall_score=float(recall_score(y_test, y_pred, zero_division=0)),
+            )
+            report["test_metrics"] = {name: round(value, 6) for name, value in vars(metric_artifact).items()}
+            write_yaml_file(self.model_trainer_config.search_report_file_path, report, replace=True)
+
+            if metric_artifact.f1_score < self.model_trainer_config.expected_score:
+                raise ValueError(
+                    f"Best model test f1 {metric_artifact.f1_score:.4f} is below the expected "
+                    f"{self.model_trainer_config.expected_score}"
+                )
+
+            # STEP 4 → Save model with its preprocessor
+            preprocessing_object = load_object(self.data_transformation_artifact.transformed_object_file_path)
+            MyModel(preprocessing_object, model).save(self.model_trainer_config.trained_model_file_path)
+
+            artifact = ModelTrainerArtifact(
+                trained_model_file_path=self.model_trainer_config.trained_model_file_path,
+                metric_artifact=metric_artifact,
+                best_params=report["best_params"],
+                best_cv_score=report["best_cv_score"],
+                search_report_file_path=self.model_trainer_config.search_report_file_path,
+                search_seconds=report["search_seconds"],
+            )
+
+            logger.info(f"Model Trainer Artifact Created: {artifact}")
+            return artifact
+
+        except Exception as e:
+            raise MyException(e, sys)
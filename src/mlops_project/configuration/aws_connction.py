@@ -0,0 +1,88 @@
+import os
+import sys
+import threading
+
+from mlops_project.constants import (
+    AWS_ACCESS_KEY_ID_ENV_KEY,
+    AWS_SECRET_ACCESS_KEY_ENV_KEY,
+    REGION_NAME,
+    S3_MAX_POOL_CONNECTIONS,
+)
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+
+class S3Client:
+    """
+    A Singleton-style S3 client manager.
+
+    One ``boto3`` S3 client is shared by the whole process; boto3 clients
+    are thread-safe, so upload/download worker threads share it too.
+
+    NOTES
+    -----
+    - Credentials come from AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY when
+      both are set, otherwise from boto3's default chain (shared config
+      files, instance or task role ...).
+
+    - ``AWS_ENDPOINT_URL`` (read by boto3 itself) points the client at an
+      S3-compatible store such as MinIO.
+
+    - ``boto3`` is imported when the shared client is first created, not
+      when this module is imported.
+
+    - The connection pool holds S3_MAX_POOL_CONNECTIONS connections, one per
+      part of concurrent multipart transfers (botocore's default is 10).
+
+    Attributes
+    ----------
+    s3_client : botocore.client.S3 or None
+        The shared client.
+    """
+
+    s3_client = None
+    _lock = threading.Lock()
+
+    def __init__(self, region_name: str = REGION_NAME) -> None:
+        """
+        Create the shared client on first use.
+
+        Parameters
+        ----------
+        region_name : str
+            AWS region of the client.
+
+        Raises
+        ------
+        MyException
+            If only one of the two credential variables is set, or boto3 fails.
+        """
+        logger = get_logger("S3 Connection")
+
+        try:
+            if S3Client.s3_client is None:
+                with S3Client._lock:
+                    if S3Client.s3_client is None:
+                        access_key_id = os.getenv(AWS_ACCESS_KEY_ID_ENV_KEY)
+                        secret_access_key = os.getenv(AWS_SECRET_ACCESS_KEY_ENV_KEY)
+                        if bool(access_key_id) != bool(secret_access_key):
+                            raise ValueError(
+                                f"Set both {AWS_ACCESS_KEY_ID_ENV_KEY} and {AWS_SECRET_ACCESS_KEY_ENV_KEY}, or neither"
+                            )
+
+                        import boto3
+                        from botocore.config import Config
+
+                        logger.info("Creating a new S3 client...")
+                        S3Client.s3_client = boto3.client(
+                            "s3",
+                            aws_access_key_id=access_key_id or None,
+                            aws_secret_access_key=secret_access_key or None,
+                            region_name=region_name,
+                            config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS),
+                        )
+
+            self.s3_client = S3Client.s3_client
+
+        except Exception as e:
+            raise MyException(e, sys)
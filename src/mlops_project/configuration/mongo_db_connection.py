@@ -1,23 +1,51 @@
+import importlib.util
 import os
 import sys
-import pymongo
-import certifi
+import threading
+from typing import Optional
 
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.entity.config_entity import MongoClientConfig
 from mlops_project.exception import MyException
 from mlops_project.logger import get_logger
-from mlops_project.constants import DATABASE_NAME
 from mlops_project.utils.mongo_utils import create_mongo_uri
 
-# Load trusted CA certificate for secure MongoDB Atlas connection
-ca = certifi.where()
+# Compressor -> Python package pymongo needs for it (zlib is in the standard library)
+_COMPRESSOR_PACKAGES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+
+def available_compressors(compressors: str) -> list[str]:
+    """
+    The compressors of a comma-separated list whose Python package is
+    installed, in the same order; pymongo would warn about the others.
+    """
+    names = [name.strip() for name in compressors.split(",") if name.strip()]
+    return [
+        name for name in names if name in _COMPRESSOR_PACKAGES and importlib.util.find_spec(_COMPRESSOR_PACKAGES[name])
+    ]
+
+
+def _read_preference(name: str):
+    from pymongo import ReadPreference
+
+    modes = {
+        "primary": ReadPreference.PRIMARY,
+        "primaryPreferred": ReadPreference.PRIMARY_PREFERRED,
+        "secondary": ReadPreference.SECONDARY,
+        "secondaryPreferred": ReadPreference.SECONDARY_PREFERRED,
+        "nearest": ReadPreference.NEAREST,
+    }
+    if name not in modes:
+        raise ValueError(f"Unknown read preference '{name}', expected one of {list(modes)}")
+    return modes[name]
 
 
 class MongoClient:
     """
-    A Singleton-style MongoDB client manager.
+    A Singleton-style MongoDB connection manager.
 
-    This class establishes and maintains **one shared MongoDB connection**
-    across the entire application.
+    This class establishes and maintains **one shared MongoDB client** (and
+    its connection pool) per process across the entire application.
 
     NOTES
     -----
@@ -27,6 +55,26 @@ class MongoClient:
 
     - MongoDB credentials must be available via:
         MONGO_USER, MONGO_PASSWORD, MONGO_HOST, CLUSTER
+      unless ``MongoClientConfig.uri`` is given.
+
+    - The URI is built and the client created once, under a lock, on first
+      use; later instantiations only select a database.
+
+    - Pool size, wire compression and read preferences come from
+      ``MongoClientConfig`` (see ``configure``). Threads of the parallel
+      export and of batch scoring each hold one pooled connection, so
+      ``max_pool_size`` bounds their useful number (see ``pool_settings``).
+
+    - A pymongo client must not be used across ``fork``: a forked child
+      drops the client created by its parent and creates its own on first
+      use. A client installed with ``MongoClient.client = ...`` (e.g. mongomock
+      in tests) is kept.
+
+    - Async code (``AsyncProjData``) gets its own ``AsyncMongoClient`` with
+      the same settings from ``create_async_client``.
+
+    - ``pymongo`` and ``certifi`` are imported when the shared client is
+      first created, not when this module is imported.
 
     Attributes
     ----------
@@ -35,14 +83,22 @@ class MongoClient:
 
     database : pymongo.database.Database
         Reference to the active database within MongoDB.
+
+    bulk_database : pymongo.database.Database
+        The same database read with ``bulk_read_preference``, for exports
+        and batch scoring.
     """
 
     # Shared Mongo client (singleton instance for entire app)
     client = None
+    config: Optional[MongoClientConfig] = None
+    # The client this class created (not an installed one), dropped in forked children
+    _created_client = None
+    _lock = threading.Lock()
 
     def __init__(self, database_name: str = DATABASE_NAME) -> None:
         """
-        Initialize MongoDB connection and select the target database.
+        Select the target database on the shared client, creating it on first use.
 
         Parameters
         ----------
@@ -56,36 +112,135 @@ class MongoClient:
             - If URI creation fails.
             - If connection to MongoDB fails.
         """
-        logger = get_logger("MongoDB Connection")
-
         try:
-            # Build URI from environment variables
-            mongo_db_uri = create_mongo_uri()
+            # Get database (PyMongo 4.x compatible)
+            self.database, self.bulk_database = MongoClient.get_databases(MongoClient.get_client(), database_name)
+
+        except Exception as e:
+            raise MyException(e, sys)
 
-            if not mongo_db_uri:
-                raise MyException(
-                    "MongoDB URI creation failed. Missing required environment variables.",
-                    sys
-                )
+    # ---------------------- SHARED CLIENT ----------------------
+    @classmethod
+    def get_config(cls) -> MongoClientConfig:
+        return cls.config or MongoClientConfig()
 
-            # Create new client only once (singleton)
-            if MongoClient.client is None:
-                logger.info("Creating a new MongoDB client...")
+    @classmethod
+    def configure(cls, config: MongoClientConfig) -> None:
+        """
+        Set the settings of the shared client, e.g. a larger pool before a
+        parallel export. A client created with other settings is closed, and
+        the next use creates one with these.
+        """
+        with cls._lock:
+            if config == cls.config:
+                return
+            cls.config = config
+            if cls.client is not None and cls.client is cls._created_client:
+                get_logger("MongoDB Connection").info("MongoDB settings changed; closing the current client")
+                cls.client.close()
+                cls.client = cls._created_client = None
+
+    @classmethod
+    def pool_settings(cls) -> dict:
+        """Settings of the shared client's pool, for sizing worker threads and logging."""
+        config = cls.get_config()
+        return {
+            "max_pool_size": config.max_pool_size,
+            "min_pool_size": config.min_pool_size,
+            "max_idle_time_ms": config.max_idle_time_ms,
+            "compressors": available_compressors(config.compressors),
+            "read_preference": config.read_preference,
+            "bulk_read_preference": config.bulk_read_preference,
+        }
+
+    @classmethod
+    def get_client(cls):
+        """
+        The shared ``pymongo.MongoClient``, created on first use.
+        """
+        client = cls.client
+        if client is not None:
+            return client
+
+        with cls._lock:
+            # Another thread may have created it while this one waited
+            if cls.client is None:
+                cls.client = cls._created_client = cls._create_client(cls.get_config())
+            return cls.client
+
+    @classmethod
+    def get_databases(cls, client, database_name: str = DATABASE_NAME) -> tuple:
+        """
+        The database of a (sync or async) client, and the same database
+        read with the bulk read preference.
+        """
+        bulk_read_preference = _read_preference(cls.get_config().bulk_read_preference)
+        return (
+            client.get_database(database_name),
+            client.get_database(database_name, read_preference=bulk_read_preference),
+        )
+
+    @classmethod
+    def create_async_client(cls, config: Optional[MongoClientConfig] = None):
+        """
+        A new ``pymongo.AsyncMongoClient`` with the shared client's settings.
 
-                MongoClient.client = pymongo.MongoClient(
-                    mongo_db_uri,
-                    tlsCAFile=ca,  # fixes SSL CERTIFICATE_VERIFY_FAILED issues
-                )
+        Async clients are bound to the event loop they first run on, so they
+        are not shared; the caller closes it (``await client.close()``).
+        """
+        from pymongo import AsyncMongoClient
+
+        mongo_db_uri, options = cls._client_options(config or cls.get_config())
+        get_logger("MongoDB Connection").info(f"Creating a new async MongoDB client in process {os.getpid()}")
+        return AsyncMongoClient(mongo_db_uri, **options)
+
+    @staticmethod
+    def _client_options(config: MongoClientConfig) -> tuple[str, dict]:
+        """The URI and the pymongo client options for ``config``."""
+        # Build URI from environment variables
+        mongo_db_uri = config.uri or create_mongo_uri()
+        if not mongo_db_uri:
+            raise MyException("MongoDB URI creation failed. Missing required environment variables.", sys)
+
+        options = {
+            "maxPoolSize": config.max_pool_size,
+            "minPoolSize": config.min_pool_size,
+            "maxIdleTimeMS": config.max_idle_time_ms,
+            "serverSelectionTimeoutMS": config.server_selection_timeout_ms,
+            "readPreference": config.read_preference,
+        }
+        compressors = available_compressors(config.compressors)
+        if compressors:
+            options["compressors"] = ",".join(compressors)
+        if mongo_db_uri.startswith("mongodb+srv://"):
+            import certifi
+
+            # Trusted CA certificate for secure MongoDB Atlas connection;
+            # fixes SSL CERTIFICATE_VERIFY_FAILED issues
+            options["tlsCAFile"] = certifi.where()
+        return mongo_db_uri, options
+
+    @staticmethod
+    def _create_client(config: MongoClientConfig):
+        logger = get_logger("MongoDB Connection")
+        mongo_db_uri, options = MongoClient._client_options(config)
 
-                logger.info("MongoDB client created successfully.")
+        import pymongo
 
-            else:
-                logger.info("Reusing existing MongoDB client.")
+        logger.info(
+            f"Creating a new MongoDB client in process {os.getpid()} "
+            f"(pool {config.min_pool_size}-{config.max_pool_size}, compressors {options.get('compressors', 'none')}, "
+            f"read preference {config.read_preference})"
+        )
+        return pymongo.MongoClient(mongo_db_uri, **options)
 
-            # Get database (PyMongo 4.x compatible)
-            self.database = MongoClient.client.get_database(database_name)
+    @classmethod
+    def _after_fork_in_child(cls) -> None:
+        # The parent's sockets and monitor threads are not usable here; never close them from the child
+        cls._lock = threading.Lock()
+        if cls.client is not None and cls.client is cls._created_client:
+            cls.client = None
+        cls._created_client = None
 
-            logger.info(f"Connected to database: {database_name}")
 
-        except Exception as e:
-            raise MyException(e, sys)
+os.register_at_fork(after_in_child=MongoClient._after_fork_in_child)
@@ -4,18 +4,71 @@ PROJECT CONSTANTS
 """
 import os
 import datetime
-from from_root import from_root
 from pathlib import Path
 from datetime import date
 
 # MongoDB details
 DATABASE_NAME = "Proj1"
 COLLECTION_NAME = "Proj1-Data"
+MONGO_EXPORT_BATCH_SIZE : int = 50_000
+MONGO_EXPORT_NUM_WORKERS : int = 1
+MONGO_EXPORT_PARTITION_FIELD : str = "_id"
+# Connection pool of the shared client: parallel export and bulk-scoring threads
+# each hold one connection while they fetch or write
+MONGO_MAX_POOL_SIZE : int = 100
+MONGO_MIN_POOL_SIZE : int = 0
+MONGO_MAX_IDLE_TIME_MS : int = 300_000
+MONGO_SERVER_SELECTION_TIMEOUT_MS : int = 30_000
+# Wire compression, in order of preference; codecs whose Python package is missing are skipped
+MONGO_COMPRESSORS : str = "zstd,snappy,zlib"
+MONGO_READ_PREFERENCE : str = "primary"
+# Bulk reads (exports, batch scoring) may go to secondaries and spare the primary
+MONGO_BULK_READ_PREFERENCE : str = "secondaryPreferred"
+# Async point lookups: concurrent lookups of one collection and field within the
+# wait are answered by a single $in query of at most the batch size keys
+MONGO_LOOKUP_FIELD : str = "id"
+MONGO_LOOKUP_MAX_BATCH_SIZE : int = 500
+MONGO_LOOKUP_MAX_WAIT_MS : float = 1.0
+
+# AWS details
+AWS_ACCESS_KEY_ID_ENV_KEY = "AWS_ACCESS_KEY_ID"
+AWS_SECRET_ACCESS_KEY_ENV_KEY = "AWS_SECRET_ACCESS_KEY"
+REGION_NAME = "us-east-1"
+# S3 transfers: objects above the threshold move in parts of the chunk size,
+# max concurrency parts at a time; directory uploads run that many files at once
+S3_MULTIPART_THRESHOLD : int = 16 * 2**20
+S3_MULTIPART_CHUNKSIZE : int = 16 * 2**20
+S3_MAX_CONCURRENCY : int = 8
+S3_UPLOAD_MAX_WORKERS : int = 4
+S3_READ_BUFFER_SIZE : int = 8 * 2**20  # bytes per ranged GET of random-access reads (Parquet, Feather)
+# Enough HTTP connections for every part of every file uploaded at once
+S3_MAX_POOL_CONNECTIONS : int = S3_MAX_CONCURRENCY * S3_UPLOAD_MAX_WORKERS
 
 PIPELINE_NAME : str = "My_Pipeline"
 ARTIFACT_DIR : str = "arftifact"
 
+"""
+Stage cache related constant start with STAGE_CACHE
+"""
+STAGE_CACHE_ENABLED : bool = True
+STAGE_CACHE_DIR_NAME : str = "stage_cache"
+STAGE_CACHE_REPORT_FILE_NAME : str = "stage_cache_report.json"
+STAGE_CACHE_MAX_AGE_DAYS : float = 14
+STAGE_CACHE_MAX_TOTAL_BYTES : int = 10 * 1024**3  # 10 GB of timestamped artifact dirs
+
+"""
+Run instrumentation related constant start with RUN_REPORT / PROFILE
+"""
+RUN_REPORT_FILE_NAME : str = "run_report.json"
+PROFILE_ENV_VAR : str = "MLOPS_PROFILE"  # "cprofile" or "tracemalloc"
+PROFILE_CPROFILE_FILE_NAME : str = "profile.prof"
+PROFILE_TRACEMALLOC_FILE_NAME : str = "tracemalloc.txt"
+PROFILE_TRACEMALLOC_TOP : int = 25
+
 MODEL_FILE_NAME = "model.pkl"
+# Saved models are loaded with their NumPy arrays memory-mapped from the file
+# (joblib mmap_mode), so worker processes share those pages; None reads them in
+MODEL_MMAP_MODE : str = "r"
 
 TARGET_COLUMN = "Response"
 CURRENT_YEAR = date.today().year
@@ -26,6 +79,9 @@ TRAIN_FILE_NAME = "train.csv"
 TEST_FILE_NAME : str = "test.csv"
 SCHEMA_FILE_PATH = Path("config") / "schema.yaml"
 
+# Supported on-disk DataFrame formats and their file extensions
+DATAFRAME_FILE_FORMATS : dict = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+
 """
 Data Ingetion related constant start with DATA_INGESTION
 """
@@ -35,5 +91,106 @@ DATA_INGESTION_DIR_NAME : str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR : str = "feature_store"
 DATA_INGESTION_INGESTED_DIR : str = "ingested"
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO : float = 0.25
+DATA_INGESTION_INCREMENTAL : bool = False
+DATA_INGESTION_WATERMARK_FIELD : str = "_id"
+DATA_INGESTION_WATERMARK_FILE_NAME : str = "watermark.json"
+DATA_INGESTION_MERGE_KEY : str = "id"
+DATA_INGESTION_FILE_FORMAT : str = "csv"
+DATA_INGESTION_USE_SCHEMA : bool = False
+DATA_INGESTION_RANDOM_STATE : int = 42
+DATA_INGESTION_SPLIT_MODE : str = "in_memory"  # or "streaming"
+DATA_INGESTION_SPLIT_STRATEGY : str = "stratified"  # in-memory split, or "random"
+DATA_INGESTION_STREAMING_SPLIT_STRATEGY : str = "hash"  # or "stratified"
+DATA_INGESTION_SPLIT_KEY : str = "id"
+DATA_INGESTION_PARQUET_COMPRESSION : str = "zstd"
 
 
+
+"""
+Data Validation related constant start with DATA_VALIDATION
+"""
+DATA_VALIDATION_DIR_NAME : str = "data_validation"
+DATA_VALIDATION_REPORT_FILE_NAME : str = "report.yaml"
+DATA_VALIDATION_CHUNK_SIZE : int = 250_000
+DATA_VALIDATION_MAX_NULL_RATIO : float = 0.05
+DATA_VALIDATION_HISTOGRAM_BINS : int = 20
+DATA_VALIDATION_DRIFT_THRESHOLD : float = 0.2  # population stability index
+DATA_VALIDATION_DRIFT_EXCLUDE_COLUMNS : tuple = ("id",)  # row identifiers
+
+"""
+Data Transformation related constant start with DATA_TRANSFORMATION
+"""
+DATA_TRANSFORMATION_DIR_NAME : str = "data_transformation"
+DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR : str = "transformed"
+DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR : str = "transformed_object"
+DATA_TRANSFORMATION_CHUNK_SIZE : int = 250_000
+# "random_oversample" (row index + weights), "class_weight", "smote" (materialized) or "none"
+DATA_TRANSFORMATION_RESAMPLING_STRATEGY : str = "random_oversample"
+DATA_TRANSFORMATION_SAMPLING_RATIO : float = 1.0  # minority/majority ratio after oversampling
+DATA_TRANSFORMATION_RANDOM_STATE : int = 42
+DATA_TRANSFORMATION_RESAMPLED_INDEX_FILE_NAME : str = "train_resampled_index.npy"
+DATA_TRANSFORMATION_SAMPLE_WEIGHT_FILE_NAME : str = "train_sample_weight.npy"
+DATA_TRANSFORMATION_SMOTE_TRAIN_FILE_NAME : str = "train_smote.npy"
+
+"""
+MODEL TRAINER related constant start with MODEL_TRAINER var name
+"""
+MODEL_TRAINER_DIR_NAME : str = "model_trainer"
+MODEL_TRAINER_TRAINED_MODEL_DIR : str = "trained_model"
+MODEL_TRAINER_TRAINED_MODEL_NAME : str = MODEL_FILE_NAME
+MODEL_TRAINER_SEARCH_REPORT_FILE_NAME : str = "search_report.yaml"
+MODEL_TRAINER_EXPECTED_SCORE : float = 0.6
+MODEL_TRAINER_MODEL_CONFIG_FILE_PATH : Path = Path("config") / "model.yaml"
+MODEL_TRAINER_N_JOBS : int = -1  # search workers (loky processes); -1 = one per CPU
+
+"""
+MODEL Evaluation related constants
+"""
+MODEL_EVALUATION_DIR_NAME : str = "model_evaluation"
+MODEL_EVALUATION_REPORT_FILE_NAME : str = "report.yaml"
+MODEL_EVALUATION_CHANGED_THRESHOLD_SCORE : float = 0.02  # minimum f1 gain over the deployed model
+MODEL_EVALUATION_N_BOOTSTRAP : int = 1000
+MODEL_EVALUATION_CONFIDENCE : float = 0.95
+MODEL_EVALUATION_RANDOM_STATE : int = 42
+MODEL_EVALUATION_CHUNK_SIZE : int = 250_000
+# Shared by every run: test-set probabilities keyed by model and test file content
+MODEL_EVALUATION_PREDICTION_CACHE_DIR : Path = Path(ARTIFACT_DIR) / "prediction_cache"
+MODEL_EVALUATION_DEPLOYED_MODEL_FILE_PATH : Path = Path(ARTIFACT_DIR) / "deployed_model" / MODEL_FILE_NAME
+
+"""
+Prediction related constants start with PREDICTION
+"""
+PREDICTION_MODEL_FILE_PATH : Path = MODEL_EVALUATION_DEPLOYED_MODEL_FILE_PATH
+PREDICTION_BATCH_SIZE : int = 100_000  # rows per vectorized transform + predict call
+
+# Prediction service (app.py): concurrent /predict requests are scored in micro-batches
+APP_HOST : str = "0.0.0.0"
+APP_PORT : int = 5000
+PREDICTION_MAX_BATCH_SIZE : int = 64
+PREDICTION_MAX_WAIT_MS : float = 5.0  # longest a request waits for others to join its batch
+
+"""
+Batch prediction (batch_predict.py) related constants start with BATCH_PREDICTION
+"""
+# Not under a timestamped run dir: a crashed job resumes from its checkpoint
+BATCH_PREDICTION_DIR : Path = Path(ARTIFACT_DIR) / "batch_prediction"
+BATCH_PREDICTION_CHECKPOINT_FILE_NAME : str = "checkpoint.json"
+BATCH_PREDICTION_OUTPUT_DIR_NAME : str = "predictions"
+BATCH_PREDICTION_OUTPUT : str = "mongo"  # or "parquet"
+BATCH_PREDICTION_OUTPUT_COLLECTION_SUFFIX : str = "-Predictions"
+BATCH_PREDICTION_CHUNK_SIZE : int = 50_000
+BATCH_PREDICTION_NUM_WORKERS : int = 4  # chunks scored and written in parallel
+BATCH_PREDICTION_KEY_FIELD : str = "_id"  # streaming order and checkpoint key
+
+
+"""
+MODEL Pusher / S3 model registry related constants
+"""
+# Bucket of the S3 model registry; without it the deployed model is the local
+# MODEL_EVALUATION_DEPLOYED_MODEL_FILE_PATH
+MODEL_BUCKET_NAME_ENV_KEY : str = "MODEL_BUCKET_NAME"
+MODEL_PUSHER_S3_KEY : str = "model-registry"  # current model at <key>/model.pkl, archive under <key>/versions/
+MODEL_REGISTRY_VERSIONS_PREFIX : str = "versions"
+MODEL_REGISTRY_SHA256_METADATA_KEY : str = "sha256"
+# Downloaded models, one dir per content hash; shared by every run and worker of the host
+MODEL_REGISTRY_CACHE_DIR : Path = Path(ARTIFACT_DIR) / "model_cache"
@@ -0,0 +1,390 @@
+import asyncio
+import sys
+import time
+import pandas as pd
+from itertools import count
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from mlops_project.configuration.mongo_db_connection import MongoClient
+from mlops_project.constants import (
+    DATABASE_NAME,
+    MONGO_EXPORT_BATCH_SIZE,
+    MONGO_LOOKUP_FIELD,
+    MONGO_LOOKUP_MAX_BATCH_SIZE,
+    MONGO_LOOKUP_MAX_WAIT_MS,
+)
+from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.data_access.schema_decoder import SchemaDecoder
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+LOGGER_NAME = "MongoDB Async Loader"
+
+
+def _with_key_field(projection: Optional[dict], field: str) -> tuple[Optional[dict], bool]:
+    """
+    The projection to fetch with so documents carry ``field`` (needed to
+    match them to their keys), and whether to drop ``field`` afterwards.
+    """
+    if not projection:
+        return projection, False
+    if any(value for name, value in projection.items() if name != "_id"):
+        # Inclusion projection
+        return ({**projection, field: True}, True) if not projection.get(field) else (projection, False)
+    if field in projection:
+        return {name: value for name, value in projection.items() if name != field}, True
+    return projection, False
+
+
+def _index_documents(documents: Iterable[dict], field: str, drop_field: bool) -> dict[Any, dict]:
+    """Documents keyed by their ``field``; the first one wins when a key repeats."""
+    indexed = {}
+    for document in documents:
+        key = document.pop(field, None) if drop_field else document.get(field)
+        indexed.setdefault(key, document)
+    return indexed
+
+
+class LookupCoalescer:
+    """
+    Coalesces concurrent point lookups of one collection and field into ``$in`` queries.
+
+    The first lookup starts a batch; lookups made within ``max_wait_ms`` of it
+    (or until ``max_batch_size`` distinct keys) join it, and one query answers
+    them all. Lookups of the same key share one slot. ``max_wait_ms=0`` still
+    gathers every lookup started in the same event loop iteration, e.g. by
+    ``asyncio.gather``.
+
+    Parameters
+    ----------
+    collection : pymongo.asynchronous.collection.AsyncCollection
+        Collection to query.
+    field : str
+        Field the keys are matched on; one document per key is returned.
+    projection : Optional[dict]
+        MongoDB projection of the returned documents.
+    max_batch_size : int
+        Most distinct keys per query.
+    max_wait_ms : float
+        Longest a lookup waits for others to join its query.
+    """
+
+    def __init__(
+        self,
+        collection,
+        field: str = MONGO_LOOKUP_FIELD,
+        projection: Optional[dict] = None,
+        max_batch_size: int = MONGO_LOOKUP_MAX_BATCH_SIZE,
+        max_wait_ms: float = MONGO_LOOKUP_MAX_WAIT_MS,
+    ) -> None:
+        if max_batch_size < 1 or max_wait_ms < 0:
+            raise ValueError(f"Invalid batching: max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms}")
+
+        self.collection = collection
+        self.field = field
+        self.projection = projection
+        self._fetch_projection, self._drop_field = _with_key_field(projection, field)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self._pending: dict[Any, list[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._queries: set[asyncio.Task] = set()
+
+        self.lookups = 0
+        self.queries = 0
+        self.keys_queried = 0
+
+    async def lookup(self, key: Any) -> Optional[dict]:
+        """The document whose ``field`` equals ``key``, or None."""
+        future = asyncio.get_running_loop().create_future()
+        self.lookups += 1
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait_ms / 1000, self._dispatch)
+        return await future
+
+    def _dispatch(self) -> None:
+        """Sends the pending keys as one query."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        # Keep a reference: the event loop only holds tasks weakly
+        task = asyncio.get_running_loop().create_task(self._query(batch))
+        self._queries.add(task)
+        task.add_done_callback(self._queries.discard)
+
+    async def _query(self, batch: dict[Any, list[asyncio.Future]]) -> None:
+        self.queries += 1
+        self.keys_queried += len(batch)
+        try:
+            cursor = self.collection.find({self.field: {"$in": list(batch)}}, projection=self._fetch_projection)
+            documents = _index_documents(await cursor.to_list(None), self.field, self._drop_field)
+        except Exception as e:
+            error = MyException(e, sys)
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            return
+
+        for key, futures in batch.items():
+            for future in futures:
+                # Lookups whose caller went away are skipped
+                if not future.done():
+                    future.set_result(documents.get(key))
+
+    def metrics(self) -> dict:
+        """Counters of the coalescer; ``keys_per_query`` shows how much it coalesces."""
+        return {
+            "lookups": self.lookups,
+            "queries": self.queries,
+            "keys_per_query": round(self.keys_queried / self.queries, 2) if self.queries else None,
+            "pending": len(self._pending),
+        }
+
+
+class AsyncProjData:
+    """
+    Asyncio counterpart of :class:`ProjData`, for the FastAPI service.
+
+    - Uses its own ``pymongo.AsyncMongoClient``, created with the settings of
+      the shared client (``MongoClient.configure``) unless one is given.
+      Async clients are bound to the event loop they first run on: create
+      one per loop (e.g. in the app's lifespan) and ``close`` it.
+    - Point lookups by a key field (``id`` by default), single or batched
+      with ``$in``; ``lookup`` coalesces concurrent point lookups into one
+      query (see :class:`LookupCoalescer`).
+    - Streams collections as DataFrame chunks from an async cursor, built
+      (and optionally schema-decoded) on a worker thread so the event loop
+      keeps serving requests meanwhile.
+    """
+
+    def __init__(
+        self,
+        database_name: str = DATABASE_NAME,
+        client=None,
+        max_batch_size: int = MONGO_LOOKUP_MAX_BATCH_SIZE,
+        max_wait_ms: float = MONGO_LOOKUP_MAX_WAIT_MS,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        database_name : str
+            Name of the MongoDB database.
+        client : Optional[pymongo.AsyncMongoClient]
+            Client to use; a new one is created (and owned) when None.
+        max_batch_size : int
+            Most keys per ``$in`` query of ``find_by_ids`` and ``lookup``.
+        max_wait_ms : float
+            Longest a ``lookup`` waits for others to join its query.
+        """
+        try:
+            self._owns_client = client is None
+            self.client = MongoClient.create_async_client() if client is None else client
+            self.database, self.bulk_database = MongoClient.get_databases(self.client, database_name)
+            self.max_batch_size = max_batch_size
+            self.max_wait_ms = max_wait_ms
+            self._coalescers: dict[tuple, LookupCoalescer] = {}
+        except Exception as e:
+            raise MyException(e, sys)
+
+    async def close(self) -> None:
+        """Closes the client if this instance created it."""
+        if self._owns_client:
+            await self.client.close()
+
+    def _get_collection(self, collection_name: str, database_name: Optional[str] = None, bulk: bool = False):
+        """
+        Return the collection from the default database or an overridden one;
+        ``bulk`` reads use the client's bulk read preference.
+        """
+        db = self.bulk_database if bulk else self.database
+        if database_name:
+            db = self.client.get_database(database_name, read_preference=db.read_preference)
+        return db.get_collection(collection_name)
+
+    # ---------------------- POINT LOOKUPS ----------------------
+    async def find_by_id(
+        self,
+        collection_name: str,
+        key: Any,
+        field: str = MONGO_LOOKUP_FIELD,
+        projection: Optional[dict] = None,
+        database_name: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        Fetch the document whose ``field`` equals ``key`` with one ``find_one``.
+
+        ``field`` should be indexed; without ``projection`` ``_id`` is left out.
+
+        Returns
+        -------
+        Optional[dict]
+            The document, or None if there is none.
+
+        Raises
+        ------
+        MyException
+            For connection or query errors.
+        """
+        try:
+            collection = self._get_collection(collection_name, database_name)
+            return await collection.find_one({field: key}, projection=projection or {"_id": False})
+        except Exception as e:
+            raise MyException(e, sys)
+
+    async def find_by_ids(
+        self,
+        collection_name: str,
+        keys: Iterable[Any],
+        field: str = MONGO_LOOKUP_FIELD,
+        projection: Optional[dict] = None,
+        database_name: Optional[str] = None,
+    ) -> dict[Any, dict]:
+        """
+        Fetch the documents of many keys with ``$in`` queries of at most
+        ``max_batch_size`` keys each.
+
+        Returns
+        -------
+        dict[Any, dict]
+            Document per key found (the first one if a key is repeated);
+            missing keys are absent.
+
+        Raises
+        ------
+        MyException
+            For connection or query errors.
+        """
+        try:
+            collection = self._get_collection(collection_name, database_name)
+            fetch_projection, drop_field = _with_key_field(projection or {"_id": False}, field)
+            keys = list(dict.fromkeys(keys))
+            found = {}
+            for start in range(0, len(keys), self.max_batch_size):
+                query = {field: {"$in": keys[start:start + self.max_batch_size]}}
+                cursor = collection.find(query, projection=fetch_projection)
+                for key, document in _index_documents(await cursor.to_list(None), field, drop_field).items():
+                    found.setdefault(key, document)
+            return found
+        except Exception as e:
+            raise MyException(e, sys)
+
+    async def lookup(
+        self,
+        collection_name: str,
+        key: Any,
+        field: str = MONGO_LOOKUP_FIELD,
+        projection: Optional[dict] = None,
+        database_name: Optional[str] = None,
+    ) -> Optional[dict]:
+        """
+        Like :meth:`find_by_id`, but concurrent calls for the same collection,
+        field and projection share ``$in`` queries, e.g. the per-request
+        feature lookups of a busy endpoint.
+        """
+        projection = projection or {"_id": False}
+        coalescer_key = (database_name, collection_name, field, tuple(sorted(projection.items())))
+        coalescer = self._coalescers.get(coalescer_key)
+        if coalescer is None:
+            coalescer = self._coalescers[coalescer_key] = LookupCoalescer(
+                self._get_collection(collection_name, database_name),
+                field,
+                projection,
+                max_batch_size=self.max_batch_size,
+                max_wait_ms=self.max_wait_ms,
+            )
+        return await coalescer.lookup(key)
+
+    def metrics(self) -> dict:
+        """Counters of each lookup coalescer, keyed by ``collection.field``."""
+        return {f"{key[1]}.{key[2]}": coalescer.metrics() for key, coalescer in self._coalescers.items()}
+
+    # ---------------------- STREAMING ----------------------
+    async def iter_collection_as_dataframes(
+        self,
+        collection_name: str,
+        database_name: Optional[str] = None,
+        batch_size: int = MONGO_EXPORT_BATCH_SIZE,
+        projection: Optional[dict] = None,
+        use_schema: bool = False,
+        query: Optional[dict] = None,
+        sort: Optional[list[tuple[str, int]]] = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        Stream a MongoDB collection as cleaned DataFrame chunks from an async cursor.
+
+        Takes the parameters of :meth:`ProjData.iter_collection_as_dataframes`.
+        The next batch is fetched only when the previous chunk is consumed.
+
+        Yields
+        ------
+        pd.DataFrame
+            Chunks of at most ``batch_size`` rows.
+
+        Raises
+        ------
+        MyException
+            For missing collections, connection errors, or data conversion issues.
+        """
+        logger = get_logger(LOGGER_NAME)
+
+        try:
+            if batch_size <= 0:
+                raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+            collection = self._get_collection(collection_name, database_name, bulk=True)
+            decoder = SchemaDecoder.from_schema_file() if use_schema else None
+            if projection is None:
+                projection = decoder.projection if decoder else {"_id": False}
+
+            logger.info(f"Streaming MongoDB collection '{collection_name}' in batches of {batch_size} (async)")
+
+            cursor = collection.find(query or {}, projection=projection, batch_size=batch_size)
+            if sort:
+                cursor = cursor.sort(sort)
+            try:
+                for batch_index in count():
+                    start = time.perf_counter()
+                    documents = await cursor.to_list(batch_size)
+                    if not documents:
+                        break
+                    fetched = time.perf_counter()
+
+                    chunk = await asyncio.to_thread(self._build_chunk, documents, decoder)
+                    logger.debug(
+                        "Batch %d of '%s': %d rows, fetch %.4fs, build %.4fs",
+                        batch_index, collection_name, len(documents), fetched - start, time.perf_counter() - fetched,
+                    )
+                    yield chunk
+            finally:
+                await cursor.close()
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @staticmethod
+    def _build_chunk(documents: list[dict], decoder: Optional[SchemaDecoder]) -> pd.DataFrame:
+        columns, n_rows = ProjData._documents_to_columns(documents)
+        return decoder.decode(columns, n_rows) if decoder else ProjData._clean_chunk(pd.DataFrame(columns))
+
+    async def export_collection_as_dataframe(self, collection_name: str, **kwargs) -> pd.DataFrame:
+        """
+        Fetch a whole collection into one DataFrame; takes the parameters of
+        :meth:`iter_collection_as_dataframes`.
+        """
+        chunks = [chunk async for chunk in self.iter_collection_as_dataframes(collection_name, **kwargs)]
+        if not chunks:
+            get_logger(LOGGER_NAME).warning(
+                f"No documents found in collection '{collection_name}'. Returning empty DataFrame."
+            )
+            return pd.DataFrame()
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
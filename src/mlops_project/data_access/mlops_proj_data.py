@@ -1,14 +1,25 @@
+import contextvars
 import sys
+import time
 import pandas as pd
 import numpy as np
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+from typing import Iterable, Iterator, Optional
 
 from mlops_project.configuration.mongo_db_connection import MongoClient
-from mlops_project.constants import DATABASE_NAME
+from mlops_project.constants import (
+    DATABASE_NAME,
+    MONGO_EXPORT_BATCH_SIZE,
+    MONGO_EXPORT_NUM_WORKERS,
+    MONGO_EXPORT_PARTITION_FIELD,
+)
+from mlops_project.data_access.schema_decoder import SchemaDecoder
 from mlops_project.exception import MyException
 from mlops_project.logger import get_logger
+from mlops_project.utils.instrumentation import increment
 
-logger = get_logger("MongoDB->DataFrame Loader")
+LOGGER_NAME = "MongoDB->DataFrame Loader"
 
 
 class ProjData:
@@ -16,6 +27,11 @@ class ProjData:
     Utility class to fetch MongoDB collections as Pandas DataFrames.
 
     - Uses the shared MongoDB client (singleton pattern).
+    - Streams the cursor in fixed-size batches, building each DataFrame
+      chunk column-wise so the full list of documents is never held in memory.
+    - Optionally decodes chunks with the dtypes declared in ``schema.yaml``.
+    - Optionally splits the collection into disjoint ranges fetched on a
+      thread pool that shares the singleton client.
     - Handles missing collections, empty results, and dataframe cleanup.
     """
 
@@ -26,18 +42,308 @@ class ProjData:
         except Exception as e:
             raise MyException(e, sys)
 
+    def _get_collection(self, collection_name: str, database_name: Optional[str] = None, bulk: bool = False):
+        """
+        Return the collection from the default database or an overridden one;
+        ``bulk`` reads use the client's bulk read preference (secondaries
+        preferred), sparing the primary during exports and batch scoring.
+        """
+        db = self.mongo_client.bulk_database if bulk else self.mongo_client.database
+        if database_name:
+            db = db.client.get_database(database_name, read_preference=db.read_preference)
+        return db.get_collection(collection_name)
+
+    @staticmethod
+    def _documents_to_columns(documents: Iterable[dict]) -> tuple[dict[str, list], int]:
+        """
+        Transpose documents into column-wise lists.
+
+        Keys missing from some documents are padded with ``None`` so that every
+        column has one entry per document.
+
+        Returns
+        -------
+        tuple[dict[str, list], int]
+            The columns and the number of documents consumed.
+        """
+        columns: dict[str, list] = {}
+        n_rows = 0
+
+        for document in documents:
+            for key, value in document.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * n_rows
+                column.append(value)
+            n_rows += 1
+
+            # Pad columns this document did not carry
+            if len(document) != len(columns):
+                for column in columns.values():
+                    if len(column) < n_rows:
+                        column.append(None)
+
+        return columns, n_rows
+
+    @staticmethod
+    def _clean_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+        """Drop Mongo's ``_id`` and replace ``"na"`` strings with NaN for one chunk."""
+        if "_id" in chunk.columns:
+            chunk = chunk.drop(columns="_id")
+
+        return chunk.replace({"na": np.nan})
+
+    def iter_collection_as_dataframes(
+        self,
+        collection_name: str,
+        database_name: Optional[str] = None,
+        batch_size: int = MONGO_EXPORT_BATCH_SIZE,
+        projection: Optional[dict] = None,
+        use_schema: bool = False,
+        query: Optional[dict] = None,
+        sort: Optional[list[tuple[str, int]]] = None,
+        keep_id: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a MongoDB collection as a sequence of cleaned DataFrame chunks.
+
+        Parameters
+        ----------
+        collection_name : str
+            Name of the MongoDB collection.
+        database_name : Optional[str]
+            If provided, overrides default database name.
+        batch_size : int
+            Number of documents per cursor batch and per yielded DataFrame.
+        projection : Optional[dict]
+            MongoDB projection pushed down to the server. Defaults to
+            excluding ``_id`` so it is never transferred, or to the schema
+            columns when ``use_schema`` is set.
+        use_schema : bool
+            Decode each chunk with :class:`SchemaDecoder` into the compact
+            dtypes declared in ``schema.yaml`` instead of letting pandas infer them.
+        query : Optional[dict]
+            MongoDB filter; all documents when omitted.
+        sort : Optional[list[tuple[str, int]]]
+            Sort specification, e.g. ``[("_id", 1)]``, for a stable order.
+        keep_id : bool
+            Fetch ``_id`` and keep it as the first column, e.g. to write
+            results back keyed by document or to resume after the last one.
+
+        Yields
+        ------
+        pd.DataFrame
+            Chunks of at most ``batch_size`` rows.
+
+        Raises
+        ------
+        MyException
+            For missing collections, connection errors, or data conversion issues.
+        """
+        logger = get_logger(LOGGER_NAME)
+
+        try:
+            if batch_size <= 0:
+                raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+            collection = self._get_collection(collection_name, database_name, bulk=True)
+            decoder = SchemaDecoder.from_schema_file() if use_schema else None
+
+            if projection is None:
+                projection = decoder.projection if decoder else {"_id": False}
+            if keep_id:
+                # Without its "_id": False, an inclusion projection returns _id, an empty one every field
+                projection = {name: value for name, value in projection.items() if name != "_id"} or None
+
+            logger.info(
+                f"Streaming MongoDB collection '{collection_name}' in batches of {batch_size}"
+            )
+
+            cursor = collection.find(query or {}, projection=projection, batch_size=batch_size)
+            if sort:
+                cursor = cursor.sort(sort)
+            try:
+                for batch_index in count():
+                    start = time.perf_counter()
+                    columns, n_rows = self._documents_to_columns(islice(cursor, batch_size))
+                    if not n_rows:
+                        break
+                    fetched = time.perf_counter()
+
+                    chunk = decoder.decode(columns, n_rows) if decoder else self._clean_chunk(pd.DataFrame(columns))
+                    if keep_id:
+                        chunk.insert(0, "_id", columns["_id"])
+                    built = time.perf_counter()
+
+                    # %-style args: formatting is deferred to the handler (the listener thread with LOG_QUEUE=1)
+                    logger.debug(
+                        "Batch %d of '%s': %d rows, fetch %.4fs, build %.4fs",
+                        batch_index, collection_name, n_rows, fetched - start, built - fetched,
+                        extra={"rows": n_rows, "fetch_seconds": fetched - start, "build_seconds": built - fetched},
+                    )
+                    # Accumulated on the caller's open instrumentation stage, if any
+                    increment("batches")
+                    increment("mongo_fetch_seconds", fetched - start)
+                    increment("dataframe_build_seconds", built - fetched)
+                    yield chunk
+            finally:
+                cursor.close()
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @staticmethod
+    def _partition_queries(collection, partition_field: str, num_partitions: int) -> list[dict]:
+        """
+        Split a collection into disjoint range filters on ``partition_field``.
+
+        Split points are the values found at evenly spaced offsets of the
+        sorted field, so partitions hold roughly the same number of documents
+        even when the values are skewed. Documents where the field is missing
+        or null get a partition of their own.
+
+        Returns
+        -------
+        list[dict]
+            MongoDB filters, in ascending range order.
+        """
+        has_field = {partition_field: {"$ne": None}}
+        total = collection.count_documents(has_field)
+
+        bounds = []
+        for k in range(1, num_partitions):
+            document = next(
+                collection.find(has_field, {partition_field: True})
+                .sort(partition_field, 1)
+                .skip(k * total // num_partitions)
+                .limit(1),
+                None,
+            )
+            if document is not None and (not bounds or document[partition_field] > bounds[-1]):
+                bounds.append(document[partition_field])
+
+        if not bounds:
+            return [{}]
+
+        queries = [{partition_field: {"$lt": bounds[0]}}]
+        queries += [{partition_field: {"$gte": low, "$lt": high}} for low, high in zip(bounds, bounds[1:])]
+        queries.append({partition_field: {"$gte": bounds[-1]}})
+
+        if partition_field != "_id":
+            queries.append({partition_field: None})
+
+        return queries
+
+    def _fetch_partition(self, index: int, query: dict, partition_field: str, **kwargs) -> Optional[pd.DataFrame]:
+        """Fetch one range partition into a single DataFrame and log its timing."""
+        logger = get_logger(LOGGER_NAME)
+        start = time.perf_counter()
+
+        chunks = list(
+            self.iter_collection_as_dataframes(query=query, sort=[(partition_field, 1)], **kwargs)
+        )
+        frame = (chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)) if chunks else None
+
+        logger.info(
+            f"Partition {index} {query}: {0 if frame is None else len(frame)} rows "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return frame
+
+    def get_max_value(
+        self,
+        collection_name: str,
+        field: str,
+        query: Optional[dict] = None,
+        database_name: Optional[str] = None,
+    ):
+        """
+        Return the largest value of ``field`` in the collection, or None if it is empty.
+
+        Uses an index on ``field`` when one exists (``_id`` always has one).
+        """
+        try:
+            collection = self._get_collection(collection_name, database_name)
+            document = next(
+                collection.find(query or {}, {field: True}).sort(field, -1).limit(1),
+                None,
+            )
+            return None if document is None else document.get(field)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def collection_fingerprint(
+        self,
+        collection_name: str,
+        fields: Iterable[str] = ("_id",),
+        database_name: Optional[str] = None,
+    ) -> dict:
+        """
+        Cheap fingerprint of a collection's content: its document count
+        (from collection metadata) and the largest value of each of ``fields``.
+
+        Inserts and deletes change it; in-place updates are only seen when an
+        update-timestamp field is included in ``fields``.
+        """
+        try:
+            collection = self._get_collection(collection_name, database_name)
+            return {
+                "collection": collection_name,
+                "count": collection.estimated_document_count(),
+                "max": {
+                    field: self.get_max_value(collection_name, field, database_name=database_name) for field in fields
+                },
+            }
+
+        except Exception as e:
+            raise MyException(e, sys)
+
     def export_collection_as_dataframe(
-        self, collection_name: str, database_name: Optional[str] = None
+        self,
+        collection_name: str,
+        database_name: Optional[str] = None,
+        batch_size: int = MONGO_EXPORT_BATCH_SIZE,
+        projection: Optional[dict] = None,
+        use_schema: bool = False,
+        num_workers: int = MONGO_EXPORT_NUM_WORKERS,
+        partition_field: str = MONGO_EXPORT_PARTITION_FIELD,
+        num_partitions: Optional[int] = None,
+        query: Optional[dict] = None,
     ) -> pd.DataFrame:
         """
         Fetch a MongoDB collection and convert it into a clean pandas DataFrame.
 
+        The collection is streamed through :meth:`iter_collection_as_dataframes`
+        and the chunks are concatenated once at the end.
+
+        With ``num_workers > 1`` the collection is split into disjoint ranges of
+        ``partition_field``, each fetched on a thread pool sharing the singleton
+        client (at most ``max_pool_size`` threads, see
+        ``MongoClient.configure``), and the partial frames are concatenated in ascending range
+        order. ``partition_field`` should be indexed (``_id`` always is),
+        otherwise every range query scans the whole collection.
+
         Parameters
         ----------
         collection_name : str
             Name of the MongoDB collection.
         database_name : Optional[str]
             If provided, overrides default database name.
+        batch_size : int
+            Number of documents fetched and converted per chunk.
+        projection : Optional[dict]
+            MongoDB projection pushed down to the server.
+        use_schema : bool
+            Produce the typed columns declared in ``schema.yaml``.
+        num_workers : int
+            Number of threads fetching partitions in parallel; 1 uses a single cursor.
+        partition_field : str
+            Field used to range-partition the collection, e.g. ``_id`` or ``id``.
+        num_partitions : Optional[int]
+            Number of ranges; defaults to ``num_workers``.
+        query : Optional[dict]
+            MongoDB filter applied on top of the partition ranges.
 
         Returns
         -------
@@ -49,39 +355,62 @@ class ProjData:
         MyException
             For missing collections, connection errors, or data conversion issues.
         """
+        logger = get_logger(LOGGER_NAME)
+
         try:
-            # Select database (default or overridden)
-            db = (
-                self.mongo_client.client.get_database(database_name)
-                if database_name
-                else self.mongo_client.database
+            logger.info(f"Fetching data from MongoDB collection: {collection_name}")
+
+            fetch_kwargs = dict(
+                collection_name=collection_name,
+                database_name=database_name,
+                batch_size=batch_size,
+                projection=projection,
+                use_schema=use_schema,
             )
 
-            # Select collection (PyMongo 4.x)
-            collection = db.get_collection(collection_name)
+            max_pool_size = MongoClient.pool_settings()["max_pool_size"]
+            if num_workers > max_pool_size:
+                # More threads would only wait for a pooled connection
+                logger.warning(f"num_workers {num_workers} exceeds the MongoDB pool size; using {max_pool_size}")
+                num_workers = max_pool_size
 
-            logger.info(f"Fetching data from MongoDB collection: {collection_name}")
+            if num_workers > 1:
+                queries = self._partition_queries(
+                    self._get_collection(collection_name, database_name, bulk=True),
+                    partition_field,
+                    num_partitions or num_workers,
+                )
+                if query:
+                    queries = [{"$and": [query, part]} if part else query for part in queries]
+                logger.info(
+                    f"Fetching {len(queries)} partitions on '{partition_field}' with {num_workers} workers"
+                )
+
+                # Each worker runs in a copy of the caller's context, so batch
+                # counters land on the caller's instrumentation stage
+                contexts = [contextvars.copy_context() for _ in queries]
 
-            # Convert cursor → list → DataFrame
-            documents = list(collection.find())
+                with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="mongo-export") as executor:
+                    frames = executor.map(
+                        lambda item: contexts[item[0]].run(
+                            self._fetch_partition, item[0], item[1], partition_field, **fetch_kwargs
+                        ),
+                        enumerate(queries),
+                    )
+                    chunks = [frame for frame in frames if frame is not None]
+            else:
+                chunks = list(self.iter_collection_as_dataframes(query=query, **fetch_kwargs))
 
-            if not documents:
+            if not chunks:
                 logger.warning(
                     f"No documents found in collection '{collection_name}'. Returning empty DataFrame."
                 )
                 return pd.DataFrame()
 
-            df = pd.DataFrame(documents)
+            df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
 
             logger.info(f"Data fetched successfully. Row count = {len(df)}")
 
-            # Cleanup: Remove Mongo's default _id
-            if "_id" in df.columns:
-                df.drop("_id", axis=1, inplace=True)
-
-            # Replace 'na' strings with NaN
-            df.replace({"na": np.nan}, inplace=True)
-
             return df
 
         except Exception as e:
@@ -92,6 +421,7 @@ if __name__ == "__main__":
     import logging
     #set_level = logging.CRITCAL to silence pymongo undesired logs
     get_logger("pymongo").setLevel(logging.CRITICAL)
+    logger = get_logger(LOGGER_NAME)
     from mlops_project.constants import COLLECTION_NAME
 
     data = ProjData()
@@ -0,0 +1,147 @@
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+
+from mlops_project.constants import SCHEMA_FILE_PATH
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.utils.main_utils import load_schema
+
+
+class SchemaDecoder:
+    """
+    Decode column-wise Mongo documents into typed DataFrame chunks.
+
+    The column list, dtypes and categorical domains come from ``schema.yaml``.
+    Numeric columns are converted straight to compact NumPy dtypes
+    (``int8``/``int16``/``int32``/``float32``) and categorical columns to
+    ``category`` with a fixed category order, so chunks decoded independently
+    concatenate without falling back to ``object``.
+
+    Values that cannot be parsed (e.g. the ``"na"`` placeholder) become NaN.
+    An integer column that contains NaN or non-integral values in a chunk is
+    widened to ``float64``, which holds every int32 value exactly.
+    """
+
+    def __init__(self, schema: dict) -> None:
+        """
+        Parameters
+        ----------
+        schema : dict
+            Parsed schema with a ``columns`` list of ``{name: dtype}`` mappings
+            and an optional ``categorical_domains`` mapping.
+        """
+        try:
+            self.dtypes: dict[str, str] = {}
+            for column in schema["columns"]:
+                self.dtypes.update(column)
+
+            domains = schema.get("categorical_domains") or {}
+            self.categorical_dtypes: dict[str, pd.CategoricalDtype] = {
+                name: pd.CategoricalDtype(categories=domains.get(name))
+                for name, dtype in self.dtypes.items()
+                if dtype == "category"
+            }
+
+            self.numeric_dtypes: dict[str, np.dtype] = {
+                name: np.dtype(dtype)
+                for name, dtype in self.dtypes.items()
+                if dtype != "category"
+            }
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @classmethod
+    def from_schema_file(cls, schema_file_path: str | Path = SCHEMA_FILE_PATH) -> "SchemaDecoder":
+        """Build a decoder from a schema YAML file (parsed once per process)."""
+        return cls(load_schema(schema_file_path))
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names in schema order."""
+        return list(self.dtypes)
+
+    @property
+    def projection(self) -> dict:
+        """MongoDB projection that returns only the schema columns."""
+        projection = {"_id": False}
+        projection.update({name: True for name in self.dtypes})
+        return projection
+
+    def _decode_numeric(self, name: str, values: list) -> np.ndarray:
+        dtype = self.numeric_dtypes[name]
+
+        if dtype.kind in "iu":
+            # Fast path: every value is already an int that fits; floats (1.5) take the parse path
+            raw = np.asarray(values)
+            if raw.dtype.kind in "iu":
+                info = np.iinfo(dtype)
+                if not raw.size or (raw.min() >= info.min and raw.max() <= info.max):
+                    return raw.astype(dtype)
+        else:
+            try:
+                # Fast path: every value is already a clean number
+                return np.array(values, dtype=dtype)
+            except (TypeError, ValueError, OverflowError):
+                pass
+
+        parsed = pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+        if dtype.kind in "iu":
+            # NaN != floor(NaN) too
+            if (parsed != np.floor(parsed)).any():
+                return parsed
+
+            info = np.iinfo(dtype)
+            if parsed.size and (parsed.min() < info.min or parsed.max() > info.max):
+                get_logger("SchemaDecoder").warning(f"Column '{name}' does not fit {dtype}; keeping int64.")
+                return parsed.astype(np.int64)
+
+        return parsed.astype(dtype)
+
+    def _decode_categorical(self, name: str, values: list) -> pd.Categorical:
+        dtype = self.categorical_dtypes[name]
+
+        if dtype.categories is None:
+            return pd.Categorical(values)
+
+        # Values outside the domain (including "na") map to code -1, i.e. NaN
+        codes = dtype.categories.get_indexer(pd.Index(values, dtype=object))
+        return pd.Categorical.from_codes(codes, dtype=dtype)
+
+    def decode(self, columns: dict[str, list], n_rows: int) -> pd.DataFrame:
+        """
+        Build a typed DataFrame from column-wise lists.
+
+        Parameters
+        ----------
+        columns : dict[str, list]
+            Column-wise values as produced by ``ProjData._documents_to_columns``.
+        n_rows : int
+            Number of rows in the chunk, used for columns absent from it.
+
+        Returns
+        -------
+        pd.DataFrame
+            Chunk with the schema columns, in schema order.
+        """
+        try:
+            data: dict[str, object] = {}
+
+            for name in self.dtypes:
+                values: Optional[list] = columns.get(name)
+                if values is None:
+                    values = [None] * n_rows
+
+                if name in self.categorical_dtypes:
+                    data[name] = self._decode_categorical(name, values)
+                else:
+                    data[name] = self._decode_numeric(name, values)
+
+            return pd.DataFrame(data, copy=False)
+
+        except Exception as e:
+            raise MyException(e, sys)
@@ -5,5 +5,67 @@ from dataclasses import dataclass
 class DataIngestionArtifact:
     trained_file_path : str
     test_file_path : str
+    file_format : str = "csv"
+    feature_store_file_path : str = None
+    # Rows per TARGET_COLUMN class, keyed by the class as a string
+    train_class_counts : dict = None
+    test_class_counts : dict = None
 
-    
\ No newline at end of file
+    
+@dataclass
+class DataValidationArtifact:
+    validation_status : bool
+    message : str
+    validation_report_file_path : str
+    drift_detected : bool = False
+
+@dataclass
+class DataTransformationArtifact:
+    transformed_object_file_path : str
+    # float32 .npy arrays: the features, then TARGET_COLUMN as the last column
+    transformed_train_file_path : str
+    transformed_test_file_path : str
+    feature_names : list = None
+    # Resampling of the train rows, applied by the trainer (None when not used):
+    # int64 row positions (oversampled rows repeated) and float32 per-row weights
+    resampling_strategy : str = "none"
+    resampled_index_file_path : str = None
+    sample_weight_file_path : str = None
+
+@dataclass
+class ClassificationMetricArtifact:
+    f1_score : float
+    precision_score : float
+    recall_score : float
+
+@dataclass
+class ModelTrainerArtifact:
+    trained_model_file_path : str
+    metric_artifact : ClassificationMetricArtifact
+    best_params : dict = None
+    best_cv_score : float = None
+    search_report_file_path : str = None
+    search_seconds : float = None
+
+    def __post_init__(self):
+        # Rebuilt from JSON (stage cache) the nested artifact is a dict
+        if isinstance(self.metric_artifact, dict):
+            self.metric_artifact = ClassificationMetricArtifact(**self.metric_artifact)
+
+@dataclass
+class ModelEvaluationArtifact:
+    is_model_accepted : bool
+    changed_accuracy : float  # trained minus deployed test f1
+    trained_model_path : str
+    deployed_model_path : str = None  # None when no model is deployed yet
+    evaluation_report_file_path : str = None
+    f1_difference_ci : list = None
+    p_not_better : float = None  # share of bootstrap resamples where the trained model is not better
+
+@dataclass
+class ModelPusherArtifact:
+    is_pushed : bool
+    bucket_name : str = None  # None when deployed to the local deployed model path
+    s3_model_path : str = None
+    model_version : str = None
+    deployed_model_path : str = None
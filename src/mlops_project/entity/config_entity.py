@@ -1,24 +1,312 @@
 import os
 from mlops_project.constants import *
-from dataclasses import dataclass
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 
-TIMESTAMP : str = datetime.now().strftime('%m_%d_%Y_%H_%M_%S')
+
+def _timestamp() -> str:
+    return datetime.now().strftime('%m_%d_%Y_%H_%M_%S')
 
 @dataclass
 class TrainPipeLineConfig:
     pipeline_name : str = PIPELINE_NAME
-    artifact_dir : str = Path.joinpath(Path(ARTIFACT_DIR),TIMESTAMP)
-    timestamp : str = TIMESTAMP
+    artifact_dir : str = None  # ARTIFACT_DIR/<timestamp> when not given
+    timestamp : str = field(default_factory=_timestamp)
+    run_report_file_path : str = None
+
+    def __post_init__(self):
+        if self.artifact_dir is None:
+            self.artifact_dir = Path.joinpath(Path(ARTIFACT_DIR),self.timestamp)
+        if self.run_report_file_path is None:
+            self.run_report_file_path = Path.joinpath(Path(self.artifact_dir),RUN_REPORT_FILE_NAME)
+
+@lru_cache(maxsize=1)
+def default_training_pipeline_config() -> TrainPipeLineConfig:
+    """Run config shared by the stage configs of this process, created on first use."""
+    return TrainPipeLineConfig()
+
+def __getattr__(name):
+    # TIMESTAMP and training_pipeline_config used to be computed at import time
+    if name == "training_pipeline_config":
+        return default_training_pipeline_config()
+    if name == "TIMESTAMP":
+        return default_training_pipeline_config().timestamp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Stage configs below take the run config as an init-only `training_pipeline_config`
+# argument (the process default when omitted); their run-dir paths are derived from
+# it in __post_init__ unless given explicitly.
 
-training_pipeline_config : TrainPipeLineConfig = TrainPipeLineConfig()
+@dataclass
+class StageCacheConfig:
+    enabled : bool = STAGE_CACHE_ENABLED
+    artifact_root_dir : str = Path(ARTIFACT_DIR)
+    cache_dir : str = Path.joinpath(Path(ARTIFACT_DIR),STAGE_CACHE_DIR_NAME)
+    report_file_path : str = None
+    max_age_days : float = STAGE_CACHE_MAX_AGE_DAYS
+    max_total_bytes : int = STAGE_CACHE_MAX_TOTAL_BYTES
+    training_pipeline_config : InitVar[TrainPipeLineConfig] = None
+
+    def __post_init__(self, training_pipeline_config):
+        if self.report_file_path is None:
+            artifact_dir = (training_pipeline_config or default_training_pipeline_config()).artifact_dir
+            self.report_file_path = Path.joinpath(Path(artifact_dir),STAGE_CACHE_REPORT_FILE_NAME)
+
+@dataclass
+class MongoClientConfig:
+    uri : str = None  # built from MONGO_USER, MONGO_PASSWORD, MONGO_HOST and CLUSTER when not given
+    max_pool_size : int = MONGO_MAX_POOL_SIZE
+    min_pool_size : int = MONGO_MIN_POOL_SIZE
+    max_idle_time_ms : int = MONGO_MAX_IDLE_TIME_MS
+    server_selection_timeout_ms : int = MONGO_SERVER_SELECTION_TIMEOUT_MS
+    compressors : str = MONGO_COMPRESSORS
+    read_preference : str = MONGO_READ_PREFERENCE
+    bulk_read_preference : str = MONGO_BULK_READ_PREFERENCE
 
 @dataclass
 class DataIngestionConfig:
-    data_ingestion_dir : str = Path.joinpath(training_pipeline_config.artifact_dir,DATA_INGESTION_DIR_NAME)
-    feature_store_file_path = Path.joinpath(data_ingestion_dir,DATA_INGESTION_FEATURE_STORE_DIR,FILE_NAME)
-    training_file_path : str = Path.joinpath(data_ingestion_dir,DATA_INGESTION_INGESTED_DIR,TRAIN_FILE_NAME)
-    testing_file_path :str = Path.joinpath(data_ingestion_dir,DATA_INGESTION_INGESTED_DIR,TEST_FILE_NAME)
+    data_ingestion_dir : str = None
+    feature_store_file_path : str = None
+    training_file_path : str = None
+    testing_file_path :str = None
     train_test_split_ratio :float = DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO
     collection_name : str = DATA_INGESTION_COLLECTION_NAME
+    use_schema : bool = DATA_INGESTION_USE_SCHEMA
+    export_batch_size : int = MONGO_EXPORT_BATCH_SIZE
+    random_state : int = DATA_INGESTION_RANDOM_STATE
+    # In-memory split: "stratified" on TARGET_COLUMN or "random"
+    split_strategy : str = DATA_INGESTION_SPLIT_STRATEGY
+    # Streaming split: rows go straight from the Mongo cursor to train/test files
+    split_mode : str = DATA_INGESTION_SPLIT_MODE
+    streaming_split_strategy : str = DATA_INGESTION_STREAMING_SPLIT_STRATEGY
+    split_key : str = DATA_INGESTION_SPLIT_KEY
+    # Incremental ingestion: cache and watermark are shared by every run, not timestamped
+    incremental : bool = DATA_INGESTION_INCREMENTAL
+    feature_store_cache_file_path : str = Path.joinpath(Path(ARTIFACT_DIR),DATA_INGESTION_FEATURE_STORE_DIR,FILE_NAME)
+    watermark_file_path : str = Path.joinpath(
+        Path(ARTIFACT_DIR),DATA_INGESTION_FEATURE_STORE_DIR,DATA_INGESTION_WATERMARK_FILE_NAME
+    )
+    watermark_field : str = DATA_INGESTION_WATERMARK_FIELD
+    merge_key : str = DATA_INGESTION_MERGE_KEY
+    # Artifact format: "csv", "parquet" or "feather"; file extensions follow it
+    file_format : str = DATA_INGESTION_FILE_FORMAT
+    parquet_compression : str = DATA_INGESTION_PARQUET_COMPRESSION
+    training_pipeline_config : InitVar[TrainPipeLineConfig] = None
+
+    def __post_init__(self, training_pipeline_config):
+        if self.data_ingestion_dir is None:
+            artifact_dir = (training_pipeline_config or default_training_pipeline_config()).artifact_dir
+            self.data_ingestion_dir = Path.joinpath(Path(artifact_dir),DATA_INGESTION_DIR_NAME)
+        if self.feature_store_file_path is None:
+            self.feature_store_file_path = Path.joinpath(
+                Path(self.data_ingestion_dir),DATA_INGESTION_FEATURE_STORE_DIR,FILE_NAME
+            )
+        if self.training_file_path is None:
+            self.training_file_path = Path.joinpath(
+                Path(self.data_ingestion_dir),DATA_INGESTION_INGESTED_DIR,TRAIN_FILE_NAME
+            )
+        if self.testing_file_path is None:
+            self.testing_file_path = Path.joinpath(
+                Path(self.data_ingestion_dir),DATA_INGESTION_INGESTED_DIR,TEST_FILE_NAME
+            )
+
+        if self.file_format not in DATAFRAME_FILE_FORMATS:
+            raise ValueError(
+                f"Unsupported file_format '{self.file_format}', expected one of {list(DATAFRAME_FILE_FORMATS)}"
+            )
+
+        if self.split_mode not in ("in_memory", "streaming"):
+            raise ValueError(f"Unsupported split_mode '{self.split_mode}', expected 'in_memory' or 'streaming'")
+
+        if self.split_strategy not in ("stratified", "random"):
+            raise ValueError(f"Unsupported split_strategy '{self.split_strategy}', expected 'stratified' or 'random'")
+
+        suffix = DATAFRAME_FILE_FORMATS[self.file_format]
+        self.feature_store_file_path = Path(self.feature_store_file_path).with_suffix(suffix)
+        self.training_file_path = Path(self.training_file_path).with_suffix(suffix)
+        self.testing_file_path = Path(self.testing_file_path).with_suffix(suffix)
+        self.feature_store_cache_file_path = Path(self.feature_store_cache_file_path).with_suffix(suffix)
+
+
+@dataclass
+class DataValidationConfig:
+    data_validation_dir : str = None
+    validation_report_file_path : str = None
+    schema_file_path : str = SCHEMA_FILE_PATH
+    # Rows read per chunk, so a file is validated without loading it whole
+    chunk_size : int = DATA_VALIDATION_CHUNK_SIZE
+    max_null_ratio : float = DATA_VALIDATION_MAX_NULL_RATIO
+    histogram_bins : int = DATA_VALIDATION_HISTOGRAM_BINS
+    drift_threshold : float = DATA_VALIDATION_DRIFT_THRESHOLD
+    drift_exclude_columns : tuple = DATA_VALIDATION_DRIFT_EXCLUDE_COLUMNS
+    training_pipeline_config : InitVar[TrainPipeLineConfig] = None
+
+    def __post_init__(self, training_pipeline_config):
+        if self.data_validation_dir is None:
+            artifact_dir = (training_pipeline_config or default_training_pipeline_config()).artifact_dir
+            self.data_validation_dir = Path.joinpath(Path(artifact_dir),DATA_VALIDATION_DIR_NAME)
+        if self.validation_report_file_path is None:
+            self.validation_report_file_path = Path.joinpath(
+                Path(self.data_validation_dir),DATA_VALIDATION_REPORT_FILE_NAME
+            )
+
+@dataclass
+class DataTransformationConfig:
+    data_transformation_dir : str = None
+    transformed_train_file_path : str = None
+    transformed_test_file_path : str = None
+    transformed_object_file_path : str = None
+    resampled_index_file_path : str = None
+    sample_weight_file_path : str = None
+    smote_train_file_path : str = None
+    schema_file_path : str = SCHEMA_FILE_PATH
+    # Rows read per chunk when fitting and transforming
+    chunk_size : int = DATA_TRANSFORMATION_CHUNK_SIZE
+    resampling_strategy : str = DATA_TRANSFORMATION_RESAMPLING_STRATEGY
+    sampling_ratio : float = DATA_TRANSFORMATION_SAMPLING_RATIO
+    random_state : int = DATA_TRANSFORMATION_RANDOM_STATE
+    training_pipeline_config : InitVar[TrainPipeLineConfig] = None
+
+    def __post_init__(self, training_pipeline_config):
+        if self.data_transformation_dir is None:
+            artifact_dir = (training_pipeline_config or default_training_pipeline_config()).artifact_dir
+            self.data_transformation_dir = Path.joinpath(Path(artifact_dir),DATA_TRANSFORMATION_DIR_NAME)
+        if self.transformed_train_file_path is None:
+            self.transformed_train_file_path = Path.joinpath(
+                Path(self.data_transformation_dir),DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,TRAIN_FILE_NAME
+            ).with_suffix(".npy")
+        if self.transformed_test_file_path is None:
+            self.transformed_test_file_path = Path.joinpath(
+                Path(self.data_transformation_dir),DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,TEST_FILE_NAME
+            ).with_suffix(".npy")
+        if self.transformed_object_file_path is None:
+            self.transformed_object_file_path = Path.joinpath(
+                Path(self.data_transformation_dir),DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR,PREPROCESSING_OBJECT_FILE_NAME
+            )
+        transformed_dir = Path(self.transformed_train_file_path).parent
+        if self.resampled_index_file_path is None:
+            self.resampled_index_file_path = Path.joinpath(
+                transformed_dir,DATA_TRANSFORMATION_RESAMPLED_INDEX_FILE_NAME
+            )
+        if self.sample_weight_file_path is None:
+            self.sample_weight_file_path = Path.joinpath(transformed_dir,DATA_TRANSFORMATION_SAMPLE_WEIGHT_FILE_NAME)
+        if self.smote_train_file_path is None:
+            self.smote_train_file_path = Path.joinpath(transformed_dir,DATA_TRANSFORMATION_SMOTE_TRAIN_FILE_NAME)
+
+        if self.resampling_strategy not in ("none", "random_oversample", "class_weight", "smote"):
+            raise ValueError(
+                f"Unsupported resampling_strategy '{self.resampling_strategy}', "
+                "expected 'none', 'random_oversample', 'class_weight' or 'smote'"
+            )
+
+@dataclass
+class ModelTrainerConfig:
+    model_trainer_dir : str = None
+    trained_model_file_path : str = None
+    search_report_file_path : str = None
+    model_config_file_path : str = MODEL_TRAINER_MODEL_CONFIG_FILE_PATH
+    expected_score : float = MODEL_TRAINER_EXPECTED_SCORE
+    n_jobs : int = MODEL_TRAINER_N_JOBS
+    training_pipeline_config : InitVar[TrainPipeLineConfig] = None
+
+    def __post_init__(self, training_pipeline_config):
+        if self.model_trainer_dir is None:
+            artifact_dir = (training_pipeline_config or default_training_pipeline_config()).artifact_dir
+            self.model_trainer_dir = Path.joinpath(Path(artifact_dir),MODEL_TRAINER_DIR_NAME)
+        if self.trained_model_file_path is None:
+            self.trained_model_file_path = Path.joinpath(
+                Path(self.model_trainer_dir),MODEL_TRAINER_TRAINED_MODEL_DIR,MODEL_TRAINER_TRAINED_MODEL_NAME
+            )
+        if self.search_report_file_path is None:
+            self.search_report_file_path = Path.joinpath(
+                Path(self.model_trainer_dir),MODEL_TRAINER_SEARCH_REPORT_FILE_NAME
+            )
+
+@dataclass
+class ModelEvaluationConfig:
+    model_evaluation_dir : str = None
+    evaluation_report_file_path : str = None
+    deployed_model_file_path : str = MODEL_EVALUATION_DEPLOYED_MODEL_FILE_PATH
+    prediction_cache_dir : str = MODEL_EVALUATION_PREDICTION_CACHE_DIR
+    changed_threshold_score : float = MODEL_EVALUATION_CHANGED_THRESHOLD_SCORE
+    n_bootstrap : int = MODEL_EVALUATION_N_BOOTSTRAP
+    confidence : float = MODEL_EVALUATION_CONFIDENCE
+    random_state : int = MODEL_EVALUATION_RANDOM_STATE
+    chunk_size : int = MODEL_EVALUATION_CHUNK_SIZE
+    # With a bucket the deployed model is the registry's current model, else deployed_model_file_path
+    bucket_name : str = field(default_factory=lambda: os.getenv(MODEL_BUCKET_NAME_ENV_KEY))
+    s3_model_key_path : str = MODEL_PUSHER_S3_KEY
+    registry_cache_dir : str = MODEL_REGISTRY_CACHE_DIR
+    training_pipeline_config : InitVar[TrainPipeLineConfig] = None
+
+    def __post_init__(self, training_pipeline_config):
+        if self.model_evaluation_dir is None:
+            artifact_dir = (training_pipeline_config or default_training_pipeline_config()).artifact_dir
+            self.model_evaluation_dir = Path.joinpath(Path(artifact_dir),MODEL_EVALUATION_DIR_NAME)
+        if self.evaluation_report_file_path is None:
+            self.evaluation_report_file_path = Path.joinpath(
+                Path(self.model_evaluation_dir),MODEL_EVALUATION_REPORT_FILE_NAME
+            )
+
+@dataclass
+class S3StorageConfig:
+    multipart_threshold : int = S3_MULTIPART_THRESHOLD
+    multipart_chunksize : int = S3_MULTIPART_CHUNKSIZE
+    max_concurrency : int = S3_MAX_CONCURRENCY  # parts in flight per object
+    upload_max_workers : int = S3_UPLOAD_MAX_WORKERS  # files in flight per directory upload
+    read_buffer_size : int = S3_READ_BUFFER_SIZE
+
+@dataclass
+class ModelPusherConfig:
+    bucket_name : str = field(default_factory=lambda: os.getenv(MODEL_BUCKET_NAME_ENV_KEY))
+    s3_model_key_path : str = MODEL_PUSHER_S3_KEY
+    registry_cache_dir : str = MODEL_REGISTRY_CACHE_DIR
+    deployed_model_file_path : str = MODEL_EVALUATION_DEPLOYED_MODEL_FILE_PATH  # without a bucket
+
+@dataclass
+class PredictionServiceConfig:
+    model_file_path : str = PREDICTION_MODEL_FILE_PATH
+    # With a bucket the model is fetched from the registry at startup into model_file_path's place
+    bucket_name : str = field(default_factory=lambda: os.getenv(MODEL_BUCKET_NAME_ENV_KEY))
+    s3_model_key_path : str = MODEL_PUSHER_S3_KEY
+    registry_cache_dir : str = MODEL_REGISTRY_CACHE_DIR
+    max_batch_size : int = PREDICTION_MAX_BATCH_SIZE
+    max_wait_ms : float = PREDICTION_MAX_WAIT_MS
+    batch_size : int = PREDICTION_BATCH_SIZE  # rows per vectorized call of /predict/batch
+    # Collection of customer records served by GET /predict/{id}; the route is off when None
+    lookup_collection_name : str = None
+    host : str = APP_HOST
+    port : int = APP_PORT
+
+@dataclass
+class BatchPredictionConfig:
+    input_collection_name : str = COLLECTION_NAME
+    output : str = BATCH_PREDICTION_OUTPUT
+    output_collection_name : str = None  # <input_collection_name>-Predictions when not given
+    batch_prediction_dir : str = None
+    checkpoint_file_path : str = None
+    output_dir : str = None
+    model_file_path : str = PREDICTION_MODEL_FILE_PATH
+    bucket_name : str = field(default_factory=lambda: os.getenv(MODEL_BUCKET_NAME_ENV_KEY))
+    s3_model_key_path : str = MODEL_PUSHER_S3_KEY
+    registry_cache_dir : str = MODEL_REGISTRY_CACHE_DIR
+    chunk_size : int = BATCH_PREDICTION_CHUNK_SIZE
+    num_workers : int = BATCH_PREDICTION_NUM_WORKERS
+    key_field : str = BATCH_PREDICTION_KEY_FIELD
+    use_schema : bool = True
+    parquet_compression : str = DATA_INGESTION_PARQUET_COMPRESSION
 
+    def __post_init__(self):
+        if self.output not in ("mongo", "parquet"):
+            raise ValueError(f"output must be 'mongo' or 'parquet', got '{self.output}'")
+        if self.output_collection_name is None:
+            self.output_collection_name = self.input_collection_name + BATCH_PREDICTION_OUTPUT_COLLECTION_SUFFIX
+        if self.batch_prediction_dir is None:
+            self.batch_prediction_dir = Path.joinpath(BATCH_PREDICTION_DIR,self.input_collection_name)
+        if self.checkpoint_file_path is None:
+            self.checkpoint_file_path = Path.joinpath(
+                Path(self.batch_prediction_dir),BATCH_PREDICTION_CHECKPOINT_FILE_NAME
+            )
+        if self.output_dir is None:
+            self.output_dir = Path.joinpath(Path(self.batch_prediction_dir),BATCH_PREDICTION_OUTPUT_DIR_NAME)
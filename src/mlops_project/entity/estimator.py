@@ -0,0 +1,147 @@
+import sys
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from mlops_project.constants import MODEL_MMAP_MODE
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.utils.main_utils import load_object, save_object
+
+
+def as_dataframe(data) -> pd.DataFrame:
+    """
+    Feature rows as one DataFrame: a DataFrame as is, a NumPy record (structured)
+    array, a list of records (dicts) or a dict of columns.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, np.ndarray):
+        if data.dtype.names is None:
+            raise TypeError("A NumPy array of feature rows needs named fields (record array)")
+        return pd.DataFrame.from_records(data)
+    if isinstance(data, dict):
+        return pd.DataFrame(data)
+    return pd.DataFrame.from_records(list(data))
+
+
+class MyModel:
+    """
+    Fitted preprocessing object and trained model, saved together so
+    prediction applies exactly the transformation the model was trained on.
+    """
+
+    def __init__(self, preprocessing_object: object, trained_model_object: object):
+        self.preprocessing_object = preprocessing_object
+        self.trained_model_object = trained_model_object
+
+    # -------------------------------------------------------------------------
+    def save(self, file_path: str | Path) -> None:
+        """
+        Saves the model uncompressed, so ``load`` can memory-map its arrays.
+        """
+        save_object(file_path, self)
+
+    @classmethod
+    def load(cls, file_path: str | Path, mmap_mode: Optional[str] = MODEL_MMAP_MODE) -> "MyModel":
+        """
+        Loads a saved model with its NumPy arrays memory-mapped (read-only)
+        from the file rather than copied into the process.
+
+        Estimators that predict from their arrays (coefficients, fitted data,
+        histogram-GBM nodes) then share those pages with every process that
+        maps the same file. Tree ensembles copy their nodes while unpickling;
+        for them the mapping only spares the temporary copy of the arrays, which
+        the allocator would otherwise keep in the process's memory.
+
+        Raises:
+            MyException: If the file cannot be read or holds no ``MyModel``.
+        """
+        model = load_object(file_path, mmap_mode=mmap_mode)
+        if not isinstance(model, cls):
+            raise MyException(f"{file_path} holds a {type(model).__name__}, not a {cls.__name__}", sys)
+        return model
+
+    def predict(self, dataframe: pd.DataFrame):
+        """
+        Transforms raw feature rows with the preprocessing object and predicts with the model.
+        """
+        try:
+            get_logger("Estimator").debug(f"Predicting {len(dataframe)} rows")
+            transformed_feature = self.preprocessing_object.transform(dataframe)
+            return self.trained_model_object.predict(transformed_feature)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def predict_proba(self, dataframe: pd.DataFrame):
+        """
+        Transforms raw feature rows and returns the model's class probabilities (columns in ``classes_`` order).
+        """
+        try:
+            get_logger("Estimator").debug(f"Predicting probabilities of {len(dataframe)} rows")
+            transformed_feature = self.preprocessing_object.transform(dataframe)
+            return self.trained_model_object.predict_proba(transformed_feature)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def _batched(self, method: str, data, batch_size: Optional[int]) -> np.ndarray:
+        # Counted after the conversion: generators and other iterables have no len()
+        dataframe = as_dataframe(data)
+        get_logger("Estimator").debug(
+            f"Predicting {'probabilities of ' if method == 'predict_proba' else ''}a batch of {len(dataframe)} rows"
+        )
+        if not len(dataframe):
+            return np.empty((0, len(self.classes_)) if method == "predict_proba" else 0)
+
+        model_method = getattr(self.trained_model_object, method)
+        batch_size = batch_size or len(dataframe)
+        outputs = [
+            model_method(self.preprocessing_object.transform(dataframe.iloc[start:start + batch_size]))
+            for start in range(0, len(dataframe), batch_size)
+        ]
+        return outputs[0] if len(outputs) == 1 else np.concatenate(outputs)
+
+    def predict_batch(self, data, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Predicts many rows with one transform and one predict call per batch.
+
+        Args:
+            data: DataFrame, record array, list of records or dict of columns (see ``as_dataframe``).
+            batch_size (Optional[int]): Rows per call, to bound memory; all rows at once when None.
+
+        Returns:
+            np.ndarray: One prediction per row, in input order.
+        """
+        try:
+            return self._batched("predict", data, batch_size)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def predict_proba_batch(self, data, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Class probabilities of many rows, batched like ``predict_batch``.
+
+        Returns:
+            np.ndarray: ``(n_rows, n_classes)`` probabilities, columns in ``classes_`` order.
+        """
+        try:
+            return self._batched("predict_proba", data, batch_size)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @property
+    def classes_(self):
+        return self.trained_model_object.classes_
+
+    def __repr__(self):
+        return f"{type(self.trained_model_object).__name__}()"
+
+    def __str__(self):
+        return f"{type(self.trained_model_object).__name__}()"
@@ -0,0 +1,184 @@
+import hashlib
+import os
+import shutil
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from mlops_project.cloud_storage.aws_storage import SimpleStorageService
+from mlops_project.constants import (
+    MODEL_FILE_NAME,
+    MODEL_PUSHER_S3_KEY,
+    MODEL_REGISTRY_CACHE_DIR,
+    MODEL_REGISTRY_SHA256_METADATA_KEY,
+    MODEL_REGISTRY_VERSIONS_PREFIX,
+)
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+
+def _file_sha256(file_path) -> str:
+    with open(file_path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+class Proj1Estimator:
+    """
+    S3 model registry with a local, content-addressed cache.
+
+    A push uploads the ``model.pkl`` bundle once, to
+    ``<model_path>/versions/<version>/model.pkl`` with its sha256 as object
+    metadata, then copies it server-side to ``<model_path>/model.pkl``, the
+    current model.
+
+    A fetch costs one HEAD of the current model: the file is downloaded only
+    if ``<cache_dir>/<sha256>/model.pkl`` is not there yet (the ETag stands
+    in for objects pushed without the metadata), so workers and evaluation
+    runs reuse the copy on disk until a new model is pushed. Downloads go to
+    a temporary file renamed into place, so concurrent workers never read a
+    partial file, and pin the HEAD's version on versioned buckets.
+    """
+
+    def __init__(
+        self, bucket_name: str, model_path: str = MODEL_PUSHER_S3_KEY, cache_dir: str | Path = MODEL_REGISTRY_CACHE_DIR
+    ):
+        self.bucket_name = bucket_name
+        self.model_path = model_path.strip("/")
+        self.cache_dir = Path(cache_dir)
+        self.s3 = SimpleStorageService()
+
+    @property
+    def current_key(self) -> str:
+        return f"{self.model_path}/{MODEL_FILE_NAME}"
+
+    def _version_key(self, version: str) -> str:
+        return f"{self.model_path}/{MODEL_REGISTRY_VERSIONS_PREFIX}/{version}/{MODEL_FILE_NAME}"
+
+    # -------------------------------------------------------------------------
+    def get_current_version(self) -> Optional[dict]:
+        """
+        Identity of the current model: ``sha256`` (None if pushed without it),
+        ``etag``, ``version_id``, ``size`` and registry ``version``; None when
+        no model was pushed.
+        """
+        try:
+            head = self.s3.get_object_metadata(self.bucket_name, self.current_key)
+            if head is None:
+                return None
+            return {
+                "sha256": head["metadata"].get(MODEL_REGISTRY_SHA256_METADATA_KEY),
+                "version": head["metadata"].get("version"),
+                "etag": head["etag"],
+                "version_id": head["version_id"],
+                "size": head["size"],
+            }
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def is_model_present(self) -> bool:
+        return self.get_current_version() is not None
+
+    def list_versions(self) -> list[str]:
+        """Pushed versions, oldest first."""
+        prefix = f"{self.model_path}/{MODEL_REGISTRY_VERSIONS_PREFIX}/"
+        return sorted({key[len(prefix):].split("/", 1)[0] for key in self.s3.list_keys(self.bucket_name, prefix)})
+
+    # -------------------------------------------------------------------------
+    def save_model(self, from_file: str | Path) -> dict:
+        """
+        Pushes ``from_file`` as a new version and makes it the current model.
+        Pushing the current model again uploads nothing.
+
+        Returns:
+            dict: ``version``, ``sha256`` and the ``s3_model_path`` of the current model.
+        """
+        logger = get_logger("S3 Estimator")
+
+        try:
+            sha256 = _file_sha256(from_file)
+            current = self.get_current_version()
+            if current is not None and current["sha256"] == sha256:
+                logger.info(f"Model {sha256[:12]} is already the current version {current['version']}")
+                return {"version": current["version"], "sha256": sha256, "s3_model_path": self.current_key}
+
+            version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{sha256[:12]}"
+            self.s3.upload_file(
+                from_file,
+                self.bucket_name,
+                self._version_key(version),
+                metadata={MODEL_REGISTRY_SHA256_METADATA_KEY: sha256, "version": version},
+            )
+            self.s3.copy_object(self.bucket_name, self._version_key(version), self.current_key)
+
+            # The pushed file is the cached copy of this version
+            self._store_in_cache(from_file, sha256, copy=True)
+            logger.info(f"Pushed model version {version} to s3://{self.bucket_name}/{self.current_key}")
+            return {"version": version, "sha256": sha256, "s3_model_path": self.current_key}
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def _cache_path(self, content_key: str) -> Path:
+        return self.cache_dir / content_key / MODEL_FILE_NAME
+
+    def _store_in_cache(self, file_path, content_key: str, copy: bool) -> Path:
+        cache_path = self._cache_path(content_key)
+        os.makedirs(cache_path.parent, exist_ok=True)
+        if copy:
+            temporary_path = cache_path.with_name(f".{os.getpid()}.tmp")
+            shutil.copyfile(file_path, temporary_path)
+            file_path = temporary_path
+        os.replace(file_path, cache_path)
+        return cache_path
+
+    def fetch_model(self) -> Optional[Path]:
+        """
+        Local path of the current model, downloaded only when not in the cache.
+
+        Returns:
+            Optional[Path]: ``<cache_dir>/<sha256 or etag>/model.pkl``; None when no model was pushed.
+        """
+        logger = get_logger("S3 Estimator")
+
+        try:
+            current = self.get_current_version()
+            if current is None:
+                return None
+
+            content_key = current["sha256"] or f"etag-{current['etag']}"
+            cache_path = self._cache_path(content_key)
+            if cache_path.exists() and cache_path.stat().st_size == current["size"]:
+                logger.debug(f"Model {content_key[:17]} served from {cache_path}")
+                return cache_path
+
+            temporary_path = cache_path.with_name(f".{os.getpid()}-{current['etag']}.tmp")
+            self.s3.download_file(self.bucket_name, self.current_key, temporary_path, version_id=current["version_id"])
+            if current["sha256"] is not None and _file_sha256(temporary_path) != current["sha256"]:
+                os.remove(temporary_path)
+                raise ValueError(f"Downloaded model does not match its sha256 {current['sha256']}")
+
+            return self._store_in_cache(temporary_path, content_key, copy=False)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def load_model(self):
+        """
+        The current model as a ``MyModel``, loaded at most once per process and version.
+        """
+        from mlops_project.pipeline.prediction_pipeline import load_model
+
+        model_file_path = self.fetch_model()
+        if model_file_path is None:
+            raise MyException(f"No model in s3://{self.bucket_name}/{self.current_key}", sys)
+        return load_model(model_file_path)
+
+    def predict(self, dataframe):
+        """Predicts with the current model, one vectorized call for all rows."""
+        try:
+            return self.load_model().predict_batch(dataframe)
+        except Exception as e:
+            raise MyException(e, sys)
@@ -1,5 +1,6 @@
 import sys
-import logging
+
+from mlops_project.logger import get_logger
 
 def error_message_detail(error: Exception, error_detail: sys) -> str:
     """
@@ -24,7 +25,8 @@ def error_message_detail(error: Exception, error_detail: sys) -> str:
         # Fallback when no traceback exists (e.g., manually raised exceptions)
         error_message = f"Error: {str(error)}"
 
-    logging.error(error_message)
+    # Through get_logger so an unconfigured root logger is set up, not basicConfig'd
+    get_logger("MyException").error(error_message)
     return error_message
 
 
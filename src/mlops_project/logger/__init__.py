@@ -1,73 +1,232 @@
-
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from datetime import datetime
-from mlops_project.utils.env_loader import load_all_envs
 import os
-from from_root import from_root
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
 #------------------------------------------------------------------------------
-#LOAD ENV FILES
+# Importing this module has no side effects: the log dir, the log file and the
+# handlers are created by the first get_logger() call, which is also where
+# .env files are loaded when AUTO_LOAD_DOTENV=1.
+#
+# Environment variables (read when logging is configured):
+#   LOG_QUEUE=1            format and write records on a background thread
+#   LOG_LEVEL              root level (default DEBUG)
+#   LOG_FILE_LEVEL         file handler level (default DEBUG)
+#   LOG_CONSOLE_LEVEL      console handler level (default DEBUG)
+#   LOG_FILE_FORMAT        "text" or "json" (default text)
+#   LOG_CONSOLE_FORMAT     "text" or "json" (default text)
+#   LOG_DIR                log directory (default <root>/logs)
 #------------------------------------------------------------------------------
-# Auto-load .env during development
-# if os.getenv("ENV", "DEV") == "DEV":
-#     try:
-#         load_all_envs()
-#     except Exception as e:
-#         print("ENV LOADING ERROR:", e)
-
-if os.getenv("AUTO_LOAD_DOTENV", "0") == "1":
-    try:
-        load_all_envs()
-        print("[ENV LOADER] sucessfully loaded all environment variables.")
-    except Exception as e:
-        raise
-
 
-#-----------------------------------------------------------------------------------
 # ---------------------- CONFIG ----------------------
 LOG_DIR_NAME = "logs"
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 3
+LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Set by configure_logging()
+LOG_DIR: Optional[Path] = None
+LOG_FILE: Optional[Path] = None
+
+root_logger = logging.getLogger()
+
+_configured = False
+_configure_lock = threading.Lock()
+_handlers: list[logging.Handler] = []  # handlers installed on the root logger
+_listener = None  # QueueListener in queue mode
+
+
+#------------------------------------------------------------------------------
+#LOAD ENV FILES
+#------------------------------------------------------------------------------
+def _load_envs() -> None:
+    # Auto-load .env during development
+    # if os.getenv("ENV", "DEV") == "DEV":
+    #     try:
+    #         load_all_envs()
+    #     except Exception as e:
+    #         print("ENV LOADING ERROR:", e)
+
+    if os.getenv("AUTO_LOAD_DOTENV", "0") == "1":
+        from mlops_project.utils.env_loader import load_all_envs
+
+        load_all_envs()
+        print("[ENV LOADER] sucessfully loaded all environment variables.")
+
+
+# ---------------------- FORMATTERS ----------------------
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per line.
+
+    Fields passed with ``extra=`` are kept as top-level keys, so timings can be
+    logged as numbers, e.g. ``logger.debug("batch", extra={"rows": n, "seconds": s})``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": f"{record.filename}:{record.lineno}",
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        payload.update(
+            (key, value) for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, default=str)
+
+
+def _formatter(kind: str) -> logging.Formatter:
+    if kind == "json":
+        return JsonFormatter(datefmt=LOG_DATE_FORMAT)
+    if kind == "text":
+        return logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    raise ValueError(f"Unsupported log format '{kind}', expected 'text' or 'json'")
 
-# ---------------------- PATH SETUP ----------------------
-root_path = from_root()
 
-LOG_DIR = root_path / LOG_DIR_NAME
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+# ---------------------- QUEUE MODE ----------------------
+def _queue_handler_class():
+    from logging.handlers import QueueHandler
+
+    class DeferredQueueHandler(QueueHandler):
+        """
+        QueueHandler that enqueues the record untouched.
+
+        The stock ``prepare`` merges ``msg % args`` and renders tracebacks on the
+        calling thread; the queue here never leaves the process, so all of
+        that is left to the listener thread.
+        """
+
+        def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+            return record
+
+    return DeferredQueueHandler
 
-# Timestamped log file
-LOG_FILE = LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d %H-%M-%S')}.log"
 
 # ---------------------- ROOT LOGGER SETUP ----------------------
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.DEBUG)
-root_logger.propagate = False #avoid duplicate records by parent and child loggers
-
-if not root_logger.handlers:
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(filename)s:%(lineno)d | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-
-    # File Handler
-    fh = RotatingFileHandler(
-        filename=LOG_FILE,
-        maxBytes=MAX_LOG_SIZE,
-        backupCount=BACKUP_COUNT,
-        encoding="utf-8"
-    )
-    fh.setLevel(logging.DEBUG)
-    fh.setFormatter(formatter)
-    root_logger.addHandler(fh)
-
-    # Console Handler
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.DEBUG)
-    ch.setFormatter(formatter)
-    root_logger.addHandler(ch)
+def configure_logging(force: bool = False) -> None:
+    """
+    Load .env files (if AUTO_LOAD_DOTENV=1) and attach the file and console
+    handlers to the root logger. Runs once per process; later calls are no-ops
+    unless ``force`` is set, which first shuts the current setup down and
+    installs the handlers even if the root logger already has some.
+
+    With LOG_QUEUE=1 the root logger only gets a QueueHandler: callers pay for
+    an enqueue, while a QueueListener thread formats the records and writes
+    them to the file and console handlers. The listener is stopped, and the
+    queue drained, at interpreter exit.
+    """
+    global _configured, _listener, LOG_DIR, LOG_FILE
+
+    if _configured and not force:
+        return
+
+    with _configure_lock:
+        if _configured and not force:
+            return
+
+        if _configured:
+            shutdown_logging()
+        else:
+            _load_envs()
+
+        # ---------------------- PATH SETUP ----------------------
+        from logging.handlers import QueueListener, RotatingFileHandler
+
+        from from_root import from_root
+
+        LOG_DIR = Path(os.getenv("LOG_DIR") or from_root() / LOG_DIR_NAME)
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+        # Timestamped log file
+        LOG_FILE = LOG_DIR / f"{datetime.now().strftime('%Y-%m-%d %H-%M-%S')}.log"
+
+        root_logger.setLevel(os.getenv("LOG_LEVEL", "DEBUG").upper())
+        root_logger.propagate = False #avoid duplicate records by parent and child loggers
+
+        if force or not root_logger.handlers:
+            # File Handler
+            fh = RotatingFileHandler(
+                filename=LOG_FILE,
+                maxBytes=MAX_LOG_SIZE,
+                backupCount=BACKUP_COUNT,
+                encoding="utf-8"
+            )
+            fh.setLevel(os.getenv("LOG_FILE_LEVEL", "DEBUG").upper())
+            fh.setFormatter(_formatter(os.getenv("LOG_FILE_FORMAT", "text")))
+
+            # Console Handler
+            ch = logging.StreamHandler()
+            ch.setLevel(os.getenv("LOG_CONSOLE_LEVEL", "DEBUG").upper())
+            ch.setFormatter(_formatter(os.getenv("LOG_CONSOLE_FORMAT", "text")))
+
+            if os.getenv("LOG_QUEUE", "0") == "1":
+                import queue
+
+                log_queue = queue.SimpleQueue()
+                _listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+                _listener.start()
+                _handlers.append(_queue_handler_class()(log_queue))
+            else:
+                _handlers.extend([fh, ch])
+
+            for handler in _handlers:
+                root_logger.addHandler(handler)
+
+        _configured = True
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the queue listener (writing every pending record), then flush, close
+    and detach the handlers installed by configure_logging. Registered with
+    atexit; safe to call more than once.
+    """
+    global _configured, _listener
+
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+            handler.close()
+
+    while _handlers:
+        handler = _handlers.pop()
+        root_logger.removeHandler(handler)
+        handler.flush()
+        handler.close()
+
+    _configured = False
+
+
+def _shutdown_at_exit() -> None:
+    global _configured
+
+    shutdown_logging()
+    # Records logged by later exit hooks go to logging.lastResort, not to a new setup
+    _configured = True
+
+
+atexit.register(_shutdown_at_exit)
+
 
 # ---------------------- PUBLIC API ----------------------
 def get_logger(name: str = __name__) -> logging.Logger:
     """Return a logger with the given name; defaults to root logger."""
+    configure_logging()
     return logging.getLogger(name) if name else root_logger
@@ -0,0 +1,227 @@
+"""
+Micro-batching of concurrent single-record predictions.
+
+Requests put their record on an asyncio queue and await a future. One
+collector task takes the first waiting record, gathers more for at most
+``max_wait_ms`` (or until ``max_batch_size``), and scores the whole batch
+with one call of the vectorized ``predict_fn`` on a worker thread, so the
+event loop keeps accepting requests meanwhile. Requests that arrive while a
+batch is scored form the next one, so batches grow with the load.
+
+Queue depths, batch sizes and waits are recorded in histograms to tune
+the two settings.
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence
+
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+
+class Histogram:
+    """
+    Counts of observations per bucket, each bucket keyed by its inclusive upper bound ("+Inf" last).
+    """
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = sorted(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        index = next((i for i, bound in enumerate(self.bounds) if value <= bound), len(self.bounds))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def to_dict(self) -> dict:
+        labels = [f"{bound:g}" for bound in self.bounds] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+        }
+
+
+def _powers_of_two(limit: int) -> list[int]:
+    bounds, bound = [], 1
+    while bound < limit:
+        bounds.append(bound)
+        bound *= 2
+    return bounds + [limit]
+
+
+class BatchCoalescer:
+    """
+    Coalesces concurrent ``submit`` calls into batches for a vectorized function.
+
+    Args:
+        predict_fn (Callable): Takes a list of records, returns one result per record, in order.
+        max_batch_size (int): Most records scored in one call.
+        max_wait_ms (float): Longest a batch waits for more records after its first one.
+        executor (Optional[ThreadPoolExecutor]): Worker of ``predict_fn``; a single thread when None.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[list], Sequence],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        if max_batch_size < 1 or max_wait_ms < 0:
+            raise ValueError(f"Invalid batching: max_batch_size={max_batch_size}, max_wait_ms={max_wait_ms}")
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+
+        self.requests = 0
+        self.batches = 0
+        self.failed_batches = 0
+        self.batch_size_histogram = Histogram(_powers_of_two(max_batch_size))
+        self.queue_depth_histogram = Histogram([0, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024])
+        self.wait_ms_histogram = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100])
+        self.predict_ms_histogram = Histogram([1, 2, 5, 10, 20, 50, 100, 200, 500, 1000])
+
+    # -------------------------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._collector is not None and not self._collector.done()
+
+    async def start(self) -> None:
+        """Starts the collector task on the running event loop."""
+        if self.running:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="predict")
+        self._queue = asyncio.Queue()
+        self._collector = asyncio.create_task(self._collect(), name="batch-coalescer")
+
+    async def stop(self) -> None:
+        """Stops collecting; waiting requests fail with CancelledError."""
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def submit(self, record: Any) -> Any:
+        """
+        Queues one record and returns its result once its batch is scored.
+        """
+        if not self.running:
+            raise RuntimeError("BatchCoalescer is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        self.requests += 1
+        self._queue.put_nowait((record, future, time.perf_counter()))
+        return await future
+
+    # -------------------------------------------------------------------------
+    async def _next_batch(self) -> list:
+        """Waits for one request, then gathers more until the batch is full or max_wait_ms passed."""
+        batch = [await self._queue.get()]
+        self.queue_depth_histogram.observe(self._queue.qsize() + 1)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait_ms / 1000
+        try:
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Stopped while gathering: these records are off the queue, so stop() cannot see them
+            self._cancel(batch)
+            raise
+        return batch
+
+    @staticmethod
+    def _cancel(batch: list) -> None:
+        for _, future, _ in batch:
+            if not future.done():
+                future.cancel()
+
+    async def _collect(self) -> None:
+        logger = get_logger("BatchCoalescer")
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = await self._next_batch()
+            # Requests whose client went away are not scored
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+
+            start = time.perf_counter()
+            for _, _, queued_at in batch:
+                self.wait_ms_histogram.observe((start - queued_at) * 1000)
+            self.batch_size_histogram.observe(len(batch))
+            self.batches += 1
+
+            try:
+                records = [record for record, _, _ in batch]
+                results = await loop.run_in_executor(self._executor, self.predict_fn, records)
+                if len(results) != len(batch):
+                    raise ValueError(f"predict_fn returned {len(results)} results for {len(batch)} records")
+            except asyncio.CancelledError:
+                # Stopped while the batch was scored; CancelledError is not an Exception
+                self._cancel(batch)
+                raise
+            except Exception as e:
+                self.failed_batches += 1
+                logger.error(f"Batch of {len(batch)} records failed: {e}")
+                error = e if isinstance(e, MyException) else MyException(e, sys)
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            finally:
+                self.predict_ms_histogram.observe((time.perf_counter() - start) * 1000)
+
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    # -------------------------------------------------------------------------
+    def metrics(self) -> dict:
+        """Settings, counters and histograms of the coalescer."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "requests": self.requests,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "batch_size": self.batch_size_histogram.to_dict(),
+            "queue_depth_at_batch_start": self.queue_depth_histogram.to_dict(),
+            "wait_ms": self.wait_ms_histogram.to_dict(),
+            "predict_ms": self.predict_ms_histogram.to_dict(),
+        }
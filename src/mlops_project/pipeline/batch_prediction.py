@@ -0,0 +1,304 @@
+"""
+Offline scoring of a whole MongoDB collection.
+
+Documents are streamed in ``key_field`` order (``_id`` by default) with the
+``ProjData`` cursor, in fixed-size chunks. Each chunk is scored with one
+vectorized call of the prediction pipeline and its predictions are written
+with an unordered ``insert_many`` (or as one Parquet part file). Chunks
+are scored and written on a thread pool while the main thread keeps
+reading the cursor.
+
+After every chunk, the checkpoint file records the last key of the longest
+run of finished chunks from the start, so a crashed or interrupted job
+resumes right after it; chunks finished beyond that run are done again,
+which both outputs tolerate: duplicates are replaced, and part files the
+checkpoint does not list are removed before the run (all of them on a
+restart). A finished job's checkpoint makes the next run score only the
+documents added since.
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from mlops_project.configuration.mongo_db_connection import MongoClient
+from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.entity.config_entity import BatchPredictionConfig
+from mlops_project.entity.s3_estimator import Proj1Estimator
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+from mlops_project.pipeline.prediction_pipeline import PredictionPipeline
+from mlops_project.utils.main_utils import write_dataframe
+
+# Duplicate key: the document was written by the run that crashed
+_DUPLICATE_KEY_ERROR = 11000
+
+
+class BatchPrediction:
+    """
+    Scores ``config.input_collection_name`` into ``config.output_collection_name``
+    or Parquet files under ``config.output_dir``, resumably.
+    """
+
+    def __init__(
+        self, batch_prediction_config: BatchPredictionConfig = None, prediction_pipeline: PredictionPipeline = None
+    ):
+        try:
+            self.batch_prediction_config = batch_prediction_config or BatchPredictionConfig()
+            # Chunks are already bounded by chunk_size: one call per chunk
+            self.prediction_pipeline = prediction_pipeline or PredictionPipeline(
+                self.get_model_file_path(), batch_size=None
+            )
+            self._output_collection = None
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def get_model_file_path(self):
+        """
+        The registry's current model (through the local model cache) when a
+        bucket is configured and holds one, else ``config.model_file_path``.
+        """
+        config = self.batch_prediction_config
+        if config.bucket_name:
+            model_file_path = Proj1Estimator(
+                config.bucket_name, model_path=config.s3_model_key_path, cache_dir=config.registry_cache_dir
+            ).fetch_model()
+            if model_file_path is not None:
+                return model_file_path
+        return config.model_file_path
+
+    # ---------------------- CHECKPOINT ----------------------
+    def read_checkpoint(self) -> Optional[dict]:
+        """
+        Returns the saved checkpoint (``last_key``, ``rows`` ...), or None before the first chunk.
+        """
+        try:
+            from bson import json_util
+
+            checkpoint_file_path = self.batch_prediction_config.checkpoint_file_path
+            if not os.path.exists(checkpoint_file_path):
+                return None
+            with open(checkpoint_file_path) as checkpoint_file:
+                return json_util.loads(checkpoint_file.read())
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def write_checkpoint(self, last_key, rows: int, parts: Optional[list[str]] = None) -> None:
+        """
+        Atomically replaces the checkpoint (write to a temporary file, then rename).
+
+        ``parts`` lists the part files written up to ``last_key`` (Parquet output).
+        """
+        try:
+            from bson import json_util
+
+            config = self.batch_prediction_config
+            checkpoint = {
+                "input_collection_name": config.input_collection_name,
+                "key_field": config.key_field,
+                "last_key": last_key,
+                "rows": rows,
+                **({} if parts is None else {"parts": parts}),
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }
+            os.makedirs(os.path.dirname(config.checkpoint_file_path), exist_ok=True)
+            temporary_path = f"{config.checkpoint_file_path}.tmp"
+            with open(temporary_path, "w") as checkpoint_file:
+                checkpoint_file.write(json_util.dumps(checkpoint))
+            os.replace(temporary_path, config.checkpoint_file_path)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # ---------------------- SCORING AND WRITING ----------------------
+    def score_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Predictions of one chunk: its key (and customer ``id``), the predicted class and its probability.
+        """
+        key_field = self.batch_prediction_config.key_field
+        probabilities = self.prediction_pipeline.predict_proba(chunk)
+
+        predictions = {"_id": chunk["_id"].to_numpy()}
+        for column in dict.fromkeys([key_field, "id"]):
+            if column != "_id" and column in chunk.columns:
+                predictions[column] = chunk[column].to_numpy()
+        predictions["prediction"] = (probabilities > 0.5).astype("int8")
+        predictions["probability"] = probabilities
+        return pd.DataFrame(predictions)
+
+    def _insert_predictions(self, predictions: pd.DataFrame) -> None:
+        from pymongo.errors import BulkWriteError
+
+        documents = predictions.to_dict(orient="records")
+        try:
+            self._output_collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            if any(error["code"] != _DUPLICATE_KEY_ERROR for error in errors):
+                raise
+            # Rows scored again after a resume or a restart: replace the earlier
+            # predictions in two round trips. A crash in between is safe, since
+            # the checkpoint has not passed this chunk yet.
+            duplicates = [documents[error["index"]] for error in errors]
+            self._output_collection.delete_many({"_id": {"$in": [document["_id"] for document in duplicates]}})
+            self._output_collection.insert_many(duplicates, ordered=False)
+
+    def _write_part(self, predictions: pd.DataFrame) -> str:
+        config = self.batch_prediction_config
+        # Named by the chunk's first key, which is past the checkpoint: no committed part is overwritten
+        part_file_path = Path(config.output_dir) / f"part-{predictions[config.key_field].iloc[0]}.parquet"
+        temporary_path = part_file_path.with_name(f".{part_file_path.name}.tmp")
+
+        write_dataframe(
+            predictions.astype({"_id": str}), temporary_path, "parquet", compression=config.parquet_compression
+        )
+        os.replace(temporary_path, part_file_path)
+        return part_file_path.name
+
+    def _remove_uncommitted_parts(self, checkpoint: Optional[dict]) -> None:
+        # Written after the checkpoint by a crashed run, possibly with another chunk
+        # size, or before a restart: left in place, their rows would be duplicated
+        committed = set() if checkpoint is None else set(checkpoint.get("parts", []))
+        for part_file_path in Path(self.batch_prediction_config.output_dir).glob("part-*.parquet"):
+            if part_file_path.name not in committed:
+                part_file_path.unlink()
+
+    def process_chunk(self, chunk: pd.DataFrame) -> tuple[object, int, Optional[str]]:
+        """
+        Scores and writes one chunk on a worker thread.
+
+        Returns:
+            tuple[object, int, Optional[str]]: The chunk's last key, its row count and its part file name
+            (None for MongoDB output).
+        """
+        predictions = self.score_chunk(chunk)
+        part_file_name = None
+        if self.batch_prediction_config.output == "mongo":
+            self._insert_predictions(predictions)
+        else:
+            part_file_name = self._write_part(predictions)
+        return chunk[self.batch_prediction_config.key_field].iloc[-1], len(chunk), part_file_name
+
+    # ---------------------- ORCHESTRATION ----------------------
+    def run(self, restart: bool = False) -> dict:
+        """
+        Main Orchestrator:
+        1. Resume after the checkpoint (unless ``restart``)
+        2. Stream chunks and score/write them on the thread pool, at most 2 per worker in flight
+        3. Advance the checkpoint over every contiguous finished chunk
+        4. Return the run report (rows, seconds, rows per second)
+        """
+        logger = get_logger("BatchPrediction")
+
+        try:
+            config = self.batch_prediction_config
+
+            # STEP 1 → Resume point
+            checkpoint = None if restart else self.read_checkpoint()
+            query = None if checkpoint is None else {config.key_field: {"$gt": checkpoint["last_key"]}}
+            total_rows = 0 if checkpoint is None else checkpoint["rows"]
+            logger.info(
+                f"Scoring '{config.input_collection_name}' into {config.output} "
+                + (f"after {config.key_field} {checkpoint['last_key']}" if checkpoint else "from the start")
+            )
+
+            # The reader and every worker each hold a pooled connection
+            max_pool_size = MongoClient.pool_settings()["max_pool_size"]
+            if config.num_workers + 1 > max_pool_size:
+                logger.warning(
+                    f"{config.num_workers} workers and the reader share {max_pool_size} MongoDB connections; "
+                    "raise MongoClientConfig.max_pool_size"
+                )
+            parts = None
+            if config.output == "mongo":
+                self._output_collection = MongoClient().database.get_collection(config.output_collection_name)
+            else:
+                self._remove_uncommitted_parts(checkpoint)
+                parts = [] if checkpoint is None else list(checkpoint.get("parts", []))
+            chunks = ProjData().iter_collection_as_dataframes(
+                config.input_collection_name,
+                batch_size=config.chunk_size,
+                use_schema=config.use_schema,
+                query=query,
+                sort=[(config.key_field, 1)],
+                keep_id=True,
+            )
+
+            start = time.perf_counter()
+            rows = n_chunks = 0
+            pending: dict[Future, int] = {}
+            finished: dict[int, tuple[object, int, Optional[str]]] = {}
+            next_commit = 0
+
+            def collect(block: bool) -> None:
+                nonlocal next_commit, rows, total_rows
+                done, _ = wait(pending, return_when=FIRST_COMPLETED) if block else (
+                    [future for future in pending if future.done()],
+                    None,
+                )
+                for future in done:
+                    finished[pending.pop(future)] = future.result()
+
+                # STEP 3 → Only a contiguous run of chunks can be skipped on resume
+                committed = next_commit
+                while next_commit in finished:
+                    last_key, chunk_rows, part_file_name = finished.pop(next_commit)
+                    rows += chunk_rows
+                    total_rows += chunk_rows
+                    if part_file_name is not None:
+                        parts.append(part_file_name)
+                    next_commit += 1
+                if next_commit > committed:
+                    self.write_checkpoint(last_key, total_rows, parts)
+                    seconds = time.perf_counter() - start
+                    logger.info(f"{rows} rows scored in {seconds:.1f}s ({rows / max(seconds, 1e-9):.0f} rows/s)")
+
+            # STEP 2 → Read on this thread, score and write on the pool
+            with ThreadPoolExecutor(max_workers=config.num_workers, thread_name_prefix="batch-predict") as executor:
+                try:
+                    for chunk in chunks:
+                        pending[executor.submit(self.process_chunk, chunk)] = n_chunks
+                        n_chunks += 1
+                        collect(block=len(pending) >= 2 * config.num_workers)
+                    while pending:
+                        collect(block=True)
+                except BaseException:
+                    # Keep the contiguous chunks that did finish, drop the queued ones
+                    for future in pending:
+                        future.cancel()
+                    wait(pending)
+                    for future in list(pending):
+                        if not future.cancelled() and future.exception() is None:
+                            finished[pending.pop(future)] = future.result()
+                    pending.clear()
+                    collect(block=False)
+                    raise
+
+            # STEP 4 → Report
+            seconds = time.perf_counter() - start
+            report = {
+                "input_collection_name": config.input_collection_name,
+                "output": config.output,
+                "output_location": (
+                    config.output_collection_name if config.output == "mongo" else str(config.output_dir)
+                ),
+                "resumed_after": None if checkpoint is None else str(checkpoint["last_key"]),
+                "rows": rows,
+                "chunks": n_chunks,
+                "total_rows": total_rows,
+                "seconds": round(seconds, 3),
+                "rows_per_second": round(rows / seconds, 1) if seconds > 0 else None,
+            }
+            logger.info(f"Batch prediction finished: {json.dumps(report)}")
+            return report
+
+        except Exception as e:
+            raise MyException(e, sys)
@@ -0,0 +1,128 @@
+"""
+Batch prediction with the deployed model.
+
+The model is loaded once per process and kept in a module-level cache
+keyed by its file, so every request or batch of a worker reuses it; it is
+reloaded only when the file changes (size or modification time). Its NumPy
+arrays are memory-mapped from the file (``MyModel.load``), so workers of
+one host share those pages. Rows are
+never scored one by one: whole batches go through one vectorized
+transform and predict call (``MyModel.predict_batch``).
+
+Importing this module is cheap; pandas and sklearn come with the first
+model load.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from mlops_project.constants import PREDICTION_BATCH_SIZE, PREDICTION_MODEL_FILE_PATH
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from mlops_project.entity.estimator import MyModel
+
+
+# ---------------------- MODEL CACHE ----------------------
+# Resolved model path -> ((size, mtime_ns), model)
+_MODEL_CACHE: dict[str, tuple[tuple[int, int], MyModel]] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _reset_model_cache_lock() -> None:
+    # A child forked while another thread held the lock would never see it released
+    global _MODEL_CACHE_LOCK
+    _MODEL_CACHE_LOCK = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_model_cache_lock)
+
+
+def load_model(model_file_path: str | Path = PREDICTION_MODEL_FILE_PATH) -> MyModel:
+    """
+    Return the model saved at ``model_file_path``, loading it at most once per
+    process and file version.
+
+    Raises:
+        MyException: If the file does not exist or cannot be loaded.
+    """
+    try:
+        key = str(Path(model_file_path).resolve())
+        stat = os.stat(key)
+        version = (stat.st_size, stat.st_mtime_ns)
+
+        cached = _MODEL_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        with _MODEL_CACHE_LOCK:
+            # Another thread may have loaded it while this one waited
+            cached = _MODEL_CACHE.get(key)
+            if cached is None or cached[0] != version:
+                get_logger("Prediction").info(f"Loading model {key} in process {os.getpid()}")
+                from mlops_project.entity.estimator import MyModel
+
+                cached = _MODEL_CACHE[key] = (version, MyModel.load(key))
+            return cached[1]
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def clear_model_cache() -> None:
+    """Drop every cached model (e.g. after a deployment, or in tests)."""
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE.clear()
+
+
+# ---------------------- PREDICTION ----------------------
+class PredictionPipeline:
+    """
+    Scores batches of customer rows with the cached deployed model.
+
+    Args:
+        model_file_path (str | Path): Saved ``MyModel``.
+        batch_size (Optional[int]): Rows per vectorized call; bounds the memory of large inputs.
+    """
+
+    def __init__(
+        self,
+        model_file_path: str | Path = PREDICTION_MODEL_FILE_PATH,
+        batch_size: Optional[int] = PREDICTION_BATCH_SIZE,
+    ):
+        self.model_file_path = model_file_path
+        self.batch_size = batch_size
+
+    @property
+    def model(self) -> MyModel:
+        return load_model(self.model_file_path)
+
+    def predict(self, data) -> np.ndarray:
+        """
+        Predicted class of every row of ``data`` (DataFrame, record array, list of records or dict of columns).
+        """
+        try:
+            return self.model.predict_batch(data, batch_size=self.batch_size)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def predict_proba(self, data) -> np.ndarray:
+        """
+        Positive-class probability of every row of ``data``.
+        """
+        try:
+            model = self.model
+            probabilities = model.predict_proba_batch(data, batch_size=self.batch_size)
+            return probabilities[:, list(model.classes_).index(1)]
+
+        except Exception as e:
+            raise MyException(e, sys)
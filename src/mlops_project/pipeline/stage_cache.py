@@ -0,0 +1,272 @@
+"""
+Content-addressed cache of pipeline stage artifacts.
+
+Each stage run is keyed by a SHA-256 hash of its inputs: a fingerprint of
+the source data, the relevant config fields and the package code version.
+When a key was seen before and every file of the recorded artifact still
+exists, the stage is skipped and the recorded artifact is returned, so an
+unchanged run reuses the outputs of an earlier ``arftifact/<timestamp>`` dir.
+
+Old timestamped artifact dirs are evicted by age and total size.
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterable, Optional, TypeVar
+
+from mlops_project.entity.config_entity import StageCacheConfig
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+Artifact = TypeVar("Artifact")
+
+# Run dirs are named with TrainPipeLineConfig.timestamp, e.g. 11_24_2025_10_15_02
+_RUN_DIR_PATTERN = re.compile(r"^\d{2}_\d{2}_\d{4}_\d{2}_\d{2}_\d{2}$")
+
+
+# ---------------------- FINGERPRINTS ----------------------
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """
+    Hash of every Python source file of the mlops_project package.
+
+    Any code change invalidates every cached stage; this is deliberately
+    conservative since stages share utils, entities and constants.
+    """
+    package_dir = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256()
+
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(source.relative_to(package_dir).as_posix().encode())
+        digest.update(source.read_bytes())
+
+    return digest.hexdigest()
+
+
+def config_fingerprint(config) -> dict:
+    """
+    Config fields that affect a stage's output, i.e. everything except paths.
+
+    Output locations change with every run's timestamp and must not change the key.
+    """
+    return {
+        name: value
+        for name, value in dataclasses.asdict(config).items()
+        if not isinstance(value, Path) and not name.endswith(("_path", "_dir"))
+    }
+
+
+def file_fingerprint(file_path) -> Optional[dict]:
+    """Cheap fingerprint of a file: its path, size and modification time."""
+    if file_path is None or not os.path.exists(file_path):
+        return None
+
+    stat = os.stat(file_path)
+    return {"path": str(file_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def artifact_fingerprint(artifact) -> dict:
+    """Fingerprint of an upstream artifact, to key the stages that consume it."""
+    return {
+        name: file_fingerprint(value) if _looks_like_path(name, value) else value
+        for name, value in dataclasses.asdict(artifact).items()
+    }
+
+
+def _looks_like_path(name: str, value) -> bool:
+    return isinstance(value, (str, Path)) and name.endswith("_path")
+
+
+def _json_default(value):
+    # Paths, ObjectIds, datetimes ... are hashed and stored by their string form
+    return str(value)
+
+
+# ---------------------- CACHE ----------------------
+class StageCache:
+    """
+    Content-addressed store of stage artifacts with a per-run hit/miss report.
+
+    Entries are small JSON files ``<cache_dir>/<stage>-<key>.json`` holding the
+    artifact fields; the artifact files themselves stay in the run dir that
+    produced them.
+    """
+
+    def __init__(self, config: StageCacheConfig = None) -> None:
+        self.config = config or StageCacheConfig()
+        self.report: dict = {"hits": [], "misses": [], "evicted": []}
+        self._reused_dirs: set[Path] = set()
+
+    # -------------------------------------------------------------------------
+    def key(self, stage: str, inputs: dict) -> str:
+        """Hash of the stage name, its inputs and the code version."""
+        payload = json.dumps(
+            {"stage": stage, "inputs": inputs, "code_version": code_version()},
+            sort_keys=True,
+            default=_json_default,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, stage: str, key: str) -> Path:
+        return Path(self.config.cache_dir) / f"{stage}-{key}.json"
+
+    # -------------------------------------------------------------------------
+    def get(self, stage: str, key: str, artifact_cls: type[Artifact]) -> Optional[Artifact]:
+        """Return the cached artifact, or None if absent or any of its files is gone."""
+        entry_path = self._entry_path(stage, key)
+        if not entry_path.exists():
+            return None
+
+        with open(entry_path, "r", encoding="utf-8") as file:
+            fields = json.load(file)
+
+        paths = [value for name, value in fields.items() if _looks_like_path(name, value)]
+        if not all(os.path.exists(path) for path in paths):
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        self._reused_dirs.update(self._run_dir_of(path) for path in paths)
+        return artifact_cls(**fields)
+
+    def put(self, stage: str, key: str, artifact) -> None:
+        """Record an artifact under its key (atomically)."""
+        entry_path = self._entry_path(stage, key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = entry_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(dataclasses.asdict(artifact), file, default=_json_default, indent=2)
+        os.replace(tmp_path, entry_path)
+
+    # -------------------------------------------------------------------------
+    def run(
+        self,
+        stage: str,
+        inputs: dict,
+        compute: Callable[[], Artifact],
+        artifact_cls: type[Artifact],
+    ) -> Artifact:
+        """
+        Return the cached artifact for ``inputs`` or compute and record it.
+
+        Args:
+            stage (str): Stage name, part of the key and of the report.
+            inputs (dict): JSON-serializable stage inputs (data fingerprint, config fields, ...).
+            compute (Callable): Runs the stage and returns its artifact.
+            artifact_cls (type): Dataclass used to rebuild a cached artifact.
+        """
+        logger = get_logger("StageCache")
+
+        try:
+            if not self.config.enabled:
+                return compute()
+
+            key = self.key(stage, inputs)
+            artifact = self.get(stage, key, artifact_cls)
+
+            if artifact is not None:
+                logger.info(f"Stage cache HIT for '{stage}' ({key[:12]}), reusing {artifact}")
+                self.report["hits"].append({"stage": stage, "key": key})
+                return artifact
+
+            logger.info(f"Stage cache MISS for '{stage}' ({key[:12]}), running stage")
+            start = time.perf_counter()
+            artifact = compute()
+            self.put(stage, key, artifact)
+            self.report["misses"].append(
+                {"stage": stage, "key": key, "seconds": round(time.perf_counter() - start, 3)}
+            )
+            return artifact
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    # -------------------------------------------------------------------------
+    def _run_dir_of(self, file_path) -> Optional[Path]:
+        """Top-level arftifact/<timestamp> dir containing ``file_path``."""
+        try:
+            relative = Path(file_path).resolve().relative_to(Path(self.config.artifact_root_dir).resolve())
+        except ValueError:
+            return None
+        return Path(self.config.artifact_root_dir).resolve() / relative.parts[0]
+
+    @staticmethod
+    def _dir_size(path: Path) -> int:
+        return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+    def evict(self, protect: Iterable = ()) -> list[str]:
+        """
+        Delete old timestamped run dirs under the artifact root.
+
+        Dirs older than ``max_age_days`` go first, then the oldest ones until
+        the remaining dirs fit in ``max_total_bytes``. Dirs in ``protect`` and
+        dirs whose artifacts were reused by this run are kept. Cache entries
+        pointing into deleted dirs are dropped lazily on their next lookup.
+
+        Returns:
+            list[str]: The deleted dirs.
+        """
+        logger = get_logger("StageCache")
+
+        try:
+            root = Path(self.config.artifact_root_dir)
+            if not root.exists():
+                return []
+
+            protected = {Path(p).resolve() for p in protect} | {d for d in self._reused_dirs if d}
+            run_dirs = sorted(
+                (d for d in root.iterdir() if d.is_dir() and _RUN_DIR_PATTERN.match(d.name)),
+                key=lambda d: d.stat().st_mtime,
+            )
+            candidates = [(d, d.stat().st_mtime, self._dir_size(d)) for d in run_dirs]
+
+            now = time.time()
+            total = sum(size for _, _, size in candidates)
+            evicted = []
+
+            for run_dir, mtime, size in candidates:
+                if run_dir.resolve() in protected:
+                    continue
+                too_old = now - mtime > self.config.max_age_days * 86400
+                too_big = total > self.config.max_total_bytes
+                if not (too_old or too_big):
+                    continue
+
+                shutil.rmtree(run_dir, ignore_errors=True)
+                total -= size
+                evicted.append(str(run_dir))
+                logger.info(f"Evicted artifact dir {run_dir} ({size / 2**20:.1f} MB)")
+
+            self.report["evicted"].extend(evicted)
+            return evicted
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def write_report(self, report_file_path=None) -> dict:
+        """Log the hits/misses of this run and write them as JSON."""
+        report_file_path = report_file_path or self.config.report_file_path
+        summary = {
+            "hit_count": len(self.report["hits"]),
+            "miss_count": len(self.report["misses"]),
+            **self.report,
+        }
+
+        get_logger("StageCache").info(
+            f"Stage cache: {summary['hit_count']} hits, {summary['miss_count']} misses, "
+            f"{len(summary['evicted'])} dirs evicted"
+        )
+
+        os.makedirs(os.path.dirname(report_file_path), exist_ok=True)
+        with open(report_file_path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+
+        return summary
@@ -1,35 +1,281 @@
 import sys
 from mlops_project.exception import MyException
 from mlops_project.logger import get_logger
-from mlops_project.components.data_ingestion import DataIngetion
+from mlops_project.pipeline.stage_cache import StageCache, artifact_fingerprint, config_fingerprint, file_fingerprint
+from mlops_project.utils.instrumentation import RunRecorder, stage
 
-from mlops_project.entity.config_entity import DataIngestionConfig
-from mlops_project.entity.artifact_entity import DataIngestionArtifact
+from mlops_project.entity.config_entity import (
+    DataIngestionConfig,
+    DataTransformationConfig,
+    DataValidationConfig,
+    ModelEvaluationConfig,
+    ModelPusherConfig,
+    ModelTrainerConfig,
+    StageCacheConfig,
+    TrainPipeLineConfig,
+    default_training_pipeline_config,
+)
+from mlops_project.entity.artifact_entity import (
+    DataIngestionArtifact,
+    DataTransformationArtifact,
+    DataValidationArtifact,
+    ModelEvaluationArtifact,
+    ModelPusherArtifact,
+    ModelTrainerArtifact,
+)
 
 class TrainPipeline:
-    def __init__(self):
-        self.data_ingestion_config = DataIngestionConfig()
+    # Components (pandas, sklearn, pymongo ...) are imported by the stage methods,
+    # so importing this module stays cheap.
 
+    def __init__(self, full_refresh: bool = False, training_pipeline_config: TrainPipeLineConfig = None):
+        self.training_pipeline_config = training_pipeline_config or default_training_pipeline_config()
+        self.data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+        self.data_validation_config = DataValidationConfig(training_pipeline_config=self.training_pipeline_config)
+        self.data_transformation_config = DataTransformationConfig(
+            training_pipeline_config=self.training_pipeline_config
+        )
+        self.model_trainer_config = ModelTrainerConfig(training_pipeline_config=self.training_pipeline_config)
+        self.model_evaluation_config = ModelEvaluationConfig(training_pipeline_config=self.training_pipeline_config)
+        self.model_pusher_config = ModelPusherConfig()
+        self.stage_cache = StageCache(
+            StageCacheConfig(
+                enabled=StageCacheConfig.enabled and not full_refresh,
+                training_pipeline_config=self.training_pipeline_config,
+            )
+        )
+        self.full_refresh = full_refresh
+
+    @stage("data_ingestion")
     def start_data_ingestion(self) ->DataIngestionArtifact:
 
         try:
+            from mlops_project.components.data_ingestion import DataIngetion
+            from mlops_project.data_access.mlops_proj_data import ProjData
+
             logger = get_logger("Pipeline")
             logger.info("Entered the start data_ingestion method of TrainingPipeline")
             logger.info("Getting the data from mongoDB")
 
             data_ingestion = DataIngetion(data_ingestion_config=self.data_ingestion_config)
-            data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
+            with stage("fingerprint"):
+                stage_inputs = {
+                    "data": ProjData().collection_fingerprint(
+                        self.data_ingestion_config.collection_name,
+                        fields=sorted({"_id", self.data_ingestion_config.watermark_field}),
+                    ),
+                    "config": config_fingerprint(self.data_ingestion_config),
+                }
+            data_ingestion_artifact = self.stage_cache.run(
+                "data_ingestion",
+                stage_inputs,
+                lambda: data_ingestion.initiate_data_ingestion(full_refresh=self.full_refresh),
+                DataIngestionArtifact,
+            )
             logger.info("Got the train set and test set from mongoDB data")
             logger.info("Exited start_data_ingestion of Pipeline Class")
 
             return data_ingestion_artifact
         except Exception as e:
             raise MyException(e,sys)
-        
+
+    @stage("data_validation")
+    def start_data_validation(self, data_ingestion_artifact: DataIngestionArtifact) -> DataValidationArtifact:
+
+        try:
+            from mlops_project.components.data_validation import DataValidation
+            from mlops_project.utils.main_utils import load_schema
+
+            logger = get_logger("Pipeline")
+            logger.info("Entered the start_data_validation method of TrainPipeline class")
+
+            data_validation = DataValidation(
+                data_ingestion_artifact=data_ingestion_artifact,
+                data_validation_config=self.data_validation_config,
+            )
+            stage_inputs = {
+                "ingestion": artifact_fingerprint(data_ingestion_artifact),
+                "schema": load_schema(self.data_validation_config.schema_file_path),
+                "config": config_fingerprint(self.data_validation_config),
+            }
+            data_validation_artifact = self.stage_cache.run(
+                "data_validation",
+                stage_inputs,
+                data_validation.initiate_data_validation,
+                DataValidationArtifact,
+            )
+            logger.info("Performed the data validation operation")
+            logger.info("Exited the start_data_validation method of TrainPipeline class")
+
+            return data_validation_artifact
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @stage("data_transformation")
+    def start_data_transformation(
+        self, data_ingestion_artifact: DataIngestionArtifact, data_validation_artifact: DataValidationArtifact
+    ) -> DataTransformationArtifact:
+
+        try:
+            from mlops_project.components.data_transformation import DataTransformation
+            from mlops_project.utils.main_utils import load_schema
+
+            logger = get_logger("Pipeline")
+            logger.info("Entered the start_data_transformation method of TrainPipeline class")
+
+            data_transformation = DataTransformation(
+                data_ingestion_artifact=data_ingestion_artifact,
+                data_validation_artifact=data_validation_artifact,
+                data_transformation_config=self.data_transformation_config,
+            )
+            stage_inputs = {
+                "ingestion": artifact_fingerprint(data_ingestion_artifact),
+                "validation": artifact_fingerprint(data_validation_artifact),
+                "schema": load_schema(self.data_transformation_config.schema_file_path),
+                "config": config_fingerprint(self.data_transformation_config),
+            }
+            data_transformation_artifact = self.stage_cache.run(
+                "data_transformation",
+                stage_inputs,
+                data_transformation.initiate_data_transformation,
+                DataTransformationArtifact,
+            )
+            logger.info("Exited the start_data_transformation method of TrainPipeline class")
+
+            return data_transformation_artifact
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @stage("model_trainer")
+    def start_model_trainer(self, data_transformation_artifact: DataTransformationArtifact) -> ModelTrainerArtifact:
+
+        try:
+            from mlops_project.components.model_trainer import ModelTrainer
+            from mlops_project.utils.main_utils import read_yaml_file
+
+            logger = get_logger("Pipeline")
+            logger.info("Entered the start_model_trainer method of TrainPipeline class")
+
+            model_trainer = ModelTrainer(
+                data_transformation_artifact=data_transformation_artifact,
+                model_trainer_config=self.model_trainer_config,
+            )
+            stage_inputs = {
+                "transformation": artifact_fingerprint(data_transformation_artifact),
+                "model": read_yaml_file(self.model_trainer_config.model_config_file_path),
+                "config": config_fingerprint(self.model_trainer_config),
+            }
+            model_trainer_artifact = self.stage_cache.run(
+                "model_trainer",
+                stage_inputs,
+                model_trainer.initiate_model_trainer,
+                ModelTrainerArtifact,
+            )
+            logger.info("Exited the start_model_trainer method of TrainPipeline class")
+
+            return model_trainer_artifact
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def deployed_model_fingerprint(self):
+        """
+        Identity of the deployed model: the registry's current version (one
+        HEAD request, no download) or the local deployed model file.
+        """
+        config = self.model_evaluation_config
+        if not config.bucket_name:
+            return file_fingerprint(config.deployed_model_file_path)
+
+        from mlops_project.entity.s3_estimator import Proj1Estimator
+
+        current = Proj1Estimator(
+            config.bucket_name, model_path=config.s3_model_key_path, cache_dir=config.registry_cache_dir
+        ).get_current_version()
+        return None if current is None else {"sha256": current["sha256"], "etag": current["etag"]}
+
+    @stage("model_evaluation")
+    def start_model_evaluation(
+        self, data_ingestion_artifact: DataIngestionArtifact, model_trainer_artifact: ModelTrainerArtifact
+    ) -> ModelEvaluationArtifact:
+
+        try:
+            from mlops_project.components.model_evaluation import ModelEvaluation
+
+            logger = get_logger("Pipeline")
+            logger.info("Entered the start_model_evaluation method of TrainPipeline class")
+
+            model_evaluation = ModelEvaluation(
+                data_ingestion_artifact=data_ingestion_artifact,
+                model_trainer_artifact=model_trainer_artifact,
+                model_evaluation_config=self.model_evaluation_config,
+            )
+            stage_inputs = {
+                "ingestion": artifact_fingerprint(data_ingestion_artifact),
+                "trainer": artifact_fingerprint(model_trainer_artifact),
+                "deployed_model": self.deployed_model_fingerprint(),
+                "config": config_fingerprint(self.model_evaluation_config),
+            }
+            model_evaluation_artifact = self.stage_cache.run(
+                "model_evaluation",
+                stage_inputs,
+                model_evaluation.initiate_model_evaluation,
+                ModelEvaluationArtifact,
+            )
+            logger.info("Exited the start_model_evaluation method of TrainPipeline class")
+
+            return model_evaluation_artifact
+        except Exception as e:
+            raise MyException(e, sys)
+
+    @stage("model_pusher")
+    def start_model_pusher(self, model_evaluation_artifact: ModelEvaluationArtifact) -> ModelPusherArtifact:
+
+        try:
+            from mlops_project.components.model_pusher import ModelPusher
+
+            logger = get_logger("Pipeline")
+            logger.info("Entered the start_model_pusher method of TrainPipeline class")
+
+            # Not stage-cached: pushing has side effects, and pushing an unchanged model is a no-op
+            model_pusher = ModelPusher(
+                model_evaluation_artifact=model_evaluation_artifact,
+                model_pusher_config=self.model_pusher_config,
+            )
+            model_pusher_artifact = model_pusher.initiate_model_pusher()
+            logger.info("Exited the start_model_pusher method of TrainPipeline class")
+
+            return model_pusher_artifact
+        except Exception as e:
+            raise MyException(e, sys)
+
     def run_pipeline(self):
+        """
+        Run every stage under a RunRecorder and write the run report (stage
+        timings, memory, row counts and the stage cache report) into the run's
+        artifact dir, also when a stage fails.
+        """
         try:
-            data_ingestion_artifact = self.start_data_ingestion()
+            recorder = RunRecorder(self.training_pipeline_config.artifact_dir)
+            try:
+                with recorder.activate():
+                    data_ingestion_artifact = self.start_data_ingestion()
+                    data_validation_artifact = self.start_data_validation(data_ingestion_artifact)
+                    data_transformation_artifact = self.start_data_transformation(
+                        data_ingestion_artifact, data_validation_artifact
+                    )
+                    model_trainer_artifact = self.start_model_trainer(data_transformation_artifact)
+                    model_evaluation_artifact = self.start_model_evaluation(
+                        data_ingestion_artifact, model_trainer_artifact
+                    )
+                    self.start_model_pusher(model_evaluation_artifact)
+
+                    with stage("stage_cache_evict"):
+                        self.stage_cache.evict(protect=[self.training_pipeline_config.artifact_dir])
+            finally:
+                recorder.write_report(
+                    self.training_pipeline_config.run_report_file_path,
+                    stage_cache=self.stage_cache.write_report(),
+                )
 
         except MyException as e:
             raise MyException(e,sys) 
-
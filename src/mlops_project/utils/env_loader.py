@@ -3,7 +3,6 @@
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 def load_all_envs(env_dir:str | Path = ".env"):
     """
@@ -18,6 +17,8 @@ def load_all_envs(env_dir:str | Path = ".env"):
         - Later files override earlier ones.
     """
 
+    from dotenv import load_dotenv
+
     env_dir = Path(env_dir)
 
     if not env_dir.exists():
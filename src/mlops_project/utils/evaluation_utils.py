@@ -0,0 +1,182 @@
+"""
+Bootstrapped classification metrics without a Python loop over resamples.
+
+A block of bootstrap resamples is drawn as one ``(n_boot, n_rows)`` index
+matrix and turned into a matrix of per-row repeat counts with a single
+``np.bincount``. Every metric of every resample is then a weighted sum over
+rows, i.e. a matrix product or a cumulative sum along the row axis:
+
+- F1 from the weighted true/false positive and false negative counts;
+- ROC-AUC as the weighted Mann-Whitney statistic over the rows sorted once by
+  score, with tied scores counted as half.
+
+Resampling the same rows for every model gives paired differences.
+"""
+
+import sys
+
+import numpy as np
+
+from mlops_project.exception import MyException
+
+# Upper bound of the elements of one count matrix block (~128 MB of int64)
+_MAX_BLOCK_ELEMENTS = 2**24
+
+
+def bootstrap_count_blocks(n_rows: int, n_boot: int, seed: int):
+    """
+    Yield float32 ``(block_size, n_rows)`` matrices of bootstrap repeat counts, ``n_boot`` rows in total.
+
+    Each matrix row is one resample: ``counts[b, i]`` is how often row ``i``
+    was drawn. Blocks bound the memory; the draws only depend on ``seed``.
+    """
+    rng = np.random.default_rng(seed)
+    block_size = max(1, min(n_boot, _MAX_BLOCK_ELEMENTS // max(n_rows, 1)))
+
+    for start in range(0, n_boot, block_size):
+        size = min(block_size, n_boot - start)
+        indices = rng.integers(0, n_rows, size=(size, n_rows))
+        # Offset each resample into its own row of the flattened matrix
+        indices += (np.arange(size) * n_rows)[:, None]
+        counts = np.bincount(indices.ravel(), minlength=size * n_rows).reshape(size, n_rows)
+        # Counts are small integers, exact in float32, which BLAS and cumsum handle twice as fast
+        yield counts.astype(np.float32)
+
+
+def weighted_f1(counts: np.ndarray, y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """
+    F1 of the positive class for every row of ``counts``.
+
+    Args:
+        counts (np.ndarray): ``(n_boot, n_rows)`` repeat counts.
+        y_true (np.ndarray): 0/1 labels.
+        y_pred (np.ndarray): 0/1 predictions.
+
+    Returns:
+        np.ndarray: F1 per resample; 0 where there are no positives and no positive predictions.
+    """
+    y_true, y_pred = np.asarray(y_true).astype(bool), np.asarray(y_pred).astype(bool)
+    outcomes = np.column_stack([y_true & y_pred, ~y_true & y_pred, y_true & ~y_pred]).astype(counts.dtype)
+    tp, fp, fn = (counts @ outcomes).T.astype(np.float64)
+
+    denominator = 2 * tp + fp + fn
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(denominator > 0, 2 * tp / denominator, 0.0)
+
+
+def weighted_roc_auc(counts: np.ndarray, y_true: np.ndarray, y_score: np.ndarray) -> np.ndarray:
+    """
+    ROC-AUC for every row of ``counts``, ties in ``y_score`` counted as half.
+
+    Rows are sorted by score once and grouped by distinct score; per
+    resample, the weight of negatives below each group is a cumulative sum.
+    Model probabilities usually take few distinct values (e.g. tree votes),
+    which makes the grouped matrices much smaller than ``counts``.
+
+    Returns:
+        np.ndarray: AUC per resample; NaN for a resample without both classes.
+    """
+    y_true, y_score = np.asarray(y_true).astype(bool), np.asarray(y_score)
+    order = np.argsort(y_score, kind="stable")
+    sorted_scores = y_score[order]
+    group_starts = np.flatnonzero(np.r_[True, sorted_scores[1:] != sorted_scores[:-1]])
+
+    counts = np.take(counts, order, axis=1)
+    positive = y_true[order]
+    pos = counts * positive
+    neg = counts - pos
+    if len(group_starts) < len(order):
+        pos = np.add.reduceat(pos, group_starts, axis=1)
+        neg = np.add.reduceat(neg, group_starts, axis=1)
+
+    # A 1-D cumsum is several times faster than one along an axis of a 2-D
+    # array: run it over the flattened matrix and remove each resample's
+    # starting offset. float64 keeps the running totals exact.
+    running = np.cumsum(neg.ravel(), dtype=np.float64).reshape(neg.shape)
+    running -= np.r_[0.0, running[:-1, -1]][:, None]
+
+    n_pos, n_neg = pos.sum(axis=1, dtype=np.float64), running[:, -1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Negatives strictly below each group, plus half of the tied ones
+        auc = np.einsum("bg,bg->b", pos, running - 0.5 * neg) / (n_pos * n_neg)
+    return auc
+
+
+def _interval(values: np.ndarray, confidence: float) -> list[float]:
+    alpha = (1 - confidence) / 2
+    low, high = np.nanquantile(values, [alpha, 1 - alpha])
+    return [round(float(low), 6), round(float(high), 6)]
+
+
+def bootstrap_metrics(
+    y_true: np.ndarray,
+    scores: dict[str, np.ndarray],
+    threshold: float = 0.5,
+    n_boot: int = 1000,
+    confidence: float = 0.95,
+    seed: int = 42,
+) -> dict:
+    """
+    Point estimates and percentile bootstrap intervals of F1 and ROC-AUC for
+    several models scored on the same rows, plus the paired differences of
+    every model against the first one.
+
+    Args:
+        y_true (np.ndarray): 0/1 labels.
+        scores (dict[str, np.ndarray]): Positive-class probability per model name; the first is the reference.
+        threshold (float): Probability above which a row is predicted positive, as ``predict`` does at 0.5.
+        n_boot (int): Number of bootstrap resamples.
+        confidence (float): Coverage of the intervals.
+        seed (int): Seed of the resampling.
+
+    Returns:
+        dict: Per model ``f1``, ``roc_auc`` and their intervals; per other model
+        ``<name>_minus_<reference>`` with the paired differences and intervals.
+    """
+    try:
+        y_true = np.asarray(y_true).astype(bool)
+        names = list(scores)
+        predictions = {name: np.asarray(score) > threshold for name, score in scores.items()}
+
+        ones = np.ones((1, len(y_true)), dtype=np.float32)
+        point = {
+            name: {
+                "f1": float(weighted_f1(ones, y_true, predictions[name])[0]),
+                "roc_auc": float(weighted_roc_auc(ones, y_true, scores[name])[0]),
+            }
+            for name in names
+        }
+
+        samples = {name: {"f1": [], "roc_auc": []} for name in names}
+        for counts in bootstrap_count_blocks(len(y_true), n_boot, seed):
+            for name in names:
+                samples[name]["f1"].append(weighted_f1(counts, y_true, predictions[name]))
+                samples[name]["roc_auc"].append(weighted_roc_auc(counts, y_true, scores[name]))
+        samples = {
+            name: {metric: np.concatenate(parts) for metric, parts in metrics.items()}
+            for name, metrics in samples.items()
+        }
+
+        report = {
+            "n_rows": int(len(y_true)), "n_boot": n_boot, "confidence": confidence, "models": {}, "differences": {}
+        }
+        for name in names:
+            report["models"][name] = {
+                metric: round(point[name][metric], 6) for metric in ("f1", "roc_auc")
+            } | {f"{metric}_ci": _interval(samples[name][metric], confidence) for metric in ("f1", "roc_auc")}
+
+        reference = names[0]
+        for name in names[1:]:
+            difference = {}
+            for metric in ("f1", "roc_auc"):
+                paired = samples[name][metric] - samples[reference][metric]
+                difference[metric] = round(point[name][metric] - point[reference][metric], 6)
+                difference[f"{metric}_ci"] = _interval(paired, confidence)
+                # Share of resamples in which this model is not better than the reference
+                difference[f"{metric}_p_not_better"] = round(float(np.mean(paired <= 0)), 6)
+            report["differences"][f"{name}_minus_{reference}"] = difference
+
+        return report
+
+    except Exception as e:
+        raise MyException(e, sys)
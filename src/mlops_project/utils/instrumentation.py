@@ -0,0 +1,310 @@
+"""
+Stage timing and memory instrumentation.
+
+Wrap a pipeline stage or one of its steps with :func:`stage`, as a context
+manager or a decorator::
+
+    with stage("fetch") as step:
+        df = fetch()
+        step.rows = len(df)
+
+    @stage("split")
+    def split(...): ...
+
+Each stage records its wall time, CPU time, peak-RSS growth, row count and
+free-form counters. Stages nest: a stage opened inside another one is
+recorded under its path, e.g. ``data_ingestion/export/fetch``. Records go to
+the active :class:`RunRecorder` (see :meth:`RunRecorder.activate`), which
+writes them as a JSON run report; without an active recorder stages are
+timed and logged only.
+
+Setting ``MLOPS_PROFILE=cprofile`` or ``MLOPS_PROFILE=tracemalloc`` makes the
+recorder also dump a cProfile stats file or the top tracemalloc allocation
+sites next to the run report.
+"""
+
+import contextlib
+import contextvars
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from mlops_project.constants import (
+    PROFILE_ENV_VAR,
+    PROFILE_CPROFILE_FILE_NAME,
+    PROFILE_TRACEMALLOC_FILE_NAME,
+    PROFILE_TRACEMALLOC_TOP,
+)
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+_MB = 1024 * 1024
+
+# Innermost open stage and active recorder of the current thread / task
+_current_stage: contextvars.ContextVar[Optional["StageRecord"]] = contextvars.ContextVar("current_stage", default=None)
+_current_recorder: contextvars.ContextVar[Optional["RunRecorder"]] = contextvars.ContextVar(
+    "current_recorder", default=None
+)
+
+
+# ---------------------- MEMORY ----------------------
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Peak resident set size of this process so far, in bytes.
+
+    Uses ``resource.getrusage`` (kilobytes on Linux, bytes on macOS) and
+    falls back to psutil where ``resource`` does not exist (Windows).
+
+    Returns:
+        Optional[int]: The peak RSS, or None when neither source is available.
+    """
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# ---------------------- RECORDS ----------------------
+@dataclasses.dataclass
+class StageRecord:
+    """Measurements of one stage run; ``rows`` and ``counters`` are set by the stage body."""
+
+    name: str
+    path: str
+    depth: int
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_delta_mb: Optional[float] = None
+    rows: Optional[int] = None
+    counters: dict = dataclasses.field(default_factory=dict)
+    status: str = "running"
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str, value: float = 1) -> None:
+        """Add ``value`` to a counter (thread-safe, e.g. from partition workers)."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def add_rows(self, rows: int) -> None:
+        with self._lock:
+            self.rows = (self.rows or 0) + rows
+
+    def to_dict(self) -> dict:
+        record = dataclasses.asdict(self)
+        record["counters"] = {
+            name: round(value, 6) if isinstance(value, float) else value for name, value in self.counters.items()
+        }
+        return record
+
+
+def current_stage() -> Optional[StageRecord]:
+    """The innermost open stage of the caller, or None."""
+    return _current_stage.get()
+
+
+def increment(counter: str, value: float = 1) -> None:
+    """Add ``value`` to a counter of the innermost open stage; a no-op outside stages."""
+    record = _current_stage.get()
+    if record is not None:
+        record.increment(counter, value)
+
+
+def add_rows(rows: int) -> None:
+    """Add to the row count of the innermost open stage; a no-op outside stages."""
+    record = _current_stage.get()
+    if record is not None:
+        record.add_rows(rows)
+
+
+# ---------------------- STAGE ----------------------
+class stage(contextlib.ContextDecorator):
+    """
+    Measure a block or a function as a pipeline stage.
+
+    Args:
+        name (str): Stage name; nested stages are recorded as ``parent/name``.
+        rows (Optional[int]): Row count, if known up front; can also be set
+            on the yielded :class:`StageRecord` or with :func:`add_rows`.
+
+    The stage is recorded (with ``status="failed"``) even if the block raises.
+    """
+
+    def __init__(self, name: str, rows: Optional[int] = None) -> None:
+        self.name = name
+        self.rows = rows
+        self._state = threading.local()
+
+    def __enter__(self) -> StageRecord:
+        parent = _current_stage.get()
+        record = StageRecord(
+            name=self.name,
+            path=f"{parent.path}/{self.name}" if parent else self.name,
+            depth=parent.depth + 1 if parent else 0,
+            started_at=datetime.now().isoformat(timespec="milliseconds"),
+            rows=self.rows,
+        )
+
+        recorder = _current_recorder.get()
+        if recorder is not None:
+            recorder.add(record)
+
+        # A decorated function may be re-entered (recursion, threads): keep a stack per thread
+        stack = getattr(self._state, "stack", None)
+        if stack is None:
+            stack = self._state.stack = []
+        stack.append((record, _current_stage.set(record), peak_rss_bytes(), time.perf_counter(), time.process_time()))
+        return record
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        record, token, rss_start, wall_start, cpu_start = self._state.stack.pop()
+
+        record.wall_seconds = round(time.perf_counter() - wall_start, 6)
+        record.cpu_seconds = round(time.process_time() - cpu_start, 6)
+        rss_end = peak_rss_bytes()
+        if rss_start is not None and rss_end is not None:
+            record.peak_rss_delta_mb = round((rss_end - rss_start) / _MB, 3)
+        record.status = "failed" if exc_type else "ok"
+        _current_stage.reset(token)
+
+        get_logger("Instrumentation").info(
+            "Stage %s %s: wall %.3fs, cpu %.3fs, peak RSS +%s MB, rows %s",
+            record.path, record.status, record.wall_seconds, record.cpu_seconds,
+            record.peak_rss_delta_mb, record.rows,
+        )
+        return False
+
+
+# ---------------------- RUN REPORT ----------------------
+class RunRecorder:
+    """
+    Collects the stage records of one pipeline run and writes the run report.
+
+    Args:
+        report_dir (str | Path): Directory of the run report and profile dumps
+            (the run's artifact dir).
+        profile (Optional[str]): "cprofile" or "tracemalloc"; defaults to the
+            MLOPS_PROFILE environment variable.
+    """
+
+    def __init__(self, report_dir: str | Path, profile: Optional[str] = None) -> None:
+        self.report_dir = Path(report_dir)
+        self.profile = (profile if profile is not None else os.getenv(PROFILE_ENV_VAR, "")).lower() or None
+        if self.profile not in (None, "cprofile", "tracemalloc"):
+            raise ValueError(f"Unsupported {PROFILE_ENV_VAR} '{self.profile}', expected 'cprofile' or 'tracemalloc'")
+
+        self.records: list[StageRecord] = []
+        self.profile_file_path: Optional[Path] = None
+        self._lock = threading.Lock()
+
+    def add(self, record: StageRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator["RunRecorder"]:
+        """
+        Make this the recorder of every stage opened in the block, and run
+        the configured profiler around it.
+        """
+        token = _current_recorder.set(self)
+        profiler = None
+
+        try:
+            if self.profile == "cprofile":
+                import cProfile
+
+                # Profiles the activating thread only
+                profiler = cProfile.Profile()
+                profiler.enable()
+            elif self.profile == "tracemalloc":
+                import tracemalloc
+
+                tracemalloc.start()
+
+            yield self
+
+        finally:
+            _current_recorder.reset(token)
+            if self.profile:
+                self._dump_profile(profiler)
+
+    def _dump_profile(self, profiler) -> None:
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+
+        if profiler is not None:
+            profiler.disable()
+            self.profile_file_path = self.report_dir / PROFILE_CPROFILE_FILE_NAME
+            profiler.dump_stats(self.profile_file_path)
+
+        elif self.profile == "tracemalloc":
+            import tracemalloc
+
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.profile_file_path = self.report_dir / PROFILE_TRACEMALLOC_FILE_NAME
+            with open(self.profile_file_path, "w", encoding="utf-8") as file:
+                file.write(f"traced current {current / _MB:.1f} MB, peak {peak / _MB:.1f} MB\n")
+                for statistic in snapshot.statistics("lineno")[:PROFILE_TRACEMALLOC_TOP]:
+                    file.write(f"{statistic}\n")
+
+        get_logger("Instrumentation").info(f"{self.profile} dump written to {self.profile_file_path}")
+
+    def report(self, **sections) -> dict:
+        """The run report: every stage record in start order plus extra sections."""
+        top_level = [record for record in self.records if record.depth == 0]
+        peak = peak_rss_bytes()
+
+        return {
+            "summary": {
+                "wall_seconds": round(sum(record.wall_seconds for record in top_level), 6),
+                "cpu_seconds": round(sum(record.cpu_seconds for record in top_level), 6),
+                "peak_rss_mb": None if peak is None else round(peak / _MB, 3),
+                "profile": self.profile,
+                "profile_file_path": None if self.profile_file_path is None else str(self.profile_file_path),
+            },
+            "stages": [record.to_dict() for record in self.records],
+            **sections,
+        }
+
+    def write_report(self, report_file_path: str | Path, **sections) -> dict:
+        """
+        Write the run report as JSON.
+
+        Args:
+            report_file_path (str | Path): Output file.
+            **sections: Extra top-level sections, e.g. the stage cache report.
+
+        Returns:
+            dict: The written report.
+        """
+        try:
+            report = self.report(**sections)
+
+            os.makedirs(os.path.dirname(report_file_path) or ".", exist_ok=True)
+            with open(report_file_path, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=2, default=str)
+
+            get_logger("Instrumentation").info(f"Run report written to {report_file_path}")
+            return report
+
+        except Exception as e:
+            raise MyException(e, sys)
@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import yaml
+
+from mlops_project.constants import DATAFRAME_FILE_FORMATS, SCHEMA_FILE_PATH
+from mlops_project.exception import MyException
+from mlops_project.logger import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+# ---------------------- YAML ----------------------
+def read_yaml_file(file_path: str | Path) -> dict:
+    """
+    Read a YAML file and return its content.
+
+    Args:
+        file_path (str | Path): Path of the YAML file.
+
+    Returns:
+        dict: Parsed YAML content (empty dict for an empty file).
+
+    Raises:
+        MyException: If the file cannot be read or parsed.
+    """
+    try:
+        with open(file_path, "rb") as yaml_file:
+            return yaml.safe_load(yaml_file) or {}
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def write_yaml_file(file_path: str | Path, content: object, replace: bool = False) -> None:
+    """
+    Write content to a YAML file, creating parent directories as needed.
+
+    Args:
+        file_path (str | Path): Destination path.
+        content (object): YAML-serializable content.
+        replace (bool): Remove an existing file first.
+
+    Raises:
+        MyException: If the file cannot be written.
+    """
+    try:
+        if replace and os.path.exists(file_path):
+            os.remove(file_path)
+
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w") as file:
+            yaml.safe_dump(content, file, sort_keys=False)
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+# ---------------------- SCHEMA ----------------------
+@lru_cache(maxsize=None)
+def _load_schema(schema_file_path: str) -> dict:
+    get_logger("Schema").info(f"Loading schema from {schema_file_path}")
+    return read_yaml_file(schema_file_path)
+
+
+def load_schema(schema_file_path: str | Path = SCHEMA_FILE_PATH) -> dict:
+    """
+    Load the dataset schema, reading and parsing each schema file only once per process.
+
+    Args:
+        schema_file_path (str | Path): Path of the schema YAML file.
+
+    Returns:
+        dict: Parsed schema. Callers must treat it as read-only since it is shared.
+    """
+    return _load_schema(str(Path(schema_file_path).resolve()))
+
+
+# ---------------------- DATAFRAMES ----------------------
+def infer_file_format(file_path: str | Path) -> str:
+    """
+    Infer the DataFrame file format ("csv", "parquet" or "feather") from the file extension.
+
+    Raises:
+        MyException: If the extension is not a supported format.
+    """
+    suffix = Path(file_path).suffix.lower()
+    for file_format, extension in DATAFRAME_FILE_FORMATS.items():
+        if suffix == extension:
+            return file_format
+
+    raise MyException(f"Cannot infer DataFrame format of '{file_path}'", sys)
+
+
+def write_dataframe(
+    dataframe: pd.DataFrame,
+    file_path: str | Path,
+    file_format: Optional[str] = None,
+    compression: Optional[str] = None,
+) -> None:
+    """
+    Write a DataFrame as CSV, Parquet or Feather, without its index.
+
+    Args:
+        dataframe (pd.DataFrame): Data to write.
+        file_path (str | Path): Destination; parent directories are created.
+        file_format (Optional[str]): "csv", "parquet" or "feather"; inferred from the extension if omitted.
+        compression (Optional[str]): Parquet codec (e.g. "zstd", "snappy"). Feather files are
+            always written uncompressed so they can be memory-mapped on read.
+
+    Raises:
+        MyException: If the format is unsupported or writing fails.
+    """
+    try:
+        file_format = file_format or infer_file_format(file_path)
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+        if file_format == "csv":
+            dataframe.to_csv(file_path, index=False)
+        elif file_format == "parquet":
+            dataframe.to_parquet(file_path, index=False, compression=compression)
+        elif file_format == "feather":
+            import pyarrow as pa
+            from pyarrow import feather
+
+            table = pa.Table.from_pandas(dataframe, preserve_index=False)
+            feather.write_feather(table, file_path, compression="uncompressed")
+        else:
+            raise ValueError(f"Unsupported file format '{file_format}'")
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def read_dataframe(
+    file_path: str | Path,
+    file_format: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    Read a DataFrame written by `write_dataframe`.
+
+    Feather files are memory-mapped, so the OS page cache backs the Arrow
+    buffers instead of a second in-process read buffer.
+
+    Args:
+        file_path (str | Path): File to read, or a binary file object (``file_format`` is then required).
+        file_format (Optional[str]): "csv", "parquet" or "feather"; inferred from the extension if omitted.
+        columns (Optional[list[str]]): Subset of columns to load (columnar formats skip the others on disk).
+
+    Returns:
+        pd.DataFrame: The loaded data.
+
+    Raises:
+        MyException: If the format is unsupported or reading fails.
+    """
+    try:
+        import pandas as pd
+
+        file_format = file_format or infer_file_format(file_path)
+
+        if file_format == "csv":
+            return pd.read_csv(file_path, usecols=columns)
+        if file_format == "parquet":
+            return pd.read_parquet(file_path, columns=columns)
+        if file_format == "feather":
+            from pyarrow import feather
+
+            return feather.read_table(file_path, columns=columns, memory_map=True).to_pandas()
+
+        raise ValueError(f"Unsupported file format '{file_format}'")
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def iter_dataframe_chunks(
+    file_path: str | Path,
+    file_format: Optional[str] = None,
+    chunk_size: int = 250_000,
+    columns: Optional[list[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a DataFrame file as a sequence of chunks of at most ``chunk_size`` rows.
+
+    CSV is parsed incrementally, Parquet is read one batch at a time and
+    Feather is memory-mapped and sliced, so peak memory is bounded by the
+    chunk size rather than the file size.
+
+    Args:
+        file_path (str | Path): File to read, or a binary file object (``file_format`` is then required).
+        file_format (Optional[str]): "csv", "parquet" or "feather"; inferred from the extension if omitted.
+        chunk_size (int): Maximum rows per chunk.
+        columns (Optional[list[str]]): Subset of columns to load.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks; nothing for an empty file.
+
+    Raises:
+        MyException: If the format is unsupported or reading fails.
+    """
+    try:
+        file_format = file_format or infer_file_format(file_path)
+
+        if file_format == "csv":
+            import pandas as pd
+
+            # An empty file has no header to parse
+            if isinstance(file_path, (str, os.PathLike)) and os.path.getsize(file_path) == 0:
+                return
+            with pd.read_csv(file_path, usecols=columns, chunksize=chunk_size) as reader:
+                yield from reader
+
+        elif file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(file_path)
+            for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+                yield batch.to_pandas()
+
+        elif file_format == "feather":
+            from pyarrow import feather
+
+            table = feather.read_table(file_path, columns=columns, memory_map=True)
+            for start in range(0, table.num_rows, chunk_size):
+                yield table.slice(start, chunk_size).to_pandas()
+
+        else:
+            raise ValueError(f"Unsupported file format '{file_format}'")
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def count_dataframe_rows(file_path: str | Path, file_format: Optional[str] = None) -> int:
+    """
+    Number of rows of a DataFrame file, without loading it.
+
+    Parquet and Feather read it from the file metadata; CSV is parsed in
+    chunks of a single column.
+
+    Raises:
+        MyException: If the format is unsupported or reading fails.
+    """
+    try:
+        file_format = file_format or infer_file_format(file_path)
+
+        if file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            return pq.ParquetFile(file_path).metadata.num_rows
+        if file_format == "feather":
+            from pyarrow import feather
+
+            return feather.read_table(file_path, memory_map=True).num_rows
+        if file_format == "csv":
+            return sum(len(chunk) for chunk in iter_dataframe_chunks(file_path, "csv", columns=[0]))
+
+        raise ValueError(f"Unsupported file format '{file_format}'")
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+class DataFrameChunkWriter:
+    """
+    Append DataFrame chunks to a single CSV, Parquet or Feather file.
+
+    The first chunk fixes the columns (and the Arrow schema for the columnar
+    formats); later chunks are cast to it. When a later chunk does not fit,
+    e.g. a float in an int column or strings in a column that was all null,
+    the schema is widened (int to float, null to any type) and the rows
+    written so far are rewritten once with it. Use as a context manager so
+    the file is finalized. An empty file is written if no chunk arrives.
+    """
+
+    def __init__(self, file_path: str | Path, file_format: Optional[str] = None, compression: Optional[str] = None):
+        self.file_path = file_path
+        self.file_format = file_format or infer_file_format(file_path)
+        self.compression = compression
+        self.rows_written = 0
+        self._writer = None
+        self._schema = None
+        self._columns = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """Append one chunk."""
+        try:
+            if self._columns is None:
+                self._columns = list(chunk.columns)
+                os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+
+            # Empty chunks carry no rows and may carry no usable Arrow types
+            if chunk.empty:
+                return
+
+            if self.file_format == "csv":
+                if self._writer is None:
+                    self._writer = open(self.file_path, "w", newline="", encoding="utf-8")
+                    # In the first chunk's column order, which an empty first chunk also fixes
+                    chunk.iloc[:0][self._columns].to_csv(self._writer, index=False)
+                chunk.to_csv(self._writer, index=False, header=False, columns=self._columns)
+
+            elif self.file_format in ("parquet", "feather"):
+                import pyarrow as pa
+
+                table = pa.Table.from_pandas(chunk[self._columns], preserve_index=False)
+                if self._writer is None:
+                    self._open(table.schema)
+                else:
+                    try:
+                        table = table.cast(self._schema)
+                    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                        self._widen(table.schema)
+                        table = table.cast(self._schema)
+                self._writer.write_table(table)
+
+            else:
+                raise ValueError(f"Unsupported file format '{self.file_format}'")
+
+            self.rows_written += len(chunk)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def _open(self, schema) -> None:
+        import pyarrow as pa
+
+        self._schema = schema
+        if self.file_format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(self.file_path, schema, compression=self.compression)
+        else:
+            self._writer = pa.ipc.new_file(str(self.file_path), schema)
+
+    def _widen(self, schema) -> None:
+        """Reopen the file with the schema widened to fit ``schema``, copying the rows written so far."""
+        import pyarrow as pa
+
+        # The pandas metadata describes the first chunk's dtypes, no longer the file's
+        widened = pa.unify_schemas([self._schema, schema], promote_options="permissive").remove_metadata()
+        get_logger("DataFrame IO").info(f"Widening the schema of {self.file_path} to fit a later chunk")
+
+        self._writer.close()
+        previous = f"{self.file_path}.narrow"
+        os.replace(self.file_path, previous)
+        try:
+            self._open(widened)
+            if self.file_format == "parquet":
+                import pyarrow.parquet as pq
+
+                batches = pq.ParquetFile(previous).iter_batches()
+                for batch in batches:
+                    self._writer.write_table(pa.Table.from_batches([batch]).cast(widened))
+            else:
+                with pa.memory_map(previous) as source:
+                    reader = pa.ipc.open_file(source)
+                    for index in range(reader.num_record_batches):
+                        self._writer.write_table(pa.Table.from_batches([reader.get_batch(index)]).cast(widened))
+        finally:
+            os.remove(previous)
+
+    def close(self) -> None:
+        """Finalize the file."""
+        try:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            elif self.rows_written == 0:
+                import pandas as pd
+
+                write_dataframe(pd.DataFrame(columns=self._columns or []), self.file_path, self.file_format)
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def __enter__(self) -> "DataFrameChunkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# ---------------------- OBJECTS AND ARRAYS ----------------------
+def save_object(file_path: str | Path, obj: object) -> None:
+    """
+    Serialize an object (fitted transformer, model ...) with joblib.
+
+    The file is uncompressed, so `load_object` can memory-map the NumPy
+    arrays in it, and written to a temporary file renamed into place: a file
+    is never rewritten under a process that has it mapped.
+
+    Args:
+        file_path (str | Path): Destination; parent directories are created.
+        obj (object): Object to save.
+
+    Raises:
+        MyException: If the object cannot be written.
+    """
+    try:
+        import joblib
+
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        temporary_path = f"{file_path}.{os.getpid()}.tmp"
+        joblib.dump(obj, temporary_path)
+        os.replace(temporary_path, file_path)
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def load_object(file_path: str | Path, mmap_mode: Optional[str] = None) -> object:
+    """
+    Load an object saved by `save_object`.
+
+    Args:
+        file_path (str | Path): File to read.
+        mmap_mode (Optional[str]): "r" (or "c") to memory-map the NumPy arrays of the object
+            instead of reading them into memory; processes mapping the same file share those pages.
+
+    Raises:
+        MyException: If the file cannot be read.
+    """
+    try:
+        import joblib
+
+        return joblib.load(file_path, mmap_mode=mmap_mode)
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def save_numpy_array_data(file_path: str | Path, array: np.ndarray) -> None:
+    """
+    Save a NumPy array as a .npy file (memory-mappable on load).
+
+    Raises:
+        MyException: If the file cannot be written.
+    """
+    try:
+        import numpy as np
+
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        np.save(file_path, array)
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def load_numpy_array_data(file_path: str | Path, mmap_mode: Optional[str] = None) -> np.ndarray:
+    """
+    Load a .npy file.
+
+    Args:
+        file_path (str | Path): File to read.
+        mmap_mode (Optional[str]): "r" (or "r+", "c") to memory-map instead of reading the array into memory.
+
+    Raises:
+        MyException: If the file cannot be read.
+    """
+    try:
+        import numpy as np
+
+        return np.load(file_path, mmap_mode=mmap_mode)
+
+    except Exception as e:
+        raise MyException(e, sys)
@@ -21,10 +21,6 @@ from mlops_project.logger import get_logger
 from mlops_project.exception import MyException
 import sys
 
-# ---------------------- LOGGER ----------------------
-logger = get_logger("MongoURI")
-
-
 # ---------------------- FUNCTION ----------------------
 def create_mongo_uri() -> str:
     """
@@ -48,6 +44,9 @@ def create_mongo_uri() -> str:
     Raises:
         MyException: If any required environment variables are missing or other errors occur.
     """
+    # Configures logging first, which loads .env files when AUTO_LOAD_DOTENV=1
+    logger = get_logger("MongoURI")
+
     try:
         # ---------------------- CHECK ENVIRONMENT VARIABLES ----------------------
         required_vars = ["MONGO_USER", "MONGO_PASSWORD", "MONGO_HOST", "CLUSTER"]
@@ -0,0 +1,119 @@
+"""
+Class-imbalance resampling without copying the training matrix.
+
+Random oversampling is expressed as an array of row positions (each
+minority row repeated as often as it would be duplicated) or, equivalently,
+as per-row sample weights equal to those repeat counts. Either is applied
+to the memory-mapped feature array by the trainer, so the dataset is never
+materialized twice. SMOTE, which synthesizes new rows, is kept as an
+explicit opt-in for comparison.
+"""
+
+import sys
+from typing import Optional
+
+import numpy as np
+
+from mlops_project.exception import MyException
+from mlops_project.utils.split_utils import group_positions
+
+
+def _target_counts(counts: np.ndarray, sampling_ratio: float) -> np.ndarray:
+    """Rows per class after oversampling: at least ``sampling_ratio`` times the majority class."""
+    return np.maximum(counts, np.floor(sampling_ratio * counts.max() + 0.5).astype(np.int64))
+
+
+def oversample_indices(labels, sampling_ratio: float = 1.0, seed: int = 42) -> np.ndarray:
+    """
+    Row positions of a random oversampling, as ``RandomOverSampler`` would draw them.
+
+    Every row appears once; minority-class rows are drawn again (with
+    replacement) until each class has ``sampling_ratio`` times the rows of
+    the majority class.
+
+    Args:
+        labels: Class of every row.
+        sampling_ratio (float): Wanted minority/majority ratio, in (0, 1].
+        seed (int): Seed of the NumPy generator.
+
+    Returns:
+        np.ndarray: Sorted row positions, so reads from a memory-mapped array stay sequential.
+    """
+    try:
+        if not 0 < sampling_ratio <= 1:
+            raise ValueError(f"sampling_ratio must be in (0, 1], got {sampling_ratio}")
+
+        rng = np.random.default_rng(seed)
+        positions, _ = group_positions(labels)
+        counts = np.array([len(rows) for rows in positions], dtype=np.int64)
+        targets = _target_counts(counts, sampling_ratio)
+
+        extra = [
+            rows[rng.integers(0, len(rows), target - len(rows))]
+            for rows, target in zip(positions, targets)
+            if target > len(rows)
+        ]
+        indices = np.concatenate([np.arange(len(labels)), *extra])
+        indices.sort(kind="stable")
+        return indices
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def sample_weights_from_indices(indices: np.ndarray, n_rows: int) -> np.ndarray:
+    """How many times each row occurs in ``indices``, as float32 sample weights."""
+    return np.bincount(indices, minlength=n_rows).astype(np.float32)
+
+
+def balanced_sample_weights(labels) -> np.ndarray:
+    """
+    ``n_rows / (n_classes * class_count)`` per row, like ``class_weight="balanced"``.
+
+    Returns:
+        np.ndarray: float32 weight of every row.
+    """
+    try:
+        classes, codes = np.unique(np.asarray(labels), return_inverse=True)
+        counts = np.bincount(codes)
+        weights = len(codes) / (len(classes) * counts)
+        return weights[codes].astype(np.float32)
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def smote_resample(
+    features: np.ndarray,
+    labels: np.ndarray,
+    sampling_ratio: float = 1.0,
+    seed: int = 42,
+    k_neighbors: int = 5,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Materialized SMOTE oversampling (imbalanced-learn), for comparison with the index-based modes.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Resampled features and labels; the
+        original rows come first, the synthetic ones after them.
+    """
+    try:
+        from imblearn.over_sampling import SMOTE
+
+        smote = SMOTE(sampling_strategy=sampling_ratio, random_state=seed, k_neighbors=k_neighbors)
+        return smote.fit_resample(features, labels)
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+def resample_summary(labels, indices: Optional[np.ndarray] = None, weights: Optional[np.ndarray] = None) -> dict:
+    """Effective rows per class after resampling, keyed by the class as a string."""
+    labels = np.asarray(labels)
+    if indices is not None:
+        labels = labels[indices]
+        weights = None
+
+    classes, codes = np.unique(labels, return_inverse=True)
+    totals = np.bincount(codes, weights=weights)
+    return {str(label.item()): round(float(total), 3) for label, total in zip(classes, totals)}
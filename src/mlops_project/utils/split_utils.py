@@ -0,0 +1,189 @@
+"""
+Deterministic train/test assignment helpers.
+
+These work on one chunk of rows at a time, so a split can be computed while
+streaming a collection without ever holding the full dataset in memory.
+"""
+
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from mlops_project.exception import MyException
+
+
+# ---------------------- HASH SPLIT ----------------------
+def _hash_key(seed: int) -> str:
+    # pandas requires a 16 character hash key
+    return f"{seed:016d}"[-16:]
+
+
+def _hash_values(values: np.ndarray, seed: int) -> np.ndarray:
+    # hash_key only salts object keys, so the seed is also mixed into the numeric hash
+    salt = pd.util.hash_array(np.array([seed], dtype=np.int64))[0]
+    hashes = pd.util.hash_array(values, hash_key=_hash_key(seed), categorize=False)
+    return pd.util.hash_array(hashes ^ salt)
+
+
+def hash_test_mask(keys, test_size: float, seed: int) -> np.ndarray:
+    """
+    Assign rows to the test set by a seeded hash of their key.
+
+    A row is in the test set when its 64-bit hash falls in the lowest
+    ``test_size`` fraction of the hash space. The result only depends on the
+    key value and the seed, never on row order or chunk boundaries.
+
+    Args:
+        keys: Row keys (e.g. the ``id`` column).
+        test_size (float): Expected fraction of rows assigned to test.
+        seed (int): Seed mixed into the hash.
+
+    Returns:
+        np.ndarray: Boolean mask, True for test rows.
+    """
+    try:
+        values = np.asarray(keys)
+        if values.dtype.kind in "iub":
+            values = values.astype(np.int64, copy=False)
+
+        if values.dtype.kind == "f":
+            # Whole numbers as ints, so an id hashes the same whether its chunk read the column as int or float
+            whole = np.isfinite(values) & (np.floor(values) == values) & (np.abs(values) < 2**63)
+            hashes = np.empty(len(values), dtype=np.uint64)
+            hashes[whole] = _hash_values(values[whole].astype(np.int64), seed)
+            hashes[~whole] = _hash_values(values[~whole], seed)
+        else:
+            hashes = _hash_values(values, seed)
+        threshold = np.uint64(min(int(test_size * 2**64), 2**64 - 1))
+        return hashes < threshold
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+# ---------------------- STRATIFIED SPLIT ----------------------
+def _class_key(value) -> str:
+    """
+    The label as a string; integral floats as ints, so label 1 has the
+    same key whether its chunk read the column as int or float.
+    """
+    if pd.isna(value):
+        return "nan"
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return str(int(value))
+    if isinstance(value, np.integer):
+        return str(int(value))
+    return str(value)
+
+
+def group_positions(labels) -> tuple[list[np.ndarray], pd.Index]:
+    """Row positions of each class, found with one stable argsort instead of a groupby."""
+    codes, classes = pd.factorize(pd.Series(labels), use_na_sentinel=False)
+    order = np.argsort(codes, kind="stable")
+    boundaries = np.cumsum(np.bincount(codes, minlength=len(classes)))[:-1]
+    return np.split(order, boundaries), classes
+
+
+def class_counts(labels) -> dict[str, int]:
+    """Number of rows per class, keyed by the class label as a string."""
+    positions, classes = group_positions(labels)
+    counts: dict[str, int] = {}
+    for code, rows in enumerate(positions):
+        # Labels 1 and 1.0 of an object column share a key
+        key = _class_key(classes[code])
+        counts[key] = counts.get(key, 0) + len(rows)
+    return counts
+
+
+def stratified_split_indices(labels, test_size: float, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Seeded stratified train/test split of row positions.
+
+    Each class is permuted with one NumPy call and its first
+    ``round(test_size * n)`` rows go to test, so every class keeps the
+    target ratio within one row. A class with at least two rows always
+    gets at least one row on each side. The returned positions are
+    shuffled so the output files are not ordered by class.
+
+    Args:
+        labels: Class label of every row (e.g. the TARGET_COLUMN values).
+        test_size (float): Fraction of each class assigned to test.
+        seed (int): Seed of the NumPy generator.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Train and test row positions.
+    """
+    try:
+        rng = np.random.default_rng(seed)
+        train_parts, test_parts = [], []
+
+        positions, _ = group_positions(labels)
+        for rows in positions:
+            n_test = math.floor(test_size * len(rows) + 0.5)
+            if len(rows) >= 2:
+                n_test = min(max(n_test, 1), len(rows) - 1)
+
+            permuted = rng.permutation(rows)
+            test_parts.append(permuted[:n_test])
+            train_parts.append(permuted[n_test:])
+
+        empty = np.empty(0, dtype=np.intp)
+        train_idx = rng.permutation(np.concatenate(train_parts)) if train_parts else empty
+        test_idx = rng.permutation(np.concatenate(test_parts)) if test_parts else empty
+        return train_idx, test_idx
+
+    except Exception as e:
+        raise MyException(e, sys)
+
+
+class StreamingStratifiedSplitter:
+    """
+    Stratified test assignment over a stream of chunks, using running counts.
+
+    For every class it keeps the number of rows seen and assigned to test,
+    and after each chunk tops the test count up to ``round(test_size * seen)``
+    by picking rows of that class from the chunk with a seeded generator.
+    Class ratios therefore stay within one row of the target at every point
+    of the stream.
+
+    Reproducible for a given seed and chunk sequence: read the source in a
+    stable order (e.g. sorted by ``_id``).
+    """
+
+    def __init__(self, test_size: float, seed: int) -> None:
+        self.test_size = test_size
+        self.rng = np.random.default_rng(seed)
+        self.seen: dict[str, int] = {}
+        self.test: dict[str, int] = {}
+
+    def assign(self, labels) -> np.ndarray:
+        """
+        Return the boolean test mask for one chunk of class labels.
+        """
+        try:
+            groups, classes = group_positions(labels)
+            mask = np.zeros(len(labels), dtype=bool)
+
+            for code, positions in enumerate(groups):
+                key = _class_key(classes[code])
+                seen = self.seen.get(key, 0) + len(positions)
+                target = math.floor(self.test_size * seen + 0.5)
+                k = min(max(target - self.test.get(key, 0), 0), len(positions))
+
+                if k:
+                    mask[self.rng.choice(positions, size=k, replace=False)] = True
+
+                self.seen[key] = seen
+                self.test[key] = self.test.get(key, 0) + k
+
+            return mask
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def class_counts(self) -> tuple[dict[str, int], dict[str, int]]:
+        """Per-class (train, test) row counts assigned so far."""
+        train = {key: seen - self.test[key] for key, seen in self.seen.items()}
+        return train, dict(self.test)
@@ -0,0 +1,353 @@
+"""
+Single-pass column statistics for schema validation and drift reports.
+
+Each accumulator is updated chunk by chunk with vectorized NumPy/pandas
+operations, so a file is validated in one streaming read. Numeric columns
+are summarised as a fixed-bin histogram and categorical columns as counts
+over their domain; two such sketches (train and test) are compared with
+the population stability index and the Jensen-Shannon divergence.
+"""
+
+import sys
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from mlops_project.exception import MyException
+
+# Probabilities are floored at this value so empty bins do not make PSI infinite
+_EPSILON = 1e-6
+# Distinct unexpected categorical values kept as examples in the report
+_MAX_EXAMPLES = 10
+
+
+def _python(value):
+    """NumPy scalar -> plain Python value, so reports serialize as plain YAML."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+# ---------------------- NUMERIC COLUMNS ----------------------
+class NumericColumnStats:
+    """
+    Streaming statistics of a numeric column.
+
+    Tracks nulls, values that are not numbers, non-integral values of an
+    integer column, min/max, values outside ``value_range`` and a histogram
+    with fixed bin edges. The edges come from ``value_range`` when both
+    bounds are known, else from ``edges``, else from the first chunk seen.
+
+    Args:
+        name (str): Column name.
+        expected_dtype (str): Schema dtype, e.g. "int8" or "float32".
+        value_range (Optional[dict]): Inclusive ``{"min": .., "max": ..}``; either bound may be absent.
+        bins (int): Number of histogram bins.
+        edges (Optional[np.ndarray]): Bin edges to reuse, e.g. those of the train file.
+    """
+
+    kind = "numeric"
+
+    def __init__(
+        self,
+        name: str,
+        expected_dtype: str,
+        value_range: Optional[dict] = None,
+        bins: int = 20,
+        edges: Optional[np.ndarray] = None,
+    ) -> None:
+        self.name = name
+        self.expected_dtype = np.dtype(expected_dtype)
+        self.low = (value_range or {}).get("min")
+        self.high = (value_range or {}).get("max")
+        self.bins = bins
+
+        if self.low is not None and self.high is not None:
+            edges = np.linspace(self.low, self.high, bins + 1)
+        self.edges = edges
+
+        self.rows = 0
+        self.nulls = 0
+        self.non_numeric = 0
+        self.non_integral = 0
+        self.out_of_range = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.observed_dtypes: set[str] = set()
+        self.histogram: Optional[np.ndarray] = None if edges is None else np.zeros(len(edges) - 1, dtype=np.int64)
+
+    def update(self, series: pd.Series) -> None:
+        self.rows += len(series)
+        self.observed_dtypes.add(str(series.dtype))
+
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            null = np.isnan(values)
+        else:
+            null = series.isna().to_numpy()
+            values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            self.non_numeric += int((np.isnan(values) & ~null).sum())
+
+        self.nulls += int(null.sum())
+        finite = values[np.isfinite(values)]
+        if not finite.size:
+            return
+
+        low, high = finite.min(), finite.max()
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+        if self.expected_dtype.kind in "iu":
+            self.non_integral += int((finite != np.floor(finite)).sum())
+        if self.low is not None:
+            self.out_of_range += int((finite < self.low).sum())
+        if self.high is not None:
+            self.out_of_range += int((finite > self.high).sum())
+
+        if self.edges is None:
+            self.edges = np.linspace(low, high if high > low else low + 1, self.bins + 1)
+            self.histogram = np.zeros(self.bins, dtype=np.int64)
+
+        # Out-of-range values count in the outermost bins
+        self.histogram += np.histogram(np.clip(finite, self.edges[0], self.edges[-1]), bins=self.edges)[0]
+
+    def fits_expected_dtype(self) -> bool:
+        """True when every non-null value can be stored in the schema dtype."""
+        if self.non_numeric:
+            return False
+        if self.expected_dtype.kind in "iu":
+            if self.non_integral:
+                return False
+            info = np.iinfo(self.expected_dtype)
+            return self.min is None or (info.min <= self.min and self.max <= info.max)
+        if self.expected_dtype.kind == "f" and self.min is not None:
+            info = np.finfo(self.expected_dtype)
+            return info.min <= self.min and self.max <= info.max
+        return True
+
+    def distribution(self) -> np.ndarray:
+        """Histogram counts followed by the null count, for drift comparison."""
+        histogram = self.histogram if self.histogram is not None else np.zeros(self.bins, dtype=np.int64)
+        return np.append(histogram, self.nulls)
+
+    def summary(self) -> dict:
+        return {
+            "kind": self.kind,
+            "expected_dtype": str(self.expected_dtype),
+            "observed_dtypes": sorted(self.observed_dtypes),
+            "dtype_ok": bool(self.fits_expected_dtype()),
+            "rows": self.rows,
+            "null_ratio": round(self.nulls / self.rows, 6) if self.rows else 0.0,
+            "non_numeric": self.non_numeric,
+            "non_integral": self.non_integral,
+            "min": _python(self.min),
+            "max": _python(self.max),
+            "out_of_range": self.out_of_range,
+        }
+
+
+# ---------------------- CATEGORICAL COLUMNS ----------------------
+class CategoricalColumnStats:
+    """
+    Streaming statistics of a categorical column: counts per domain value,
+    nulls, and values outside the domain (with a few examples).
+
+    Without a domain, the distinct values seen are counted instead.
+
+    Args:
+        name (str): Column name.
+        domain (Optional[list]): Allowed values, from ``categorical_domains``.
+    """
+
+    kind = "categorical"
+
+    def __init__(self, name: str, domain: Optional[list] = None) -> None:
+        self.name = name
+        self.domain = pd.Index(domain) if domain is not None else None
+        self.counts = np.zeros(len(domain), dtype=np.int64) if domain is not None else None
+        self.value_counts: dict = {}
+
+        self.rows = 0
+        self.nulls = 0
+        self.out_of_domain = 0
+        self.unknown_values: dict[str, int] = {}
+        self.observed_dtypes: set[str] = set()
+        self.numeric_chunks = 0
+
+    def update(self, series: pd.Series) -> None:
+        self.rows += len(series)
+        self.observed_dtypes.add(str(series.dtype))
+        if pd.api.types.is_numeric_dtype(series) and not isinstance(series.dtype, pd.CategoricalDtype):
+            self.numeric_chunks += 1
+
+        null = series.isna().to_numpy()
+        self.nulls += int(null.sum())
+
+        if self.domain is None:
+            for value, count in series[~null].value_counts().items():
+                self.value_counts[value] = self.value_counts.get(value, 0) + int(count)
+            return
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Map the (few) categories once, then the integer codes
+            category_codes = self.domain.get_indexer(series.cat.categories)
+            codes = series.cat.codes.to_numpy()
+            positions = np.where(codes >= 0, category_codes[codes], -1)
+        else:
+            positions = self.domain.get_indexer(pd.Index(series, dtype=object))
+
+        unknown = (positions < 0) & ~null
+        self.counts += np.bincount(positions[positions >= 0], minlength=len(self.domain))
+
+        n_unknown = int(unknown.sum())
+        if n_unknown:
+            self.out_of_domain += n_unknown
+            for value, count in series[unknown].astype(str).value_counts().items():
+                if value in self.unknown_values or len(self.unknown_values) < _MAX_EXAMPLES:
+                    self.unknown_values[value] = self.unknown_values.get(value, 0) + int(count)
+
+    def fits_expected_dtype(self) -> bool:
+        """Categorical columns hold labels, so a numeric dtype means the wrong column or encoding."""
+        return not self.numeric_chunks
+
+    def distribution(self, reference: Optional["CategoricalColumnStats"] = None) -> np.ndarray:
+        """Counts per value, then out-of-domain, then nulls, for drift comparison."""
+        if self.counts is not None:
+            return np.concatenate([self.counts, [self.out_of_domain, self.nulls]])
+
+        # No domain: align on the values of both sides
+        keys = sorted(set(self.value_counts) | set(reference.value_counts if reference else ()), key=str)
+        return np.array([self.value_counts.get(key, 0) for key in keys] + [self.nulls], dtype=np.int64)
+
+    def summary(self) -> dict:
+        return {
+            "kind": self.kind,
+            "expected_dtype": "category",
+            "observed_dtypes": sorted(self.observed_dtypes),
+            "dtype_ok": bool(self.fits_expected_dtype()),
+            "rows": self.rows,
+            "null_ratio": round(self.nulls / self.rows, 6) if self.rows else 0.0,
+            "out_of_domain": self.out_of_domain,
+            "unknown_values": dict(self.unknown_values),
+        }
+
+
+# ---------------------- DATASET PROFILE ----------------------
+class DatasetProfile:
+    """
+    Statistics of every schema column of one file, fed chunk by chunk.
+
+    Args:
+        schema (dict): Parsed ``schema.yaml``.
+        bins (int): Histogram bins of numeric columns.
+        reference (Optional[DatasetProfile]): Profile whose histogram edges are
+            reused (e.g. train's for test), so both sketches are comparable.
+    """
+
+    def __init__(self, schema: dict, bins: int = 20, reference: Optional["DatasetProfile"] = None) -> None:
+        try:
+            self.dtypes: dict[str, str] = {}
+            for column in schema["columns"]:
+                self.dtypes.update(column)
+
+            domains = schema.get("categorical_domains") or {}
+            ranges = schema.get("numerical_ranges") or {}
+            self.ignored = set(schema.get("drop_columns") or [])
+
+            self.columns: dict[str, NumericColumnStats | CategoricalColumnStats] = {}
+            for name, dtype in self.dtypes.items():
+                if dtype == "category":
+                    self.columns[name] = CategoricalColumnStats(name, domains.get(name))
+                else:
+                    edges = None
+                    if reference is not None and name in reference.columns:
+                        edges = reference.columns[name].edges
+                    self.columns[name] = NumericColumnStats(name, dtype, ranges.get(name), bins, edges)
+
+            self.rows = 0
+            self.seen_columns: Optional[set[str]] = None
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.rows += len(chunk)
+        if self.seen_columns is None:
+            self.seen_columns = set(chunk.columns)
+
+        for name, stats in self.columns.items():
+            if name in chunk.columns:
+                stats.update(chunk[name])
+
+    @property
+    def missing_columns(self) -> list[str]:
+        return [name for name in self.columns if name not in (self.seen_columns or ())]
+
+    @property
+    def unexpected_columns(self) -> list[str]:
+        return sorted(set(self.seen_columns or ()) - set(self.columns) - self.ignored)
+
+
+# ---------------------- DRIFT ----------------------
+def _proportions(counts: np.ndarray) -> np.ndarray:
+    counts = np.asarray(counts, dtype=np.float64)
+    total = counts.sum()
+    proportions = counts / total if total else np.full(len(counts), 1 / len(counts))
+    return np.clip(proportions, _EPSILON, None)
+
+
+def population_stability_index(expected: np.ndarray, actual: np.ndarray) -> float:
+    """
+    PSI between two histograms over the same bins: sum((a - e) * ln(a / e)).
+
+    Rule of thumb: < 0.1 stable, 0.1-0.2 moderate shift, > 0.2 significant shift.
+    """
+    e, a = _proportions(expected), _proportions(actual)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def jensen_shannon_divergence(p_counts: np.ndarray, q_counts: np.ndarray) -> float:
+    """Jensen-Shannon divergence (base 2, in [0, 1]) between two histograms over the same bins."""
+    p, q = _proportions(p_counts), _proportions(q_counts)
+    p, q = p / p.sum(), q / q.sum()
+    m = (p + q) / 2
+    return float(0.5 * np.sum(p * np.log2(p / m)) + 0.5 * np.sum(q * np.log2(q / m)))
+
+
+def drift_report(reference: DatasetProfile, current: DatasetProfile, threshold: float, exclude: tuple = ()) -> dict:
+    """
+    Compare the column sketches of two profiles.
+
+    Args:
+        reference (DatasetProfile): Usually the train file.
+        current (DatasetProfile): Usually the test file, built with ``reference=``.
+        threshold (float): PSI above which a column is flagged as drifted.
+        exclude (tuple): Columns not compared, e.g. row identifiers.
+
+    Returns:
+        dict: ``drift_detected`` and, per column, its PSI, JS divergence and flag.
+    """
+    columns = {}
+    for name, stats in reference.columns.items():
+        other = current.columns.get(name)
+        if name in exclude or other is None or not stats.rows or not other.rows:
+            continue
+
+        if isinstance(stats, CategoricalColumnStats):
+            expected, actual = stats.distribution(other), other.distribution(stats)
+        else:
+            expected, actual = stats.distribution(), other.distribution()
+
+        psi = population_stability_index(expected, actual)
+        columns[name] = {
+            "psi": round(psi, 6),
+            "js_divergence": round(jensen_shannon_divergence(expected, actual), 6),
+            "drift": bool(psi > threshold),
+        }
+
+    return {
+        "threshold_psi": threshold,
+        "drift_detected": any(column["drift"] for column in columns.values()),
+        "columns": columns,
+    }
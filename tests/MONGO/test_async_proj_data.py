@@ -0,0 +1,149 @@
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.async_proj_data import AsyncProjData
+from mlops_project.exception import MyException
+
+COLLECTION = "test-collection"
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def _insert_documents(client, n_rows: int) -> None:
+    client[DATABASE_NAME][COLLECTION].insert_many(
+        [
+            {"id": i, "Gender": "Male" if i % 2 else "Female", "Annual_Premium": "na" if i % 5 == 0 else float(i)}
+            for i in range(n_rows)
+        ]
+    )
+
+
+# ---------------------- TEST: POINT LOOKUPS ----------------------
+def test_find_by_id_and_find_by_ids(mock_mongo, mock_async_mongo):
+    """
+    Test single and batched lookups by id.
+
+    Steps:
+        - Insert 25 documents, look up one id, then 7 ids (one missing, one repeated) with max_batch_size=3.
+        - Expect the documents without _id, the missing id absent, and 2 $in queries.
+    """
+    _insert_documents(mock_mongo, 25)
+    data = AsyncProjData(client=mock_async_mongo, max_batch_size=3)
+
+    document = _run(data.find_by_id(COLLECTION, 7))
+    assert document == {"id": 7, "Gender": "Male", "Annual_Premium": 7.0}
+
+    mock_async_mongo.finds.clear()
+    found = _run(data.find_by_ids(COLLECTION, [1, 2, 3, 2, 4, 99, 5]))
+    assert sorted(found) == [1, 2, 3, 4, 5]
+    assert found[4] == {"id": 4, "Gender": "Female", "Annual_Premium": 4.0}
+    assert len(mock_async_mongo.finds) == 2
+
+    assert _run(data.find_by_id(COLLECTION, 99)) is None
+
+
+def test_concurrent_lookups_share_queries(mock_mongo, mock_async_mongo):
+    """
+    Test that concurrent point lookups are answered by coalesced $in queries.
+
+    Steps:
+        - Look up 50 ids (and one missing, and repeats) concurrently with max_batch_size=20.
+        - Expect each caller its own document, in 3 queries instead of 60.
+        - Expect a projection without the key field to still match documents, without returning it.
+    """
+    _insert_documents(mock_mongo, 50)
+    data = AsyncProjData(client=mock_async_mongo, max_batch_size=20, max_wait_ms=5)
+    keys = list(range(50)) + [7, 7, 999] + list(range(7))
+
+    async def lookup_all(projection=None):
+        return await asyncio.gather(*(data.lookup(COLLECTION, key, projection=projection) for key in keys))
+
+    documents = _run(lookup_all())
+
+    assert [document and document["id"] for document in documents] == [None if key == 999 else key for key in keys]
+    assert len(mock_async_mongo.finds) == 3
+    assert data.metrics()[f"{COLLECTION}.id"]["lookups"] == len(keys)
+
+    documents = _run(lookup_all({"Gender": True, "_id": False}))
+    assert documents[3] == {"Gender": "Male"}
+
+
+def test_failed_lookup_query_reaches_every_caller(mock_async_mongo, monkeypatch):
+    data = AsyncProjData(client=mock_async_mongo, max_wait_ms=0)
+
+    def broken_find(*args, **kwargs):
+        raise RuntimeError("connection reset")
+
+    async def lookup_all():
+        collection = data._get_collection(COLLECTION)
+        monkeypatch.setattr(type(collection), "find", broken_find)
+        return await asyncio.gather(*(data.lookup(COLLECTION, key) for key in range(3)), return_exceptions=True)
+
+    results = _run(lookup_all())
+    assert all(isinstance(result, MyException) and "connection reset" in str(result) for result in results)
+
+
+# ---------------------- TEST: ASYNC STREAMING ----------------------
+def test_iter_collection_yields_bounded_chunks(mock_mongo, mock_async_mongo):
+    """
+    Test that the async cursor yields chunks like ProjData: bounded, cleaned, without _id.
+    """
+    _insert_documents(mock_mongo, 25)
+    data = AsyncProjData(client=mock_async_mongo)
+
+    async def collect():
+        chunks = data.iter_collection_as_dataframes(COLLECTION, batch_size=10, sort=[("id", 1)])
+        return [chunk async for chunk in chunks]
+
+    chunks = _run(collect())
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert all("_id" not in chunk.columns for chunk in chunks)
+    assert np.isnan(chunks[0]["Annual_Premium"].iloc[0])
+    assert len(_run(data.export_collection_as_dataframe(COLLECTION, batch_size=7))) == 25
+
+    with pytest.raises(MyException):
+        _run(data.export_collection_as_dataframe(COLLECTION, batch_size=0))
+
+
+# ---------------------- TEST: LOCAL MONGOD ----------------------
+@pytest.mark.skipif(not os.getenv("MONGO_TEST_URI"), reason="set MONGO_TEST_URI to a disposable mongod")
+def test_against_mongod():
+    """
+    Test lookups and streaming with pymongo's AsyncMongoClient against a real mongod.
+
+    Steps:
+        - Fill a scratch collection of MONGO_TEST_URI's server.
+        - Run concurrent lookups and a streamed export, then drop the collection.
+    """
+    from mlops_project.configuration.mongo_db_connection import MongoClient
+    from mlops_project.entity.config_entity import MongoClientConfig
+
+    collection_name = f"async-proj-data-test-{os.getpid()}"
+
+    async def scenario():
+        client = MongoClient.create_async_client(MongoClientConfig(uri=os.environ["MONGO_TEST_URI"]))
+        data = AsyncProjData(client=client, max_wait_ms=5)
+        collection = data._get_collection(collection_name)
+        try:
+            await collection.insert_many([{"id": i, "Age": 20 + i % 50} for i in range(1000)])
+            await collection.create_index("id")
+
+            documents = await asyncio.gather(*(data.lookup(collection_name, key) for key in range(0, 1000, 10)))
+            chunks = [chunk async for chunk in data.iter_collection_as_dataframes(collection_name, batch_size=300)]
+            return documents, chunks, data.metrics()
+        finally:
+            await collection.drop()
+            await client.close()
+
+    documents, chunks, metrics = _run(scenario())
+
+    assert [document["id"] for document in documents] == list(range(0, 1000, 10))
+    assert metrics[f"{collection_name}.id"]["queries"] == 1
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
@@ -0,0 +1,141 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from mlops_project.configuration import mongo_db_connection
+from mlops_project.configuration.mongo_db_connection import MongoClient, available_compressors
+from mlops_project.entity.config_entity import MongoClientConfig
+
+LOCAL_URI = "mongodb://localhost:27017"
+
+
+@pytest.fixture
+def fresh_manager(monkeypatch):
+    """
+    Reset the shared client state; clients are created lazily and never
+    connect in these tests (pymongo connects in the background on first use).
+    """
+    monkeypatch.setattr(MongoClient, "client", None)
+    monkeypatch.setattr(MongoClient, "config", None)
+    monkeypatch.setattr(MongoClient, "_created_client", None)
+    yield
+    if MongoClient._created_client is not None:
+        MongoClient._created_client.close()
+
+
+# ---------------------- TEST: LAZY SINGLETON ----------------------
+def test_uri_is_built_and_client_created_once(fresh_manager, monkeypatch):
+    """
+    Test that the URI is built and the client created only on first use, also under concurrent first uses.
+
+    Steps:
+        - Count create_mongo_uri calls.
+        - Instantiate MongoClient from 8 threads at once, then again from this one.
+        - Expect one URI, one client, shared by every instance.
+    """
+    calls = []
+    monkeypatch.setattr(mongo_db_connection, "create_mongo_uri", lambda: calls.append(1) or LOCAL_URI)
+    barrier = threading.Barrier(8)
+    clients = []
+
+    def connect():
+        barrier.wait()
+        clients.append(MongoClient().database.client)
+
+    threads = [threading.Thread(target=connect) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    clients.append(MongoClient(database_name="Other").database.client)
+
+    assert len(calls) == 1
+    assert len({id(client) for client in clients}) == 1
+
+
+def test_client_settings(fresh_manager):
+    """
+    Test that pool, compression and read preference settings reach the pymongo client.
+    """
+    MongoClient.configure(
+        MongoClientConfig(uri=LOCAL_URI, max_pool_size=7, min_pool_size=2, compressors="zstd,snappy,zlib")
+    )
+    connection = MongoClient()
+    client = connection.database.client
+
+    assert client.options.pool_options.max_pool_size == 7
+    assert client.options.pool_options.min_pool_size == 2
+    assert client.options._options["compressors"] == available_compressors("zstd,snappy,zlib")
+    assert connection.database.read_preference.mongos_mode == "primary"
+    assert connection.bulk_database.read_preference.mongos_mode == "secondaryPreferred"
+    assert MongoClient.pool_settings()["max_pool_size"] == 7
+
+
+def test_configure_replaces_the_client(fresh_manager):
+    """
+    Test that new settings replace the created client, while the same settings keep it.
+    """
+    MongoClient.configure(MongoClientConfig(uri=LOCAL_URI, max_pool_size=5))
+    first = MongoClient.get_client()
+    MongoClient.configure(MongoClientConfig(uri=LOCAL_URI, max_pool_size=5))
+    assert MongoClient.get_client() is first
+
+    MongoClient.configure(MongoClientConfig(uri=LOCAL_URI, max_pool_size=9))
+    second = MongoClient.get_client()
+    assert second is not first
+    assert second.options.pool_options.max_pool_size == 9
+
+
+def test_available_compressors_skips_missing_codecs():
+    assert available_compressors("zlib") == ["zlib"]
+    assert available_compressors(" zlib , lz4 ,") == ["zlib"]
+    assert set(available_compressors("zstd,snappy,zlib")) <= {"zstd", "snappy", "zlib"}
+
+
+# ---------------------- TEST: FORK SAFETY ----------------------
+FORK_SCRIPT = """
+import os
+from mlops_project.configuration.mongo_db_connection import MongoClient
+from mlops_project.entity.config_entity import MongoClientConfig
+
+def in_child(check):
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if check() else 1)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status) == 0
+
+MongoClient.configure(MongoClientConfig(uri="mongodb://localhost:27017"))
+parent_client = MongoClient.get_client()
+assert in_child(lambda: MongoClient.client is None and MongoClient.get_client() is not parent_client)
+assert MongoClient.client is parent_client
+
+installed = object()
+MongoClient.client = installed
+assert in_child(lambda: MongoClient.client is installed)
+"""
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_creates_its_own_client():
+    """
+    Test that a forked child drops the parent's created client, but keeps an installed one.
+
+    Runs in a fresh interpreter: forking the test process could copy locks
+    held by its other threads (e.g. allocator threads of earlier tests).
+
+    Steps:
+        - Create the client, fork, and check in the child that it creates its own.
+        - Install a plain object as the client, fork again.
+    """
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore::DeprecationWarning", "-c", FORK_SCRIPT],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.returncode == 0, result.stderr
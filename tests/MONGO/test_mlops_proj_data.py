@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.exception import MyException
+
+COLLECTION = "test-collection"
+
+
+def _insert_documents(client, n_rows: int) -> None:
+    collection = client[DATABASE_NAME][COLLECTION]
+    collection.insert_many(
+        [
+            {"id": i, "Gender": "Male" if i % 2 else "Female", "Annual_Premium": "na" if i % 5 == 0 else float(i)}
+            for i in range(n_rows)
+        ]
+    )
+
+
+# ---------------------- TEST: CHUNKED STREAMING ----------------------
+def test_iter_collection_yields_bounded_chunks(mock_mongo):
+    """
+    Test that the collection is streamed in chunks of at most batch_size rows.
+
+    Steps:
+        - Insert 25 documents.
+        - Stream them with batch_size=10.
+        - Expect chunks of 10, 10 and 5 rows without the _id column.
+    """
+    _insert_documents(mock_mongo, 25)
+
+    chunks = list(ProjData().iter_collection_as_dataframes(COLLECTION, batch_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert all("_id" not in chunk.columns for chunk in chunks)
+
+
+def test_iter_collection_keeps_id_on_request(mock_mongo):
+    _insert_documents(mock_mongo, 25)
+    ids = sorted(mock_mongo[DATABASE_NAME][COLLECTION].distinct("_id"))
+
+    chunks = list(ProjData().iter_collection_as_dataframes(COLLECTION, batch_size=10, sort=[("_id", 1)], keep_id=True))
+
+    assert list(chunks[0].columns) == ["_id", "id", "Gender", "Annual_Premium"]
+    assert [value for chunk in chunks for value in chunk["_id"]] == ids
+
+
+# ---------------------- TEST: PER-CHUNK CLEANUP ----------------------
+def test_export_replaces_na_and_drops_id(mock_mongo):
+    """
+    Test that the concatenated export matches the documents and is cleaned.
+
+    Steps:
+        - Insert 12 documents, every fifth one has Annual_Premium == "na".
+        - Export with a projection that keeps _id and batch_size=5.
+        - Expect _id dropped, "na" replaced with NaN and a contiguous index.
+    """
+    _insert_documents(mock_mongo, 12)
+
+    df = ProjData().export_collection_as_dataframe(COLLECTION, batch_size=5, projection=None)
+
+    assert len(df) == 12
+    assert "_id" not in df.columns
+    assert list(df.index) == list(range(12))
+    assert df["Annual_Premium"].isna().sum() == 3
+    assert not (df["Annual_Premium"] == "na").any()
+    assert np.isclose(df.loc[df["id"] == 7, "Annual_Premium"].iloc[0], 7.0)
+
+
+# ---------------------- TEST: MISSING KEYS ----------------------
+def test_documents_with_missing_keys_are_padded():
+    """
+    Test that documents with different keys are transposed into aligned columns.
+    """
+    columns, n_rows = ProjData._documents_to_columns([{"a": 1}, {"a": 2, "b": 3}, {"b": 4}])
+
+    assert n_rows == 3
+    assert columns == {"a": [1, 2, None], "b": [None, 3, 4]}
+
+
+# ---------------------- TEST: EMPTY COLLECTION ----------------------
+def test_export_empty_collection_returns_empty_dataframe(mock_mongo):
+    df = ProjData().export_collection_as_dataframe("missing-collection")
+    assert df.empty
+
+
+# ---------------------- TEST: INVALID BATCH SIZE ----------------------
+def test_invalid_batch_size_raises(mock_mongo):
+    with pytest.raises(MyException):
+        list(ProjData().iter_collection_as_dataframes(COLLECTION, batch_size=0))
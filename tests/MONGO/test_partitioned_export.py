@@ -0,0 +1,75 @@
+import logging
+
+import pandas as pd
+
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.mlops_proj_data import ProjData
+
+COLLECTION = "partitioned"
+
+
+def _insert_documents(client, n_rows: int) -> None:
+    client[DATABASE_NAME][COLLECTION].insert_many(
+        [{"id": (i * 7) % n_rows, "Age": 20 + i % 60} for i in range(n_rows)]
+    )
+
+
+# ---------------------- TEST: PARTITIONS ARE DISJOINT ----------------------
+def test_partition_queries_cover_collection_once(mock_mongo):
+    """
+    Test that range partitions on a numeric field are disjoint and complete.
+
+    Steps:
+        - Insert 50 documents plus one without the partition field.
+        - Build 4 partitions on "id".
+        - Expect every document to match exactly one partition filter.
+    """
+    _insert_documents(mock_mongo, 50)
+    collection = mock_mongo[DATABASE_NAME][COLLECTION]
+    collection.insert_one({"Age": 99})
+
+    queries = ProjData._partition_queries(collection, "id", 4)
+
+    assert len(queries) == 5
+    counts = [collection.count_documents(query) for query in queries]
+    assert sum(counts) == 51
+    assert counts[-1] == 1
+
+
+# ---------------------- TEST: PARALLEL EXPORT ----------------------
+def test_parallel_export_matches_single_cursor(mock_mongo, caplog):
+    """
+    Test that the parallel export returns the same rows in a deterministic order.
+
+    Steps:
+        - Insert 101 documents with ids in shuffled order.
+        - Export with one cursor and with 3 workers partitioned on "id".
+        - Expect identical content, ids sorted by range, and per-partition timing logs.
+    """
+    _insert_documents(mock_mongo, 101)
+    data = ProjData()
+
+    sequential = data.export_collection_as_dataframe(COLLECTION)
+    with caplog.at_level(logging.INFO):
+        parallel = data.export_collection_as_dataframe(
+            COLLECTION, num_workers=3, partition_field="id", batch_size=10
+        )
+
+    assert len(parallel) == 101
+    assert parallel["id"].tolist() == sorted(sequential["id"].tolist())
+    pd.testing.assert_frame_equal(
+        parallel.sort_values("id").reset_index(drop=True),
+        sequential.sort_values("id").reset_index(drop=True),
+    )
+    assert sum("Partition" in record.message for record in caplog.records) == 4
+
+
+# ---------------------- TEST: OBJECT ID PARTITIONS ----------------------
+def test_parallel_export_on_object_id(mock_mongo):
+    _insert_documents(mock_mongo, 40)
+
+    df = ProjData().export_collection_as_dataframe(COLLECTION, num_workers=4, num_partitions=8)
+
+    assert len(df) == 40
+    assert "_id" not in df.columns
+    assert df["id"].nunique() == 40
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.data_access.schema_decoder import SchemaDecoder
+
+SCHEMA = {
+    "columns": [{"id": "int32"}, {"Gender": "category"}, {"Age": "int8"}, {"Annual_Premium": "float32"}],
+    "categorical_domains": {"Gender": ["Male", "Female"]},
+}
+
+
+# ---------------------- TEST: TYPED DECODING ----------------------
+def test_decode_produces_compact_dtypes():
+    """
+    Test that clean columns are decoded into the schema dtypes.
+    """
+    decoder = SchemaDecoder(SCHEMA)
+    df = decoder.decode(
+        {"id": [1, 2], "Gender": ["Male", "Female"], "Age": [30, 40], "Annual_Premium": [100.0, 200.0]}, 2
+    )
+
+    assert list(df.columns) == ["id", "Gender", "Age", "Annual_Premium"]
+    assert df["id"].dtype == np.int32
+    assert df["Age"].dtype == np.int8
+    assert df["Annual_Premium"].dtype == np.float32
+    assert isinstance(df["Gender"].dtype, pd.CategoricalDtype)
+    assert list(df["Gender"].cat.categories) == ["Male", "Female"]
+
+
+# ---------------------- TEST: INVALID VALUES ----------------------
+def test_int_columns_keep_exact_values():
+    """
+    Test that int columns neither truncate non-integral floats nor round large ids.
+
+    Steps:
+        - Decode an int column holding 1.5, and an int32 id column holding 2**24 + 1 and "na".
+        - Expect float64 columns with the exact values.
+    """
+    decoder = SchemaDecoder(SCHEMA)
+    df = decoder.decode({"id": [2**24 + 1, "na"], "Age": [1.5, 30]}, 2)
+
+    assert df["Age"].dtype == np.float64
+    assert df["Age"].tolist() == [1.5, 30.0]
+    assert df["id"].iloc[0] == 2**24 + 1
+    assert decoder.decode({"Age": [30.0, 31.0]}, 2)["Age"].dtype == np.int8
+
+
+def test_decode_turns_placeholders_into_nan():
+    """
+    Test that "na" placeholders, unknown categories and missing columns become NaN.
+
+    Steps:
+        - Decode a chunk with "na" in a float and an int column and an unknown Gender.
+        - Leave the Annual_Premium column out of one chunk entirely.
+        - Expect NaN values and the int column widened to float64.
+    """
+    decoder = SchemaDecoder(SCHEMA)
+    df = decoder.decode({"id": [1, 2], "Gender": ["Male", "Other"], "Age": [30, "na"]}, 2)
+
+    assert df["Age"].dtype == np.float64
+    assert np.isnan(df["Age"].iloc[1])
+    assert pd.isna(df["Gender"].iloc[1])
+    assert df["Annual_Premium"].isna().all()
+
+
+# ---------------------- TEST: PROJECTION ----------------------
+def test_projection_contains_only_schema_columns():
+    projection = SchemaDecoder(SCHEMA).projection
+    assert projection == {"_id": False, "id": True, "Gender": True, "Age": True, "Annual_Premium": True}
+
+
+# ---------------------- TEST: TYPED EXPORT ----------------------
+def test_typed_export_keeps_categories_across_chunks(mock_mongo):
+    """
+    Test that chunks decoded independently concatenate into category columns.
+
+    Steps:
+        - Insert documents with an extra column not declared in schema.yaml.
+        - Export with use_schema=True and a small batch size.
+        - Expect category dtypes, the schema column order and no extra column.
+    """
+    mock_mongo[DATABASE_NAME]["typed"].insert_many(
+        [
+            {"id": i, "Gender": "Male" if i % 3 else "Female", "Vehicle_Age": "< 1 Year",
+             "Vehicle_Damage": "Yes", "Annual_Premium": "na" if i == 4 else 2000.0, "extra": i}
+            for i in range(10)
+        ]
+    )
+
+    df = ProjData().export_collection_as_dataframe("typed", batch_size=3, use_schema=True)
+
+    assert len(df) == 10
+    assert "extra" not in df.columns
+    assert list(df.columns) == SchemaDecoder.from_schema_file().columns
+    assert isinstance(df["Gender"].dtype, pd.CategoricalDtype)
+    assert df["Annual_Premium"].dtype == np.float32
+    assert df["Annual_Premium"].isna().sum() == 1
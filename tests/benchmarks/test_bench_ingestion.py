@@ -0,0 +1,60 @@
+import pytest
+
+from benchmarks.bench_ingestion import BENCH_COLLECTION, compare, parse_scale, run_scale
+from benchmarks.synthetic import load_collection
+from mlops_project.constants import DATABASE_NAME
+
+
+# ---------------------- TEST: SCALES ----------------------
+@pytest.mark.parametrize("value, rows", [("100k", 100_000), ("1M", 1_000_000), ("10m", 10_000_000), ("2_500", 2_500)])
+def test_parse_scale(value, rows):
+    assert parse_scale(value) == rows
+
+
+# ---------------------- TEST: RUN ----------------------
+def test_run_scale_measures_every_stage(mock_mongo, tmp_path):
+    """
+    Test a small benchmark run end to end on mongomock.
+
+    Steps:
+        - Load 3000 synthetic documents.
+        - Run the stages for csv and parquet.
+        - Expect one export and one split result, and both writes per format.
+    """
+    load_collection(mock_mongo[DATABASE_NAME][BENCH_COLLECTION], 3000)
+
+    results = run_scale(3000, ["csv", "parquet"], batch_size=1000, num_workers=1, use_schema=True, work_dir=tmp_path)
+
+    keys = [(row["stage"], row["format"]) for row in results]
+    assert keys == [
+        ("export", None),
+        ("split", None),
+        ("write_train_test", "csv"),
+        ("write_feature_store", "csv"),
+        ("write_train_test", "parquet"),
+        ("write_feature_store", "parquet"),
+    ]
+    export = results[0]
+    assert export["scale"] == 3000 and export["rows_per_second"] > 0
+    assert export["mongo_fetch_seconds"] > 0
+    assert all(row["seconds"] >= 0 for row in results)
+    assert all(row["file_mb"] > 0 for row in results if row["stage"].startswith("write"))
+
+
+# ---------------------- TEST: COMPARE ----------------------
+def test_compare_flags_slowdowns_and_memory_growth():
+    baseline = [
+        {"scale": 10, "stage": "export", "format": None, "seconds": 1.0, "peak_rss_delta_mb": 100.0},
+        {"scale": 10, "stage": "write_train_test", "format": "csv", "seconds": 0.01, "peak_rss_delta_mb": 1.0},
+    ]
+    current = [
+        {"scale": 10, "stage": "export", "format": None, "seconds": 1.1, "peak_rss_delta_mb": 150.0},
+        # 3x slower but within the timer noise floor
+        {"scale": 10, "stage": "write_train_test", "format": "csv", "seconds": 0.03, "peak_rss_delta_mb": 1.0},
+        {"scale": 99, "stage": "export", "format": None, "seconds": 9.0, "peak_rss_delta_mb": 1.0},
+    ]
+
+    regressions = compare(current, baseline, tolerance=0.2)
+
+    assert [(row["stage"], row["metric"]) for row in regressions] == [("export", "peak_rss_delta_mb")]
+    assert regressions[0]["ratio"] == 1.5
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+
+from mlops_project.cloud_storage.aws_storage import SimpleStorageService
+from mlops_project.components.model_evaluation import ModelEvaluation
+from mlops_project.components.model_pusher import ModelPusher
+from mlops_project.entity.artifact_entity import (
+    ClassificationMetricArtifact,
+    DataIngestionArtifact,
+    ModelEvaluationArtifact,
+    ModelTrainerArtifact,
+)
+from mlops_project.entity.config_entity import ModelEvaluationConfig, ModelPusherConfig
+from mlops_project.entity.estimator import MyModel
+from mlops_project.entity.s3_estimator import Proj1Estimator
+from mlops_project.utils.main_utils import save_object
+
+
+def _frame(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({"x0": rng.normal(size=n_rows), "x1": rng.normal(size=n_rows)})
+    frame["Response"] = (frame["x0"] + 0.3 * rng.normal(size=n_rows) > 0.8).astype(int)
+    return frame
+
+
+def _save_model(file_path, c=1.0):
+    """A small MyModel; a different ``c`` gives a different file."""
+    train = _frame(500, seed=0)
+    preprocessor = ColumnTransformer([("passthrough", "passthrough", ["x0", "x1"])]).fit(train)
+    model = LogisticRegression(C=c).fit(preprocessor.transform(train), train["Response"])
+    save_object(file_path, MyModel(preprocessor, model))
+    return file_path
+
+
+@pytest.fixture
+def count_downloads(monkeypatch):
+    """Counts SimpleStorageService.download_file calls."""
+    calls = []
+    download_file = SimpleStorageService.download_file
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return download_file(self, *args, **kwargs)
+
+    monkeypatch.setattr(SimpleStorageService, "download_file", counting)
+    return calls
+
+
+# ---------------------- TEST: LOCAL CACHE ----------------------
+def test_unchanged_model_is_downloaded_once(mock_s3, tmp_path, count_downloads):
+    """
+    Test that workers fetching an unchanged model reuse the cached copy.
+
+    Steps:
+        - Push a model, then fetch it from two estimators with an empty cache.
+        - Expect one download, and the file's bytes in the cache.
+    """
+    model_file_path = _save_model(tmp_path / "model.pkl")
+    Proj1Estimator(mock_s3, cache_dir=tmp_path / "pusher_cache").save_model(model_file_path)
+
+    first = Proj1Estimator(mock_s3, cache_dir=tmp_path / "cache").fetch_model()
+    second = Proj1Estimator(mock_s3, cache_dir=tmp_path / "cache").fetch_model()
+
+    assert first == second
+    assert len(count_downloads) == 1
+    assert first.read_bytes() == model_file_path.read_bytes()
+
+
+def test_new_version_is_downloaded(mock_s3, tmp_path, count_downloads):
+    """
+    Test that pushing a different model invalidates the cached one, and that
+    pushing the current model again is a no-op.
+    """
+    estimator = Proj1Estimator(mock_s3, cache_dir=tmp_path / "cache")
+    first = estimator.save_model(_save_model(tmp_path / "v1.pkl", c=1.0))
+    assert estimator.save_model(tmp_path / "v1.pkl")["version"] == first["version"]
+
+    worker = Proj1Estimator(mock_s3, cache_dir=tmp_path / "worker_cache")
+    first_path = worker.fetch_model()
+    second = estimator.save_model(_save_model(tmp_path / "v2.pkl", c=0.01))
+    second_path = worker.fetch_model()
+
+    assert second["version"] != first["version"]
+    assert estimator.list_versions() == sorted([first["version"], second["version"]])
+    assert first_path != second_path
+    assert second_path.read_bytes() == (tmp_path / "v2.pkl").read_bytes()
+    assert len(count_downloads) == 2
+
+
+def test_truncated_cache_entry_is_downloaded_again(mock_s3, tmp_path, count_downloads):
+    """
+    Test that a cached file whose size does not match the object is replaced.
+    """
+    estimator = Proj1Estimator(mock_s3, cache_dir=tmp_path / "cache")
+    estimator.save_model(_save_model(tmp_path / "model.pkl"))
+    cached = estimator.fetch_model()
+    cached.write_bytes(cached.read_bytes()[:10])
+
+    assert estimator.fetch_model().read_bytes() == (tmp_path / "model.pkl").read_bytes()
+    assert len(count_downloads) == 1
+
+
+def test_object_without_metadata_is_cached_by_etag(mock_s3, tmp_path, count_downloads):
+    """
+    Test that a model uploaded by other tools (no sha256 metadata) is cached by its ETag.
+    """
+    model_file_path = _save_model(tmp_path / "model.pkl")
+    SimpleStorageService().upload_file(model_file_path, mock_s3, "model-registry/model.pkl")
+    estimator = Proj1Estimator(mock_s3, cache_dir=tmp_path / "cache")
+
+    first = estimator.fetch_model()
+    assert estimator.fetch_model() == first
+    assert first.parent.name.startswith("etag-")
+    assert len(count_downloads) == 1
+    assert estimator.predict(_frame(5, seed=2).drop(columns=["Response"])).shape == (5,)
+
+
+def test_empty_registry(mock_s3, tmp_path):
+    estimator = Proj1Estimator(mock_s3, cache_dir=tmp_path / "cache")
+
+    assert not estimator.is_model_present()
+    assert estimator.fetch_model() is None
+    assert estimator.list_versions() == []
+
+
+# ---------------------- TEST: PUSHER AND EVALUATION ----------------------
+def test_pusher_pushes_only_accepted_models(mock_s3, tmp_path):
+    """
+    Test that the pusher skips rejected models and pushes accepted ones to the registry.
+    """
+    model_file_path = _save_model(tmp_path / "model.pkl")
+    config = ModelPusherConfig(bucket_name=mock_s3, registry_cache_dir=tmp_path / "cache")
+
+    def artifact(accepted):
+        return ModelEvaluationArtifact(
+            is_model_accepted=accepted, changed_accuracy=0.1, trained_model_path=model_file_path
+        )
+
+    rejected = ModelPusher(artifact(False), config).initiate_model_pusher()
+    assert not rejected.is_pushed
+    assert not Proj1Estimator(mock_s3).is_model_present()
+
+    pushed = ModelPusher(artifact(True), config).initiate_model_pusher()
+    assert pushed.is_pushed and pushed.s3_model_path == "model-registry/model.pkl"
+    assert Proj1Estimator(mock_s3).list_versions() == [pushed.model_version]
+
+
+def test_pusher_without_bucket_deploys_locally(tmp_path):
+    model_file_path = _save_model(tmp_path / "model.pkl")
+    config = ModelPusherConfig(bucket_name=None, deployed_model_file_path=tmp_path / "deployed" / "model.pkl")
+
+    evaluation_artifact = ModelEvaluationArtifact(
+        is_model_accepted=True, changed_accuracy=0.1, trained_model_path=model_file_path
+    )
+    artifact = ModelPusher(evaluation_artifact, config).initiate_model_pusher()
+
+    assert artifact.is_pushed and artifact.bucket_name is None
+    assert artifact.deployed_model_path.read_bytes() == model_file_path.read_bytes()
+
+
+def test_evaluation_compares_with_the_registry_model(mock_s3, tmp_path, count_downloads):
+    """
+    Test that evaluation uses the registry's current model through the cache,
+    downloading it once across runs.
+    """
+    Proj1Estimator(mock_s3, cache_dir=tmp_path / "pusher_cache").save_model(_save_model(tmp_path / "deployed.pkl"))
+    test_file_path = tmp_path / "test.csv"
+    _frame(1000, seed=1).to_csv(test_file_path, index=False)
+
+    def evaluate():
+        return ModelEvaluation(
+            DataIngestionArtifact(trained_file_path=tmp_path / "train.csv", test_file_path=test_file_path),
+            ModelTrainerArtifact(
+                trained_model_file_path=_save_model(tmp_path / "trained.pkl", c=0.5),
+                metric_artifact=ClassificationMetricArtifact(f1_score=0.8, precision_score=0.8, recall_score=0.8),
+            ),
+            ModelEvaluationConfig(
+                model_evaluation_dir=tmp_path / "model_evaluation",
+                prediction_cache_dir=tmp_path / "prediction_cache",
+                bucket_name=mock_s3,
+                registry_cache_dir=tmp_path / "cache",
+                n_bootstrap=50,
+            ),
+        ).initiate_model_evaluation()
+
+    first, second = evaluate(), evaluate()
+
+    assert first.deployed_model_path == second.deployed_model_path
+    assert first.deployed_model_path.is_relative_to(tmp_path / "cache")
+    assert len(count_downloads) == 1
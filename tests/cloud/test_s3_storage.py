@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlops_project.cloud_storage.aws_storage import SimpleStorageService
+from mlops_project.entity.config_entity import S3StorageConfig
+from mlops_project.utils.main_utils import save_numpy_array_data, write_dataframe
+
+# Small parts and buffers, so a test object spans several of them
+SMALL_TRANSFERS = S3StorageConfig(
+    multipart_threshold=5 * 2**20, multipart_chunksize=5 * 2**20, max_concurrency=4, read_buffer_size=64 * 2**10
+)
+
+
+def _frame(n_rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(n_rows),
+            "Annual_Premium": rng.normal(30_000, 5_000, n_rows),
+            "Vehicle_Age": rng.choice(["< 1 Year", "1-2 Year", "> 2 Years"], n_rows),
+        }
+    )
+
+
+# ---------------------- TEST: MULTIPART TRANSFERS ----------------------
+def test_multipart_upload_and_download_roundtrip(mock_s3, tmp_path):
+    """
+    Test that an object above the multipart threshold is uploaded in parts and downloaded intact.
+    """
+    payload = np.random.default_rng(0).bytes(12 * 2**20)
+    (tmp_path / "large.bin").write_bytes(payload)
+    storage = SimpleStorageService(SMALL_TRANSFERS)
+
+    storage.upload_file(tmp_path / "large.bin", mock_s3, "artifacts/large.bin")
+    storage.download_file(mock_s3, "artifacts/large.bin", tmp_path / "copy.bin")
+
+    # Multipart ETags end with the part count
+    assert storage.get_object_metadata(mock_s3, "artifacts/large.bin")["etag"].endswith("-3")
+    assert (tmp_path / "copy.bin").read_bytes() == payload
+
+
+def test_upload_directory(mock_s3, tmp_path):
+    """
+    Test that a directory is uploaded recursively under the prefix.
+    """
+    for name in ["train.parquet", "test.parquet", "nested/model.pkl"]:
+        (tmp_path / "artifact" / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / "artifact" / name).write_bytes(name.encode())
+    storage = SimpleStorageService(SMALL_TRANSFERS)
+
+    keys = storage.upload_directory(tmp_path / "artifact", mock_s3, "runs/1/", max_workers=2)
+
+    assert keys == ["runs/1/nested/model.pkl", "runs/1/test.parquet", "runs/1/train.parquet"]
+    assert sorted(storage.list_keys(mock_s3, "runs/1/")) == keys
+
+
+# ---------------------- TEST: STREAMING READS ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_read_dataframe_from_s3(mock_s3, tmp_path, file_format):
+    """
+    Test that DataFrames are read from S3, whole, by columns and in chunks, without a local copy.
+    """
+    frame = _frame(5_000)
+    file_path = tmp_path / f"train.{file_format}"
+    write_dataframe(frame, file_path)
+    storage = SimpleStorageService(SMALL_TRANSFERS)
+    storage.upload_file(file_path, mock_s3, f"artifacts/train.{file_format}")
+
+    whole = storage.read_dataframe(mock_s3, f"artifacts/train.{file_format}")
+    column = storage.read_dataframe(mock_s3, f"artifacts/train.{file_format}", columns=["Annual_Premium"])
+    chunks = list(storage.iter_dataframe_chunks(mock_s3, f"artifacts/train.{file_format}", chunk_size=2_000))
+
+    pd.testing.assert_frame_equal(whole, frame, check_dtype=False)
+    assert list(column.columns) == ["Annual_Premium"]
+    assert [len(chunk) for chunk in chunks] == [2_000, 2_000, 1_000]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), frame, check_dtype=False)
+
+
+def test_ranged_reads_fetch_only_what_is_read(mock_s3):
+    """
+    Test that the seekable reader issues ranged GETs for the bytes read.
+    """
+    payload = bytes(range(256)) * 1024
+    storage = SimpleStorageService(S3StorageConfig(read_buffer_size=1024))
+    storage.s3_client.put_object(Bucket=mock_s3, Key="blob", Body=payload)
+
+    with storage.open_object(mock_s3, "blob") as file:
+        file.seek(100_000)
+        assert file.read(10) == payload[100_000:100_010]
+        file.seek(-5, 2)
+        assert file.read() == payload[-5:]
+
+
+def test_read_numpy_array_streams_the_body(mock_s3, tmp_path):
+    array = np.random.default_rng(0).normal(size=(20_000, 8)).astype(np.float32)
+    save_numpy_array_data(tmp_path / "train.npy", array)
+    storage = SimpleStorageService(SMALL_TRANSFERS)
+    storage.upload_file(tmp_path / "train.npy", mock_s3, "artifacts/train.npy")
+
+    np.testing.assert_array_equal(storage.read_numpy_array(mock_s3, "artifacts/train.npy"), array)
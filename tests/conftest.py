@@ -0,0 +1,117 @@
+from itertools import islice
+
+import pytest
+
+from mlops_project.configuration.mongo_db_connection import MongoClient
+
+
+@pytest.fixture
+def mock_mongo(monkeypatch):
+    """
+    Replace the shared MongoDB client with an in-process mongomock client.
+
+    Steps:
+        - Set placeholder credentials so URI creation succeeds.
+        - Install a mongomock client as the MongoClient singleton.
+        - Restore the original singleton after the test.
+    """
+    mongomock = pytest.importorskip("mongomock")
+
+    monkeypatch.setenv("MONGO_USER", "testuser")
+    monkeypatch.setenv("MONGO_PASSWORD", "testpass")
+    monkeypatch.setenv("MONGO_HOST", "cluster0.mongodb.net")
+    monkeypatch.setenv("CLUSTER", "TestCluster")
+
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(MongoClient, "client", client)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mock_s3(monkeypatch):
+    """
+    Replace the shared S3 client with one talking to an in-process moto S3.
+
+    Steps:
+        - Set fake credentials and drop any endpoint override.
+        - Start moto's AWS mock and reset the S3Client singleton inside it.
+        - Create the registry bucket and yield its name.
+    """
+    moto = pytest.importorskip("moto")
+
+    from mlops_project.configuration.aws_connction import S3Client
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_ENDPOINT_URL", raising=False)
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+    with moto.mock_aws():
+        monkeypatch.setattr(S3Client, "s3_client", None)
+        S3Client().s3_client.create_bucket(Bucket="test-model-registry")
+        yield "test-model-registry"
+
+
+class _AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    async def to_list(self, length=None):
+        return list(islice(self._cursor, length or None))
+
+    async def close(self):
+        self._cursor.close()
+
+
+class _AsyncCollection:
+    def __init__(self, collection, finds):
+        self._collection = collection
+        self._finds = finds
+
+    def find(self, filter=None, projection=None, **kwargs):
+        self._finds.append(filter)
+        return _AsyncCursor(self._collection.find(filter, projection))
+
+    async def find_one(self, filter=None, projection=None):
+        self._finds.append(filter)
+        return self._collection.find_one(filter, projection)
+
+
+class _AsyncDatabase:
+    def __init__(self, database, finds, read_preference=None):
+        self._database = database
+        self._finds = finds
+        self.read_preference = read_preference
+
+    def get_collection(self, name):
+        return _AsyncCollection(self._database.get_collection(name), self._finds)
+
+
+class AsyncMongomockClient:
+    """The subset of ``pymongo.AsyncMongoClient`` used by AsyncProjData, over mongomock."""
+
+    def __init__(self, client):
+        self.sync_client = client
+        # Filter of every find / find_one sent
+        self.finds = []
+        self.closed = False
+
+    def get_database(self, name, read_preference=None):
+        return _AsyncDatabase(self.sync_client.get_database(name), self.finds, read_preference)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def mock_async_mongo(mock_mongo):
+    """
+    An async client over the ``mock_mongo`` mongomock client, so documents
+    inserted through either are seen by both.
+    """
+    return AsyncMongomockClient(mock_mongo)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from sklearn.metrics import f1_score, roc_auc_score
+
+from mlops_project.utils.evaluation_utils import (
+    bootstrap_count_blocks,
+    bootstrap_metrics,
+    weighted_f1,
+    weighted_roc_auc,
+)
+
+
+def _scored_rows(n_rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    labels = rng.random(n_rows) < 0.2
+    # Rounded scores have many ties, like the votes of a forest
+    scores = np.round(np.clip(0.35 * labels + rng.random(n_rows) * 0.7, 0, 1), 2)
+    return labels.astype(int), scores
+
+
+# ---------------------- TEST: BATCHED METRICS ----------------------
+@pytest.mark.parametrize("rounded", [True, False])
+def test_batched_metrics_match_sklearn_on_every_resample(rounded):
+    """
+    Test that the count-matrix metrics equal sklearn's on the explicitly resampled rows.
+
+    Steps:
+        - Draw 8 resamples as a count matrix.
+        - Materialize each resample with np.repeat and score it with sklearn.
+        - Expect the same F1 and ROC-AUC, with and without tied scores.
+    """
+    labels, scores = _scored_rows()
+    if not rounded:
+        scores = scores + np.random.default_rng(1).random(len(scores)) * 1e-6
+    counts = next(bootstrap_count_blocks(len(labels), 8, seed=3))
+
+    assert counts.shape == (8, len(labels))
+    assert (counts.sum(axis=1) == len(labels)).all()
+
+    resamples = [np.repeat(np.arange(len(labels)), row.astype(int)) for row in counts]
+    np.testing.assert_allclose(
+        weighted_f1(counts, labels, scores > 0.5), [f1_score(labels[rows], scores[rows] > 0.5) for rows in resamples]
+    )
+    np.testing.assert_allclose(
+        weighted_roc_auc(counts, labels, scores), [roc_auc_score(labels[rows], scores[rows]) for rows in resamples]
+    )
+
+
+def test_count_blocks_cover_n_boot_and_depend_on_seed_only(monkeypatch):
+    monkeypatch.setattr("mlops_project.utils.evaluation_utils._MAX_BLOCK_ELEMENTS", 1000)
+
+    blocks = list(bootstrap_count_blocks(300, 10, seed=0))
+    assert [len(block) for block in blocks] == [3, 3, 3, 1]
+    np.testing.assert_array_equal(np.vstack(blocks), np.vstack(list(bootstrap_count_blocks(300, 10, seed=0))))
+
+
+# ---------------------- TEST: BOOTSTRAP REPORT ----------------------
+def test_bootstrap_metrics_intervals_and_paired_differences():
+    """
+    Test point estimates, intervals and paired differences of the report.
+
+    Steps:
+        - Bootstrap a model against itself and against a noisier model.
+        - Expect sklearn point estimates inside their intervals.
+        - Expect a zero difference for the identical model and a positive one for the better model.
+    """
+    labels, scores = _scored_rows()
+    noisy = np.clip(scores + np.random.default_rng(2).normal(0, 0.3, len(scores)), 0, 1)
+
+    report = bootstrap_metrics(labels, {"reference": noisy, "same": noisy, "better": scores}, n_boot=200, seed=0)
+
+    reference = report["models"]["reference"]
+    assert reference["f1"] == round(f1_score(labels, noisy > 0.5), 6)
+    assert reference["roc_auc"] == round(roc_auc_score(labels, noisy), 6)
+    assert reference["f1_ci"][0] <= reference["f1"] <= reference["f1_ci"][1]
+
+    same = report["differences"]["same_minus_reference"]
+    assert (same["f1"], same["f1_ci"], same["roc_auc_ci"]) == (0.0, [0.0, 0.0], [0.0, 0.0])
+    assert same["f1_p_not_better"] == 1.0
+
+    better = report["differences"]["better_minus_reference"]
+    assert better["roc_auc_ci"][0] > 0
+    assert better["roc_auc_p_not_better"] == 0.0
+    first = bootstrap_metrics(labels, {"a": scores}, n_boot=50, seed=5)
+    assert first == bootstrap_metrics(labels, {"a": scores}, n_boot=50, seed=5)
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+
+from mlops_project.components.model_evaluation import ModelEvaluation
+from mlops_project.entity.artifact_entity import (
+    ClassificationMetricArtifact,
+    DataIngestionArtifact,
+    ModelTrainerArtifact,
+)
+from mlops_project.entity.config_entity import ModelEvaluationConfig
+from mlops_project.entity.estimator import MyModel
+from mlops_project.utils.main_utils import read_yaml_file, save_object
+
+
+def _frame(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({"x0": rng.normal(size=n_rows), "x1": rng.normal(size=n_rows)})
+    frame["Response"] = (frame["x0"] + 0.3 * rng.normal(size=n_rows) > 0.8).astype(int)
+    return frame
+
+
+def _save_model(file_path, columns):
+    """A logistic regression on ``columns`` of a fresh training frame, saved as MyModel."""
+    train = _frame(2000, seed=0)
+    preprocessor = ColumnTransformer([("passthrough", "passthrough", columns)]).fit(train)
+    model = LogisticRegression().fit(preprocessor.transform(train), train["Response"])
+    save_object(file_path, MyModel(preprocessor, model))
+    return file_path
+
+
+def _evaluation(tmp_path, trained_columns=("x0", "x1"), deployed_columns=None) -> ModelEvaluation:
+    test_file_path = tmp_path / "test.csv"
+    _frame(3000, seed=1).to_csv(test_file_path, index=False)
+
+    trained_model_path = _save_model(tmp_path / "trained" / "model.pkl", list(trained_columns))
+    deployed_model_path = tmp_path / "deployed" / "model.pkl"
+    if deployed_columns is not None:
+        _save_model(deployed_model_path, list(deployed_columns))
+
+    return ModelEvaluation(
+        DataIngestionArtifact(trained_file_path=tmp_path / "train.csv", test_file_path=test_file_path),
+        ModelTrainerArtifact(
+            trained_model_file_path=trained_model_path,
+            metric_artifact=ClassificationMetricArtifact(f1_score=0.8, precision_score=0.8, recall_score=0.8),
+        ),
+        ModelEvaluationConfig(
+            model_evaluation_dir=tmp_path / "model_evaluation",
+            deployed_model_file_path=deployed_model_path,
+            prediction_cache_dir=tmp_path / "prediction_cache",
+            n_bootstrap=200,
+            chunk_size=1000,
+        ),
+    )
+
+
+# ---------------------- TEST: DECISION ----------------------
+def test_first_model_is_accepted_without_deployed_model(tmp_path):
+    artifact = _evaluation(tmp_path).initiate_model_evaluation()
+
+    assert artifact.is_model_accepted
+    assert artifact.deployed_model_path is None
+    report = read_yaml_file(artifact.evaluation_report_file_path)
+    assert report["reason"] == "No model is deployed yet"
+    assert list(report["models"]) == ["trained"]
+
+
+@pytest.mark.parametrize(
+    "trained_columns, deployed_columns, accepted",
+    [(("x0", "x1"), ("x1",), True), (("x1",), ("x0", "x1"), False), (("x0", "x1"), ("x0", "x1"), False)],
+)
+def test_trained_model_needs_a_significant_gain(tmp_path, trained_columns, deployed_columns, accepted):
+    """
+    Test the accept/reject decision against a deployed model.
+
+    Steps:
+        - Evaluate a better, a worse and an identical trained model.
+        - Expect only the better one accepted, and the decision statistics in the artifact and report.
+    """
+    artifact = _evaluation(tmp_path, trained_columns, deployed_columns).initiate_model_evaluation()
+
+    assert artifact.is_model_accepted is accepted
+    assert (artifact.f1_difference_ci[0] > 0) is accepted
+    report = read_yaml_file(artifact.evaluation_report_file_path)
+    difference = report["differences"]["trained_minus_deployed"]
+    assert difference["f1"] == artifact.changed_accuracy
+    assert difference["f1_p_not_better"] == artifact.p_not_better
+
+
+# ---------------------- TEST: PREDICTION CACHE ----------------------
+def test_each_model_scores_the_test_file_once(tmp_path, monkeypatch):
+    """
+    Test that a second evaluation reuses the cached probabilities of both models.
+
+    Steps:
+        - Evaluate a trained model against a deployed one.
+        - Evaluate again with model loading disabled.
+        - Expect the same artifact and one cache file per model.
+    """
+    evaluation = _evaluation(tmp_path, deployed_columns=("x1",))
+    first = evaluation.initiate_model_evaluation()
+    assert len(list((tmp_path / "prediction_cache").glob("*.npy"))) == 2
+
+    def _no_scoring(cls, file_path):
+        raise AssertionError(f"{file_path} scored again")
+
+    monkeypatch.setattr(MyModel, "load", classmethod(_no_scoring))
+    assert evaluation.initiate_model_evaluation() == first
+
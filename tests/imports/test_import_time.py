@@ -0,0 +1,50 @@
+import pytest
+
+from benchmarks.bench_import_time import IMPORT_TIME_BUDGET_MS, LIGHT_MODULES, measure_import
+from mlops_project.entity.config_entity import (
+    DataIngestionConfig,
+    TrainPipeLineConfig,
+    default_training_pipeline_config,
+)
+
+
+# ---------------------- TEST: IMPORT BUDGET ----------------------
+@pytest.mark.parametrize("module", LIGHT_MODULES)
+def test_light_module_import_is_cheap_and_side_effect_free(module):
+    """
+    Test the import cost of a module in a fresh interpreter.
+
+    Steps:
+        - Import the module under ``python -X importtime`` (best of 3 runs).
+        - Expect no heavy dependency (pandas, sklearn, pymongo ...) to be loaded.
+        - Expect no logging handlers to be configured.
+        - Expect the cumulative import time to fit the budget.
+    """
+    result = measure_import(module, repeat=3)
+
+    assert result["heavy"] == []
+    assert result["configured_logging"] is False
+    assert result["ms"] < IMPORT_TIME_BUDGET_MS, result["slowest"]
+
+
+def test_data_ingestion_does_not_import_sklearn():
+    result = measure_import("mlops_project.components.data_ingestion", repeat=1)
+    assert "sklearn" not in result["heavy"]
+    assert "pymongo" not in result["heavy"]
+
+
+# ---------------------- TEST: RUN CONFIG ----------------------
+def test_run_config_is_created_on_use(tmp_path):
+    """
+    Test that the timestamped run dir comes from the run config, not import time.
+
+    Steps:
+        - Build an ingestion config from an explicit run config.
+        - Expect its paths under that run's artifact dir.
+        - Expect default configs to share the process-wide run config.
+    """
+    run_config = TrainPipeLineConfig(artifact_dir=tmp_path / "run")
+    config = DataIngestionConfig(training_pipeline_config=run_config)
+
+    assert config.training_file_path.parent.parent.parent == tmp_path / "run"
+    assert DataIngestionConfig().data_ingestion_dir.parent == default_training_pipeline_config().artifact_dir
@@ -0,0 +1,130 @@
+import pandas as pd
+import pytest
+
+from mlops_project.components.data_ingestion import DataIngetion
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.data_access.mlops_proj_data import ProjData
+from mlops_project.entity.config_entity import DataIngestionConfig
+
+COLLECTION = "ingestion"
+
+
+@pytest.fixture
+def ingestion_config(tmp_path):
+    """Incremental ingestion config writing every artifact under tmp_path."""
+    return DataIngestionConfig(
+        data_ingestion_dir=tmp_path / "run",
+        feature_store_file_path=tmp_path / "run" / "feature_store" / "data.csv",
+        training_file_path=tmp_path / "run" / "ingested" / "train.csv",
+        testing_file_path=tmp_path / "run" / "ingested" / "test.csv",
+        collection_name=COLLECTION,
+        incremental=True,
+        feature_store_cache_file_path=tmp_path / "cache" / "data.csv",
+        watermark_file_path=tmp_path / "cache" / "watermark.json",
+    )
+
+
+def _insert(client, ids, age=30):
+    client[DATABASE_NAME][COLLECTION].insert_many([{"id": i, "Age": age} for i in ids])
+
+
+# ---------------------- TEST: INCREMENTAL FETCH ----------------------
+def test_incremental_run_fetches_only_new_documents(mock_mongo, ingestion_config, monkeypatch):
+    """
+    Test that a second run only fetches documents inserted after the watermark.
+
+    Steps:
+        - Run ingestion once over 20 documents (full load, writes cache and watermark).
+        - Insert 5 more documents and run again.
+        - Expect the second Mongo query to return 5 rows and the feature store to hold 25.
+    """
+    _insert(mock_mongo, range(20))
+    DataIngetion(ingestion_config).export_data_into_feature_store()
+    assert ingestion_config.watermark_file_path.exists()
+
+    _insert(mock_mongo, range(20, 25))
+
+    fetched = []
+    export = ProjData.export_collection_as_dataframe
+
+    def spy(self, *args, **kwargs):
+        df = export(self, *args, **kwargs)
+        fetched.append(len(df))
+        return df
+
+    monkeypatch.setattr(ProjData, "export_collection_as_dataframe", spy)
+
+    df = DataIngetion(ingestion_config).export_data_into_feature_store()
+
+    assert fetched == [5]
+    assert len(df) == 25
+    assert sorted(pd.read_csv(ingestion_config.feature_store_file_path)["id"]) == list(range(25))
+    assert len(pd.read_csv(ingestion_config.feature_store_cache_file_path)) == 25
+
+
+# ---------------------- TEST: NOTHING NEW ----------------------
+def test_incremental_run_without_new_documents_reuses_cache(mock_mongo, ingestion_config):
+    _insert(mock_mongo, range(10))
+    DataIngetion(ingestion_config).export_data_into_feature_store()
+
+    df = DataIngetion(ingestion_config).export_data_into_feature_store()
+
+    assert len(df) == 10
+
+
+# ---------------------- TEST: MERGE BY KEY ----------------------
+def test_newer_documents_replace_cached_rows_with_same_key(mock_mongo, ingestion_config):
+    """
+    Test that a re-inserted document with an existing id replaces the cached row.
+    """
+    _insert(mock_mongo, range(5), age=30)
+    DataIngetion(ingestion_config).export_data_into_feature_store()
+
+    _insert(mock_mongo, [2], age=55)
+    df = DataIngetion(ingestion_config).export_data_into_feature_store()
+
+    assert len(df) == 5
+    assert df.loc[df["id"] == 2, "Age"].tolist() == [55]
+
+
+# ---------------------- TEST: FULL REFRESH ----------------------
+def test_full_refresh_ignores_cache(mock_mongo, ingestion_config):
+    """
+    Test that full_refresh rebuilds the cache from the collection.
+
+    Steps:
+        - Ingest 10 documents, then delete 4 of them from the collection.
+        - Run with full_refresh=True.
+        - Expect only the 6 remaining documents.
+    """
+    _insert(mock_mongo, range(10))
+    DataIngetion(ingestion_config).export_data_into_feature_store()
+
+    mock_mongo[DATABASE_NAME][COLLECTION].delete_many({"id": {"$lt": 4}})
+    df = DataIngetion(ingestion_config).export_data_into_feature_store(full_refresh=True)
+
+    assert sorted(df["id"]) == list(range(4, 10))
+
+
+# ---------------------- TEST: COLUMNAR CACHE ----------------------
+def test_incremental_cache_in_parquet(mock_mongo, tmp_path):
+    """
+    Test that the feature store cache follows the configured artifact format.
+    """
+    config = DataIngestionConfig(
+        feature_store_file_path=tmp_path / "run" / "data.csv",
+        collection_name=COLLECTION,
+        incremental=True,
+        feature_store_cache_file_path=tmp_path / "cache" / "data.csv",
+        watermark_file_path=tmp_path / "cache" / "watermark.json",
+        file_format="parquet",
+    )
+    _insert(mock_mongo, range(8))
+    DataIngetion(config).export_data_into_feature_store()
+    _insert(mock_mongo, range(8, 10))
+
+    df = DataIngetion(config).export_data_into_feature_store()
+
+    assert len(df) == 10
+    assert (tmp_path / "cache" / "data.parquet").exists()
+    assert (tmp_path / "run" / "data.parquet").exists()
@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from mlops_project.components.data_ingestion import DataIngetion
+from mlops_project.entity.config_entity import DataIngestionConfig
+from mlops_project.utils.main_utils import read_dataframe
+
+
+# ---------------------- TEST: CONFIGURABLE FORMAT ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_split_writes_configured_format(tmp_path, file_format):
+    """
+    Test that train/test artifacts use the configured format and extension.
+
+    Steps:
+        - Build a config with .csv paths and the given file_format.
+        - Split a 100-row frame.
+        - Expect files with the format's extension whose rows add up to 100.
+    """
+    config = DataIngestionConfig(
+        training_file_path=tmp_path / "ingested" / "train.csv",
+        testing_file_path=tmp_path / "ingested" / "test.csv",
+        file_format=file_format,
+    )
+    dataframe = pd.DataFrame({"id": range(100), "Response": [0, 1] * 50})
+
+    DataIngetion(config).split_data_as_train_test_split(dataframe)
+
+    assert config.training_file_path.suffix == f".{file_format}"
+    train = read_dataframe(config.training_file_path)
+    test = read_dataframe(config.testing_file_path)
+    assert len(train) + len(test) == 100
+    assert set(train["id"]).isdisjoint(test["id"])
+
+
+def test_unsupported_format_is_rejected():
+    with pytest.raises(ValueError):
+        DataIngestionConfig(file_format="xlsx")
+
+
+# ---------------------- TEST: STRATIFIED SPLIT ----------------------
+def test_split_is_stratified_and_returns_class_counts(tmp_path):
+    """
+    Test the default stratified in-memory split.
+
+    Steps:
+        - Split a 1000-row frame with 8% positives.
+        - Expect the returned class counts to match the written files.
+        - Expect the positive share of test to equal the one of the frame.
+    """
+    config = DataIngestionConfig(
+        training_file_path=tmp_path / "train.csv",
+        testing_file_path=tmp_path / "test.csv",
+    )
+    dataframe = pd.DataFrame({"id": range(1000), "Response": [1] * 80 + [0] * 920})
+
+    train_counts, test_counts = DataIngetion(config).split_data_as_train_test_split(dataframe)
+
+    test = read_dataframe(config.testing_file_path)
+    assert test_counts == {"0": 230, "1": 20}
+    assert train_counts == {"0": 690, "1": 60}
+    assert test["Response"].value_counts().to_dict() == {0: 230, 1: 20}
+
+
+def test_unsupported_split_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        DataIngestionConfig(split_strategy="kfold")
@@ -0,0 +1,67 @@
+import pytest
+
+from mlops_project.components.data_ingestion import DataIngetion
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.entity.config_entity import DataIngestionConfig
+from mlops_project.utils.main_utils import read_dataframe
+
+COLLECTION = "streaming"
+
+
+def _config(tmp_path, **overrides):
+    return DataIngestionConfig(
+        training_file_path=tmp_path / "ingested" / "train.csv",
+        testing_file_path=tmp_path / "ingested" / "test.csv",
+        collection_name=COLLECTION,
+        split_mode="streaming",
+        **overrides,
+    )
+
+
+@pytest.fixture
+def collection(mock_mongo):
+    collection = mock_mongo[DATABASE_NAME][COLLECTION]
+    collection.insert_many(
+        [{"id": i, "Gender": "Male" if i % 2 else "Female", "Response": int(i % 8 == 0)} for i in range(400)]
+    )
+    return collection
+
+
+# ---------------------- TEST: STREAMING HASH SPLIT ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_streaming_hash_split_is_reproducible(collection, tmp_path, file_format):
+    """
+    Test that the streaming split writes disjoint, complete and reproducible outputs.
+
+    Steps:
+        - Run the streaming hash split twice with a batch size of 64 rows.
+        - Expect train+test to cover all 400 ids exactly once, and identical runs.
+    """
+    results = []
+    for run in ("a", "b"):
+        config = _config(tmp_path / run, file_format=file_format, export_batch_size=64)
+        artifact = DataIngetion(config).initiate_data_ingestion()
+        train = read_dataframe(artifact.trained_file_path)
+        test = read_dataframe(artifact.test_file_path)
+        results.append((sorted(train["id"]), sorted(test["id"])))
+
+    (train_ids, test_ids), second = results
+    assert (train_ids, test_ids) == second
+    assert sorted(train_ids + test_ids) == list(range(400))
+    assert 60 < len(test_ids) < 140
+    assert artifact.feature_store_file_path is None
+    assert sum(artifact.test_class_counts.values()) == len(test_ids)
+
+
+# ---------------------- TEST: STREAMING STRATIFIED SPLIT ----------------------
+def test_streaming_stratified_split_preserves_target_ratio(collection, tmp_path):
+    config = _config(tmp_path, streaming_split_strategy="stratified")
+
+    artifact = DataIngetion(config).initiate_data_ingestion()
+
+    test = read_dataframe(artifact.test_file_path)
+    # 25% of 350 negatives and 50 positives, each rounded to the nearest row
+    assert len(test) == 88 + 13
+    assert test["Response"].sum() == 13
+    assert artifact.test_class_counts == {"0": 88, "1": 13}
+    assert artifact.train_class_counts == {"0": 262, "1": 37}
@@ -0,0 +1,142 @@
+# tests/logger/test_queue_logging.py
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from logging.handlers import QueueHandler
+from pathlib import Path
+
+import pytest
+
+import mlops_project.logger as log_module
+from mlops_project.logger import JsonFormatter, configure_logging, get_logger, shutdown_logging
+
+
+@pytest.fixture
+def isolated_logging(monkeypatch, tmp_path):
+    """
+    Reconfigure the root logger into tmp_path and restore the previous setup afterwards.
+    """
+    root = logging.getLogger()
+    saved_handlers, saved_ours, saved_level = list(root.handlers), list(log_module._handlers), root.level
+    monkeypatch.setenv("LOG_DIR", str(tmp_path))
+
+    yield tmp_path
+
+    shutdown_logging()
+    for handler in saved_handlers:
+        if handler not in root.handlers:
+            root.addHandler(handler)
+    log_module._handlers[:] = saved_ours
+    log_module._configured = True
+    root.setLevel(saved_level)
+
+
+def _read_lines(log_dir):
+    (log_file,) = log_dir.glob("*.log")
+    return log_file.read_text(encoding="utf-8").splitlines()
+
+
+# ---------------------- TEST: QUEUE MODE ----------------------
+def test_queue_mode_writes_on_listener_thread(isolated_logging, monkeypatch, capsys):
+    """
+    Test that LOG_QUEUE=1 installs a QueueHandler and honours per-handler levels.
+
+    Steps:
+        - Configure queue mode with a JSON file handler and a WARNING console handler.
+        - Log from a worker thread, with and without `extra` fields.
+        - Stop the listener and expect every record in the file, only the warning on the console.
+    """
+    monkeypatch.setenv("LOG_QUEUE", "1")
+    monkeypatch.setenv("LOG_FILE_FORMAT", "json")
+    monkeypatch.setenv("LOG_CONSOLE_LEVEL", "WARNING")
+    configure_logging(force=True)
+
+    root = logging.getLogger()
+    assert [type(handler).__bases__ for handler in log_module._handlers] == [(QueueHandler,)]
+    assert log_module._listener is not None
+
+    log = get_logger("queue_test")
+
+    def work():
+        for i in range(100):
+            log.debug("batch %d", i, extra={"rows": i})
+        log.warning("slow batch")
+
+    worker = threading.Thread(target=work, name="worker")
+    worker.start()
+    worker.join()
+    shutdown_logging()
+
+    records = [json.loads(line) for line in _read_lines(isolated_logging)]
+    assert len(records) == 101
+    assert records[5]["message"] == "batch 5" and records[5]["rows"] == 5
+    assert records[5]["thread"] == "worker"
+    assert all(handler not in root.handlers for handler in log_module._handlers)
+
+    console = capsys.readouterr().err
+    assert "slow batch" in console and "batch 5" not in console
+
+
+def test_queue_is_drained_at_exit(tmp_path):
+    """
+    Test that records still queued when the interpreter exits are written.
+    """
+    script = (
+        "from mlops_project.logger import get_logger\n"
+        "log = get_logger('exit_test')\n"
+        "for i in range(2000): log.info('record %d', i)\n"
+    )
+    src_dir = Path(__file__).resolve().parents[2] / "src"
+    env = {
+        **os.environ,
+        "LOG_QUEUE": "1",
+        "LOG_DIR": str(tmp_path),
+        "LOG_CONSOLE_LEVEL": "ERROR",
+        "PYTHONPATH": str(src_dir),
+    }
+    subprocess.run([sys.executable, "-c", script], env=env, check=True)
+
+    lines = _read_lines(tmp_path)
+    assert len(lines) == 2000
+    assert lines[-1].endswith("record 1999")
+
+
+# ---------------------- TEST: LEVELS AND FORMATS ----------------------
+def test_file_level_without_queue(isolated_logging, monkeypatch):
+    monkeypatch.setenv("LOG_FILE_LEVEL", "INFO")
+    configure_logging(force=True)
+
+    log = get_logger("level_test")
+    log.debug("hidden")
+    log.info("shown")
+    shutdown_logging()
+
+    lines = _read_lines(isolated_logging)
+    assert len(lines) == 1 and "| INFO | level_test |" in lines[0]
+
+
+def test_json_formatter_keeps_extra_fields_and_traceback():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("json_test").makeRecord(
+            "json_test", logging.ERROR, __file__, 1, "failed %s", ("step",), sys.exc_info(),
+            extra={"seconds": 1.5},
+        )
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "failed step"
+    assert payload["level"] == "ERROR"
+    assert payload["seconds"] == 1.5
+    assert "ValueError: boom" in payload["exc_info"]
+
+
+def test_unknown_format_is_rejected(isolated_logging, monkeypatch):
+    monkeypatch.setenv("LOG_FILE_FORMAT", "xml")
+    with pytest.raises(ValueError):
+        configure_logging(force=True)
@@ -0,0 +1,119 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from mlops_project.entity.config_entity import DataIngestionConfig, StageCacheConfig
+from mlops_project.pipeline.stage_cache import StageCache, config_fingerprint
+
+
+@dataclass
+class DummyArtifact:
+    output_file_path: str
+    rows: int
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return StageCache(
+        StageCacheConfig(
+            artifact_root_dir=tmp_path / "arftifact",
+            cache_dir=tmp_path / "arftifact" / "stage_cache",
+            report_file_path=tmp_path / "arftifact" / "report.json",
+        )
+    )
+
+
+def _make_run_dir(root, name, size=1000, age_days=0.0):
+    run_dir = root / name
+    run_dir.mkdir(parents=True)
+    output = run_dir / "out.csv"
+    output.write_bytes(b"x" * size)
+    mtime = time.time() - age_days * 86400
+    os.utime(run_dir, (mtime, mtime))
+    return run_dir, output
+
+
+# ---------------------- TEST: HIT AND MISS ----------------------
+def test_second_run_with_same_inputs_is_a_hit(cache, tmp_path):
+    """
+    Test that identical inputs reuse the recorded artifact without recomputing.
+
+    Steps:
+        - Run a stage whose compute writes an output file.
+        - Run it again with the same inputs, then with different inputs.
+        - Expect compute to run twice and the report to show 1 hit and 2 misses.
+    """
+    _, output = _make_run_dir(tmp_path / "arftifact", "01_01_2025_00_00_00")
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return DummyArtifact(output_file_path=str(output), rows=3)
+
+    first = cache.run("stage", {"data": 1}, compute, DummyArtifact)
+    second = cache.run("stage", {"data": 1}, compute, DummyArtifact)
+    cache.run("stage", {"data": 2}, compute, DummyArtifact)
+
+    assert first == second
+    assert len(calls) == 2
+    report = cache.write_report()
+    assert (report["hit_count"], report["miss_count"]) == (1, 2)
+    assert json.loads((tmp_path / "arftifact" / "report.json").read_text())["hit_count"] == 1
+
+
+# ---------------------- TEST: MISSING FILES ----------------------
+def test_entry_with_deleted_files_is_a_miss(cache, tmp_path):
+    _, output = _make_run_dir(tmp_path / "arftifact", "01_01_2025_00_00_00")
+
+    def compute():
+        return DummyArtifact(output_file_path=str(output), rows=3)
+
+    cache.run("stage", {"data": 1}, compute, DummyArtifact)
+    output.unlink()
+
+    assert cache.get("stage", cache.key("stage", {"data": 1}), DummyArtifact) is None
+
+
+# ---------------------- TEST: CONFIG FINGERPRINT ----------------------
+def test_config_fingerprint_ignores_paths():
+    """
+    Test that output paths (which change with every timestamp) do not change the key.
+    """
+    a = config_fingerprint(DataIngestionConfig(training_file_path="a/train.csv"))
+    b = config_fingerprint(DataIngestionConfig(training_file_path="b/train.csv"))
+    c = config_fingerprint(DataIngestionConfig(train_test_split_ratio=0.5))
+
+    assert a == b
+    assert a != c
+    assert "training_file_path" not in a
+
+
+# ---------------------- TEST: EVICTION ----------------------
+def test_evict_by_age_and_size_keeps_protected_dirs(cache, tmp_path):
+    """
+    Test eviction of timestamped run dirs.
+
+    Steps:
+        - Create an old dir, two recent dirs and a non-timestamp dir.
+        - Limit total size to 2500 bytes and age to 7 days.
+        - Expect the old dir evicted by age and both unprotected recent dirs by size,
+          while the protected dir and the feature store dir survive.
+    """
+    root = tmp_path / "arftifact"
+    old, _ = _make_run_dir(root, "01_01_2025_00_00_00", age_days=30)
+    older, _ = _make_run_dir(root, "01_02_2025_00_00_00", size=2000, age_days=2)
+    newer, _ = _make_run_dir(root, "01_03_2025_00_00_00", size=2000, age_days=1)
+    current, _ = _make_run_dir(root, "01_04_2025_00_00_00", size=2000)
+    (root / "feature_store").mkdir()
+
+    cache.config.max_age_days = 7
+    cache.config.max_total_bytes = 2500
+
+    evicted = cache.evict(protect=[current])
+
+    assert sorted(evicted) == sorted([str(old), str(older), str(newer)])
+    assert current.exists()
+    assert (root / "feature_store").exists()
@@ -0,0 +1,94 @@
+import json
+import shutil
+from pathlib import Path
+
+import yaml
+
+from benchmarks.synthetic import generate_documents
+from mlops_project.constants import DATABASE_NAME, MODEL_TRAINER_MODEL_CONFIG_FILE_PATH, SCHEMA_FILE_PATH
+from mlops_project.pipeline.training_pipeline import TrainPipeline
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+# A two-candidate search keeps the training stage fast
+SMALL_MODEL_CONFIG = {
+    "estimator": {"class": "sklearn.tree.DecisionTreeClassifier", "params": {"random_state": 0}},
+    "search": {"strategy": "grid", "scoring": "f1", "cv": 2},
+    "param_grid": {"max_depth": [2, 4]},
+}
+
+
+def _enter_project_dir(tmp_path, monkeypatch):
+    """Run from tmp_path, with the schema and a small model.yaml at their usual relative paths."""
+    (tmp_path / SCHEMA_FILE_PATH).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy(PROJECT_ROOT / SCHEMA_FILE_PATH, tmp_path / SCHEMA_FILE_PATH)
+    (tmp_path / MODEL_TRAINER_MODEL_CONFIG_FILE_PATH).write_text(yaml.safe_dump(SMALL_MODEL_CONFIG))
+    monkeypatch.chdir(tmp_path)
+
+
+def _pipeline() -> TrainPipeline:
+    pipeline = TrainPipeline()
+    # Synthetic labels are random: nothing to learn
+    pipeline.model_trainer_config.expected_score = 0.0
+    return pipeline
+
+
+# ---------------------- TEST: PIPELINE REUSES INGESTION ----------------------
+def test_unchanged_collection_skips_ingestion(mock_mongo, tmp_path, monkeypatch):
+    """
+    Test that a second pipeline run over an unchanged collection reuses the ingestion artifact.
+
+    Steps:
+        - Run the pipeline from a temporary working directory.
+        - Run it again, then insert a document and run a third time.
+        - Expect a hit on the second run and a miss on the third.
+    """
+    _enter_project_dir(tmp_path, monkeypatch)
+    collection = mock_mongo[DATABASE_NAME]["Proj1-Data"]
+    collection.insert_many(next(generate_documents(40)))
+
+    first = _pipeline()
+    first_artifact = first.start_data_ingestion()
+    second = _pipeline()
+    second_artifact = second.start_data_ingestion()
+
+    collection.insert_one(next(generate_documents(1, seed=1))[0] | {"id": 41})
+    third = _pipeline()
+    third.run_pipeline()
+
+    assert str(second_artifact.trained_file_path) == str(first_artifact.trained_file_path)
+    assert len(second.stage_cache.report["hits"]) == 1
+    assert [miss["stage"] for miss in third.stage_cache.report["misses"]] == [
+        "data_ingestion",
+        "data_validation",
+        "data_transformation",
+        "model_trainer",
+        "model_evaluation",
+    ]
+    report = json.loads(open(third.stage_cache.config.report_file_path).read())
+    assert report["miss_count"] == 5
+
+
+# ---------------------- TEST: RUN REPORT ----------------------
+def test_run_pipeline_writes_run_report(mock_mongo, tmp_path, monkeypatch):
+    """
+    Test that a pipeline run writes stage timings and row counts next to its artifacts.
+    """
+    _enter_project_dir(tmp_path, monkeypatch)
+    mock_mongo[DATABASE_NAME]["Proj1-Data"].insert_many(next(generate_documents(40)))
+
+    pipeline = _pipeline()
+    pipeline.run_pipeline()
+
+    report = json.loads(open(pipeline.training_pipeline_config.run_report_file_path).read())
+    stages = {record["path"]: record for record in report["stages"]}
+    assert stages["data_ingestion/export"]["rows"] == 40
+    assert stages["data_ingestion/export"]["counters"]["batches"] == 1
+    assert stages["data_ingestion/split/write_train_test"]["rows"] == 40
+    assert stages["data_validation/profile_train"]["rows"] + stages["data_validation/profile_test"]["rows"] == 40
+    assert stages["data_transformation/transform_test"]["rows"] == stages["data_validation/profile_test"]["rows"]
+    assert all(record["status"] == "ok" for record in report["stages"])
+    assert stages["model_trainer/search"]["status"] == "ok"
+    assert stages["model_evaluation/bootstrap"]["rows"] == stages["data_validation/profile_test"]["rows"]
+    assert report["stage_cache"]["miss_count"] == 5
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+
+import pytest
+
+from mlops_project.exception import MyException
+from mlops_project.pipeline.batch_coalescer import BatchCoalescer, Histogram
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _submit_all(coalescer, records):
+    await coalescer.start()
+    try:
+        return await asyncio.gather(*(coalescer.submit(record) for record in records))
+    finally:
+        await coalescer.stop()
+
+
+# ---------------------- TEST: COALESCING ----------------------
+def test_concurrent_submits_are_scored_in_batches():
+    """
+    Test that concurrent single-record requests are scored together, off the event loop.
+
+    Steps:
+        - Submit 100 records at once with max_batch_size=32.
+        - Expect every result in order, 4 calls of at most 32 records on a worker thread.
+        - Expect the batch-size histogram to record the batches.
+    """
+    calls = []
+
+    def predict(records):
+        calls.append((len(records), threading.current_thread().name))
+        return [record * 2 for record in records]
+
+    coalescer = BatchCoalescer(predict, max_batch_size=32, max_wait_ms=50)
+    results = _run(_submit_all(coalescer, list(range(100))))
+
+    assert results == [record * 2 for record in range(100)]
+    assert [size for size, _ in calls] == [32, 32, 32, 4]
+    assert all(name.startswith("predict") for _, name in calls)
+
+    metrics = coalescer.metrics()
+    assert (metrics["requests"], metrics["batches"]) == (100, 4)
+    assert metrics["batch_size"]["buckets"]["32"] == 3
+    assert metrics["batch_size"]["buckets"]["4"] == 1
+    assert metrics["queue_depth_at_batch_start"]["count"] == 4
+
+
+def test_lone_request_waits_at_most_max_wait():
+    async def scenario(coalescer):
+        await coalescer.start()
+        try:
+            first = await coalescer.submit(1)
+            # Arrives after the first batch was scored: a batch of its own
+            second = await coalescer.submit(2)
+            return first, second
+        finally:
+            await coalescer.stop()
+
+    sizes = []
+    coalescer = BatchCoalescer(lambda records: sizes.append(len(records)) or records, max_batch_size=8, max_wait_ms=1)
+
+    assert _run(scenario(coalescer)) == (1, 2)
+    assert sizes == [1, 1]
+    assert coalescer.metrics()["wait_ms"]["count"] == 2
+
+
+def test_failed_batch_fails_its_requests_only():
+    def predict(records):
+        if "bad" in records:
+            raise ValueError("cannot score")
+        return records
+
+    async def scenario():
+        coalescer = BatchCoalescer(predict, max_batch_size=2, max_wait_ms=20)
+        await coalescer.start()
+        try:
+            results = await asyncio.gather(*(coalescer.submit(r) for r in ["a", "bad", "c"]), return_exceptions=True)
+            return results, coalescer.metrics()["failed_batches"]
+        finally:
+            await coalescer.stop()
+
+    results, failed_batches = _run(scenario())
+
+    assert all(isinstance(result, MyException) for result in results[:2])
+    assert results[2] == "c"
+    assert failed_batches == 1
+
+
+def test_stop_cancels_the_batch_in_flight():
+    """
+    Test that stopping while a batch is scored resolves its requests instead of leaving them pending.
+    """
+    scoring, release = threading.Event(), threading.Event()
+
+    def predict(records):
+        scoring.set()
+        release.wait(5)
+        return records
+
+    async def scenario():
+        coalescer = BatchCoalescer(predict, max_batch_size=4, max_wait_ms=1)
+        await coalescer.start()
+        pending = [asyncio.ensure_future(coalescer.submit(record)) for record in range(3)]
+        await asyncio.to_thread(scoring.wait, 5)
+        await coalescer.stop()
+        return await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), 1)
+
+    try:
+        results = _run(scenario())
+    finally:
+        release.set()
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+def test_submit_requires_start_and_valid_settings():
+    with pytest.raises(RuntimeError):
+        _run(BatchCoalescer(list).submit(1))
+    with pytest.raises(ValueError):
+        BatchCoalescer(list, max_batch_size=0)
+
+
+def test_histogram_buckets():
+    histogram = Histogram([1, 2, 4])
+    for value in (0.5, 2, 3, 9):
+        histogram.observe(value)
+
+    assert histogram.to_dict() == {"buckets": {"1": 1, "2": 1, "4": 1, "+Inf": 1}, "count": 4, "mean": 3.625}
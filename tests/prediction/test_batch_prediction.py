@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import OneHotEncoder
+
+from benchmarks.synthetic import generate_documents
+from mlops_project.constants import DATABASE_NAME
+from mlops_project.entity.config_entity import BatchPredictionConfig
+from mlops_project.entity.estimator import MyModel
+from mlops_project.exception import MyException
+from mlops_project.pipeline.batch_prediction import BatchPrediction
+from mlops_project.pipeline.prediction_pipeline import clear_model_cache, load_model
+from mlops_project.utils.main_utils import save_object
+
+N_ROWS = 1000
+
+
+def _save_model(model_file_path, seed=0):
+    documents = pd.DataFrame(next(generate_documents(2000, seed=seed)))
+    columns = ["Age", "Vehicle_Damage"]
+    preprocessor = ColumnTransformer(
+        [("age", "passthrough", ["Age"]), ("damage", OneHotEncoder(drop="if_binary"), ["Vehicle_Damage"])]
+    ).fit(documents[columns])
+    labels = ((documents["Vehicle_Damage"] == "Yes") & (documents["Age"] > 40 + 10 * seed)).astype(int)
+    model = LogisticRegression(max_iter=1000).fit(preprocessor.transform(documents[columns]), labels)
+    save_object(model_file_path, MyModel(preprocessor, model))
+
+
+@pytest.fixture
+def collection(mock_mongo, tmp_path):
+    clear_model_cache()
+    _save_model(tmp_path / "model.pkl")
+    collection = mock_mongo[DATABASE_NAME]["Customers"]
+    collection.insert_many(next(generate_documents(N_ROWS, seed=3)))
+    yield collection
+    clear_model_cache()
+
+
+def _batch_prediction(tmp_path, **overrides) -> BatchPrediction:
+    config = {
+        "input_collection_name": "Customers",
+        "batch_prediction_dir": tmp_path / "batch_prediction",
+        "model_file_path": tmp_path / "model.pkl",
+        "chunk_size": 100,
+        "num_workers": 3,
+    }
+    return BatchPrediction(BatchPredictionConfig(**(config | overrides)))
+
+
+def _expected_probabilities(collection, tmp_path) -> dict:
+    documents = pd.DataFrame(list(collection.find({}, {"_id": False})))
+    probabilities = load_model(tmp_path / "model.pkl").predict_proba_batch(documents)[:, 1]
+    return dict(zip(documents["id"], probabilities))
+
+
+# ---------------------- TEST: MONGO OUTPUT ----------------------
+def test_collection_is_scored_into_predictions_collection(mock_mongo, collection, tmp_path):
+    """
+    Test a full run writing to MongoDB.
+
+    Steps:
+        - Score 1000 documents in chunks of 100 on 3 workers.
+        - Expect one prediction per document, keyed by its _id, equal to a direct prediction.
+        - Expect the checkpoint at the last _id and a rows/s report.
+    """
+    batch_prediction = _batch_prediction(tmp_path)
+    report = batch_prediction.run()
+
+    output = mock_mongo[DATABASE_NAME]["Customers-Predictions"]
+    assert (report["rows"], report["chunks"]) == (N_ROWS, 10)
+    assert report["rows_per_second"] > 0
+    assert output.count_documents({}) == N_ROWS
+
+    expected = _expected_probabilities(collection, tmp_path)
+    predictions = list(output.find())
+    np.testing.assert_allclose([p["probability"] for p in predictions], [expected[p["id"]] for p in predictions])
+    assert all(p["prediction"] == int(p["probability"] > 0.5) for p in predictions)
+    assert {p["_id"] for p in predictions} == set(collection.distinct("_id"))
+
+    checkpoint = batch_prediction.read_checkpoint()
+    assert checkpoint["last_key"] == max(collection.distinct("_id"))
+    assert checkpoint["rows"] == N_ROWS
+
+    # Nothing new: nothing to score; new documents only are scored next time
+    assert batch_prediction.run()["rows"] == 0
+    collection.insert_many(next(generate_documents(50, seed=4)))
+    assert batch_prediction.run()["rows"] == 50
+    assert output.count_documents({}) == N_ROWS + 50
+
+
+def test_crash_resumes_after_contiguous_chunks(mock_mongo, collection, tmp_path, monkeypatch):
+    """
+    Test that a crashed run resumes after the last contiguous finished chunk.
+
+    Steps:
+        - Fail the writes of the 5th chunk while 3 workers run.
+        - Expect the checkpoint at most 4 chunks in and its chunks written.
+        - Resume and expect every document scored exactly once in the output.
+    """
+    batch_prediction = _batch_prediction(tmp_path)
+    insert = BatchPrediction._insert_predictions
+    fifth_chunk_ids = set(sorted(collection.distinct("_id"))[400:500])
+
+    def failing_insert(self, predictions):
+        if set(predictions["_id"]) & fifth_chunk_ids:
+            raise ConnectionError("connection lost")
+        insert(self, predictions)
+
+    monkeypatch.setattr(BatchPrediction, "_insert_predictions", failing_insert)
+    with pytest.raises(MyException, match="connection lost"):
+        batch_prediction.run()
+
+    checkpoint = batch_prediction.read_checkpoint()
+    assert checkpoint["rows"] == 400
+    assert max(fifth_chunk_ids) > checkpoint["last_key"]
+
+    monkeypatch.setattr(BatchPrediction, "_insert_predictions", insert)
+    report = batch_prediction.run()
+
+    output = mock_mongo[DATABASE_NAME]["Customers-Predictions"]
+    assert report["rows"] == N_ROWS - 400
+    assert report["total_rows"] == N_ROWS
+    assert output.count_documents({}) == N_ROWS
+
+
+def test_restart_replaces_earlier_predictions(mock_mongo, collection, tmp_path):
+    _batch_prediction(tmp_path).run()
+    _save_model(tmp_path / "model.pkl", seed=1)
+
+    report = _batch_prediction(tmp_path).run(restart=True)
+
+    output = mock_mongo[DATABASE_NAME]["Customers-Predictions"]
+    assert report["rows"] == N_ROWS
+    assert output.count_documents({}) == N_ROWS
+    expected = _expected_probabilities(collection, tmp_path)
+    prediction = output.find_one()
+    assert prediction["probability"] == pytest.approx(expected[prediction["id"]])
+
+
+# ---------------------- TEST: PARQUET OUTPUT ----------------------
+def _read_parts(output_dir) -> tuple[list, pd.DataFrame]:
+    parts = sorted(output_dir.glob("part-*.parquet"))
+    return parts, pd.concat([pd.read_parquet(part) for part in parts])
+
+
+def test_parquet_parts_are_idempotent(collection, tmp_path):
+    output_dir = tmp_path / "parts"
+    _batch_prediction(tmp_path, output="parquet", output_dir=output_dir, num_workers=2).run()
+    # Another chunk size: none of the earlier parts may be left next to the new ones
+    _batch_prediction(tmp_path, output="parquet", output_dir=output_dir, chunk_size=300).run(restart=True)
+
+    parts, predictions = _read_parts(output_dir)
+
+    assert len(parts) == 4
+    assert len(predictions) == N_ROWS
+    assert predictions["_id"].is_unique
+    assert list(predictions.columns) == ["_id", "id", "prediction", "probability"]
+
+
+def test_resume_removes_parts_written_after_the_checkpoint(collection, tmp_path, monkeypatch):
+    """
+    Test that parts finished beyond the checkpoint by a crashed run are not kept on resume.
+
+    Steps:
+        - Fail the 3rd chunk while 3 workers run, so later chunks may still be written.
+        - Resume with another chunk size, and expect every document in exactly one part.
+    """
+    output_dir = tmp_path / "parts"
+    write_part = BatchPrediction._write_part
+    third_chunk_ids = {str(_id) for _id in sorted(collection.distinct("_id"))[200:300]}
+
+    def failing_write_part(self, predictions):
+        if set(predictions["_id"].astype(str)) & third_chunk_ids:
+            raise OSError("disk full")
+        return write_part(self, predictions)
+
+    monkeypatch.setattr(BatchPrediction, "_write_part", failing_write_part)
+    with pytest.raises(MyException, match="disk full"):
+        _batch_prediction(tmp_path, output="parquet", output_dir=output_dir).run()
+    assert len(_batch_prediction(tmp_path).read_checkpoint()["parts"]) == 2
+
+    monkeypatch.setattr(BatchPrediction, "_write_part", write_part)
+    report = _batch_prediction(tmp_path, output="parquet", output_dir=output_dir, chunk_size=250).run()
+
+    parts, predictions = _read_parts(output_dir)
+    assert report["total_rows"] == N_ROWS
+    assert len(parts) == 2 + 4
+    assert len(predictions) == N_ROWS
+    assert predictions["_id"].is_unique
+
+
+def test_config_rejects_unknown_output():
+    with pytest.raises(ValueError):
+        BatchPredictionConfig(output="csv")
+    assert BatchPredictionConfig(input_collection_name="New").output_collection_name == "New-Predictions"
@@ -0,0 +1,161 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import OneHotEncoder
+
+from mlops_project.entity.estimator import MyModel
+from mlops_project.exception import MyException
+from mlops_project.pipeline.prediction_pipeline import PredictionPipeline, clear_model_cache, load_model
+from mlops_project.utils.main_utils import save_object
+
+
+class _CountingPreprocessor:
+    """Wraps a fitted transformer and counts its transform calls."""
+
+    def __init__(self, preprocessor):
+        self.preprocessor = preprocessor
+        self.calls = 0
+
+    def transform(self, dataframe):
+        self.calls += 1
+        return self.preprocessor.transform(dataframe)
+
+
+def _frame(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "Age": rng.integers(20, 80, n_rows),
+            "Vehicle_Damage": rng.choice(["Yes", "No"], n_rows),
+        }
+    )
+    frame["Response"] = ((frame["Vehicle_Damage"] == "Yes") & (frame["Age"] > 40)).astype(int)
+    return frame
+
+
+def _model() -> MyModel:
+    train = _frame(500)
+    preprocessor = ColumnTransformer(
+        [("age", "passthrough", ["Age"]), ("damage", OneHotEncoder(drop="if_binary"), ["Vehicle_Damage"])]
+    ).fit(train)
+    model = LogisticRegression(max_iter=1000).fit(preprocessor.transform(train), train["Response"])
+    return MyModel(_CountingPreprocessor(preprocessor), model)
+
+
+@pytest.fixture(autouse=True)
+def _empty_model_cache():
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
+# ---------------------- TEST: BATCHED PREDICTION ----------------------
+def test_predict_batch_makes_one_call_per_batch():
+    """
+    Test that a batch is transformed and predicted in one call, with the row-wise results.
+
+    Steps:
+        - Predict 1000 rows at once and in batches of 300.
+        - Expect one transform call per batch and the same predictions as predict().
+    """
+    model, rows = _model(), _frame(1000, seed=1).drop(columns=["Response"])
+    expected = model.predict(rows)
+    model.preprocessing_object.calls = 0
+
+    np.testing.assert_array_equal(model.predict_batch(rows), expected)
+    assert model.preprocessing_object.calls == 1
+
+    np.testing.assert_array_equal(model.predict_batch(rows, batch_size=300), expected)
+    assert model.preprocessing_object.calls == 1 + 4
+    assert model.predict_proba_batch(rows, batch_size=300).shape == (1000, 2)
+
+
+def test_predict_batch_accepts_records_and_record_arrays():
+    model, rows = _model(), _frame(50, seed=2).drop(columns=["Response"])
+    expected = model.predict_batch(rows)
+
+    np.testing.assert_array_equal(model.predict_batch(rows.to_dict(orient="records")), expected)
+    np.testing.assert_array_equal(model.predict_batch(rows.to_records(index=False)), expected)
+    np.testing.assert_array_equal(model.predict_batch(rows.to_dict(orient="list")), expected)
+    records = (record for record in rows.to_dict(orient="records"))
+    np.testing.assert_array_equal(model.predict_batch(records), expected)
+    assert model.predict_batch(rows.iloc[:0]).shape == (0,)
+    assert model.predict_proba_batch(rows.iloc[:0]).shape == (0, 2)
+
+    with pytest.raises(MyException):
+        model.predict_batch(np.zeros((3, 2)))
+
+
+# ---------------------- TEST: PER-PROCESS MODEL CACHE ----------------------
+def test_model_is_loaded_once_per_file_version(tmp_path, monkeypatch):
+    """
+    Test the process-wide model cache.
+
+    Steps:
+        - Load the same model file twice, then through two PredictionPipelines.
+        - Expect a single load until the file is replaced.
+    """
+    model_file_path = tmp_path / "model.pkl"
+    save_object(model_file_path, _model())
+    loads = []
+    monkeypatch.setattr(MyModel, "load", classmethod(lambda cls, path: loads.append(path) or _model()))
+
+    first = load_model(model_file_path)
+    assert load_model(model_file_path) is first
+    assert PredictionPipeline(model_file_path).model is PredictionPipeline(str(model_file_path)).model
+    assert len(loads) == 1
+
+    save_object(model_file_path, _model())
+    os.utime(model_file_path, ns=(0, os.stat(model_file_path).st_mtime_ns + 1))
+    assert load_model(model_file_path) is not first
+    assert len(loads) == 2
+
+
+def test_prediction_pipeline_positive_probabilities(tmp_path):
+    model_file_path = tmp_path / "model.pkl"
+    save_object(model_file_path, _model())
+    rows = _frame(200, seed=3).drop(columns=["Response"])
+    pipeline = PredictionPipeline(model_file_path, batch_size=64)
+
+    probabilities = pipeline.predict_proba(rows)
+
+    assert probabilities.shape == (200,)
+    np.testing.assert_array_equal(pipeline.predict(rows), (probabilities > 0.5).astype(int))
+
+    with pytest.raises(MyException):
+        PredictionPipeline(tmp_path / "missing.pkl").predict(rows)
+
+
+# ---------------------- TEST: MEMORY-MAPPED LOADING ----------------------
+def test_model_arrays_are_memory_mapped(tmp_path):
+    """
+    Test that MyModel.load maps the estimator's arrays read-only from the file, with unchanged predictions.
+
+    Steps:
+        - Save a model whose coefficients are large enough for joblib to store as arrays.
+        - Load it with and without mmap_mode.
+        - Expect np.memmap coefficients and equal probabilities, and no temporary file left by the save.
+    """
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(300, 50)), columns=[f"x{i}" for i in range(50)])
+    preprocessor = ColumnTransformer([("passthrough", "passthrough", list(features.columns))]).fit(features)
+    model = LogisticRegression(max_iter=200).fit(features.to_numpy(), features["x0"] > 0)
+    model_file_path = tmp_path / "model.pkl"
+    MyModel(preprocessor, model).save(model_file_path)
+
+    mapped = MyModel.load(model_file_path)
+    in_memory = MyModel.load(model_file_path, mmap_mode=None)
+
+    assert isinstance(mapped.trained_model_object.coef_, np.memmap)
+    assert not mapped.trained_model_object.coef_.flags.writeable
+    assert not isinstance(in_memory.trained_model_object.coef_, np.memmap)
+    np.testing.assert_array_equal(mapped.predict_proba(features), in_memory.predict_proba(features))
+    assert [path.name for path in tmp_path.iterdir()] == ["model.pkl"]
+
+    save_object(tmp_path / "not_a_model.pkl", {"coef": 1})
+    with pytest.raises(MyException):
+        MyModel.load(tmp_path / "not_a_model.pkl")
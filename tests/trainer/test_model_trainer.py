@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+import yaml
+
+from mlops_project.components.model_trainer import ModelTrainer
+from mlops_project.entity.artifact_entity import DataTransformationArtifact, ModelTrainerArtifact
+from mlops_project.entity.config_entity import ModelTrainerConfig
+from mlops_project.entity.estimator import MyModel
+from mlops_project.exception import MyException
+from mlops_project.utils.main_utils import load_object, read_yaml_file, save_numpy_array_data, save_object
+from mlops_project.utils.resampling_utils import oversample_indices, sample_weights_from_indices
+
+
+class _Identity:
+    def transform(self, features):
+        return features
+
+
+def _write_arrays(tmp_path, n_rows=600, seed=0):
+    """Two informative features and an imbalanced label, as the transformation stage writes them."""
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n_rows, 4)).astype(np.float32)
+    labels = (features[:, 0] + 0.5 * features[:, 1] > 1.2).astype(np.float32)
+    data = np.column_stack([features, labels]).astype(np.float32)
+
+    save_numpy_array_data(tmp_path / "train.npy", data[: n_rows * 3 // 4])
+    save_numpy_array_data(tmp_path / "test.npy", data[n_rows * 3 // 4:])
+    save_object(tmp_path / "preprocessing.pkl", _Identity())
+
+    indices = oversample_indices(data[: n_rows * 3 // 4, -1].astype(int), seed=seed)
+    save_numpy_array_data(tmp_path / "index.npy", indices)
+    save_numpy_array_data(tmp_path / "weight.npy", sample_weights_from_indices(indices, n_rows * 3 // 4))
+
+    return DataTransformationArtifact(
+        transformed_object_file_path=tmp_path / "preprocessing.pkl",
+        transformed_train_file_path=tmp_path / "train.npy",
+        transformed_test_file_path=tmp_path / "test.npy",
+        resampling_strategy="random_oversample",
+        resampled_index_file_path=tmp_path / "index.npy",
+        sample_weight_file_path=tmp_path / "weight.npy",
+    )
+
+
+def _model_config(tmp_path, strategy, estimator="sklearn.tree.DecisionTreeClassifier", param_grid=None):
+    config = {
+        "estimator": {"class": estimator, "params": {"random_state": 0}},
+        "search": {"strategy": strategy, "scoring": "f1", "cv": 3, "random_state": 0, "n_iter": 4, "factor": 2},
+        "param_grid": param_grid or {"max_depth": [1, 2, 4, 8], "min_samples_leaf": [1, 5]},
+    }
+    path = tmp_path / "model.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return path
+
+
+def _trainer(tmp_path, strategy, n_jobs=2, **model_config):
+    return ModelTrainer(
+        _write_arrays(tmp_path),
+        ModelTrainerConfig(
+            model_trainer_dir=tmp_path / "model_trainer",
+            model_config_file_path=_model_config(tmp_path, strategy, **model_config),
+            expected_score=0.5,
+            n_jobs=n_jobs,
+        ),
+    )
+
+
+# ---------------------- TEST: SEARCH STRATEGIES ----------------------
+@pytest.mark.parametrize("strategy", ["grid", "random", "halving_grid", "halving_random"])
+def test_search_strategies_train_and_report(tmp_path, strategy):
+    """
+    Test every search strategy end to end on a process pool.
+
+    Steps:
+        - Search a decision tree space declared in a temporary model.yaml with 2 workers.
+        - Expect a saved MyModel, test metrics above the expected score and a search report.
+        - Expect halving searches to record fewer candidates in later rounds.
+    """
+    artifact = _trainer(tmp_path, strategy).initiate_model_trainer()
+
+    assert isinstance(load_object(artifact.trained_model_file_path), MyModel)
+    assert artifact.metric_artifact.f1_score >= 0.5
+    assert set(artifact.best_params) == {"max_depth", "min_samples_leaf"}
+
+    report = read_yaml_file(artifact.search_report_file_path)
+    assert report["best_params"] == artifact.best_params
+    assert report["test_metrics"]["f1_score"] == round(artifact.metric_artifact.f1_score, 6)
+    if strategy.startswith("halving"):
+        rounds = report["halving"]
+        assert rounds["n_candidates"][0] > rounds["n_candidates"][-1]
+        assert rounds["n_resources"][0] < rounds["n_resources"][-1]
+
+
+def test_search_distributions(tmp_path):
+    trainer = _trainer(
+        tmp_path,
+        "random",
+        n_jobs=1,
+        param_grid={"max_depth": {"distribution": "randint", "low": 1, "high": 8}, "min_samples_leaf": [1, 5]},
+    )
+    search = trainer.get_search_object()
+    assert search.param_distributions["max_depth"].rvs(random_state=0) in range(1, 8)
+
+    with pytest.raises(MyException):
+        param_grid = {"max_depth": {"distribution": "randint", "low": 1, "high": 8}}
+        _trainer(tmp_path, "grid", param_grid=param_grid).get_search_object()
+
+
+# ---------------------- TEST: MEMORY-MAPPED INPUTS ----------------------
+def test_training_data_stays_memory_mapped(tmp_path):
+    """
+    Test that the features are a view of the .npy memmap and the oversampling comes as weights.
+    """
+    trainer = _trainer(tmp_path, "grid")
+    features, labels, sample_weight = trainer.load_training_data()
+
+    assert isinstance(features, np.memmap)
+    assert sample_weight.sum() == 2 * (labels == 0).sum()
+
+
+def test_estimator_without_sample_weight_gets_indexed_rows(tmp_path):
+    trainer = _trainer(
+        tmp_path, "grid", estimator="sklearn.neighbors.KNeighborsClassifier", param_grid={"n_neighbors": [3, 5]}
+    )
+    trainer._model_config["estimator"]["params"] = {}
+    features, labels, sample_weight = trainer.load_training_data()
+
+    assert sample_weight is None
+    assert len(labels) == 2 * (labels == 0).sum()
+
+
+def test_expected_score_is_enforced(tmp_path):
+    trainer = _trainer(tmp_path, "grid")
+    trainer.model_trainer_config.expected_score = 1.1
+
+    with pytest.raises(MyException, match="below the expected"):
+        trainer.initiate_model_trainer()
+
+
+def test_artifact_rebuilds_metrics_from_dict():
+    artifact = ModelTrainerArtifact(
+        trained_model_file_path="model.pkl",
+        metric_artifact={"f1_score": 0.7, "precision_score": 0.6, "recall_score": 0.8},
+    )
+    assert artifact.metric_artifact.recall_score == 0.8
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from benchmarks.synthetic import generate_documents
+from mlops_project.components.data_transformation import DataTransformation
+from mlops_project.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact
+from mlops_project.entity.config_entity import DataTransformationConfig
+from mlops_project.exception import MyException
+from mlops_project.utils.main_utils import load_numpy_array_data, load_object, write_dataframe
+
+
+def _transform(tmp_path, file_format="csv", chunk_size=128, validation_status=True, **config):
+    documents = next(generate_documents(1000, seed=3))
+    frame = pd.DataFrame(documents)
+    train, test = frame.iloc[:800], frame.iloc[800:]
+
+    train_path, test_path = tmp_path / f"train.{file_format}", tmp_path / f"test.{file_format}"
+    write_dataframe(train, train_path, file_format=file_format)
+    write_dataframe(test, test_path, file_format=file_format)
+
+    transformation = DataTransformation(
+        DataIngestionArtifact(trained_file_path=train_path, test_file_path=test_path, file_format=file_format),
+        DataValidationArtifact(validation_status=validation_status, message="", validation_report_file_path=None),
+        DataTransformationConfig(
+            data_transformation_dir=tmp_path / "data_transformation", chunk_size=chunk_size, **config
+        ),
+    )
+    return transformation.initiate_data_transformation(), train, test
+
+
+# ---------------------- TEST: STREAMING FIT ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_chunked_fit_matches_full_fit(tmp_path, file_format):
+    """
+    Test that fitting on 128-row chunks gives the scaler a full-fit would.
+
+    Steps:
+        - Transform an 800/200-row train/test pair in 128-row chunks.
+        - Expect float32 arrays with the target as last column.
+        - Expect the scaler's mean/variance to match StandardScaler on all of train.
+    """
+    artifact, train, test = _transform(tmp_path, file_format)
+
+    train_array = load_numpy_array_data(artifact.transformed_train_file_path, mmap_mode="r")
+    test_array = load_numpy_array_data(artifact.transformed_test_file_path)
+    assert train_array.dtype == np.float32
+    assert train_array.shape == (800, len(artifact.feature_names) + 1)
+    assert test_array.shape == (200, len(artifact.feature_names) + 1)
+    np.testing.assert_array_equal(test_array[:, -1], test["Response"].to_numpy())
+
+    preprocessor = load_object(artifact.transformed_object_file_path)
+    scaler = preprocessor.named_transformers_["scaler"]
+    expected = StandardScaler().fit(train[["Age", "Annual_Premium", "Vintage"]].astype(float))
+    np.testing.assert_allclose(scaler.mean_, expected.mean_)
+    np.testing.assert_allclose(scaler.var_, expected.var_)
+    assert scaler.n_samples_seen_ == 800
+
+    # Scaled columns of the whole train array are standardized
+    assert np.abs(train_array[:, :3].mean(axis=0)).max() < 1e-4
+
+
+def test_feature_layout(tmp_path):
+    artifact, train, _ = _transform(tmp_path)
+
+    assert artifact.feature_names == [
+        "Age", "Annual_Premium", "Vintage",
+        "Gender_Female",
+        "Vehicle_Age_< 1 Year", "Vehicle_Age_1-2 Year", "Vehicle_Age_> 2 Years",
+        "Vehicle_Damage_No",
+        "Driving_License", "Region_Code", "Previously_Insured", "Policy_Sales_Channel",
+    ]
+    train_array = load_numpy_array_data(artifact.transformed_train_file_path)
+    np.testing.assert_array_equal(train_array[:, 3], (train["Gender"] == "Female").to_numpy())
+    assert (train_array[:, 4:7].sum(axis=1) == 1).all()
+
+
+def test_failed_validation_is_not_transformed(tmp_path):
+    with pytest.raises(MyException, match="Data validation failed"):
+        _transform(tmp_path, validation_status=False)
+
+
+# ---------------------- TEST: RESAMPLING ----------------------
+def test_random_oversample_writes_index_and_weights(tmp_path):
+    """
+    Test that the default oversampling leaves the train array as is and adds row positions and weights.
+    """
+    artifact, train, _ = _transform(tmp_path)
+
+    train_array = load_numpy_array_data(artifact.transformed_train_file_path, mmap_mode="r")
+    indices = load_numpy_array_data(artifact.resampled_index_file_path)
+    weights = load_numpy_array_data(artifact.sample_weight_file_path)
+
+    assert artifact.resampling_strategy == "random_oversample"
+    assert train_array.shape[0] == 800
+    negatives = int((train["Response"] == 0).sum())
+    assert len(indices) == 2 * negatives
+    assert (train_array[indices, -1] == 1).sum() == negatives
+    np.testing.assert_array_equal(weights, np.bincount(indices, minlength=800))
+
+
+@pytest.mark.parametrize("strategy", ["none", "class_weight", "smote"])
+def test_other_resampling_strategies(tmp_path, strategy):
+    artifact, train, _ = _transform(tmp_path, resampling_strategy=strategy)
+
+    assert artifact.resampled_index_file_path is None
+    assert (artifact.sample_weight_file_path is not None) == (strategy == "class_weight")
+
+    train_array = load_numpy_array_data(artifact.transformed_train_file_path)
+    if strategy == "smote":
+        assert train_array.shape[0] == 2 * int((train["Response"] == 0).sum())
+        assert train_array[:, -1].mean() == 0.5
+    else:
+        assert train_array.shape[0] == 800
+
+
+def test_unknown_resampling_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        DataTransformationConfig(resampling_strategy="bootstrap")
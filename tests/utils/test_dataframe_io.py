@@ -0,0 +1,134 @@
+import pandas as pd
+import pytest
+
+from mlops_project.exception import MyException
+from mlops_project.utils.main_utils import (
+    DataFrameChunkWriter,
+    infer_file_format,
+    iter_dataframe_chunks,
+    read_dataframe,
+    write_dataframe,
+)
+
+
+def _frame() -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "id": [3, 1, 2],
+            "Gender": pd.Categorical(["Male", "Female", "Male"]),
+            "Annual_Premium": [100.5, None, 300.0],
+        }
+    )
+    # Shuffled index, as produced by train_test_split
+    return df.set_index(pd.Index([7, 0, 4]))
+
+
+# ---------------------- TEST: ROUND TRIP ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_round_trip(tmp_path, file_format):
+    """
+    Test that every supported format writes and reads back the same values.
+
+    Steps:
+        - Write a frame with a non-default index to <format> under a nested directory.
+        - Read it back, inferring the format from the extension.
+        - Expect identical values and a fresh RangeIndex.
+    """
+    path = tmp_path / "nested" / f"data.{file_format}"
+    write_dataframe(_frame(), path, file_format, compression="zstd")
+
+    df = read_dataframe(path)
+
+    assert list(df.index) == [0, 1, 2]
+    assert df["id"].tolist() == [3, 1, 2]
+    assert df["Gender"].astype(str).tolist() == ["Male", "Female", "Male"]
+    assert df["Annual_Premium"].isna().tolist() == [False, True, False]
+
+
+# ---------------------- TEST: COLUMN SUBSET ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_read_column_subset(tmp_path, file_format):
+    path = tmp_path / f"data.{file_format}"
+    write_dataframe(_frame(), path)
+
+    df = read_dataframe(path, columns=["id"])
+
+    assert list(df.columns) == ["id"]
+
+
+# ---------------------- TEST: CATEGORIES KEPT ----------------------
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_columnar_formats_keep_dtypes(tmp_path, file_format):
+    path = tmp_path / f"data.{file_format}"
+    write_dataframe(_frame(), path)
+
+    df = read_dataframe(path)
+
+    assert isinstance(df["Gender"].dtype, pd.CategoricalDtype)
+
+
+# ---------------------- TEST: UNKNOWN FORMAT ----------------------
+def test_unknown_extension_raises(tmp_path):
+    with pytest.raises(MyException):
+        infer_file_format(tmp_path / "data.xlsx")
+
+
+# ---------------------- TEST: CHUNKED READ ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_iter_dataframe_chunks(tmp_path, file_format):
+    """
+    Test that chunked reads return every row once, in order, in bounded chunks.
+    """
+    df = pd.DataFrame({"id": range(1000), "Gender": ["Male", "Female"] * 500})
+    path = tmp_path / f"data.{file_format}"
+    write_dataframe(df, path)
+
+    chunks = list(iter_dataframe_chunks(path, chunk_size=300, columns=["id"]))
+
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    assert list(pd.concat(chunks)["id"]) == list(range(1000))
+    assert list(chunks[0].columns) == ["id"]
+
+
+# ---------------------- TEST: CHUNKED WRITE ----------------------
+@pytest.mark.parametrize("file_format", ["parquet", "feather"])
+def test_chunk_writer_widens_schema_for_later_chunks(tmp_path, file_format):
+    """
+    Test that chunks whose dtypes drift, as untyped Mongo chunks do, are written without loss.
+
+    Steps:
+        - Write an int column, then a chunk with 1.5 in it.
+        - Write a column that is all null at first, then strings.
+        - Expect every row back, with a float and a string column.
+    """
+    path = tmp_path / f"data.{file_format}"
+    chunks = [
+        pd.DataFrame({"id": [1, 2], "premium": [10, 20], "note": [None, None]}),
+        pd.DataFrame({"id": [3, 4], "premium": [30, 40], "note": [None, None]}),
+        pd.DataFrame({"id": [5, 6], "premium": [1.5, None], "note": ["a", None]}),
+        pd.DataFrame({"id": [7], "premium": [70], "note": ["b"]}),
+    ]
+    with DataFrameChunkWriter(path) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    df = read_dataframe(path)
+
+    assert writer.rows_written == 7
+    assert df["id"].tolist() == list(range(1, 8))
+    assert df["premium"].tolist()[:5] == [10.0, 20.0, 30.0, 40.0, 1.5]
+    assert [None if pd.isna(note) else note for note in df["note"]] == [None] * 4 + ["a", None, "b"]
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_chunk_writer_keeps_columns_of_an_empty_first_chunk(tmp_path, file_format):
+    path = tmp_path / f"data.{file_format}"
+    with DataFrameChunkWriter(path) as writer:
+        writer.write(pd.DataFrame({"a": [], "b": []}))
+        writer.write(pd.DataFrame({"b": [1, 2], "a": [3, 4]}))
+
+    df = read_dataframe(path)
+
+    assert list(df.columns) == ["a", "b"]
+    assert df["a"].tolist() == [3, 4]
+    assert df["b"].tolist() == [1, 2]
@@ -0,0 +1,131 @@
+import contextvars
+import json
+import pstats
+import threading
+
+import pytest
+
+from mlops_project.utils.instrumentation import RunRecorder, add_rows, current_stage, increment, stage
+
+
+# ---------------------- TEST: STAGES ----------------------
+def test_nested_stages_are_recorded_with_paths(tmp_path):
+    """
+    Test that stages opened inside a recorder are recorded with their nesting.
+
+    Steps:
+        - Run a decorated function and a block inside a parent stage.
+        - Set rows and counters from inside the stages.
+        - Expect records in start order with parent/child paths and measurements.
+    """
+    recorder = RunRecorder(tmp_path, profile="")
+
+    @stage("work")
+    def work():
+        add_rows(10)
+        add_rows(5)
+        increment("batches")
+        increment("batches")
+        return sum(range(100_000))
+
+    with recorder.activate():
+        with stage("pipeline") as parent:
+            work()
+            with stage("write", rows=3) as step:
+                assert current_stage() is step
+            parent.rows = 15
+
+    assert current_stage() is None
+    assert [record.path for record in recorder.records] == ["pipeline", "pipeline/work", "pipeline/write"]
+    pipeline, work_record, write = recorder.records
+    assert work_record.rows == 15 and work_record.counters == {"batches": 2}
+    assert write.rows == 3 and write.depth == 1
+    assert pipeline.wall_seconds >= work_record.wall_seconds > 0
+    assert all(record.status == "ok" for record in recorder.records)
+    assert pipeline.peak_rss_delta_mb is not None
+
+
+def test_failed_stage_is_recorded_and_reraised(tmp_path):
+    recorder = RunRecorder(tmp_path, profile="")
+
+    with recorder.activate(), pytest.raises(ZeroDivisionError):
+        with stage("boom"):
+            1 / 0
+
+    assert recorder.records[0].status == "failed"
+
+
+def test_stages_outside_a_recorder_only_measure():
+    with stage("alone") as record:
+        increment("calls")
+
+    assert record.status == "ok"
+    assert record.counters == {"calls": 1}
+
+
+def test_decorated_function_is_reentrant_across_threads(tmp_path):
+    """
+    Test one decorated function running on several threads at once.
+
+    Steps:
+        - Run it on 8 threads, each in a copy of the recorder's context.
+        - Expect 8 separate records, each with its own row count.
+    """
+    recorder = RunRecorder(tmp_path, profile="")
+    barrier = threading.Barrier(8)
+
+    @stage("task")
+    def task():
+        barrier.wait()
+        add_rows(1)
+
+    with recorder.activate():
+        threads = [threading.Thread(target=contextvars.copy_context().run, args=(task,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(recorder.records) == 8
+    assert all(record.rows == 1 and record.status == "ok" for record in recorder.records)
+
+
+# ---------------------- TEST: RUN REPORT ----------------------
+def test_run_report_is_written_with_sections(tmp_path):
+    recorder = RunRecorder(tmp_path, profile="")
+    with recorder.activate():
+        with stage("a", rows=1):
+            pass
+
+    report = recorder.write_report(tmp_path / "run_report.json", stage_cache={"hit_count": 1})
+
+    written = json.loads((tmp_path / "run_report.json").read_text())
+    assert written == json.loads(json.dumps(report))
+    assert written["stages"][0]["name"] == "a"
+    assert written["stage_cache"] == {"hit_count": 1}
+    assert written["summary"]["peak_rss_mb"] > 0
+
+
+@pytest.mark.parametrize("profile", ["cprofile", "tracemalloc"])
+def test_profile_dump_from_env(tmp_path, monkeypatch, profile):
+    """
+    Test that MLOPS_PROFILE selects a profiler whose dump lands in the report dir.
+    """
+    monkeypatch.setenv("MLOPS_PROFILE", profile)
+    recorder = RunRecorder(tmp_path)
+
+    with recorder.activate():
+        with stage("allocate"):
+            data = [bytes(1000) for _ in range(1000)]
+            del data
+
+    assert recorder.profile_file_path.exists()
+    if profile == "cprofile":
+        assert pstats.Stats(str(recorder.profile_file_path)).total_calls > 0
+    else:
+        assert "peak" in recorder.profile_file_path.read_text().splitlines()[0]
+
+
+def test_unknown_profile_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        RunRecorder(tmp_path, profile="perf")
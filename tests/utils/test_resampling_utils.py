@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from mlops_project.exception import MyException
+from mlops_project.utils.resampling_utils import (
+    balanced_sample_weights,
+    oversample_indices,
+    resample_summary,
+    sample_weights_from_indices,
+    smote_resample,
+)
+
+
+# ---------------------- TEST: INDEX OVERSAMPLING ----------------------
+def test_oversample_indices_balance_classes_without_dropping_rows():
+    """
+    Test that the index array keeps every row and tops up the minority class.
+
+    Steps:
+        - Oversample 900 negatives / 100 positives to a 1:1 ratio.
+        - Expect 1800 sorted positions covering every row at least once.
+        - Expect bincount weights that sum to the same class totals.
+    """
+    labels = np.array([0] * 900 + [1] * 100)
+
+    indices = oversample_indices(labels, sampling_ratio=1.0, seed=0)
+
+    assert len(indices) == 1800
+    assert (np.diff(indices) >= 0).all()
+    assert np.isin(np.arange(1000), indices).all()
+    assert resample_summary(labels, indices=indices) == {"0": 900.0, "1": 900.0}
+
+    weights = sample_weights_from_indices(indices, len(labels))
+    assert weights.dtype == np.float32
+    assert (weights[:900] == 1).all()
+    assert resample_summary(labels, weights=weights) == {"0": 900.0, "1": 900.0}
+
+
+def test_oversample_indices_ratio_and_seed():
+    labels = np.array([1] * 50 + [0] * 950)
+
+    half = oversample_indices(labels, sampling_ratio=0.5, seed=1)
+    assert resample_summary(labels, indices=half) == {"0": 950.0, "1": 475.0}
+    np.testing.assert_array_equal(half, oversample_indices(labels, sampling_ratio=0.5, seed=1))
+
+    with pytest.raises(MyException):
+        oversample_indices(labels, sampling_ratio=1.5)
+
+
+def test_balanced_sample_weights():
+    labels = np.array([0] * 90 + [1] * 10)
+    weights = balanced_sample_weights(labels)
+
+    assert resample_summary(labels, weights=weights) == {"0": 50.0, "1": 50.0}
+
+
+# ---------------------- TEST: SMOTE ----------------------
+def test_smote_keeps_original_rows_first():
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(200, 3)).astype(np.float32)
+    labels = np.array([0] * 180 + [1] * 20)
+
+    resampled_features, resampled_labels = smote_resample(features, labels, seed=0)
+
+    assert len(resampled_labels) == 360
+    np.testing.assert_array_equal(resampled_features[:200], features)
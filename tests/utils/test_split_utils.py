@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from mlops_project.utils.split_utils import (
+    StreamingStratifiedSplitter,
+    class_counts,
+    hash_test_mask,
+    stratified_split_indices,
+)
+
+
+# ---------------------- TEST: HASH SPLIT ----------------------
+def test_hash_split_is_independent_of_chunking():
+    """
+    Test that the hash split gives the same assignment whatever the chunk boundaries.
+
+    Steps:
+        - Compute the mask for 100k ids at once and in shuffled chunks of 7k.
+        - Expect the same test ids and a test fraction close to 0.25.
+    """
+    ids = np.arange(100_000)
+    whole = set(ids[hash_test_mask(ids, 0.25, seed=42)])
+
+    shuffled = np.random.default_rng(0).permutation(ids)
+    chunked = set()
+    for chunk in np.array_split(shuffled, 15):
+        chunked.update(chunk[hash_test_mask(chunk, 0.25, seed=42)])
+
+    assert whole == chunked
+    assert abs(len(whole) / len(ids) - 0.25) < 0.01
+
+
+def test_hash_split_depends_on_seed_and_dtype_width_is_irrelevant():
+    ids = np.arange(10_000)
+    assert not np.array_equal(hash_test_mask(ids, 0.25, 1), hash_test_mask(ids, 0.25, 2))
+    assert np.array_equal(hash_test_mask(ids.astype(np.int32), 0.25, 1), hash_test_mask(ids, 0.25, 1))
+
+
+def test_hash_split_treats_whole_float_keys_as_ints():
+    # A chunk with a null id decodes the column as float64
+    ids = np.arange(10_000)
+    float_ids = np.append(ids.astype(np.float64), [np.nan, 0.5])
+
+    mask = hash_test_mask(float_ids, 0.25, 1)
+
+    assert np.array_equal(mask[:-2], hash_test_mask(ids, 0.25, 1))
+    assert np.array_equal(hash_test_mask(float_ids[-2:], 0.25, 1), mask[-2:])
+
+
+# ---------------------- TEST: STREAMING STRATIFIED SPLIT ----------------------
+def test_streaming_stratified_split_keeps_class_ratio():
+    """
+    Test that running counts keep every class within one row of the target ratio.
+
+    Steps:
+        - Stream 20k imbalanced labels (12% positives) in chunks of 999.
+        - Expect each class's test share to be 0.25 within one row.
+        - Expect the same seed to reproduce the same masks.
+    """
+    labels = (np.random.default_rng(1).random(20_000) < 0.12).astype(int)
+
+    def run(seed):
+        splitter = StreamingStratifiedSplitter(0.25, seed)
+        masks = [splitter.assign(chunk) for chunk in np.array_split(labels, 21)]
+        return splitter, np.concatenate(masks)
+
+    splitter, mask = run(7)
+    _, again = run(7)
+
+    train_counts, test_counts = splitter.class_counts()
+    for key in ("0", "1"):
+        total = train_counts[key] + test_counts[key]
+        assert abs(test_counts[key] - 0.25 * total) <= 1
+    assert np.array_equal(mask, again)
+    assert test_counts["1"] == int(mask[labels == 1].sum())
+
+
+def test_streaming_stratified_split_handles_missing_labels():
+    splitter = StreamingStratifiedSplitter(0.5, 0)
+    mask = splitter.assign(pd.Series([1, None, 1, None]))
+
+    assert mask.sum() == 2
+    assert splitter.class_counts()[1] == {"1": 1, "nan": 1}
+
+
+def test_class_keys_do_not_depend_on_label_dtype():
+    """
+    Test that chunks reading the label as int or as float count into the same classes.
+    """
+    splitter = StreamingStratifiedSplitter(0.5, 0)
+    splitter.assign(pd.Series([1, 0, 1, 0]))
+    splitter.assign(pd.Series([1.0, 0.0, None, 1.0]))
+    train, test = splitter.class_counts()
+
+    assert {key: train[key] + test[key] for key in train} == {"0": 3, "1": 4, "nan": 1}
+    assert class_counts(pd.Series([1, 1.0, "1"], dtype=object)) == {"1": 3}
+
+
+# ---------------------- TEST: IN-MEMORY STRATIFIED SPLIT ----------------------
+def test_stratified_split_indices_keep_class_ratio_and_are_seeded():
+    """
+    Test the per-class permutation split.
+
+    Steps:
+        - Split 50k imbalanced labels (with a NaN class and a singleton class).
+        - Expect a disjoint, complete partition of the rows.
+        - Expect each class's test share to be 0.25 within one row.
+        - Expect the same seed to reproduce the split and another seed to change it.
+    """
+    rng = np.random.default_rng(3)
+    labels = (rng.random(50_000) < 0.1).astype(float)
+    labels[:50] = np.nan
+    labels[50] = 7.0
+
+    train_idx, test_idx = stratified_split_indices(labels, 0.25, seed=42)
+
+    assert len(np.intersect1d(train_idx, test_idx)) == 0
+    assert np.array_equal(np.sort(np.concatenate([train_idx, test_idx])), np.arange(len(labels)))
+
+    train_counts, test_counts = class_counts(labels[train_idx]), class_counts(labels[test_idx])
+    for key in ("0", "1", "nan"):
+        total = train_counts[key] + test_counts[key]
+        assert abs(test_counts[key] - 0.25 * total) <= 1
+    assert train_counts["7"] == 1 and "7" not in test_counts
+
+    again, _ = stratified_split_indices(labels, 0.25, seed=42)
+    other, _ = stratified_split_indices(labels, 0.25, seed=43)
+    assert np.array_equal(train_idx, again)
+    assert not np.array_equal(train_idx, other)
+
+
+def test_stratified_split_puts_a_row_of_each_class_on_both_sides():
+    labels = pd.Series(["a"] * 98 + ["b"] * 2)
+    train_idx, test_idx = stratified_split_indices(labels, 0.1, seed=0)
+
+    assert class_counts(labels.iloc[test_idx]) == {"a": 10, "b": 1}
+    assert class_counts(labels.iloc[train_idx]) == {"a": 88, "b": 1}
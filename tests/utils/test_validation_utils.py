@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from mlops_project.utils.validation_utils import (
+    CategoricalColumnStats,
+    NumericColumnStats,
+    jensen_shannon_divergence,
+    population_stability_index,
+)
+
+
+# ---------------------- TEST: CHUNKED == SINGLE PASS ----------------------
+def test_numeric_stats_do_not_depend_on_chunking():
+    """
+    Test that updating chunk by chunk gives the same statistics as one update.
+    """
+    values = pd.Series(np.random.default_rng(0).uniform(0, 100, 10_000))
+    values[::97] = np.nan
+
+    whole = NumericColumnStats("x", "float32", {"min": 0, "max": 90}, bins=10)
+    whole.update(values)
+    chunked = NumericColumnStats("x", "float32", {"min": 0, "max": 90}, bins=10)
+    for start in range(0, len(values), 777):
+        chunked.update(values[start:start + 777])
+
+    assert whole.summary() == chunked.summary()
+    np.testing.assert_array_equal(whole.distribution(), chunked.distribution())
+    assert whole.distribution().sum() == len(values)
+    assert whole.out_of_range == int((values > 90).sum())
+
+
+def test_integer_dtype_bounds_and_fractions():
+    stats = NumericColumnStats("Age", "int8")
+    stats.update(pd.Series([20, 30, 40]))
+    assert stats.fits_expected_dtype()
+
+    stats.update(pd.Series([300]))
+    assert not stats.fits_expected_dtype()
+
+    fractional = NumericColumnStats("Age", "int8")
+    fractional.update(pd.Series([20.0, 30.5]))
+    assert fractional.non_integral == 1
+
+
+def test_categorical_stats_accept_category_and_object_dtypes():
+    domain = ["Male", "Female"]
+    values = ["Male", "Female", "Other", None, "Male"]
+
+    as_object = CategoricalColumnStats("Gender", domain)
+    as_object.update(pd.Series(values, dtype=object))
+    as_category = CategoricalColumnStats("Gender", domain)
+    as_category.update(pd.Series(values, dtype="category"))
+
+    for stats in (as_object, as_category):
+        assert stats.counts.tolist() == [2, 1]
+        assert stats.out_of_domain == 1 and stats.nulls == 1
+        assert stats.unknown_values == {"Other": 1}
+
+
+# ---------------------- TEST: DRIFT METRICS ----------------------
+def test_drift_metrics():
+    same = population_stability_index([10, 20, 30], [20, 40, 60])
+    shifted = population_stability_index([10, 20, 30], [30, 20, 10])
+
+    assert same == 0.0
+    assert shifted > 0.2
+    assert jensen_shannon_divergence([1, 0], [0, 1]) > 0.99
+    assert jensen_shannon_divergence([5, 5], [5, 5]) == 0.0
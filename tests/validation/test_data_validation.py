@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlops_project.components.data_validation import DataValidation
+from mlops_project.entity.artifact_entity import DataIngestionArtifact
+from mlops_project.entity.config_entity import DataValidationConfig
+from mlops_project.utils.main_utils import read_yaml_file, write_dataframe
+
+
+def _frame(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "Gender": rng.choice(["Male", "Female"], n),
+            "Age": rng.integers(20, 86, n),
+            "Driving_License": rng.integers(0, 2, n),
+            "Region_Code": rng.integers(0, 53, n).astype(float),
+            "Previously_Insured": rng.integers(0, 2, n),
+            "Vehicle_Age": rng.choice(["< 1 Year", "1-2 Year", "> 2 Years"], n),
+            "Vehicle_Damage": rng.choice(["Yes", "No"], n),
+            "Annual_Premium": rng.uniform(2630, 40000, n),
+            "Policy_Sales_Channel": rng.integers(1, 164, n).astype(float),
+            "Vintage": rng.integers(10, 300, n),
+            "Response": (rng.random(n) < 0.12).astype(int),
+        }
+    )
+
+
+def _validate(tmp_path, train: pd.DataFrame, test: pd.DataFrame, file_format: str = "csv", **config):
+    train_path = tmp_path / f"train.{file_format}"
+    test_path = tmp_path / f"test.{file_format}"
+    write_dataframe(train, train_path, file_format=file_format)
+    write_dataframe(test, test_path, file_format=file_format)
+
+    artifact = DataIngestionArtifact(trained_file_path=train_path, test_file_path=test_path, file_format=file_format)
+    validation_config = DataValidationConfig(data_validation_dir=tmp_path / "data_validation", **config)
+    return DataValidation(artifact, validation_config).initiate_data_validation()
+
+
+# ---------------------- TEST: VALID FILES ----------------------
+@pytest.mark.parametrize("file_format", ["csv", "parquet", "feather"])
+def test_valid_files_pass_in_chunks(tmp_path, file_format):
+    """
+    Test that schema-conforming files pass when read in many small chunks.
+
+    Steps:
+        - Write 2000/500-row train/test files drawn from the same distribution.
+        - Validate with a 300-row chunk size.
+        - Expect a passing artifact, no drift and a report covering every row.
+    """
+    artifact = _validate(tmp_path, _frame(2000, seed=1), _frame(500, seed=2), file_format, chunk_size=300)
+
+    assert artifact.validation_status, artifact.message
+    assert not artifact.drift_detected
+    report = read_yaml_file(artifact.validation_report_file_path)
+    assert report["files"]["train"]["rows"] == 2000
+    assert report["files"]["train"]["columns"]["Age"]["min"] >= 20
+    assert set(report["drift"]["columns"]) >= {"Age", "Gender", "Annual_Premium"}
+
+
+# ---------------------- TEST: SCHEMA VIOLATIONS ----------------------
+def test_schema_violations_are_reported(tmp_path):
+    """
+    Test that every kind of violation fails validation with a message naming the column.
+
+    Steps:
+        - Drop Vintage from test, and in train put unknown genders, ages out of
+          range, fractional licences and 10% nulls in Region_Code.
+        - Expect a failing artifact listing each problem.
+    """
+    train = _frame(1000, seed=3)
+    train.loc[:4, "Gender"] = "Unknown"
+    train.loc[5:9, "Age"] = 120
+    train["Driving_License"] = train["Driving_License"].astype(float)
+    train.loc[10, "Driving_License"] = 0.5
+    train.loc[100:199, "Region_Code"] = np.nan
+    test = _frame(300, seed=4).drop(columns="Vintage")
+
+    artifact = _validate(tmp_path, train, test, chunk_size=256)
+
+    assert not artifact.validation_status
+    assert "test: missing columns ['Vintage']" in artifact.message
+    assert "train.Gender: 5 values outside the domain" in artifact.message
+    assert "train.Age: 5 values outside [20, 85]" in artifact.message
+    assert "train.Driving_License: values do not fit dtype int8" in artifact.message
+    assert "train.Region_Code: null ratio 0.1000" in artifact.message
+
+
+def test_class_counts_must_match_ingestion(tmp_path):
+    train, test = _frame(400, seed=5), _frame(100, seed=6)
+    train_path, test_path = tmp_path / "train.csv", tmp_path / "test.csv"
+    write_dataframe(train, train_path)
+    write_dataframe(test, test_path)
+
+    artifact = DataIngestionArtifact(
+        trained_file_path=train_path,
+        test_file_path=test_path,
+        train_class_counts={"0": 1, "1": 399},
+    )
+    result = DataValidation(artifact, DataValidationConfig(data_validation_dir=tmp_path)).initiate_data_validation()
+
+    assert not result.validation_status
+    assert "train: Response class counts" in result.message
+
+
+# ---------------------- TEST: DRIFT ----------------------
+def test_shifted_test_distribution_is_flagged(tmp_path):
+    """
+    Test that a shifted numeric column and a re-weighted categorical column are flagged as drift.
+    """
+    train, test = _frame(3000, seed=7), _frame(1000, seed=8)
+    test["Age"] = np.clip(test["Age"] + 30, 20, 85)
+    test["Vehicle_Damage"] = "Yes"
+
+    artifact = _validate(tmp_path, train, test)
+
+    assert artifact.validation_status
+    assert artifact.drift_detected
+    drift = read_yaml_file(artifact.validation_report_file_path)["drift"]["columns"]
+    assert drift["Age"]["drift"] and drift["Vehicle_Damage"]["drift"]
+    assert not drift["Gender"]["drift"]